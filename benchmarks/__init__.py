@@ -0,0 +1 @@
+"""Banc d'essai des performances du gestionnaire de tâches (voir benchmarks.bench)."""
@@ -0,0 +1,406 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+Module bench.
+
+Ce module mesure le temps d'exécution et la mémoire maximale (tracemalloc) des
+opérations principales du gestionnaire de tâches sur des jeux de tâches synthétiques
+de tailles croissantes (1k, 10k, 100k et 1M tâches par défaut) :
+
+    load: Chargement des tâches et des métadonnées (load_tasks, load_meta).
+    save: Réécriture complète du fichier (save_tasks).
+    generate_id: Attribution d'un nouvel identifiant (generate_unique_id).
+    add: Ajout d'une tâche et sauvegarde de la modification.
+    edit: Modification d'une tâche et sauvegarde de la modification.
+    list: Affichage de toutes les tâches triées par priorité (handle_list).
+
+Les résultats sont écrits dans un fichier JSON de référence ; le mode ``compare``
+relance les mesures (ou lit un second fichier) et signale les opérations dont le
+temps ou la mémoire dépasse la référence de plus d'un seuil.
+
+Exemples :
+
+    python -m benchmarks.bench run --sizes 1000 10000 --output benchmarks/baseline.json
+    python -m benchmarks.bench compare benchmarks/baseline.json --threshold 0.2
+"""
+
+import argparse
+import contextlib
+import json
+import os
+import platform
+import random
+import shutil
+import sys
+import tempfile
+import time
+import tracemalloc
+
+from types import SimpleNamespace
+
+from source import task_manager
+from source.storage import storage_class
+from source.tache import Tache
+from source.task_store import TaskStore
+
+DEFAULT_SIZES = (1_000, 10_000, 100_000, 1_000_000)
+DEFAULT_REPEAT = 3  # Nombre de mesures du temps, dont on garde la meilleure
+DEFAULT_THRESHOLD = 0.25  # Hausse relative tolérée avant de signaler une régression
+DEFAULT_BASELINE = os.path.join("benchmarks", "baseline.json")
+FIRST_ID = 10_000_000  # Identifiants à 8 chiffres : assez pour 1M de tâches
+ID_WIDTH = 8
+
+WORDS = (
+    "acheter pain lait courrier rapport réunion projet client facture relire "
+    "appeler déployer corriger tester préparer envoyer planifier réviser été congés"
+).split()
+
+
+def generate_tasks(count, seed=0):
+    """Génère des tâches synthétiques de manière déterministe.
+
+    Args:
+        count (int): Nombre de tâches.
+        seed (int, optional): Graine du générateur aléatoire. Defaults to 0.
+
+    Returns:
+        list[Tache]: Les tâches, d'identifiants consécutifs à partir de FIRST_ID.
+    """
+    rng = random.Random(seed)
+    tasks = []
+    for index in range(count):
+        day = rng.randrange(1, 29)
+        tasks.append(
+            Tache(
+                " ".join(rng.choices(WORDS, k=3)).capitalize(),
+                " ".join(rng.choices(WORDS, k=8)) if rng.random() < 0.7 else None,
+                rng.randint(1, 5),
+                f"2026-{rng.randint(1, 12):02d}-{day:02d}" if rng.random() < 0.8 else None,
+                FIRST_ID + index,
+            )
+        )
+    return tasks
+
+
+class Fixture:
+    """Fichiers de tâches préparés une fois par taille et copiés avant chaque mesure.
+
+    Attributes:
+        storage (str): Nom du backend de stockage.
+        size (int): Nombre de tâches.
+        root (str): Répertoire temporaire des fichiers de cette taille.
+        directory (str): Répertoire de référence contenant le fichier et ses annexes.
+    """
+
+    def __init__(self, storage, size):
+        """Écrit le fichier de référence dans un répertoire temporaire.
+
+        Args:
+            storage (str): Nom du backend de stockage.
+            size (int): Nombre de tâches.
+        """
+        self.storage = storage
+        self.size = size
+        self.root = tempfile.mkdtemp(prefix=f"bench-{storage}-{size}-")
+        self.directory = os.path.join(self.root, "reference")
+        os.makedirs(self.directory)
+        store = TaskStore(generate_tasks(size), meta={"next_id": FIRST_ID + size})
+        task_manager.save_tasks(store, self.filename(self.directory), storage)
+        self._copies = 0
+
+    def cleanup(self):
+        """Supprime le répertoire temporaire et toutes les copies."""
+        shutil.rmtree(self.root, ignore_errors=True)
+
+    def filename(self, directory):
+        """Retourne le chemin du fichier de tâches dans un répertoire.
+
+        Args:
+            directory (str): Le répertoire.
+
+        Returns:
+            str: Le chemin du fichier.
+        """
+        name = storage_class(self.storage).default_filename
+        return os.path.join(directory, name)
+
+    def copy(self):
+        """Copie le fichier de référence pour une mesure qui le modifie.
+
+        Returns:
+            str: Le chemin du fichier copié.
+        """
+        self._copies += 1
+        directory = os.path.join(self.root, f"copie-{self._copies}")
+        shutil.copytree(self.directory, directory)
+        return self.filename(directory)
+
+    def load(self, filename=None):
+        """Charge les tâches comme la CLI.
+
+        Args:
+            filename (str, optional): Fichier à charger. Defaults to the reference file.
+
+        Returns:
+            TaskStore: Les tâches chargées.
+        """
+        filename = filename or self.filename(self.directory)
+        return TaskStore(
+            task_manager.load_tasks(filename, self.storage),
+            meta=task_manager.load_meta(filename, self.storage),
+        )
+
+
+def _setup_load(fixture):
+    """Prépare la mesure de "load"."""
+    return fixture.filename(fixture.directory)
+
+
+def _run_load(fixture, filename):
+    """Charge les tâches."""
+    fixture.load(filename)
+
+
+def _setup_copy(fixture):
+    """Prépare une mesure qui modifie le fichier : copie puis chargement."""
+    filename = fixture.copy()
+    return filename, fixture.load(filename)
+
+
+def _run_save(fixture, state):
+    """Réécrit toutes les tâches."""
+    filename, tasks = state
+    task_manager.save_tasks(tasks, filename, fixture.storage)
+
+
+def _setup_generate_id(fixture):
+    """Prépare la mesure de "generate_id"."""
+    return fixture.load()
+
+
+def _run_generate_id(_fixture, tasks):
+    """Attribue un identifiant."""
+    task_manager.generate_unique_id(tasks, ID_WIDTH)
+
+
+def _run_add(fixture, state):
+    """Ajoute une tâche et sauvegarde la modification."""
+    filename, tasks = state
+    task = Tache("Nouvelle tâche", None, 2, "2026-06-01")
+    task.task_id = task_manager.generate_unique_id(tasks, ID_WIDTH)
+    tasks.add(task)
+    task_manager.save_tasks(tasks, filename, fixture.storage, changes=[("add", task)])
+
+
+def _run_edit(fixture, state):
+    """Modifie une tâche et sauvegarde la modification."""
+    filename, tasks = state
+    task = tasks.get(FIRST_ID + fixture.size // 2)
+    task.set_priorite(task.priorite % 5 + 1)
+    task_manager.save_tasks(tasks, filename, fixture.storage, changes=[("edit", task)])
+
+
+def _setup_list(fixture):
+    """Prépare la mesure de "list"."""
+    filename = fixture.filename(fixture.directory)
+    return SimpleNamespace(file=filename, storage=fixture.storage, sort="priority")
+
+
+def _run_list(fixture, args):
+    """Affiche toutes les tâches triées par priorité, comme la CLI."""
+    tasks = task_manager.load_tasks(args.file, fixture.storage, sort=args.sort, stream=True)
+    with open(os.devnull, "w", encoding="utf-8") as devnull:
+        with contextlib.redirect_stdout(devnull):
+            task_manager.handle_list(args, tasks)
+
+
+# Nom de l'opération -> (préparation non mesurée, opération mesurée)
+OPERATIONS = {
+    "load": (_setup_load, _run_load),
+    "save": (_setup_copy, _run_save),
+    "generate_id": (_setup_generate_id, _run_generate_id),
+    "add": (_setup_copy, _run_add),
+    "edit": (_setup_copy, _run_edit),
+    "list": (_setup_list, _run_list),
+}
+
+
+def measure(fixture, operation, repeat=DEFAULT_REPEAT):
+    """Mesure le temps et la mémoire maximale d'une opération.
+
+    Le temps retenu est le meilleur de ``repeat`` exécutions ; la mémoire est
+    mesurée lors d'une exécution séparée, tracemalloc ralentissant le code.
+
+    Args:
+        fixture (Fixture): Les fichiers de tâches préparés.
+        operation (str): Nom de l'opération (clé de OPERATIONS).
+        repeat (int, optional): Nombre de mesures du temps. Defaults to DEFAULT_REPEAT.
+
+    Returns:
+        dict: ``{"seconds": float, "peak_bytes": int}``.
+    """
+    setup, run = OPERATIONS[operation]
+    best = float("inf")
+    for _ in range(repeat):
+        state = setup(fixture)
+        start = time.perf_counter()
+        run(fixture, state)
+        best = min(best, time.perf_counter() - start)
+    state = setup(fixture)
+    tracemalloc.start()
+    try:
+        run(fixture, state)
+        peak = tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+    return {"seconds": best, "peak_bytes": peak}
+
+
+def run_benchmarks(
+    sizes=DEFAULT_SIZES, operations=tuple(OPERATIONS), storage="json", repeat=DEFAULT_REPEAT
+):
+    """Mesure chaque opération pour chaque taille.
+
+    Args:
+        sizes (iterable[int], optional): Nombres de tâches. Defaults to DEFAULT_SIZES.
+        operations (iterable[str], optional): Opérations mesurées. Defaults to all.
+        storage (str, optional): Nom du backend de stockage. Defaults to "json".
+        repeat (int, optional): Nombre de mesures du temps. Defaults to DEFAULT_REPEAT.
+
+    Returns:
+        dict: Les résultats, ``{"meta": {...}, "results": {opération: {taille: mesure}}}``.
+    """
+    results = {operation: {} for operation in operations}
+    for size in sizes:
+        fixture = Fixture(storage, size)
+        try:
+            for operation in operations:
+                result = measure(fixture, operation, repeat)
+                results[operation][str(size)] = result
+                print(
+                    f"{operation:<12} {size:>9} tâches : {result['seconds']:.4f} s, "
+                    f"{result['peak_bytes'] / 1e6:.1f} Mo",
+                    file=sys.stderr,
+                )
+        finally:
+            fixture.cleanup()
+    return {
+        "meta": {
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "storage": storage,
+            "repeat": repeat,
+        },
+        "results": results,
+    }
+
+
+def compare(baseline, current, threshold=DEFAULT_THRESHOLD):
+    """Compare deux séries de résultats et liste les régressions.
+
+    Args:
+        baseline (dict): Résultats de référence (voir run_benchmarks).
+        current (dict): Nouveaux résultats.
+        threshold (float, optional): Hausse relative tolérée (0.25 pour 25 %).\
+              Defaults to DEFAULT_THRESHOLD.
+
+    Returns:
+        list[tuple[str, str, str, float, float]]: Régressions (opération, taille,\
+              mesure, valeur de référence, nouvelle valeur).
+    """
+    regressions = []
+    for operation, by_size in current["results"].items():
+        for size, result in by_size.items():
+            reference = baseline["results"].get(operation, {}).get(size)
+            if reference is None:
+                continue
+            for metric in ("seconds", "peak_bytes"):
+                if reference[metric] > 0 and result[metric] > reference[metric] * (
+                    1 + threshold
+                ):
+                    regressions.append(
+                        (operation, size, metric, reference[metric], result[metric])
+                    )
+    return regressions
+
+
+def _read(filename):
+    """Lit un fichier de résultats.
+
+    Args:
+        filename (str): Chemin du fichier JSON.
+
+    Returns:
+        dict: Les résultats.
+    """
+    with open(filename, "r", encoding="utf-8") as file:
+        return json.load(file)
+
+
+def build_parser():
+    """Construit l'analyseur des arguments du banc d'essai.
+
+    Returns:
+        argparse.ArgumentParser: L'analyseur, avec les commandes "run" et "compare".
+    """
+    parser = argparse.ArgumentParser(description="Banc d'essai du gestionnaire de tâches.")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+    for name in ("run", "compare"):
+        subparser = subparsers.add_parser(name)
+        subparser.add_argument("--sizes", type=int, nargs="+", default=list(DEFAULT_SIZES))
+        subparser.add_argument(
+            "--operations", nargs="+", choices=list(OPERATIONS), default=list(OPERATIONS)
+        )
+        subparser.add_argument("--storage", default="json")
+        subparser.add_argument("--repeat", type=int, default=DEFAULT_REPEAT)
+    run_parser, compare_parser = subparsers.choices["run"], subparsers.choices["compare"]
+    run_parser.add_argument(
+        "--output", default=DEFAULT_BASELINE, help="Fichier JSON des résultats"
+    )
+    compare_parser.add_argument("baseline", help="Fichier JSON de référence")
+    compare_parser.add_argument(
+        "--current", help="Fichier JSON à comparer (défaut: nouvelles mesures)"
+    )
+    compare_parser.add_argument(
+        "--threshold",
+        type=float,
+        default=DEFAULT_THRESHOLD,
+        help=f"Hausse relative tolérée (défaut: {DEFAULT_THRESHOLD})",
+    )
+    return parser
+
+
+def main(argv=None):
+    """Point d'entrée du banc d'essai.
+
+    Args:
+        argv (list[str], optional): Arguments à analyser. Defaults to sys.argv[1:].
+
+    Returns:
+        int: 0 si tout va bien, 1 si des régressions ont été détectées.
+    """
+    args = build_parser().parse_args(argv)
+    if args.command == "run":
+        results = run_benchmarks(args.sizes, args.operations, args.storage, args.repeat)
+        with open(args.output, "w", encoding="utf-8") as file:
+            json.dump(results, file, indent=4)
+        print(f"Résultats écrits dans {args.output}.")
+        return 0
+    baseline = _read(args.baseline)
+    if args.current:
+        current = _read(args.current)
+    else:
+        current = run_benchmarks(args.sizes, args.operations, args.storage, args.repeat)
+    regressions = compare(baseline, current, args.threshold)
+    for operation, size, metric, before, after in regressions:
+        print(
+            f"RÉGRESSION {operation} ({size} tâches) {metric} : "
+            f"{before:.4g} -> {after:.4g} (+{(after / before - 1) * 100:.0f} %)"
+        )
+    if not regressions:
+        print(f"Aucune régression au-delà de {args.threshold:.0%}.")
+    return 1 if regressions else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,335 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+Module load_test.
+
+Ce module mesure la latence et le débit de l'API HTTP (commande ``serve``) : des
+clients simultanés (coroutines asyncio, chacune avec sa connexion gardée ouverte)
+envoient un mélange de requêtes, et le rapport donne le nombre de requêtes par seconde
+et les latences p50, p99 et maximale :
+
+    read: GET /tasks/<id> d'une tâche existante.
+    list: GET /tasks?sort=priority&limit=20.
+    add: POST /tasks.
+    edit: PATCH /tasks/<id>.
+
+Sans ``--url``, le serveur est lancé dans un processus séparé (pour ne pas partager
+l'interpréteur avec les clients) sur un fichier temporaire de ``--tasks`` tâches
+synthétiques (voir benchmarks.bench.generate_tasks).
+
+Exemples :
+
+    python -m benchmarks.load_test --tasks 100000 --requests 20000 --concurrency 32
+    python -m benchmarks.load_test --url http://127.0.0.1:8080 --writes 0.2
+"""
+
+import argparse
+import asyncio
+import json
+import math
+import os
+import random
+import shutil
+import signal
+import socket
+import subprocess
+import sys
+import tempfile
+import time
+
+from urllib.parse import urlsplit
+
+from benchmarks.bench import FIRST_ID, generate_tasks
+from source import task_manager
+from source.storage import storage_class
+from source.task_store import TaskStore
+
+DEFAULT_TASKS = 10_000
+DEFAULT_REQUESTS = 5_000
+DEFAULT_CONCURRENCY = 16
+DEFAULT_WRITES = 0.1  # Part des requêtes qui modifient les tâches (add et edit)
+DEFAULT_LISTS = 0.1  # Part des requêtes "list" parmi les lectures
+STARTUP_TIMEOUT = 30.0  # Délai maximal (s) de démarrage du serveur lancé par le test
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def plan_requests(count, ids, writes=DEFAULT_WRITES, lists=DEFAULT_LISTS, seed=0):
+    """Prépare un mélange de requêtes de manière déterministe.
+
+    Args:
+        count (int): Nombre de requêtes.
+        ids (list[int]): Identifiants de tâches existantes.
+        writes (float, optional): Part des modifications. Defaults to DEFAULT_WRITES.
+        lists (float, optional): Part des listes parmi les lectures.\
+              Defaults to DEFAULT_LISTS.
+        seed (int, optional): Graine du générateur aléatoire. Defaults to 0.
+
+    Returns:
+        list[tuple[str, str, dict or None]]: Les requêtes (méthode, chemin, corps).
+    """
+    rng = random.Random(seed)
+    requests = []
+    for index in range(count):
+        task_id = rng.choice(ids)
+        if rng.random() < writes:
+            if rng.random() < 0.5:
+                requests.append(("POST", "/tasks", {"titre": f"Charge {index}"}))
+            else:
+                body = {"priorite": rng.randint(1, 5)}
+                requests.append(("PATCH", f"/tasks/{task_id}", body))
+        elif rng.random() < lists:
+            requests.append(("GET", "/tasks?sort=priority&limit=20", None))
+        else:
+            requests.append(("GET", f"/tasks/{task_id}", None))
+    return requests
+
+
+async def send(reader, writer, method, path, body=None):
+    """Envoie une requête HTTP/1.1 sur une connexion ouverte et lit la réponse.
+
+    Args:
+        reader (asyncio.StreamReader): Flux de lecture de la connexion.
+        writer (asyncio.StreamWriter): Flux d'écriture de la connexion.
+        method (str): La méthode.
+        path (str): Le chemin.
+        body (dict, optional): Le corps JSON. Defaults to None.
+
+    Returns:
+        tuple[int, bytes]: Le code HTTP et le corps de la réponse.
+    """
+    data = b"" if body is None else json.dumps(body).encode("utf-8")
+    head = (
+        f"{method} {path} HTTP/1.1\r\nHost: load-test\r\n"
+        f"Content-Type: application/json\r\nContent-Length: {len(data)}\r\n\r\n"
+    )
+    writer.write(head.encode("latin-1") + data)
+    await writer.drain()
+    status = int((await reader.readline()).split()[1])
+    length = 0
+    while True:
+        line = await reader.readline()
+        if line in (b"\r\n", b""):
+            break
+        name, _, value = line.partition(b":")
+        if name.strip().lower() == b"content-length":
+            length = int(value)
+    return status, await reader.readexactly(length)
+
+
+async def run_clients(host, port, requests, concurrency=DEFAULT_CONCURRENCY):
+    """Envoie les requêtes avec des clients simultanés et mesure chaque latence.
+
+    Args:
+        host (str): Adresse du serveur.
+        port (int): Port du serveur.
+        requests (list[tuple[str, str, dict or None]]): Les requêtes à envoyer.
+        concurrency (int, optional): Nombre de clients simultanés.\
+              Defaults to DEFAULT_CONCURRENCY.
+
+    Returns:
+        tuple[list[float], int, float]: Latences (s), nombre de réponses en erreur\
+              et durée totale (s).
+    """
+    pending = iter(requests)
+    latencies = []
+    errors = 0
+
+    async def client():
+        nonlocal errors
+        reader, writer = await asyncio.open_connection(host, port)
+        try:
+            for method, path, body in pending:
+                start = time.perf_counter()
+                status, _ = await send(reader, writer, method, path, body)
+                latencies.append(time.perf_counter() - start)
+                if status >= 400:
+                    errors += 1
+        finally:
+            writer.close()
+
+    start = time.perf_counter()
+    await asyncio.gather(*(client() for _ in range(concurrency)))
+    return latencies, errors, time.perf_counter() - start
+
+
+def percentile(values, rank):
+    """Retourne le centile d'une liste triée (méthode du rang le plus proche).
+
+    Args:
+        values (list[float]): Les valeurs, triées.
+        rank (float): Le centile, entre 0 et 100.
+
+    Returns:
+        float: La valeur du centile, 0 pour une liste vide.
+    """
+    if not values:
+        return 0.0
+    return values[max(math.ceil(rank / 100 * len(values)) - 1, 0)]
+
+
+def summarize(latencies, errors, seconds):
+    """Résume les mesures d'un test de charge.
+
+    Args:
+        latencies (list[float]): Latences (s) des requêtes.
+        errors (int): Nombre de réponses en erreur.
+        seconds (float): Durée totale (s).
+
+    Returns:
+        dict: Requêtes, erreurs, durée, requêtes par seconde et latences (ms).
+    """
+    latencies = sorted(latencies)
+    return {
+        "requests": len(latencies),
+        "errors": errors,
+        "seconds": seconds,
+        "requests_per_second": len(latencies) / seconds if seconds > 0 else 0.0,
+        "p50_ms": percentile(latencies, 50) * 1000,
+        "p99_ms": percentile(latencies, 99) * 1000,
+        "max_ms": (latencies[-1] if latencies else 0.0) * 1000,
+    }
+
+
+def _free_port():
+    """Retourne un port TCP local libre.
+
+    Returns:
+        int: Le port.
+    """
+    with socket.socket() as probe:
+        probe.bind(("127.0.0.1", 0))
+        return probe.getsockname()[1]
+
+
+def start_server(directory, size, storage="json", flush_interval=1.0):
+    """Écrit des tâches synthétiques et lance "serve" dans un processus séparé.
+
+    Args:
+        directory (str): Répertoire du fichier de tâches.
+        size (int): Nombre de tâches.
+        storage (str, optional): Nom du backend de stockage. Defaults to "json".
+        flush_interval (float, optional): Intervalle d'écriture du serveur.\
+              Defaults to 1.0.
+
+    Returns:
+        tuple[subprocess.Popen, int, list[int]]: Le processus, son port et les\
+              identifiants des tâches.
+
+    Raises:
+        RuntimeError: Si le serveur n'accepte pas de connexion à temps.
+    """
+    filename = os.path.join(directory, storage_class(storage).default_filename)
+    tasks = generate_tasks(size)
+    task_manager.save_tasks(TaskStore(tasks, meta={"next_id": FIRST_ID + size}), filename, storage)
+    port = _free_port()
+    command = [sys.executable, "-m", "source.task_manager", "--storage", storage]
+    command += ["--file", filename, "--id-width", "8", "serve", "--port", str(port)]
+    command += ["--flush-interval", str(flush_interval)]
+    env = dict(os.environ, PYTHONPATH=ROOT)
+    process = subprocess.Popen(command, cwd=ROOT, env=env, stdout=subprocess.DEVNULL)
+    deadline = time.monotonic() + STARTUP_TIMEOUT
+    while True:
+        try:
+            socket.create_connection(("127.0.0.1", port), timeout=1).close()
+            break
+        except OSError as exc:
+            if process.poll() is not None or time.monotonic() > deadline:
+                process.kill()
+                raise RuntimeError("Le serveur n'a pas démarré") from exc
+            time.sleep(0.05)
+    return process, port, [task.task_id for task in tasks]
+
+
+async def _known_ids(host, port):
+    """Lit les identifiants des premières tâches d'un serveur existant.
+
+    Args:
+        host (str): Adresse du serveur.
+        port (int): Port du serveur.
+
+    Returns:
+        list[int]: Les identifiants.
+    """
+    reader, writer = await asyncio.open_connection(host, port)
+    try:
+        _, body = await send(reader, writer, "GET", "/tasks?limit=1000")
+    finally:
+        writer.close()
+    return [task["task_id"] for task in json.loads(body)["tasks"]]
+
+
+def run_load_test(args):
+    """Exécute le test de charge décrit par les arguments.
+
+    Args:
+        args: Arguments analysés (voir build_parser).
+
+    Returns:
+        dict: Le résumé des mesures (voir summarize).
+    """
+    process = directory = None
+    if args.url:
+        parts = urlsplit(args.url)
+        host, port = parts.hostname, parts.port or 80
+        ids = asyncio.run(_known_ids(host, port)) or [0]
+    else:
+        directory = tempfile.mkdtemp(prefix="load-test-")
+        host = "127.0.0.1"
+        process, port, ids = start_server(
+            directory, args.tasks, args.storage, args.flush_interval
+        )
+    try:
+        requests = plan_requests(args.requests, ids, args.writes, args.lists)
+        result = summarize(*asyncio.run(run_clients(host, port, requests, args.concurrency)))
+    finally:
+        if process is not None:
+            process.send_signal(signal.SIGINT)  # Le serveur écrit son lot avant de quitter
+            process.wait()
+            shutil.rmtree(directory, ignore_errors=True)
+    return result
+
+
+def build_parser():
+    """Construit l'analyseur des arguments du test de charge.
+
+    Returns:
+        argparse.ArgumentParser: L'analyseur.
+    """
+    parser = argparse.ArgumentParser(description="Test de charge de l'API HTTP.")
+    parser.add_argument("--url", help="Serveur existant (défaut: serveur lancé par le test)")
+    parser.add_argument("--tasks", type=int, default=DEFAULT_TASKS)
+    parser.add_argument("--storage", default="json")
+    parser.add_argument("--flush-interval", type=float, default=1.0)
+    parser.add_argument("--requests", type=int, default=DEFAULT_REQUESTS)
+    parser.add_argument("--concurrency", type=int, default=DEFAULT_CONCURRENCY)
+    parser.add_argument("--writes", type=float, default=DEFAULT_WRITES)
+    parser.add_argument("--lists", type=float, default=DEFAULT_LISTS)
+    parser.add_argument("--output", help="Fichier JSON des résultats")
+    return parser
+
+
+def main(argv=None):
+    """Point d'entrée du test de charge.
+
+    Args:
+        argv (list[str], optional): Arguments à analyser. Defaults to sys.argv[1:].
+
+    Returns:
+        int: 0 si toutes les requêtes ont réussi, 1 sinon.
+    """
+    args = build_parser().parse_args(argv)
+    result = run_load_test(args)
+    print(
+        f"{result['requests']} requêtes en {result['seconds']:.2f} s "
+        f"({result['requests_per_second']:.0f} req/s), {result['errors']} erreur(s)\n"
+        f"latence p50 {result['p50_ms']:.2f} ms, p99 {result['p99_ms']:.2f} ms, "
+        f"max {result['max_ms']:.2f} ms"
+    )
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as file:
+            json.dump(result, file, indent=4)
+    return 1 if result["errors"] else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
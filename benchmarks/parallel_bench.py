@@ -0,0 +1,159 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+Module parallel_bench.
+
+Ce module mesure le chargement d'un grand fichier JSON Lines selon le nombre de
+processus de lecture (voir source.parallel_load) : pour chaque nombre de processus, il
+donne le meilleur temps, l'accélération par rapport à la lecture en série
+(``--workers 1``) et l'accélération par cœur (accélération / processus).
+
+Le fichier est généré une fois avec les tâches synthétiques de benchmarks.bench. Les
+nombres de processus par défaut vont de 1 au nombre de processeurs, par puissances
+de 2 ; au-delà du nombre de processeurs, aucune accélération n'est attendue.
+
+Exemple :
+
+    python -m benchmarks.parallel_bench --tasks 2000000 --workers 1 2 4 8
+"""
+
+import argparse
+import json
+import os
+import shutil
+import sys
+import tempfile
+import time
+
+from benchmarks.bench import DEFAULT_REPEAT, generate_tasks
+from source import parallel_load
+from source.jsonl_storage import JsonlStorage, iter_tasks
+
+DEFAULT_TASKS = 1_000_000
+
+
+def default_workers():
+    """Retourne les nombres de processus mesurés par défaut.
+
+    Returns:
+        list[int]: 1, 2, 4... jusqu'au nombre de processeurs (inclus).
+    """
+    cpus = os.cpu_count() or 1
+    counts = [1]
+    while counts[-1] * 2 <= cpus:
+        counts.append(counts[-1] * 2)
+    if counts[-1] != cpus:
+        counts.append(cpus)
+    return counts
+
+
+def load_with(filename, workers):
+    """Charge le fichier en série (1 processus) ou avec plusieurs processus.
+
+    Args:
+        filename (str): Chemin du fichier JSON Lines.
+        workers (int): Nombre de processus.
+
+    Returns:
+        list[Tache]: Les tâches.
+    """
+    if workers == 1:
+        return list(iter_tasks(filename))
+    return parallel_load.load(filename, workers)
+
+
+def run_benchmark(tasks=DEFAULT_TASKS, workers=None, repeat=DEFAULT_REPEAT):
+    """Mesure le chargement pour chaque nombre de processus.
+
+    Args:
+        tasks (int, optional): Nombre de tâches du fichier. Defaults to DEFAULT_TASKS.
+        workers (list[int], optional): Nombres de processus, en commençant par 1.\
+              Defaults to default_workers().
+        repeat (int, optional): Nombre de mesures, dont on garde la meilleure.\
+              Defaults to DEFAULT_REPEAT.
+
+    Returns:
+        dict: ``{"meta": {...}, "results": [{"workers", "seconds", "speedup",\
+              "speedup_per_core"}, ...]}``.
+
+    Raises:
+        AssertionError: Si une lecture parallèle diffère de la lecture en série.
+    """
+    workers = workers or default_workers()
+    directory = tempfile.mkdtemp(prefix="parallel-bench-")
+    try:
+        filename = os.path.join(directory, "tasks.jsonl")
+        JsonlStorage(filename).save(generate_tasks(tasks))
+        expected = None
+        results = []
+        for count in workers:
+            best = float("inf")
+            for _ in range(repeat):
+                start = time.perf_counter()
+                loaded = load_with(filename, count)
+                best = min(best, time.perf_counter() - start)
+            if expected is None:
+                expected = loaded
+            assert loaded == expected, f"Lecture différente avec {count} processus"
+            serial = results[0]["seconds"] if results else best
+            speedup = serial / best if best > 0 else 0.0
+            results.append(
+                {
+                    "workers": count,
+                    "seconds": best,
+                    "speedup": speedup,
+                    "speedup_per_core": speedup / count,
+                }
+            )
+        size = os.path.getsize(filename)
+    finally:
+        shutil.rmtree(directory, ignore_errors=True)
+    return {
+        "meta": {"tasks": tasks, "bytes": size, "cpus": os.cpu_count(), "repeat": repeat},
+        "results": results,
+    }
+
+
+def build_parser():
+    """Construit l'analyseur des arguments du banc d'essai.
+
+    Returns:
+        argparse.ArgumentParser: L'analyseur.
+    """
+    parser = argparse.ArgumentParser(
+        description="Chargement parallèle d'un fichier JSON Lines selon le nombre de processus."
+    )
+    parser.add_argument("--tasks", type=int, default=DEFAULT_TASKS)
+    parser.add_argument("--workers", type=int, nargs="+", help="Défaut : 1, 2, 4... processeurs")
+    parser.add_argument("--repeat", type=int, default=DEFAULT_REPEAT)
+    parser.add_argument("--output", help="Fichier JSON des résultats")
+    return parser
+
+
+def main(argv=None):
+    """Point d'entrée du banc d'essai.
+
+    Args:
+        argv (list[str], optional): Arguments à analyser. Defaults to sys.argv[1:].
+
+    Returns:
+        int: 0.
+    """
+    args = build_parser().parse_args(argv)
+    workers = sorted(set([1] + (args.workers or default_workers())))
+    results = run_benchmark(args.tasks, workers, args.repeat)
+    meta = results["meta"]
+    print(f"{meta['tasks']} tâches, {meta['bytes'] / 1e6:.1f} Mo, {meta['cpus']} processeur(s)")
+    for result in results["results"]:
+        print(
+            f"{result['workers']:>3} processus : {result['seconds']:.3f} s, "
+            f"accélération {result['speedup']:.2f}x ({result['speedup_per_core']:.2f} par cœur)"
+        )
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as file:
+            json.dump(results, file, indent=4)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,7 @@
+"""
+Package source.
+
+Application CLI de gestion de tâches.
+"""
+
+__version__ = "0.1"
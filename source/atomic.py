@@ -0,0 +1,186 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+Module atomic.
+
+Ce module écrit les fichiers de sauvegarde de manière atomique : le contenu est écrit
+dans un fichier temporaire voisin, synchronisé sur disque puis renommé par-dessus
+l'ancien fichier (``os.replace``). Une panne ou un disque plein pendant l'écriture
+laisse l'ancien fichier intact, jamais un fichier tronqué.
+
+Le niveau de durabilité (``--durability``) fixe le nombre de synchronisations :
+
+    off     Aucun fsync : le renommage reste atomique, mais les dernières écritures
+            peuvent être perdues en cas de coupure de courant.
+    normal  fsync du fichier avant le renommage (défaut).
+    full    fsync du fichier puis du répertoire, qui rend le renommage lui-même durable.
+
+Les écritures en mode ajout (journal, JSON Lines) sont suivies d'un fsync aux niveaux
+``normal`` et ``full`` ; un lot de modifications est écrit en une fois et ne coûte
+qu'une synchronisation. Une dernière ligne tronquée par une écriture interrompue
+est retirée avant l'ajout suivant (voir drop_torn_tail).
+"""
+
+import itertools
+import os
+
+# Niveau de durabilité -> description
+DURABILITY_LEVELS = {
+    "off": "Aucun fsync (renommage atomique seulement)",
+    "normal": "fsync du fichier avant le renommage",
+    "full": "fsync du fichier et du répertoire",
+}
+DEFAULT_DURABILITY = "normal"
+DURABILITY_ENV = "TASK_MANAGER_DURABILITY"  # Variable d'environnement du niveau par défaut
+TEMP_SUFFIX = ".tmp"  # Suffixe des fichiers temporaires, à côté du fichier écrit
+TAIL_CHUNK = 4096  # Octets lus à la fois pour trouver la fin de la dernière ligne
+
+_temp_numbers = itertools.count()
+
+
+def sync_directory(path):
+    """Synchronise un répertoire sur disque, pour rendre durable un renommage.
+
+    Sans effet sur les plateformes qui ne permettent pas d'ouvrir un répertoire.
+
+    Args:
+        path (str): Chemin du répertoire.
+    """
+    try:
+        descriptor = os.open(path, os.O_RDONLY)
+    except OSError:
+        return
+    try:
+        os.fsync(descriptor)
+    except OSError:
+        pass
+    finally:
+        os.close(descriptor)
+
+
+def sync(file, durability=DEFAULT_DURABILITY):
+    """Synchronise sur disque un fichier ouvert en mode ajout, selon la durabilité.
+
+    Args:
+        file: Le fichier ouvert.
+        durability (str, optional): Niveau de durabilité. Defaults to DEFAULT_DURABILITY.
+    """
+    if durability != "off":
+        file.flush()
+        os.fsync(file.fileno())
+
+
+def drop_torn_tail(path):
+    """Retire la dernière ligne tronquée d'un fichier de lignes, avant un ajout.
+
+    Une écriture en mode ajout interrompue laisse une ligne sans saut de ligne final ;
+    sans cette réparation, la ligne ajoutée ensuite y serait collée et illisible.
+    Le fichier est tronqué après son dernier saut de ligne.
+
+    Args:
+        path (str): Chemin du fichier (absent : rien n'est fait).
+    """
+    try:
+        file = open(path, "rb+")
+    except FileNotFoundError:
+        return
+    with file:
+        end = file.seek(0, os.SEEK_END)
+        position = end
+        while position > 0:
+            start = max(position - TAIL_CHUNK, 0)
+            file.seek(start)
+            newline = file.read(position - start).rfind(b"\n")
+            if newline >= 0:
+                position = start + newline + 1
+                break
+            position = start
+        if position != end:
+            file.truncate(position)
+
+
+def _discard(path):
+    """Supprime un fichier temporaire s'il existe.
+
+    Args:
+        path (str): Chemin du fichier.
+    """
+    try:
+        os.remove(path)
+    except FileNotFoundError:
+        pass
+
+
+class AtomicFile:
+    """Fichier remplacé atomiquement à la sortie d'un bloc ``with``.
+
+    Le bloc reçoit le fichier temporaire ouvert en écriture. Si le bloc lève une
+    exception, ou si l'écriture échoue (disque plein), le fichier temporaire est
+    supprimé et le fichier d'origine reste inchangé.
+
+    Attributes:
+        path (str): Chemin du fichier à remplacer.
+        durability (str): Niveau de durabilité (clé de DURABILITY_LEVELS).
+        temp_path (str): Chemin du fichier temporaire.
+    """
+
+    def __init__(self, path, durability=DEFAULT_DURABILITY, encoding="utf-8"):
+        """Initialise l'écriture sans ouvrir le fichier temporaire.
+
+        Args:
+            path (str): Chemin du fichier à remplacer.
+            durability (str, optional): Niveau de durabilité.\
+                  Defaults to DEFAULT_DURABILITY.
+            encoding (str, optional): Encodage du texte ; None pour écrire des octets.\
+                  Defaults to "utf-8".
+        """
+        self.path = path
+        self.durability = durability
+        self.encoding = encoding
+        self.temp_path = f"{path}.{os.getpid()}.{next(_temp_numbers)}{TEMP_SUFFIX}"
+        self._file = None
+
+    def __enter__(self):
+        """Ouvre le fichier temporaire, avec les permissions du fichier remplacé.
+
+        Returns:
+            io.TextIOWrapper or io.BufferedWriter: Le fichier temporaire ouvert en\
+                  écriture, en mode texte ou binaire selon l'encodage.
+        """
+        self._file = open(  # pylint: disable=consider-using-with
+            self.temp_path, "w" if self.encoding else "wb", encoding=self.encoding
+        )
+        try:
+            os.chmod(self.temp_path, os.stat(self.path).st_mode & 0o7777)
+        except OSError:
+            pass
+        return self._file
+
+    def __exit__(self, exc_type, *exc_info):
+        """Synchronise et renomme le fichier temporaire, ou le supprime en cas d'erreur.
+
+        Args:
+            exc_type (type or None): Type de l'exception levée dans le bloc.
+
+        Returns:
+            bool: False, l'exception éventuelle est propagée.
+        """
+        try:
+            try:
+                if exc_type is None:
+                    self._file.flush()
+                    if self.durability != "off":
+                        os.fsync(self._file.fileno())
+            finally:
+                self._file.close()
+            if exc_type is None:
+                os.replace(self.temp_path, self.path)
+        except BaseException:
+            _discard(self.temp_path)
+            raise
+        if exc_type is not None:
+            _discard(self.temp_path)
+            return False
+        if self.durability == "full":
+            sync_directory(os.path.dirname(os.path.abspath(self.path)))
+        return False
@@ -0,0 +1,426 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+Module binary_storage.
+
+Ce module fournit un backend de stockage binaire (``--storage binary``), lu par
+``mmap`` sans analyse du texte ni appel à ``Tache.from_dict`` :
+
+    en-tête     HEADER : signature, version, nombre de tâches, nombre d'identifiants,
+                position de la table des positions et de la table des identifiants
+    tâches      Une fiche par tâche : RECORD (drapeaux, identifiant, priorité, numéro
+                de jour de la date limite, longueurs du titre et de la description)
+                suivi du titre et de la description encodés en UTF-8 ; une date
+                limite en texte libre (ancien fichier, sans numéro de jour) suit,
+                précédée de sa longueur DATE_TEXT (drapeau HAS_DATE_TEXT)
+    positions   Position (8 octets) de chaque fiche, dans l'ordre des tâches
+    ids         Couples (identifiant, rang de la fiche) triés par identifiant
+
+Tous les entiers sont en petit-boutiste. Le nombre de tâches se lit dans l'en-tête,
+une tâche se trouve par son identifiant par dichotomie dans la table des identifiants,
+et ``list --limit`` ne lit que les fiches affichées. Les tâches chargées sont des
+LazyTache : seuls les champs numériques sont lus à la création, le titre, la
+description et la date limite sont décodés au premier accès.
+
+La conversion depuis et vers le JSON se fait avec la commande ``migrate`` (par exemple
+``migrate --to binary`` puis ``--storage binary migrate --to json``).
+"""
+
+import mmap
+import struct
+
+from datetime import date
+
+from source import timings
+from source.atomic import AtomicFile
+from source.storage import JsonStorage, StorageError
+from source.tache import Tache
+
+MAGIC = b"TMB1"  # Signature des fichiers binaires de tâches
+VERSION = 1  # Version du format
+
+# Signature, version, réservé, nombre de tâches, nombre d'identifiants, position de la
+# table des positions, position de la table des identifiants
+HEADER = struct.Struct("<4sHHIIQQ")
+# Drapeaux, identifiant, priorité, numéro de jour (0 sans date), longueur du titre,
+# longueur de la description
+RECORD = struct.Struct("<BqqiII")
+OFFSET = struct.Struct("<Q")
+ID_ENTRY = struct.Struct("<qI")
+DATE_TEXT = struct.Struct("<I")  # Longueur d'une date limite en texte libre
+
+HAS_ID = 1  # Drapeau : la tâche a un identifiant
+HAS_DESCRIPTION = 2  # Drapeau : la tâche a une description
+HAS_DATE_TEXT = 4  # Drapeau : la date limite est un texte libre, sans numéro de jour
+
+# Attributs de Tache, lus et écrits directement par LazyTache
+_TITRE = Tache.__dict__["titre"]
+_DESCRIPTION = Tache.__dict__["description"]
+_DATE_LIMITE = Tache.__dict__["_date_limite"]
+
+
+def encode_record(task):
+    """Encode une tâche en fiche binaire.
+
+    Args:
+        task (Tache): La tâche.
+
+    Returns:
+        bytes: La fiche (RECORD suivi du titre, de la description et, pour une date\
+              en texte libre, de la date).
+    """
+    titre = task.titre.encode("utf-8")
+    description = task.description
+    flags = 0 if task.task_id is None else HAS_ID
+    if description is not None:
+        flags |= HAS_DESCRIPTION
+        description = description.encode("utf-8")
+    else:
+        description = b""
+    date_text = b""
+    if task.date_limite is not None and task.date_ordinal is None:
+        flags |= HAS_DATE_TEXT
+        text = task.date_limite.encode("utf-8")
+        date_text = DATE_TEXT.pack(len(text)) + text
+    fixed = RECORD.pack(
+        flags,
+        task.task_id or 0,
+        task.priorite,
+        task.date_ordinal or 0,
+        len(titre),
+        len(description),
+    )
+    return fixed + titre + description + date_text
+
+
+def write_store(file, tasks, unchanged=None):
+    """Écrit des tâches au format binaire dans un fichier ouvert en écriture.
+
+    Args:
+        file (io.BufferedWriter): Le fichier, ouvert en mode binaire.
+        tasks (iterable[Tache]): Les tâches.
+        unchanged (callable, optional): Prédicat des LazyTache dont la fiche d'origine\
+              peut être recopiée telle quelle, sans décodage ni encodage.\
+              Defaults to None.
+
+    Returns:
+        int: Le nombre d'octets écrits.
+    """
+    file.write(bytes(HEADER.size))
+    offsets = []
+    ids = []
+    position = HEADER.size
+    for rank, task in enumerate(tasks):
+        if unchanged is not None and isinstance(task, LazyTache) and unchanged(task):
+            record = task.raw()
+        else:
+            record = encode_record(task)
+        file.write(record)
+        offsets.append(position)
+        position += len(record)
+        if task.task_id is not None:
+            ids.append((task.task_id, rank))
+    ids.sort()
+    table_offset = position
+    file.write(struct.pack(f"<{len(offsets)}Q", *offsets))
+    ids_offset = table_offset + OFFSET.size * len(offsets)
+    file.write(b"".join(ID_ENTRY.pack(task_id, rank) for task_id, rank in ids))
+    file.seek(0)
+    file.write(
+        HEADER.pack(
+            MAGIC, VERSION, 0, len(offsets), len(ids), table_offset, ids_offset
+        )
+    )
+    return ids_offset + ID_ENTRY.size * len(ids)
+
+
+class LazyTache(Tache):
+    """Tâche lue dans un fichier binaire, dont le texte est décodé à la demande.
+
+    Elle se comporte comme une Tache : les attributs peuvent être lus et modifiés.
+    """
+
+    __slots__ = ("_buffer", "_offset")
+
+    def __init__(self, buffer, offset):  # pylint: disable=super-init-not-called
+        """Lit les champs numériques d'une fiche, sans décoder le texte.
+
+        Args:
+            buffer (mmap.mmap): Le contenu du fichier.
+            offset (int): Position de la fiche.
+        """
+        flags, task_id, priorite, ordinal, _, _ = RECORD.unpack_from(buffer, offset)
+        self._buffer = buffer
+        self._offset = offset
+        self.task_id = task_id if flags & HAS_ID else None
+        self.priorite = priorite
+        self._ordinal = ordinal or None
+        if not flags & HAS_DESCRIPTION:
+            _DESCRIPTION.__set__(self, None)
+
+    def _text(self, skip, length):
+        """Décode un champ texte de la fiche.
+
+        Args:
+            skip (int): Nombre d'octets à sauter après RECORD.
+            length (int): Longueur du champ en octets.
+
+        Returns:
+            str: Le texte décodé.
+        """
+        start = self._offset + RECORD.size + skip
+        return str(self._buffer[start : start + length], "utf-8")
+
+    @property
+    def titre(self):
+        """str: Le titre, décodé au premier accès."""
+        try:
+            return _TITRE.__get__(self)
+        except AttributeError:
+            length = RECORD.unpack_from(self._buffer, self._offset)[4]
+            value = self._text(0, length)
+            _TITRE.__set__(self, value)
+            return value
+
+    @titre.setter
+    def titre(self, value):
+        _TITRE.__set__(self, value)
+
+    @property
+    def description(self):
+        """str or None: La description, décodée au premier accès."""
+        try:
+            return _DESCRIPTION.__get__(self)
+        except AttributeError:
+            _, _, _, _, skip, length = RECORD.unpack_from(self._buffer, self._offset)
+            value = self._text(skip, length)
+            _DESCRIPTION.__set__(self, value)
+            return value
+
+    @description.setter
+    def description(self, value):
+        _DESCRIPTION.__set__(self, value)
+
+    @property
+    def date_limite(self):
+        """str or None: La date limite, recalculée ou décodée au premier accès."""
+        try:
+            return _DATE_LIMITE.__get__(self)
+        except AttributeError:
+            ordinal = self._ordinal
+            if ordinal is not None:
+                value = date.fromordinal(ordinal).isoformat()
+            else:
+                value = self._date_text()
+            _DATE_LIMITE.__set__(self, value)
+            return value
+
+    @date_limite.setter
+    def date_limite(self, value):
+        Tache.date_limite.fset(self, value)
+
+    def _date_text(self):
+        """Décode la date limite en texte libre de la fiche.
+
+        Returns:
+            str or None: La date, ou None si la fiche n'en contient pas.
+        """
+        flags, _, _, _, title_length, description_length = RECORD.unpack_from(
+            self._buffer, self._offset
+        )
+        if not flags & HAS_DATE_TEXT:
+            return None
+        skip = title_length + description_length
+        (length,) = DATE_TEXT.unpack_from(self._buffer, self._offset + RECORD.size + skip)
+        return self._text(skip + DATE_TEXT.size, length)
+
+    def raw(self):
+        """Retourne la fiche d'origine, telle qu'elle est dans le fichier.
+
+        Returns:
+            bytes: La fiche.
+        """
+        flags, _, _, _, title_length, description_length = RECORD.unpack_from(
+            self._buffer, self._offset
+        )
+        end = self._offset + RECORD.size + title_length + description_length
+        if flags & HAS_DATE_TEXT:
+            end += DATE_TEXT.size + DATE_TEXT.unpack_from(self._buffer, end)[0]
+        return self._buffer[self._offset : end]
+
+
+class BinaryFile:
+    """Fichier binaire de tâches ouvert en lecture par ``mmap``.
+
+    Attributes:
+        count (int): Nombre de tâches.
+    """
+
+    def __init__(self, filename):
+        """Ouvre le fichier ; un fichier absent ou vide ne contient aucune tâche.
+
+        Args:
+            filename (str): Chemin du fichier.
+
+        Raises:
+            StorageError: Si le fichier n'est pas un fichier binaire de tâches valide.
+        """
+        self._buffer = b""
+        self.count = self._id_count = self._table_offset = self._ids_offset = 0
+        try:
+            with open(filename, "rb") as file:
+                # Le fichier est remplacé par renommage : la projection reste valide.
+                self._buffer = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+        except FileNotFoundError:
+            return
+        except ValueError:  # Fichier vide : mmap refuse une projection de taille nulle
+            return
+        if len(self._buffer) < HEADER.size:
+            raise StorageError(f"Fichier binaire tronqué : {filename}")
+        magic, version, _, count, id_count, table_offset, ids_offset = (
+            HEADER.unpack_from(self._buffer)
+        )
+        if magic != MAGIC or version != VERSION:
+            raise StorageError(f"{filename} n'est pas un fichier binaire de tâches")
+        if ids_offset + ID_ENTRY.size * id_count > len(self._buffer):
+            raise StorageError(f"Fichier binaire tronqué : {filename}")
+        self.count = count
+        self._id_count = id_count
+        self._table_offset = table_offset
+        self._ids_offset = ids_offset
+
+    def __len__(self):
+        """Retourne le nombre de tâches, lu dans l'en-tête.
+
+        Returns:
+            int: Le nombre de tâches.
+        """
+        return self.count
+
+    def task(self, rank):
+        """Retourne la tâche d'un rang donné.
+
+        Args:
+            rank (int): Rang de la tâche dans le fichier.
+
+        Returns:
+            LazyTache: La tâche.
+        """
+        offset = OFFSET.unpack_from(self._buffer, self._table_offset + OFFSET.size * rank)
+        return LazyTache(self._buffer, offset[0])
+
+    def __iter__(self):
+        """Produit les tâches dans l'ordre du fichier.
+
+        Yields:
+            LazyTache: Les tâches.
+        """
+        for rank in range(self.count):
+            yield self.task(rank)
+
+    def find(self, task_id):
+        """Cherche une tâche par identifiant, par dichotomie dans la table des identifiants.
+
+        Args:
+            task_id (int): Identifiant de la tâche.
+
+        Returns:
+            LazyTache or None: La tâche, ou None si elle n'existe pas.
+        """
+        low, high = 0, self._id_count
+        while low < high:
+            middle = (low + high) // 2
+            found, rank = ID_ENTRY.unpack_from(
+                self._buffer, self._ids_offset + ID_ENTRY.size * middle
+            )
+            if found == task_id:
+                return self.task(rank)
+            if found < task_id:
+                low = middle + 1
+            else:
+                high = middle
+        return None
+
+
+class BinaryStorage(JsonStorage):
+    """Stockage binaire lu par ``mmap`` (voir le format en tête du module).
+
+    Les métadonnées, les index triés et l'index de recherche sont sauvegardés dans les
+    mêmes fichiers voisins que le backend JSON.
+    """
+
+    default_filename = "tasks.bin"
+
+    def iter_tasks(self, sort=None):
+        """Produit les tâches une par une, sans décoder leur texte.
+
+        Args:
+            sort (str, optional): Ignoré, le tri est fait par l'appelant. Defaults to None.
+
+        Returns:
+            iterator[LazyTache]: Les tâches, dans l'ordre du fichier.
+        """
+        return iter(BinaryFile(self.filename))
+
+    def load(self, sort=None):
+        """Charge toutes les tâches.
+
+        Args:
+            sort (str, optional): Ignoré, le tri est fait par l'appelant. Defaults to None.
+
+        Returns:
+            list[LazyTache]: Les tâches.
+        """
+        return list(BinaryFile(self.filename))
+
+    def count(self):
+        """Retourne le nombre de tâches, lu dans l'en-tête du fichier.
+
+        Returns:
+            int: Le nombre de tâches.
+        """
+        return len(BinaryFile(self.filename))
+
+    def get_tasks(self, ids):
+        """Retourne des tâches par identifiant, par dichotomie dans le fichier.
+
+        Args:
+            ids (iterable[int]): Les identifiants.
+
+        Returns:
+            list[LazyTache]: Les tâches trouvées, dans l'ordre des identifiants.
+        """
+        binary = BinaryFile(self.filename)
+        tasks = (binary.find(task_id) for task_id in ids)
+        return [task for task in tasks if task is not None]
+
+    def save(self, tasks):
+        """Réécrit le fichier binaire complet.
+
+        Args:
+            tasks (iterable[Tache]): Tâches à sauvegarder.
+        """
+        self._write(tasks)
+        self.save_indexes(tasks)
+
+    def apply(self, tasks, changes):
+        """Réécrit le fichier en recopiant telles quelles les fiches non modifiées.
+
+        Args:
+            tasks (iterable[Tache]): Tâches après modification.
+            changes (list[tuple[str, Tache]]): Modifications (opération, tâche).
+        """
+        current = self.current_indexes()
+        changed = {task.task_id for _, task in changes}
+        self._write(tasks, lambda task: task.task_id not in changed)
+        self.save_indexes(tasks, current, changes)
+
+    def _write(self, tasks, unchanged=None):
+        """Remplace atomiquement le fichier binaire.
+
+        Args:
+            tasks (iterable[Tache]): Tâches à écrire.
+            unchanged (callable, optional): Voir write_store. Defaults to None.
+        """
+        with AtomicFile(self.filename, self.durability, encoding=None) as file:
+            timings.count("bytes_written", write_store(file, tasks, unchanged))
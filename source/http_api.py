@@ -0,0 +1,501 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+Module http_api.
+
+Ce module fournit le mode ``serve`` : un serveur HTTP local, écrit avec ``asyncio`` et
+la seule bibliothèque standard, qui permet à des tableaux de bord ou des robots de
+consulter et modifier les tâches en JSON sans lancer un processus Python par requête.
+
+    GET    /tasks         Liste des tâches, avec les paramètres de "list" (sort,
+                          limit, offset, where, due_before, due_after, overdue, count).
+    GET    /tasks/<id>    Une tâche.
+    POST   /tasks         Ajoute une tâche : {"titre": ..., "description": ...,
+                          "priorite": ..., "date_limite": ...}.
+    PATCH  /tasks/<id>    Modifie une tâche (mêmes champs, tous facultatifs).
+    DELETE /tasks/<id>    Supprime une tâche.
+
+Les tâches sont chargées une seule fois dans une Session (voir source.shell), comme en
+mode démon. Les paramètres et les champs sont traduits en options de la commande
+correspondante et validés par l'analyseur de la ligne de commande ; la commande est
+ensuite exécutée par les mêmes fonctions que la CLI (list_page, add_task, edit_task,
+remove_task).
+
+Les lectures sont servies directement depuis la mémoire. Les modifications passent par
+une file traitée par une seule coroutine d'écriture, qui les applique l'une après
+l'autre et les accumule dans le lot de la session ; le lot est écrit sur disque au plus
+une fois par intervalle (``--flush-interval``), dans un thread, sans bloquer les
+lectures. Les connexions HTTP/1.1 sont gardées ouvertes entre deux requêtes.
+"""
+
+import asyncio
+import contextlib
+import io
+import json
+import sys
+import threading
+
+from http import HTTPStatus
+from urllib.parse import parse_qsl
+
+from source.locking import ConflictError
+from source.storage import StorageError
+from source.task_manager import (
+    add_task,
+    edit_task,
+    list_count,
+    list_page,
+    remove_task,
+)
+
+MAX_BODY_SIZE = 1024 * 1024  # Taille maximale (octets) du corps d'une requête
+POLL_INTERVAL = 0.5  # Délai (s) entre deux vérifications du lot en attente
+
+# Champ JSON d'une tâche -> option des commandes "add" et "edit"
+FIELD_OPTIONS = {
+    "titre": "--title",
+    "description": "--desc",
+    "priorite": "--priority",
+    "date_limite": "--due",
+}
+# Paramètres de "GET /tasks" qui sont des options sans valeur de "list"
+FLAG_PARAMETERS = ("overdue", "count")
+
+
+class HttpError(Exception):
+    """Erreur renvoyée au client avec un code HTTP.
+
+    Attributes:
+        status (int): Le code HTTP.
+    """
+
+    def __init__(self, status, message):
+        """Initialise l'erreur.
+
+        Args:
+            status (int): Le code HTTP.
+            message (str): Le message renvoyé au client.
+        """
+        super().__init__(message)
+        self.status = status
+
+
+class Request:
+    """Requête HTTP lue sur une connexion.
+
+    Attributes:
+        method (str): La méthode (GET, POST...).
+        path (str): Le chemin, sans la chaîne de requête.
+        query (str): La chaîne de requête.
+        body (bytes): Le corps de la requête.
+        keep_alive (bool): True si la connexion reste ouverte après la réponse.
+    """
+
+    __slots__ = ("method", "path", "query", "body", "keep_alive")
+
+    def __init__(self, method, target, headers, body, version):
+        """Initialise la requête.
+
+        Args:
+            method (str): La méthode.
+            target (str): La cible, chemin et chaîne de requête.
+            headers (dict[str, str]): Les en-têtes, noms en minuscules.
+            body (bytes): Le corps.
+            version (str): La version du protocole, par exemple "HTTP/1.1".
+        """
+        self.method = method
+        self.path, _, self.query = target.partition("?")
+        self.body = body
+        connection = headers.get("connection", "").lower()
+        if version == "HTTP/1.0":
+            self.keep_alive = connection == "keep-alive"
+        else:
+            self.keep_alive = connection != "close"
+
+
+async def read_request(reader):
+    """Lit une requête HTTP.
+
+    Args:
+        reader (asyncio.StreamReader): Le flux de la connexion.
+
+    Returns:
+        Request or None: La requête, ou None si le client a fermé la connexion.
+
+    Raises:
+        HttpError: Si la requête est invalide ou son corps trop grand.
+    """
+    line = await reader.readline()
+    if not line:
+        return None
+    try:
+        method, target, version = line.decode("latin-1").split()
+    except ValueError as exc:
+        raise HttpError(HTTPStatus.BAD_REQUEST, "Ligne de requête invalide") from exc
+    headers = {}
+    while True:
+        line = await reader.readline()
+        if line in (b"\r\n", b"\n", b""):
+            break
+        name, _, value = line.decode("latin-1").partition(":")
+        headers[name.strip().lower()] = value.strip()
+    try:
+        length = int(headers.get("content-length", 0))
+    except ValueError as exc:
+        raise HttpError(HTTPStatus.BAD_REQUEST, "Content-Length invalide") from exc
+    if length > MAX_BODY_SIZE:
+        raise HttpError(HTTPStatus.REQUEST_ENTITY_TOO_LARGE, "Corps trop grand")
+    body = await reader.readexactly(length) if length > 0 else b""
+    return Request(method, target, headers, body, version)
+
+
+def encode_response(status, payload=None, keep_alive=True):
+    """Encode une réponse HTTP dont le corps est un document JSON.
+
+    Args:
+        status (int): Le code HTTP.
+        payload (object, optional): Le document JSON ; None pour un corps vide.\
+              Defaults to None.
+        keep_alive (bool, optional): Garde la connexion ouverte. Defaults to True.
+
+    Returns:
+        bytes: La réponse, en-têtes et corps.
+    """
+    body = b""
+    if payload is not None:
+        body = json.dumps(payload, ensure_ascii=False).encode("utf-8")
+    head = (
+        f"HTTP/1.1 {int(status)} {HTTPStatus(status).phrase}\r\n"
+        "Content-Type: application/json; charset=utf-8\r\n"
+        f"Content-Length: {len(body)}\r\n"
+        f"Connection: {'keep-alive' if keep_alive else 'close'}\r\n\r\n"
+    )
+    return head.encode("latin-1") + body
+
+
+def _task_id(text):
+    """Convertit l'identifiant d'un chemin ``/tasks/<id>``.
+
+    Args:
+        text (str): Le dernier élément du chemin.
+
+    Returns:
+        int: L'identifiant.
+
+    Raises:
+        HttpError: Si ce n'est pas un entier.
+    """
+    try:
+        return int(text)
+    except ValueError as exc:
+        raise HttpError(HTTPStatus.NOT_FOUND, f"Tâche inconnue : {text}") from exc
+
+
+def _field_tokens(body, required=()):
+    """Traduit le corps JSON d'une requête en options de "add" ou "edit".
+
+    Args:
+        body (bytes): Le corps de la requête, un objet JSON.
+        required (tuple[str], optional): Champs obligatoires. Defaults to ().
+
+    Returns:
+        list[str]: Les options, sous la forme ``--option=valeur``.
+
+    Raises:
+        HttpError: Si le corps n'est pas un objet JSON, contient un champ inconnu ou\
+              nul, ou s'il manque un champ obligatoire.
+    """
+    try:
+        fields = json.loads(body or b"{}")
+    except ValueError as exc:
+        raise HttpError(HTTPStatus.BAD_REQUEST, f"JSON invalide : {exc}") from exc
+    if not isinstance(fields, dict):
+        raise HttpError(HTTPStatus.BAD_REQUEST, "Le corps doit être un objet JSON")
+    tokens = []
+    for name in required:
+        if name not in fields:
+            raise HttpError(HTTPStatus.BAD_REQUEST, f"Champ obligatoire : {name}")
+    for name, value in fields.items():
+        if name not in FIELD_OPTIONS:
+            raise HttpError(HTTPStatus.BAD_REQUEST, f"Champ inconnu : {name}")
+        if value is None or isinstance(value, (dict, list)):
+            raise HttpError(HTTPStatus.BAD_REQUEST, f"Valeur invalide pour {name}")
+        # "--option=valeur" : une valeur commençant par "-" n'est pas prise pour une option
+        tokens.append(f"{FIELD_OPTIONS[name]}={value}")
+    return tokens
+
+
+def _add(args, tasks):
+    """Ajoute une tâche (commande "add").
+
+    Args:
+        args: Arguments de la commande.
+        tasks (TaskStore): Les tâches en mémoire.
+
+    Returns:
+        tuple[int, object]: Le code HTTP et le document JSON.
+    """
+    try:
+        task = add_task(args, tasks)
+    except ValueError as exc:
+        return HTTPStatus.CONFLICT, {"erreur": str(exc)}
+    return HTTPStatus.CREATED, task.to_dict()
+
+
+def _edit(args, tasks):
+    """Modifie une tâche (commande "edit").
+
+    Args:
+        args: Arguments de la commande.
+        tasks (TaskStore): Les tâches en mémoire.
+
+    Returns:
+        tuple[int, object]: Le code HTTP et le document JSON.
+    """
+    task = tasks.get(int(args.id))
+    if task is None:
+        return HTTPStatus.NOT_FOUND, {"erreur": f"Tâche inconnue : {args.id}"}
+    edit_task(args, tasks, task)
+    return HTTPStatus.OK, task.to_dict()
+
+
+def _remove(args, tasks):
+    """Supprime une tâche (commande "remove").
+
+    Args:
+        args: Arguments de la commande.
+        tasks (TaskStore): Les tâches en mémoire.
+
+    Returns:
+        tuple[int, object]: Le code HTTP et le document JSON.
+    """
+    if remove_task(args, tasks, int(args.id)) is None:
+        return HTTPStatus.NOT_FOUND, {"erreur": f"Tâche inconnue : {args.id}"}
+    return HTTPStatus.NO_CONTENT, None
+
+
+class ApiServer:
+    """Serveur HTTP de l'API des tâches, partageant une Session en mémoire.
+
+    Attributes:
+        session (Session): La session : tâches en mémoire et lot en attente.
+        port (int or None): Le port d'écoute, connu une fois le serveur démarré.
+        ready (threading.Event): Signalé quand le serveur accepte des connexions.
+    """
+
+    def __init__(self, session):
+        """Initialise le serveur.
+
+        Args:
+            session (Session): La session.
+        """
+        self.session = session
+        self.port = None
+        self.ready = threading.Event()
+        self._loop = None
+        self._queue = None
+        self._stopped = None
+        self._connections = {}  # Tâche asyncio de chaque connexion -> son flux d'écriture
+
+    def run(self, host, port):
+        """Sert les requêtes jusqu'à l'arrêt (Ctrl+C ou stop), puis écrit le lot.
+
+        Args:
+            host (str): Adresse d'écoute.
+            port (int): Port d'écoute ; 0 pour un port libre.
+        """
+        try:
+            asyncio.run(self._serve(host, port))
+        except KeyboardInterrupt:
+            pass
+        finally:
+            self.session.flush()
+
+    def stop(self):
+        """Demande l'arrêt du serveur ; peut être appelée depuis un autre thread."""
+        if self._loop is not None:
+            self._loop.call_soon_threadsafe(self._stopped.set)
+
+    async def _serve(self, host, port):
+        """Démarre le serveur et la coroutine d'écriture, puis attend l'arrêt.
+
+        Args:
+            host (str): Adresse d'écoute.
+            port (int): Port d'écoute.
+        """
+        self._loop = asyncio.get_running_loop()
+        self._queue = asyncio.Queue()
+        self._stopped = asyncio.Event()
+        server = await asyncio.start_server(self._handle_connection, host, port)
+        self.port = server.sockets[0].getsockname()[1]
+        writer = asyncio.create_task(self._write_loop())
+        self.ready.set()
+        try:
+            await self._stopped.wait()
+        finally:
+            server.close()
+            # Les modifications déjà reçues sont appliquées avant l'écriture finale,
+            # puis les connexions ouvertes sont fermées (fin de flux, pas d'annulation).
+            await self._queue.join()
+            for connection in self._connections.values():
+                connection.close()
+            await asyncio.gather(*self._connections, return_exceptions=True)
+            writer.cancel()
+
+    async def _write_loop(self):
+        """Applique les modifications de la file, une à la fois, et écrit le lot."""
+        while True:
+            try:
+                func, args, future = await asyncio.wait_for(
+                    self._queue.get(), POLL_INTERVAL
+                )
+            except asyncio.TimeoutError:
+                pass
+            else:
+                try:
+                    future.set_result(func(args, self.session.tasks))
+                except Exception as exc:  # pylint: disable=broad-exception-caught
+                    future.set_exception(exc)
+                finally:
+                    self._queue.task_done()
+                if not self._queue.empty():
+                    continue
+            if self.session.flush_due():
+                try:
+                    # Les lectures continuent pendant l'écriture ; les modifications
+                    # attendent dans la file.
+                    await self._loop.run_in_executor(None, self.session.flush)
+                except (ConflictError, StorageError, OSError) as exc:
+                    print(f"Écriture impossible : {exc}", file=sys.stderr)
+
+    async def _handle_connection(self, reader, writer):
+        """Traite les requêtes d'une connexion jusqu'à sa fermeture.
+
+        Args:
+            reader (asyncio.StreamReader): Flux de lecture de la connexion.
+            writer (asyncio.StreamWriter): Flux d'écriture de la connexion.
+        """
+        self._connections[asyncio.current_task()] = writer
+        try:
+            while True:
+                try:
+                    request = await read_request(reader)
+                except HttpError as exc:
+                    writer.write(encode_response(exc.status, {"erreur": str(exc)}, False))
+                    await writer.drain()
+                    break
+                if request is None:
+                    break
+                try:
+                    status, payload = await self.dispatch(request)
+                except HttpError as exc:
+                    status, payload = exc.status, {"erreur": str(exc)}
+                writer.write(encode_response(status, payload, request.keep_alive))
+                await writer.drain()
+                if not request.keep_alive:
+                    break
+        except (ConnectionError, asyncio.IncompleteReadError):
+            pass
+        finally:
+            del self._connections[asyncio.current_task()]
+            writer.close()
+
+    async def dispatch(self, request):
+        """Exécute une requête.
+
+        Args:
+            request (Request): La requête.
+
+        Returns:
+            tuple[int, object]: Le code HTTP et le document JSON (ou None).
+
+        Raises:
+            HttpError: Si la ressource ou la méthode est inconnue, ou la requête invalide.
+        """
+        parts = request.path.strip("/").split("/")
+        if parts[0] != "tasks" or len(parts) > 2:
+            raise HttpError(HTTPStatus.NOT_FOUND, f"Ressource inconnue : {request.path}")
+        method = request.method
+        if len(parts) == 1:
+            if method == "GET":
+                return self.list_tasks(request.query)
+            if method == "POST":
+                tokens = ["add"] + _field_tokens(request.body, required=("titre",))
+                return await self.submit(_add, tokens)
+        else:
+            task_id = _task_id(parts[1])
+            if method == "GET":
+                task = self.session.tasks.get(task_id)
+                if task is None:
+                    raise HttpError(HTTPStatus.NOT_FOUND, f"Tâche inconnue : {task_id}")
+                return HTTPStatus.OK, task.to_dict()
+            if method == "PATCH":
+                tokens = ["edit", "--id", str(task_id)] + _field_tokens(request.body)
+                return await self.submit(_edit, tokens)
+            if method == "DELETE":
+                return await self.submit(_remove, ["remove", "--id", str(task_id)])
+        raise HttpError(HTTPStatus.METHOD_NOT_ALLOWED, f"Méthode non permise : {method}")
+
+    def list_tasks(self, query):
+        """Exécute "list" avec les paramètres d'une requête ``GET /tasks``.
+
+        Args:
+            query (str): La chaîne de requête, par exemple ``sort=priority&limit=20``.
+
+        Returns:
+            tuple[int, object]: Le code HTTP et ``{"tasks": [...]}`` (ou\
+                  ``{"count": n}`` avec le paramètre count).
+
+        Raises:
+            HttpError: Si un paramètre est inconnu ou invalide.
+        """
+        tokens = ["list"]
+        for name, value in parse_qsl(query, keep_blank_values=True):
+            tokens.append("--" + name.replace("_", "-"))
+            if name not in FLAG_PARAMETERS:
+                tokens.append(value)
+        args = self.parse(tokens)
+        tasks = self.session.tasks
+        if args.count:
+            count = list_count(args, tasks)
+            if count is None:
+                count = sum(1 for _ in list_page(args, tasks))
+            return HTTPStatus.OK, {"count": count}
+        return HTTPStatus.OK, {"tasks": [task.to_dict() for task in list_page(args, tasks)]}
+
+    def parse(self, tokens):
+        """Analyse une commande avec l'analyseur de la ligne de commande.
+
+        Args:
+            tokens (list[str]): La commande découpée.
+
+        Returns:
+            argparse.Namespace: Les arguments de la commande.
+
+        Raises:
+            HttpError: Si la commande est invalide, avec le message de l'analyseur.
+        """
+        output = io.StringIO()
+        with contextlib.redirect_stdout(output), contextlib.redirect_stderr(output):
+            args = self.session.prepare(tokens)
+        if args is None:
+            lines = output.getvalue().strip().splitlines() or [""]
+            # Dernière ligne de l'analyseur : "usage ... : error: <message>"
+            message = lines[-1].partition("error: ")
+            raise HttpError(HTTPStatus.BAD_REQUEST, message[2] or message[0])
+        return args
+
+    async def submit(self, func, tokens):
+        """Confie une modification à la coroutine d'écriture et attend son résultat.
+
+        Args:
+            func (callable): Fonction ``func(args, tasks)`` qui applique la modification.
+            tokens (list[str]): La commande découpée.
+
+        Returns:
+            tuple[int, object]: Le code HTTP et le document JSON.
+        """
+        args = self.parse(tokens)
+        future = self._loop.create_future()
+        await self._queue.put((func, args, future))
+        return await future
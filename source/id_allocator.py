@@ -0,0 +1,80 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+Module id_allocator.
+
+Ce module définit la classe IdAllocator qui attribue des identifiants de tâches
+de manière déterministe, sans tirage aléatoire.
+
+L'allocateur conserve un curseur (le prochain identifiant candidat) enregistré dans
+les métadonnées du stockage. Les identifiants déjà utilisés (par exemple ceux tirés
+au hasard par les anciennes versions) sont sautés une seule fois, car le curseur
+ne recule jamais : l'attribution est donc en temps constant amorti, sans boucle
+infinie lorsque l'espace des identifiants est épuisé.
+"""
+
+DEFAULT_ID_WIDTH = 6  # Nombre de chiffres des identifiants par défaut
+
+
+class IdAllocator:
+    """Attribue des identifiants croissants d'un nombre de chiffres fixé.
+
+    Attributes:
+        width (int): Nombre de chiffres des identifiants.
+        next_id (int): Prochain identifiant candidat.
+    """
+
+    def __init__(self, width=DEFAULT_ID_WIDTH, next_id=None):
+        """Initialise l'allocateur.
+
+        Args:
+            width (int, optional): Nombre de chiffres des identifiants.\
+                  Defaults to DEFAULT_ID_WIDTH.
+            next_id (int, optional): Curseur issu des métadonnées du stockage.\
+                  Defaults to the smallest identifier of the given width.
+
+        Raises:
+            ValueError: Si la largeur est inférieure à 1.
+        """
+        if width < 1:
+            raise ValueError("La largeur des identifiants doit être au moins 1.")
+        self.width = width
+        self.next_id = max(next_id or 0, self.first)
+
+    @property
+    def first(self):
+        """int: Le plus petit identifiant de la largeur choisie."""
+        return 10 ** (self.width - 1)
+
+    @property
+    def last(self):
+        """int: Le plus grand identifiant de la largeur choisie."""
+        return 10**self.width - 1
+
+    def allocate(self, count=1, used=()):
+        """Attribue un ou plusieurs identifiants consécutifs disponibles.
+
+        Args:
+            count (int, optional): Nombre d'identifiants à attribuer. Defaults to 1.
+            used (Container[int], optional): Identifiants déjà utilisés, à sauter.\
+                  Defaults to ().
+
+        Returns:
+            list[int]: Les identifiants attribués, dans l'ordre croissant.
+
+        Raises:
+            ValueError: Si l'espace des identifiants de cette largeur est épuisé.
+        """
+        ids = []
+        candidate = self.next_id
+        while len(ids) < count:
+            if candidate > self.last:
+                raise ValueError(
+                    f"Plus aucun identifiant disponible sur {self.width} chiffres ;"
+                    " augmentez --id-width."
+                )
+            if candidate not in used:
+                ids.append(candidate)
+            candidate += 1
+        self.next_id = candidate
+        return ids
@@ -0,0 +1,145 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+Module importer.
+
+Ce module permet d'importer en masse des tâches depuis un fichier CSV ou JSON Lines.
+
+Les lignes sont lues et validées en flux ; les identifiants des tâches valides sont
+attribués en un seul lot, puis les tâches sont ajoutées à la collection. L'appelant
+n'a ensuite qu'une seule sauvegarde à effectuer.
+
+Les colonnes (CSV) ou clés (JSON Lines) reconnues sont celles de Tache.to_dict :
+titre (obligatoire), description, priorite et date_limite. Un éventuel task_id est
+ignoré : un nouvel identifiant est attribué à chaque tâche importée.
+"""
+
+import csv
+import json
+
+from source.id_allocator import DEFAULT_ID_WIDTH
+from source.tache import Tache, parse_date
+
+FORMATS = ("csv", "jsonl")
+
+
+def detect_format(filename):
+    """Déduit le format d'import de l'extension du fichier.
+
+    Args:
+        filename (str): Chemin du fichier ("-" pour l'entrée standard).
+
+    Returns:
+        str: "csv" pour un fichier .csv, "jsonl" sinon.
+    """
+    return "csv" if filename.lower().endswith(".csv") else "jsonl"
+
+
+def read_rows(file, fmt):
+    """Lit les lignes d'un fichier d'import une par une.
+
+    Args:
+        file (TextIO): Fichier ouvert en lecture.
+        fmt (str): Format du fichier ("csv" ou "jsonl").
+
+    Yields:
+        tuple[int, dict or None, str or None]: Numéro de ligne, données de la ligne\
+              et message d'erreur si la ligne n'a pas pu être décodée.
+    """
+    if fmt == "csv":
+        reader = csv.DictReader(file)
+        while True:
+            try:
+                row = next(reader)
+            except StopIteration:
+                return
+            except csv.Error as exc:
+                # Ligne illisible (champ trop long...) : la lecture reprend à la suivante.
+                # DictReader.line_num n'est mis à jour qu'après une ligne lue sans erreur.
+                yield reader.reader.line_num, None, f"CSV invalide ({exc})"
+                continue
+            yield reader.line_num, row, None
+    for line_number, line in enumerate(file, start=1):
+        if not line.strip():
+            continue
+        try:
+            row = json.loads(line)
+        except json.JSONDecodeError:
+            yield line_number, None, "JSON invalide"
+            continue
+        if not isinstance(row, dict):
+            yield line_number, None, "objet JSON attendu"
+            continue
+        yield line_number, row, None
+
+
+def validate_row(row):
+    """Valide une ligne d'import et construit la tâche correspondante.
+
+    Les valeurs vides sont considérées comme absentes.
+
+    Args:
+        row (dict): Données de la ligne.
+
+    Returns:
+        Tache: La tâche, sans identifiant.
+
+    Raises:
+        ValueError: Si le titre est absent ou n'est pas une chaîne, si la description\
+              n'est pas une chaîne, si la priorité n'est pas un entier (un nombre\
+              décimal ou un booléen est refusé) ou si la date limite n'est pas au\
+              format YYYY-MM-DD.
+    """
+    titre = row.get("titre")
+    if not titre:
+        raise ValueError("titre manquant")
+    if not isinstance(titre, str):
+        raise ValueError(f"titre invalide : {titre!r}")
+    description = row.get("description")
+    if description in (None, ""):
+        description = None
+    elif not isinstance(description, str):
+        raise ValueError(f"description invalide : {description!r}")
+    priorite = row.get("priorite")
+    if priorite in (None, ""):
+        priorite = 1
+    # int() tronquerait un nombre décimal et accepterait un booléen
+    if isinstance(priorite, bool) or not isinstance(priorite, (int, str)):
+        raise ValueError(f"priorité invalide : {priorite!r}")
+    try:
+        priorite = int(priorite)
+    except ValueError as exc:
+        raise ValueError(f"priorité invalide : {priorite!r}") from exc
+    date_limite = row.get("date_limite") or None
+    parse_date(date_limite)
+    return Tache(titre, description, priorite, date_limite)
+
+
+def import_tasks(file, fmt, tasks, width=DEFAULT_ID_WIDTH):
+    """Importe les tâches d'un fichier dans une collection.
+
+    Args:
+        file (TextIO): Fichier ouvert en lecture.
+        fmt (str): Format du fichier ("csv" ou "jsonl").
+        tasks (TaskStore): Collection dans laquelle ajouter les tâches.
+        width (int, optional): Nombre de chiffres des identifiants.\
+              Defaults to DEFAULT_ID_WIDTH.
+
+    Returns:
+        tuple[list[Tache], list[tuple[int, str]]]: Tâches importées et liste des\
+              lignes rejetées (numéro de ligne, raison).
+    """
+    valid = []
+    rejected = []
+    for line_number, row, error in read_rows(file, fmt):
+        if error is None:
+            try:
+                valid.append(validate_row(row))
+                continue
+            except ValueError as exc:
+                error = str(exc)
+        rejected.append((line_number, error))
+    for task, task_id in zip(valid, tasks.allocate_ids(len(valid), width)):
+        task.task_id = task_id
+        tasks.add(task)
+    return valid, rejected
@@ -0,0 +1,256 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+Module index_log.
+
+Ce module fournit le format commun des index sauvegardés à côté du fichier des tâches
+(voir source.sorted_index et source.search_index) : une base binaire, lue par ``mmap``
+sans être décodée en entier, et un journal des modifications en mode ajout seul.
+
+    base        ``<index>`` : en-tête BASE_HEADER (signature du format, version,
+                longueur de la signature des données) suivi de la signature des
+                fichiers de données (JSON) puis des données propres à l'index
+    journal     ``<index>.log`` : une ligne JSON par tâche modifiée depuis la base,
+                puis, après chaque écriture, une ligne ``{"signature": ...}``
+
+Une écriture incrémentale ne lit pas l'index : elle vérifie la dernière signature
+(fin du journal, sinon en-tête de la base) puis ajoute ses lignes au journal. Lorsque
+le journal dépasserait COMPACT_RATIO fois la taille de la base, l'index est reconstruit
+à partir des tâches et le journal supprimé. L'index est reconstructible : ses fichiers
+sont écrits sans fsync.
+
+Un index dont la dernière signature ne correspond pas aux fichiers de données
+(modification hors de l'application, écriture interrompue) est périmé et ignoré.
+"""
+
+import json
+import os
+import struct
+import sys
+
+from array import array
+
+LOG_SUFFIX = ".log"  # Suffixe du journal, à côté de la base de l'index
+BASE_HEADER = struct.Struct("<4sHHI")  # Signature, version, réservé, longueur de la signature
+COMPACT_RATIO = 0.25  # Taille maximale du journal, en proportion de la taille de la base
+COMPACT_MIN_BYTES = 64 * 1024  # Taille du journal toujours acceptée, même sur une petite base
+TAIL_BYTES = 4096  # Octets lus à la fin du journal pour y trouver la dernière signature
+
+
+def log_path(path):
+    """Retourne le chemin du journal associé à la base d'un index.
+
+    Args:
+        path (str): Chemin de la base de l'index.
+
+    Returns:
+        str: Chemin du journal.
+    """
+    return path + LOG_SUFFIX
+
+
+def pack_ints(values):
+    """Encode des entiers sur 8 octets, en petit-boutiste.
+
+    Args:
+        values (iterable[int]): Les entiers.
+
+    Returns:
+        bytes: Les entiers encodés.
+    """
+    ints = array("q", values)
+    if sys.byteorder == "big":
+        ints.byteswap()
+    return ints.tobytes()
+
+
+def unpack_ints(buffer, offset, count):
+    """Décode des entiers sur 8 octets, en petit-boutiste.
+
+    Args:
+        buffer (bytes or mmap.mmap): Les données.
+        offset (int): Position du premier entier.
+        count (int): Nombre d'entiers.
+
+    Returns:
+        array: Les entiers.
+    """
+    ints = array("q", buffer[offset:offset + 8 * count])
+    if sys.byteorder == "big":
+        ints.byteswap()
+    return ints
+
+
+def pack_header(magic, version, signature):
+    """Encode l'en-tête d'une base d'index.
+
+    Args:
+        magic (bytes): Signature du format (4 octets).
+        version (int): Version du format.
+        signature (list): Signature des fichiers de données.
+
+    Returns:
+        bytes: L'en-tête suivi de la signature des données.
+    """
+    data = json.dumps(signature).encode("ascii")
+    return BASE_HEADER.pack(magic, version, 0, len(data)) + data
+
+
+def unpack_header(buffer, magic, version):
+    """Lit l'en-tête d'une base d'index.
+
+    Args:
+        buffer (bytes or mmap.mmap): Début de la base (au moins l'en-tête complet).
+        magic (bytes): Signature du format attendue.
+        version (int): Version du format attendue.
+
+    Returns:
+        tuple[list, int] or None: La signature des données et la position des données\
+              de l'index, ou None si l'en-tête est invalide.
+    """
+    if len(buffer) < BASE_HEADER.size:
+        return None
+    found, found_version, _, length = BASE_HEADER.unpack_from(buffer)
+    end = BASE_HEADER.size + length
+    if found != magic or found_version != version or len(buffer) < end:
+        return None
+    try:
+        return json.loads(bytes(buffer[BASE_HEADER.size:end])), end
+    except ValueError:
+        return None
+
+
+def _tail_signature(path):
+    """Lit la signature de la dernière ligne du journal.
+
+    Args:
+        path (str): Chemin de la base de l'index.
+
+    Returns:
+        list or None: La signature, ou None si le journal ne se termine pas par une\
+              ligne de signature complète.
+    """
+    with open(log_path(path), "rb") as file:
+        size = file.seek(0, os.SEEK_END)
+        file.seek(max(size - TAIL_BYTES, 0))
+        lines = file.read().split(b"\n")
+    if len(lines) < 2 or lines[-1]:
+        return None  # Journal vide ou dernière ligne tronquée
+    try:
+        return json.loads(lines[-2])["signature"]
+    except (ValueError, KeyError, TypeError):
+        return None
+
+
+def current_signature(path, magic, version):
+    """Retourne la dernière signature enregistrée d'un index, sans lire ses données.
+
+    Args:
+        path (str): Chemin de la base de l'index.
+        magic (bytes): Signature du format de la base.
+        version (int): Version du format de la base.
+
+    Returns:
+        list or None: La signature, ou None si l'index est absent ou invalide.
+    """
+    try:
+        return _tail_signature(path)
+    except FileNotFoundError:
+        pass
+    try:
+        with open(path, "rb") as file:
+            head = file.read(BASE_HEADER.size)
+            if len(head) == BASE_HEADER.size:
+                head += file.read(BASE_HEADER.unpack(head)[3])
+    except FileNotFoundError:
+        return None
+    header = unpack_header(head, magic, version)
+    return None if header is None else header[0]
+
+
+def read_log(path):
+    """Lit les lignes du journal d'un index.
+
+    Args:
+        path (str): Chemin de la base de l'index.
+
+    Returns:
+        tuple[list, list or None] or None: Les lignes de modification, dans l'ordre, et\
+              la dernière signature (None si la dernière ligne n'en est pas une), ou\
+              None s'il n'y a pas de journal.
+    """
+    try:
+        with open(log_path(path), "rb") as file:
+            lines = file.read().split(b"\n")
+    except FileNotFoundError:
+        return None
+    entries = []
+    signature = None
+    for line in lines[:-1]:
+        try:
+            entry = json.loads(line)
+        except ValueError:
+            return entries, None
+        if isinstance(entry, dict):
+            signature = entry.get("signature")
+        else:
+            entries.append(entry)
+            signature = None
+    return entries, None if lines[-1] else signature
+
+
+def append_log(path, entries, signature):
+    """Ajoute des lignes de modification et la nouvelle signature au journal.
+
+    Rien n'est écrit si le journal dépasserait sa taille maximale : l'appelant doit
+    alors reconstruire l'index.
+
+    Args:
+        path (str): Chemin de la base de l'index.
+        entries (list): Lignes de modification (valeurs JSON autres que des objets).
+        signature (list): Signature des fichiers de données après l'écriture.
+
+    Returns:
+        bool: True si les lignes ont été ajoutées.
+    """
+    lines = [json.dumps(entry, ensure_ascii=False, separators=(",", ":")) for entry in entries]
+    lines.append(json.dumps({"signature": signature}))
+    data = ("\n".join(lines) + "\n").encode("utf-8")
+    try:
+        base_size = os.path.getsize(path)
+    except FileNotFoundError:
+        return False
+    try:
+        log_size = os.path.getsize(log_path(path))
+    except FileNotFoundError:
+        log_size = 0
+    if log_size + len(data) > max(base_size * COMPACT_RATIO, COMPACT_MIN_BYTES):
+        return False
+    with open(log_path(path), "ab") as file:
+        file.write(data)
+    return True
+
+
+def clear_log(path):
+    """Supprime le journal d'un index, avant la réécriture de sa base.
+
+    Args:
+        path (str): Chemin de la base de l'index.
+    """
+    try:
+        os.remove(log_path(path))
+    except FileNotFoundError:
+        pass
+
+
+def remove(path):
+    """Supprime la base d'un index et son journal s'ils existent.
+
+    Args:
+        path (str): Chemin de la base de l'index.
+    """
+    clear_log(path)
+    try:
+        os.remove(path)
+    except FileNotFoundError:
+        pass
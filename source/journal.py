@@ -0,0 +1,127 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+Module journal.
+
+Ce module implémente un journal des modifications en mode ajout seul (append-only).
+
+Au lieu de réécrire l'intégralité du fichier JSON à chaque commande, chaque modification
+(ajout, modification ou suppression d'une tâche) est ajoutée sous forme d'un petit
+enregistrement JSON sur une ligne dans un fichier journal situé à côté du fichier de
+sauvegarde (par exemple ``tasks.json.journal``).
+
+Au chargement, le journal est rejoué par-dessus le dernier instantané (snapshot).
+La commande ``compact`` réécrit l'instantané et vide le journal.
+"""
+
+import json
+import os
+
+from source import timings
+from source.atomic import DEFAULT_DURABILITY, drop_torn_tail, sync
+from source.tache import Tache
+
+JOURNAL_SUFFIX = ".journal"  # Suffixe ajouté au nom du fichier de sauvegarde
+
+
+def journal_path(filename):
+    """Retourne le chemin du journal associé à un fichier de sauvegarde.
+
+    Args:
+        filename (str): Chemin du fichier JSON de sauvegarde.
+
+    Returns:
+        str: Chemin du fichier journal.
+    """
+    return filename + JOURNAL_SUFFIX
+
+
+def _entry_line(operation, task):
+    """Encode un enregistrement de modification sur une ligne.
+
+    Args:
+        operation (str): Type de modification ("add", "edit" ou "remove").
+        task (Tache): La tâche concernée par la modification.
+
+    Returns:
+        str: La ligne JSON, terminée par un saut de ligne.
+    """
+    if operation == "remove":
+        entry = {"op": operation, "task_id": task.task_id}
+    else:
+        entry = {"op": operation, "task": task.to_dict()}
+    return json.dumps(entry, ensure_ascii=False) + "\n"
+
+
+def append_entry(filename, operation, task):
+    """Ajoute un enregistrement de modification à la fin du journal.
+
+    Args:
+        filename (str): Chemin du fichier JSON de sauvegarde.
+        operation (str): Type de modification ("add", "edit" ou "remove").
+        task (Tache): La tâche concernée par la modification.
+    """
+    append_entries(filename, [(operation, task)])
+
+
+def append_entries(filename, changes, durability=DEFAULT_DURABILITY):
+    """Ajoute plusieurs enregistrements de modification en une seule écriture.
+
+    Le lot est synchronisé sur disque une seule fois (voir source.atomic.sync) ; une
+    écriture interrompue ne laisse qu'une dernière ligne tronquée, ignorée par replay
+    et retirée avant l'ajout suivant.
+
+    Args:
+        filename (str): Chemin du fichier JSON de sauvegarde.
+        changes (list[tuple[str, Tache]]): Modifications (opération, tâche).
+        durability (str, optional): Niveau de durabilité. Defaults to DEFAULT_DURABILITY.
+    """
+    drop_torn_tail(journal_path(filename))
+    with open(journal_path(filename), "a", encoding="utf-8") as file:
+        start = file.tell()
+        file.write("".join(_entry_line(operation, task) for operation, task in changes))
+        timings.count("bytes_written", file.tell() - start)
+        sync(file, durability)
+
+
+def replay(tasks, filename):
+    """Rejoue le journal par-dessus une liste de tâches.
+
+    Une dernière ligne tronquée (écriture interrompue) est ignorée.
+
+    Args:
+        tasks (list[Tache]): Tâches issues du dernier instantané.
+        filename (str): Chemin du fichier JSON de sauvegarde.
+
+    Returns:
+        list[Tache]: Liste des tâches après application du journal.
+    """
+    try:
+        file = open(journal_path(filename), "r", encoding="utf-8")
+    except FileNotFoundError:
+        return tasks
+    by_id = {task.task_id: task for task in tasks}
+    with file:
+        for line in file:
+            try:
+                entry = json.loads(line)
+            except json.JSONDecodeError:
+                break
+            if entry["op"] == "remove":
+                by_id.pop(entry["task_id"], None)
+            else:
+                task = Tache.from_dict(entry["task"])
+                by_id[task.task_id] = task
+    return list(by_id.values())
+
+
+def clear(filename):
+    """Supprime le journal associé à un fichier de sauvegarde s'il existe.
+
+    Args:
+        filename (str): Chemin du fichier JSON de sauvegarde.
+    """
+    try:
+        os.remove(journal_path(filename))
+    except FileNotFoundError:
+        pass
@@ -0,0 +1,171 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+Module jsonl_storage.
+
+Ce module fournit un backend de stockage au format JSON Lines (``.jsonl``) :
+une tâche par ligne, encodée en JSON compact.
+
+Contrairement au fichier JSON indenté, ce format se lit ligne par ligne : la fonction
+iter_tasks produit les tâches une à une, sans garder en mémoire le texte brut ni la
+liste des dictionnaires, ce qui permet à la commande ``list`` d'afficher les tâches
+en mémoire constante. Un ajout se fait en ajoutant une ligne à la fin du fichier.
+
+Une dernière ligne sans saut de ligne final vient d'un ajout interrompu : elle est
+ignorée à la lecture et retirée avant l'ajout suivant. Toute autre ligne invalide rend
+le fichier illisible (StorageError), pour qu'une sauvegarde ne l'efface jamais.
+
+Un très grand fichier est chargé par plusieurs processus, chacun décodant une plage
+de lignes (voir source.parallel_load).
+
+La conversion depuis et vers le fichier ``tasks.json`` se fait avec la commande
+``migrate`` (par exemple ``migrate --to jsonl``).
+"""
+
+import json
+import os
+
+from source import parallel_load, timings
+from source.atomic import AtomicFile, drop_torn_tail, sync
+from source.storage import JsonStorage, StorageError
+from source.tache import Tache
+
+
+def iter_tasks(filename):
+    """Produit les tâches d'un fichier JSON Lines une par une.
+
+    Les lignes vides et une dernière ligne tronquée (ajout interrompu) sont ignorées.
+
+    Args:
+        filename (str): Chemin du fichier JSON Lines.
+
+    Yields:
+        Tache: Les tâches, dans l'ordre du fichier.
+
+    Raises:
+        StorageError: Si une ligne complète n'est pas un JSON valide.
+    """
+    try:
+        file = open(filename, "r", encoding="utf-8")
+    except FileNotFoundError:
+        return
+    with file:
+        for line_number, line in enumerate(file, start=1):
+            if not line.strip():
+                continue
+            try:
+                item = json.loads(line)
+            except json.JSONDecodeError as exc:
+                if not line.endswith("\n"):
+                    return  # Dernière ligne tronquée
+                raise StorageError(
+                    f"Erreur lors du décodage de la ligne {line_number} de {filename} : {exc}"
+                ) from exc
+            yield Tache.from_dict(item)
+
+
+def dump_task(task):
+    """Encode une tâche sur une ligne JSON Lines.
+
+    Args:
+        task (Tache): La tâche à encoder.
+
+    Returns:
+        str: La ligne JSON, terminée par un saut de ligne.
+    """
+    return json.dumps(task.to_dict(), ensure_ascii=False) + "\n"
+
+
+class JsonlStorage(JsonStorage):
+    """Stockage au format JSON Lines, lisible en flux."""
+
+    default_filename = "tasks.jsonl"
+
+    def iter_tasks(self, sort=None):
+        """Produit les tâches une par une, en mémoire constante.
+
+        Args:
+            sort (str, optional): Ignoré, le tri est fait par l'appelant. Defaults to None.
+
+        Returns:
+            iterator[Tache]: Les tâches, dans l'ordre du fichier.
+        """
+        return iter_tasks(self.filename)
+
+    def load(self, sort=None):
+        """Charge toutes les tâches du fichier JSON Lines.
+
+        Un fichier d'au moins parallel_load.MIN_SIZE octets est décodé par plusieurs
+        processus ; sinon, ou si les processus ne peuvent pas être créés, il est lu
+        en série.
+
+        Args:
+            sort (str, optional): Ignoré, le tri est fait par l'appelant. Defaults to None.
+
+        Returns:
+            list[Tache]: Liste d'instances de Tache.
+
+        Raises:
+            StorageError: Si une ligne complète n'est pas un JSON valide.
+        """
+        try:
+            size = os.path.getsize(self.filename)
+        except OSError:
+            size = 0
+        if size >= parallel_load.MIN_SIZE:
+            workers = parallel_load.worker_count(self.workers)
+            if workers > 1:
+                try:
+                    return parallel_load.load(self.filename, workers)
+                except OSError:
+                    pass  # Processus impossibles à créer ici : lecture en série
+        return list(iter_tasks(self.filename))
+
+    def save(self, tasks):
+        """Réécrit le fichier avec une tâche par ligne.
+
+        Args:
+            tasks (iterable[Tache]): Tâches à sauvegarder.
+        """
+        self._write(tasks, "w")
+        self.save_indexes(tasks)
+
+    def apply(self, tasks, changes):
+        """Ajoute une ligne par tâche si le lot ne contient que des ajouts.
+
+        Sinon, le fichier est réécrit une seule fois. Dans les deux cas, les index
+        sont mis à jour avec les seules modifications.
+
+        Args:
+            tasks (iterable[Tache]): Tâches après modification.
+            changes (list[tuple[str, Tache]]): Modifications (opération, tâche).
+        """
+        current = self.current_indexes()
+        if any(operation != "add" for operation, _ in changes):
+            self._write(tasks, "w")
+        else:
+            self._write((task for _, task in changes), "a")
+        self.save_indexes(tasks, current, changes)
+
+    def _write(self, tasks, mode):
+        """Écrit des tâches, une par ligne.
+
+        Une réécriture remplace le fichier atomiquement ; un ajout retire d'abord une
+        dernière ligne tronquée, puis est synchronisé sur disque une seule fois pour
+        tout le lot.
+
+        Args:
+            tasks (iterable[Tache]): Tâches à écrire.
+            mode (str): "w" pour réécrire le fichier, "a" pour ajouter à la fin.
+        """
+        if mode == "w":
+            with AtomicFile(self.filename, self.durability) as file:
+                file.writelines(dump_task(task) for task in tasks)
+                timings.count("bytes_written", file.tell())
+            return
+        drop_torn_tail(self.filename)
+        with open(self.filename, mode, encoding="utf-8") as file:
+            start = file.tell()
+            file.writelines(dump_task(task) for task in tasks)
+            timings.count("bytes_written", file.tell() - start)
+            sync(file, self.durability)
@@ -0,0 +1,133 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+Module locking.
+
+Ce module protège un fichier de sauvegarde contre les accès concurrents de plusieurs
+processus (tâches cron, utilisateurs lançant la CLI en même temps) :
+
+    - un verrou consultatif ``fcntl.flock`` posé sur un fichier voisin
+      (``tasks.json.lock``) : partagé pendant les lectures, exclusif pendant les
+      écritures, si bien qu'un lecteur ne voit jamais un fichier à moitié écrit ;
+    - un numéro de génération conservé dans les métadonnées du stockage et incrémenté
+      à chaque écriture : une collection chargée à la génération N ne peut être
+      sauvegardée que si le stockage est toujours à la génération N, sinon
+      ConflictError est levée et l'appelant recommence à partir des données à jour.
+
+Sur les plateformes sans ``fcntl`` (Windows), le verrou est sans effet ; le numéro de
+génération détecte toujours les conflits, mais pas les lectures d'un fichier en cours
+d'écriture.
+"""
+
+try:
+    import fcntl
+except ImportError:  # pragma: no cover - Windows
+    fcntl = None
+
+LOCK_SUFFIX = ".lock"  # Suffixe du fichier de verrou, à côté du fichier des tâches
+GENERATION_KEY = "generation"  # Clé des métadonnées contenant le numéro de génération
+
+
+class ConflictError(Exception):
+    """Le stockage a été modifié par un autre processus depuis le chargement des tâches.
+
+    Attributes:
+        expected (int): Génération à laquelle les tâches ont été chargées.
+        actual (int): Génération actuelle du stockage.
+    """
+
+    def __init__(self, expected, actual):
+        """Initialise l'erreur.
+
+        Args:
+            expected (int): Génération à laquelle les tâches ont été chargées.
+            actual (int): Génération actuelle du stockage.
+        """
+        super().__init__(
+            f"les tâches ont été modifiées par un autre processus "
+            f"(génération {actual} au lieu de {expected})"
+        )
+        self.expected = expected
+        self.actual = actual
+
+
+def lock_path(filename):
+    """Retourne le chemin du fichier de verrou associé à un fichier de sauvegarde.
+
+    Args:
+        filename (str): Chemin du fichier de sauvegarde.
+
+    Returns:
+        str: Chemin du fichier de verrou.
+    """
+    return filename + LOCK_SUFFIX
+
+
+class FileLock:
+    """Verrou consultatif sur un fichier de sauvegarde, utilisable avec ``with``.
+
+    Le verrou est libéré à la sortie du bloc, ou par le système si le processus meurt.
+
+    Attributes:
+        path (str): Chemin du fichier de verrou.
+        shared (bool): True pour un verrou partagé (lecture), False pour un verrou\
+              exclusif (écriture).
+    """
+
+    def __init__(self, filename, shared=False):
+        """Initialise le verrou sans le prendre.
+
+        Args:
+            filename (str): Chemin du fichier de sauvegarde.
+            shared (bool, optional): Verrou partagé plutôt qu'exclusif.\
+                  Defaults to False.
+        """
+        self.path = lock_path(filename)
+        self.shared = shared
+        self._file = None
+
+    def __enter__(self):
+        """Prend le verrou, en attendant que les autres processus le libèrent.
+
+        Le fichier de verrou est créé par la première écriture ; un lecteur ne le
+        crée pas et lit sans verrou s'il n'existe pas encore (ou n'est pas lisible).
+
+        Returns:
+            FileLock: Le verrou.
+
+        Raises:
+            OSError: Si le fichier de verrou d'une écriture ne peut pas être ouvert.
+        """
+        if fcntl is None:
+            return self
+        try:
+            # pylint: disable-next=consider-using-with
+            self._file = open(self.path, "rb" if self.shared else "a+b")
+        except OSError:
+            if self.shared:
+                return self
+            raise
+        fcntl.flock(self._file.fileno(), fcntl.LOCK_SH if self.shared else fcntl.LOCK_EX)
+        return self
+
+    def __exit__(self, *exc_info):
+        """Libère le verrou."""
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+
+def locked_iter(filename, open_tasks):
+    """Produit des tâches lues en flux sous un verrou partagé.
+
+    Le verrou est pris à la lecture de la première tâche et libéré à la fin du flux.
+
+    Args:
+        filename (str): Chemin du fichier de sauvegarde.
+        open_tasks (callable): Fonction sans argument retournant l'itérateur des tâches.
+
+    Yields:
+        Tache: Les tâches.
+    """
+    with FileLock(filename, shared=True):
+        yield from open_tasks()
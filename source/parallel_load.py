@@ -0,0 +1,165 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+Module parallel_load.
+
+Ce module charge un très grand fichier JSON Lines sur plusieurs processeurs : le
+décodage JSON et la validation des tâches (``Tache.from_dict``) occupent un seul cœur
+lorsque le fichier est lu ligne par ligne.
+
+Le fichier est découpé en plages d'octets qui commencent et finissent sur une fin de
+ligne, quelques plages par processus pour équilibrer la charge. Chaque plage est lue
+et décodée par un processus d'un ``ProcessPoolExecutor``, qui renvoie les valeurs
+validées de ses tâches sous forme de tuples (rapides à transmettre entre processus) ;
+le processus principal reconstruit les tâches dans l'ordre du fichier (voir
+source.tache.from_rows).
+
+Les fichiers plus petits que MIN_SIZE, plus rapides à lire que les processus à
+démarrer, sont lus en série, de même qu'avec un seul processus (``--workers 1``).
+Sans ``--workers``, le nombre de processus vient de ``TASK_MANAGER_WORKERS``, sinon du
+nombre de processeurs.
+"""
+
+import json
+import os
+
+from source import timings
+from source.storage import StorageError
+from source.tache import from_rows, to_ordinal
+
+MIN_SIZE = 32 * 1024 * 1024  # Taille minimale (octets) d'un fichier lu en parallèle
+CHUNKS_PER_WORKER = 4  # Nombre de plages par processus, pour équilibrer la charge
+WORKERS_ENV = "TASK_MANAGER_WORKERS"  # Variable d'environnement du nombre de processus
+
+
+def worker_count(workers=None):
+    """Retourne le nombre de processus de lecture.
+
+    Args:
+        workers (int, optional): Nombre choisi par ``--workers`` ; None ou 0 pour le\
+              choix automatique. Defaults to None.
+
+    Returns:
+        int: Le nombre choisi, sinon celui de WORKERS_ENV, sinon le nombre de\
+              processeurs ; au moins 1.
+    """
+    if not workers:
+        try:
+            workers = int(os.environ.get(WORKERS_ENV, 0))
+        except ValueError:
+            workers = 0
+        workers = workers or os.cpu_count() or 1
+    return max(workers, 1)
+
+
+def chunk_ranges(filename, count):
+    """Découpe un fichier en plages d'octets alignées sur les fins de ligne.
+
+    Args:
+        filename (str): Chemin du fichier.
+        count (int): Nombre de plages souhaité.
+
+    Returns:
+        list[tuple[int, int]]: Les plages (début inclus, fin exclue), dans l'ordre du\
+              fichier, sans plage vide.
+    """
+    with open(filename, "rb") as file:
+        size = os.fstat(file.fileno()).st_size
+        bounds = [0]
+        for index in range(1, count):
+            position = max(size * index // count, bounds[-1])
+            if position >= size:
+                break
+            file.seek(position)
+            file.readline()  # Avance jusqu'au début de la ligne suivante
+            bounds.append(file.tell())
+    bounds.append(size)
+    return [(start, end) for start, end in zip(bounds, bounds[1:]) if start < end]
+
+
+def parse_chunk(filename, start, end):
+    """Décode et valide les tâches d'une plage d'octets (exécutée dans un processus).
+
+    Args:
+        filename (str): Chemin du fichier JSON Lines.
+        start (int): Début de la plage, au début d'une ligne.
+        end (int): Fin de la plage, après une fin de ligne ou en fin de fichier.
+
+    Returns:
+        tuple[list[tuple], list[int], int]: Les valeurs des tâches (voir\
+              source.tache.from_rows), les numéros (relatifs à la plage, à partir de 1)\
+              des lignes invalides et le nombre de lignes de la plage. Une dernière\
+              ligne tronquée (fin de fichier sans saut de ligne) n'est pas invalide.
+
+    Raises:
+        KeyError: Si une tâche n'a pas de titre.
+    """
+    with open(filename, "rb") as file:
+        file.seek(start)
+        lines = file.read(end - start).split(b"\n")
+    torn = len(lines)  # Dernière ligne, tronquée sans fin de ligne finale
+    if lines and not lines[-1]:
+        lines.pop()  # Plage terminée par une fin de ligne
+        torn = None
+    rows = []
+    append = rows.append
+    invalid = []
+    loads = json.loads
+    for line_number, line in enumerate(lines, start=1):
+        if not line.strip():
+            continue
+        try:
+            item = loads(line)
+        except ValueError:  # JSON invalide ou UTF-8 invalide
+            if line_number != torn:
+                invalid.append(line_number)
+            continue
+        # Mêmes valeurs et mêmes contrôles que Tache.from_dict
+        date_limite = item.get("date_limite")
+        append(
+            (
+                item["titre"],
+                item.get("description"),
+                max(item.get("priorite", 1), 1),
+                date_limite,
+                to_ordinal(date_limite),
+                item.get("task_id"),
+            )
+        )
+    return rows, invalid, len(lines)
+
+
+def load(filename, workers):
+    """Charge les tâches d'un fichier JSON Lines avec plusieurs processus.
+
+    Args:
+        filename (str): Chemin du fichier JSON Lines.
+        workers (int): Nombre de processus, au moins 2.
+
+    Returns:
+        list[Tache]: Les tâches, dans l'ordre du fichier.
+
+    Raises:
+        StorageError: Si une ligne complète n'est pas un JSON valide.
+    """
+    from concurrent.futures import ProcessPoolExecutor  # pylint: disable=import-outside-toplevel
+
+    ranges = chunk_ranges(filename, workers * CHUNKS_PER_WORKER)
+    with timings.phase("decode"), ProcessPoolExecutor(max_workers=workers) as pool:
+        results = list(
+            pool.map(
+                parse_chunk,
+                [filename] * len(ranges),
+                [start for start, _ in ranges],
+                [end for _, end in ranges],
+            )
+        )
+    offset = 0
+    for _, invalid, line_count in results:
+        if invalid:
+            raise StorageError(
+                f"Erreur lors du décodage de la ligne {offset + invalid[0]} de {filename}."
+            )
+        offset += line_count
+    with timings.phase("build"):
+        return from_rows(row for rows, _, _ in results for row in rows)
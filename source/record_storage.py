@@ -0,0 +1,625 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+Module record_storage.
+
+Ce module fournit un backend de stockage en fiches de taille fixe
+(``--storage records``), modifiées sur place :
+
+    tasks.rec           HEADER (signature, version, nombre de fiches, nombre de tâches,
+                        première fiche libre, numéro du tas) suivi des fiches SLOT :
+                        drapeaux, identifiant, priorité, numéro de jour de la date
+                        limite, position et longueur du titre et de la description
+    tasks.rec.<n>.heap  Tas du texte : titres et descriptions encodés en UTF-8,
+                        ajoutés en fin de fichier
+
+Une date limite en texte libre (ancien fichier, sans numéro de jour) est rangée dans le
+tas juste après la description ; sa fiche porte le drapeau HAS_DATE_TEXT et la longueur
+du texte à la place du numéro de jour.
+
+Une fiche a une position connue : ``edit --priority`` réécrit seulement sa fiche,
+et ``remove --id`` pose le drapeau DELETED et chaîne la fiche dans la liste des
+fiches libres, réutilisées par les ajouts suivants. Un texte modifié est ajouté en
+fin de tas ; l'ancien texte et les fiches supprimées restent en place jusqu'à la
+commande ``vacuum``, qui réécrit les deux fichiers de manière compacte.
+
+Le texte d'un lot de modifications est écrit et synchronisé avant les fiches qui y
+font référence, et le tas n'est jamais modifié sur place. Une réécriture complète
+crée un nouveau tas (numéro suivant) puis remplace atomiquement le fichier des fiches :
+une écriture interrompue laisse le fichier d'origine et son tas intacts. Un lot sur
+place interrompu avant l'en-tête peut laisser celui-ci désigner comme libre une fiche
+réutilisée : chaque fiche retirée de la liste des fiches libres est vérifiée.
+
+Contrairement aux backends JSON, ce backend ne tient pas d'index triés ni d'index de
+recherche à côté du fichier : leur réécriture coûterait bien plus que celle de la
+fiche modifiée. ``list --sort`` et ``search`` parcourent alors les tâches.
+"""
+
+import os
+import struct
+
+from datetime import date
+
+from source import timings
+from source.atomic import AtomicFile, sync
+from source.storage import JsonStorage, Storage, StorageError
+from source.tache import Tache
+
+MAGIC = b"TMR1"  # Signature des fichiers de fiches
+VERSION = 1  # Version du format
+HEAP_SUFFIX = ".heap"  # Suffixe du tas du texte, précédé de son numéro
+
+# Signature, version, réservé, nombre de fiches, nombre de tâches, première fiche
+# libre (-1 sans fiche libre), numéro du tas
+HEADER = struct.Struct("<4sHHIIiI")
+# Drapeaux, identifiant (fiche libre suivante pour une fiche supprimée), priorité,
+# numéro de jour (0 sans date ; longueur de la date avec HAS_DATE_TEXT), position et
+# longueur du titre, position et longueur de la description
+SLOT = struct.Struct("<BqqiQIQI")
+ID_FIELD = struct.Struct("<Bq")  # Début d'une fiche : drapeaux et identifiant
+
+DELETED = 1  # Drapeau : fiche supprimée, dans la liste des fiches libres
+HAS_ID = 2  # Drapeau : la tâche a un identifiant
+HAS_DESCRIPTION = 4  # Drapeau : la tâche a une description
+HAS_DATE_TEXT = 8  # Drapeau : date limite en texte libre, rangée après la description
+
+NO_SLOT = -1  # Fin de la liste des fiches libres
+
+
+def heap_path(filename, number):
+    """Retourne le chemin du tas du texte associé à un fichier de fiches.
+
+    Args:
+        filename (str): Chemin du fichier de fiches.
+        number (int): Numéro du tas, incrémenté à chaque réécriture complète.
+
+    Returns:
+        str: Chemin du tas.
+    """
+    return f"{filename}.{number}{HEAP_SUFFIX}"
+
+
+def read_header(file, filename):
+    """Lit et vérifie l'en-tête d'un fichier de fiches.
+
+    Args:
+        file (io.BufferedIOBase): Le fichier, ouvert en mode binaire.
+        filename (str): Chemin du fichier, pour les messages d'erreur.
+
+    Returns:
+        list: Nombre de fiches, nombre de tâches, première fiche libre, numéro du tas.
+
+    Raises:
+        StorageError: Si le fichier n'est pas un fichier de fiches valide.
+    """
+    file.seek(0)
+    data = file.read(HEADER.size)
+    if len(data) < HEADER.size:
+        raise StorageError(f"Fichier de fiches tronqué : {filename}")
+    magic, version, _, slots, count, free, heap = HEADER.unpack(data)
+    if magic != MAGIC or version != VERSION:
+        raise StorageError(f"{filename} n'est pas un fichier de fiches de tâches")
+    return [slots, count, free, heap]
+
+
+class RecordTache(Tache):
+    """Tâche lue dans un fichier de fiches, qui retient la position de sa fiche.
+
+    La position permet de retrouver la fiche sans parcourir le fichier lors de la
+    sauvegarde ; elle est vérifiée (identifiant de la fiche) avant d'être utilisée.
+    """
+
+    __slots__ = ("slot",)
+
+
+def encode_text(value):
+    """Encode un titre ou une description pour le tas.
+
+    Args:
+        value (str or None): Le texte.
+
+    Returns:
+        bytes: Le texte encodé en UTF-8, vide pour None.
+    """
+    return b"" if value is None else value.encode("utf-8")
+
+
+def encode_date_text(task):
+    """Encode la date limite d'une tâche si elle n'a pas de numéro de jour.
+
+    Args:
+        task (Tache): La tâche.
+
+    Returns:
+        bytes or None: La date en texte libre encodée, ou None si la tâche n'a pas de\
+              date ou a une date au format YYYY-MM-DD.
+    """
+    if task.date_limite is None or task.date_ordinal is not None:
+        return None
+    return task.date_limite.encode("utf-8")
+
+
+class RecordFile:
+    """Lot de modifications sur place d'un fichier de fiches ouvert.
+
+    Les fiches modifiées sont gardées en mémoire jusqu'à commit, qui écrit d'abord le
+    texte en fin de tas, puis les fiches à leur position et enfin l'en-tête.
+
+    Attributes:
+        slots (int): Nombre de fiches, supprimées comprises.
+        count (int): Nombre de tâches.
+        free (int): Première fiche libre, ou NO_SLOT.
+        heap_number (int): Numéro du tas.
+    """
+
+    def __init__(self, filename):
+        """Ouvre le fichier de fiches et son tas en lecture et écriture.
+
+        Args:
+            filename (str): Chemin du fichier de fiches, qui doit exister.
+
+        Raises:
+            StorageError: Si le fichier n'est pas un fichier de fiches valide.
+        """
+        self.filename = filename
+        self._file = open(filename, "r+b")  # pylint: disable=consider-using-with
+        try:
+            self.slots, self.count, self.free, self.heap_number = read_header(
+                self._file, filename
+            )
+            # pylint: disable-next=consider-using-with
+            self._heap = open(heap_path(filename, self.heap_number), "a+b")
+        except BaseException:
+            self._file.close()
+            raise
+        self._heap_size = self._heap_end = self._heap.seek(0, os.SEEK_END)
+        self._text = []  # Texte à ajouter en fin de tas
+        self._pending = {}  # Numéro de fiche -> fiche à écrire
+        self._by_id = None  # Identifiant -> numéro de fiche, construit à la demande
+
+    def close(self):
+        """Ferme le fichier de fiches et le tas."""
+        self._heap.close()
+        self._file.close()
+
+    def read_slot(self, number):
+        """Lit une fiche, en tenant compte des fiches modifiées dans ce lot.
+
+        Args:
+            number (int): Numéro de la fiche.
+
+        Returns:
+            tuple: Les champs de SLOT.
+        """
+        if number in self._pending:
+            return SLOT.unpack(self._pending[number])
+        self._file.seek(HEADER.size + SLOT.size * number)
+        return SLOT.unpack(self._file.read(SLOT.size))
+
+    def find(self, task):
+        """Retourne le numéro de la fiche d'une tâche.
+
+        La position retenue par une RecordTache est essayée en premier ; sinon, les
+        identifiants de toutes les fiches sont lus une fois pour le lot.
+
+        Args:
+            task (Tache): La tâche.
+
+        Returns:
+            int or None: Le numéro de la fiche, ou None si la tâche n'est pas stockée.
+        """
+        if self._by_id is not None:
+            return self._by_id.get(task.task_id)
+        number = getattr(task, "slot", None)
+        if number is not None and number < self.slots:
+            flags, task_id = self.read_slot(number)[:2]
+            if not flags & DELETED and flags & HAS_ID and task_id == task.task_id:
+                return number
+        self._by_id = self._scan_ids()
+        return self._by_id.get(task.task_id)
+
+    def _scan_ids(self):
+        """Lit les identifiants de toutes les fiches.
+
+        Returns:
+            dict[int, int]: Identifiant -> numéro de fiche, pour les fiches non supprimées.
+        """
+        self._file.seek(HEADER.size)
+        data = self._file.read(SLOT.size * self.slots)
+        by_id = {}
+        for number in range(self.slots):
+            if number in self._pending:
+                flags, task_id = ID_FIELD.unpack_from(self._pending[number])
+            else:
+                flags, task_id = ID_FIELD.unpack_from(data, SLOT.size * number)
+            if not flags & DELETED and flags & HAS_ID:
+                by_id[task_id] = number
+        return by_id
+
+    def _append_text(self, data):
+        """Réserve la place d'un texte en fin de tas.
+
+        Args:
+            data (bytes): Le texte encodé.
+
+        Returns:
+            int: Position du texte dans le tas.
+        """
+        position = self._heap_end
+        self._text.append(data)
+        self._heap_end += len(data)
+        return position
+
+    def _read_text(self, position, length):
+        """Lit un texte du tas, y compris un texte ajouté dans ce lot.
+
+        Args:
+            position (int): Position du texte.
+            length (int): Longueur en octets.
+
+        Returns:
+            bytes: Le texte encodé.
+        """
+        if position >= self._heap_size:  # Texte ajouté dans ce lot, pas encore écrit
+            start = position - self._heap_size
+            return b"".join(self._text)[start : start + length]
+        self._heap.seek(position)
+        return self._heap.read(length)
+
+    def _text_span(self, data, position, length):
+        """Retourne la position d'un texte, ajouté au tas seulement s'il a changé.
+
+        Args:
+            data (bytes): Le nouveau texte encodé.
+            position (int or None): Position de l'ancien texte, None sans ancien texte.
+            length (int): Longueur de l'ancien texte.
+
+        Returns:
+            tuple[int, int]: Position et longueur du texte dans le tas.
+        """
+        if position is not None and len(data) == length:
+            if self._read_text(position, length) == data:
+                return position, length
+        return self._append_text(data), len(data)
+
+    def _record(self, task, old=None):
+        """Encode la fiche d'une tâche.
+
+        Args:
+            task (Tache): La tâche.
+            old (tuple, optional): Champs de l'ancienne fiche, dont le texte inchangé\
+                  est réutilisé. Defaults to None.
+
+        Returns:
+            bytes: La fiche.
+        """
+        flags = 0 if task.task_id is None else HAS_ID
+        if task.description is not None:
+            flags |= HAS_DESCRIPTION
+        date_text = encode_date_text(task)
+        if date_text is not None:
+            flags |= HAS_DATE_TEXT
+        old_title = old_text = (None, 0)
+        if old is not None:
+            old_title = old[4:6]
+            # Texte qui suit le titre : la description, puis la date en texte libre
+            old_text = (old[6], old[7] + (old[3] if old[0] & HAS_DATE_TEXT else 0))
+        title = self._text_span(encode_text(task.titre), *old_title)
+        description = encode_text(task.description)
+        text = description + (date_text or b"")
+        position = self._text_span(text, *old_text)[0] if text else 0
+        return SLOT.pack(
+            flags,
+            task.task_id or 0,
+            task.priorite,
+            len(date_text) if date_text is not None else task.date_ordinal or 0,
+            *title,
+            position,
+            len(description),
+        )
+
+    def add(self, task):
+        """Ajoute une tâche dans une fiche libre, ou à la fin du fichier.
+
+        Args:
+            task (Tache): La tâche.
+        """
+        if self.free != NO_SLOT and not self._is_free(self.free):
+            self._rebuild_free_list()
+        if self.free != NO_SLOT:
+            number = self.free
+            self.free = self.read_slot(number)[1]
+        else:
+            number = self.slots
+            self.slots += 1
+        self._pending[number] = self._record(task)
+        self.count += 1
+        if self._by_id is not None and task.task_id is not None:
+            self._by_id[task.task_id] = number
+
+    def _is_free(self, number):
+        """Indique si une fiche de la liste des fiches libres est bien supprimée.
+
+        Args:
+            number (int): Numéro de la fiche.
+
+        Returns:
+            bool: True si la fiche existe et porte le drapeau DELETED.
+        """
+        return 0 <= number < self.slots and bool(self.read_slot(number)[0] & DELETED)
+
+    def _rebuild_free_list(self):
+        """Reconstruit la liste des fiches libres et le nombre de tâches.
+
+        Un commit interrompu entre l'écriture des fiches et celle de l'en-tête peut
+        laisser l'en-tête désigner comme libre une fiche réutilisée depuis : les fiches
+        supprimées sont alors relues et chaînées à nouveau.
+        """
+        self._file.seek(HEADER.size)
+        data = self._file.read(SLOT.size * self.slots)
+        self.free = NO_SLOT
+        self.count = 0
+        for number in reversed(range(self.slots)):
+            if number in self._pending:
+                flags = self._pending[number][0]
+            else:
+                flags = data[SLOT.size * number]
+            if flags & DELETED:
+                self._pending[number] = SLOT.pack(DELETED, self.free, 0, 0, 0, 0, 0, 0)
+                self.free = number
+            else:
+                self.count += 1
+
+    def edit(self, task):
+        """Réécrit la fiche d'une tâche ; seul le texte modifié est ajouté au tas.
+
+        Args:
+            task (Tache): La tâche modifiée.
+        """
+        number = self.find(task)
+        if number is None:
+            self.add(task)
+        else:
+            self._pending[number] = self._record(task, self.read_slot(number))
+
+    def remove(self, task):
+        """Supprime la fiche d'une tâche et l'ajoute à la liste des fiches libres.
+
+        Args:
+            task (Tache): La tâche supprimée.
+        """
+        number = self.find(task)
+        if number is None:
+            return
+        self._pending[number] = SLOT.pack(DELETED, self.free, 0, 0, 0, 0, 0, 0)
+        self.free = number
+        self.count -= 1
+        if self._by_id is not None:
+            del self._by_id[task.task_id]
+
+    def commit(self, durability):
+        """Écrit le texte, les fiches modifiées puis l'en-tête.
+
+        Une interruption avant l'écriture de l'en-tête est réparée au prochain ajout :
+        une fiche libre de l'en-tête qui n'est plus supprimée entraîne la reconstruction
+        de la liste des fiches libres (voir _rebuild_free_list).
+
+        Args:
+            durability (str): Niveau de durabilité (voir source.atomic).
+
+        Returns:
+            int: Le nombre d'octets écrits.
+        """
+        written = 0
+        if self._text:
+            text = b"".join(self._text)
+            self._heap.write(text)
+            sync(self._heap, durability)
+            written += len(text)
+        for number in sorted(self._pending):
+            self._file.seek(HEADER.size + SLOT.size * number)
+            written += self._file.write(self._pending[number])
+        self._file.seek(0)
+        written += self._file.write(
+            HEADER.pack(
+                MAGIC, VERSION, 0, self.slots, self.count, self.free, self.heap_number
+            )
+        )
+        sync(self._file, durability)
+        self._text = []
+        self._pending = {}
+        return written
+
+
+class RecordStorage(JsonStorage):
+    """Stockage en fiches de taille fixe modifiées sur place (voir le format en tête
+    du module).
+
+    Les métadonnées sont sauvegardées dans le même fichier voisin que le backend JSON.
+    """
+
+    default_filename = "tasks.rec"
+
+    def _read(self):
+        """Lit l'en-tête et toutes les fiches.
+
+        Returns:
+            tuple[list, bytes]: L'en-tête (voir read_header) et les fiches, ou None si\
+                  le fichier n'existe pas.
+
+        Raises:
+            StorageError: Si le fichier n'est pas un fichier de fiches valide.
+        """
+        try:
+            with open(self.filename, "rb") as file:
+                header = read_header(file, self.filename)
+                data = file.read()
+        except FileNotFoundError:
+            return None
+        if len(data) < SLOT.size * header[0]:
+            raise StorageError(f"Fichier de fiches tronqué : {self.filename}")
+        return header, data
+
+    def load(self, sort=None):
+        """Charge toutes les tâches non supprimées, dans l'ordre des fiches.
+
+        Args:
+            sort (str, optional): Ignoré, le tri est fait par l'appelant. Defaults to None.
+
+        Returns:
+            list[RecordTache]: Les tâches.
+
+        Raises:
+            StorageError: Si le fichier ou son tas est invalide.
+        """
+        with timings.phase("decode"):
+            stored = self._read()
+            if stored is None:
+                return []
+            (slots, _, _, heap_number), data = stored
+            try:
+                with open(heap_path(self.filename, heap_number), "rb") as file:
+                    heap = file.read()
+            except FileNotFoundError as exc:
+                raise StorageError(f"Tas du texte introuvable : {exc.filename}") from exc
+        with timings.phase("build"):
+            tasks = []
+            for number, fields in enumerate(
+                SLOT.iter_unpack(data[: SLOT.size * slots])
+            ):
+                flags, task_id, priorite, ordinal = fields[:4]
+                if flags & DELETED:
+                    continue
+                task = RecordTache.__new__(RecordTache)
+                task.titre = str(heap[fields[4] : fields[4] + fields[5]], "utf-8")
+                if flags & HAS_DESCRIPTION:
+                    start = fields[6]
+                    task.description = str(heap[start : start + fields[7]], "utf-8")
+                else:
+                    task.description = None
+                task.priorite = priorite
+                # pylint: disable=protected-access
+                if flags & HAS_DATE_TEXT:
+                    start = fields[6] + fields[7]
+                    task._ordinal = None
+                    task._date_limite = str(heap[start : start + ordinal], "utf-8")
+                elif ordinal:
+                    task._ordinal = ordinal
+                    task._date_limite = date.fromordinal(ordinal).isoformat()
+                else:
+                    task._ordinal = task._date_limite = None
+                task.task_id = task_id if flags & HAS_ID else None
+                task.slot = number
+                tasks.append(task)
+        return tasks
+
+    def count(self):
+        """Retourne le nombre de tâches, lu dans l'en-tête du fichier.
+
+        Returns:
+            int: Le nombre de tâches.
+        """
+        try:
+            with open(self.filename, "rb") as file:
+                return read_header(file, self.filename)[1]
+        except FileNotFoundError:
+            return 0
+
+    def save(self, tasks):
+        """Réécrit les fiches et le tas de manière compacte, sans fiche libre.
+
+        Le texte est écrit dans un nouveau tas, puis le fichier des fiches est remplacé
+        atomiquement ; l'ancien tas est ensuite supprimé.
+
+        Args:
+            tasks (iterable[Tache]): Tâches à sauvegarder.
+        """
+        stored = self._read()
+        old_number = None if stored is None else stored[0][3]
+        number = 0 if old_number is None else old_number + 1
+        records = []
+        position = 0
+        with AtomicFile(heap_path(self.filename, number), self.durability, None) as heap:
+            for task in tasks:
+                flags = 0 if task.task_id is None else HAS_ID
+                title = encode_text(task.titre)
+                description = encode_text(task.description)
+                date_text = encode_date_text(task)
+                if task.description is not None:
+                    flags |= HAS_DESCRIPTION
+                if date_text is not None:
+                    flags |= HAS_DATE_TEXT
+                    ordinal = len(date_text)
+                else:
+                    date_text = b""
+                    ordinal = task.date_ordinal or 0
+                heap.write(title)
+                heap.write(description)
+                heap.write(date_text)
+                records.append(
+                    SLOT.pack(
+                        flags,
+                        task.task_id or 0,
+                        task.priorite,
+                        ordinal,
+                        position,
+                        len(title),
+                        position + len(title),
+                        len(description),
+                    )
+                )
+                position += len(title) + len(description) + len(date_text)
+        with AtomicFile(self.filename, self.durability, None) as file:
+            file.write(
+                HEADER.pack(MAGIC, VERSION, 0, len(records), len(records), NO_SLOT, number)
+            )
+            file.write(b"".join(records))
+        timings.count("bytes_written", position + HEADER.size + SLOT.size * len(records))
+        if old_number is not None:
+            try:
+                os.remove(heap_path(self.filename, old_number))
+            except FileNotFoundError:
+                pass
+
+    def apply(self, tasks, changes):
+        """Modifie sur place les fiches des tâches ajoutées, modifiées ou supprimées.
+
+        Args:
+            tasks (list[Tache]): Tâches après modification, réécrites seulement si le\
+                  fichier n'existe pas encore.
+            changes (list[tuple[str, Tache]]): Modifications (opération, tâche).
+        """
+        if not os.path.exists(self.filename):
+            self.save(tasks)
+            return
+        records = RecordFile(self.filename)
+        try:
+            for operation, task in changes:
+                if operation == "add":
+                    records.add(task)
+                elif operation == "edit":
+                    records.edit(task)
+                elif operation == "remove":
+                    records.remove(task)
+            timings.count("bytes_written", records.commit(self.durability))
+        finally:
+            records.close()
+
+    def disk_usage(self):
+        """Retourne la taille du fichier des fiches et de son tas, en octets.
+
+        Returns:
+            int: La taille en octets.
+        """
+        stored = self._read()
+        if stored is None:
+            return 0
+        heap = heap_path(self.filename, stored[0][3])
+        return os.path.getsize(self.filename) + (
+            os.path.getsize(heap) if os.path.exists(heap) else 0
+        )
+
+    # Pas d'index trié ni d'index de recherche : les tâches sont triées et parcourues
+    # par l'appelant.
+    sorted_ids = Storage.sorted_ids
+    search = Storage.search
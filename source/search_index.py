@@ -0,0 +1,466 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+Module search_index.
+
+Ce module définit la classe SearchIndex, un index inversé (mot -> identifiants des
+tâches) sur le titre et la description des tâches, utilisé par la commande ``search``.
+
+Les mots sont normalisés sans casse ni accents (« Été » et « ete » sont le même mot).
+Le vocabulaire est conservé trié : un préfixe (``boulang*``) est résolu par recherche
+dichotomique, sans parcourir tous les mots.
+
+Syntaxe des requêtes : les termes sont combinés par ET ; le mot-clé ``OR`` sépare des
+groupes combinés par OU. Par exemple ``pain lait OR boulang*`` trouve les tâches
+contenant « pain » et « lait », ou un mot commençant par « boulang ».
+
+Comme les index triés (voir source.sorted_index), l'index est sauvegardé à côté du
+fichier des tâches (``tasks.json.search``), mis à jour à chaque modification et ignoré
+si les fichiers de données ont été modifiés hors de l'application. Il suit le format de
+source.index_log : la base contient le vocabulaire trié, une table de positions (une
+par mot) et, après chaque mot, les identifiants de ses tâches ; une recherche n'y lit
+que les mots demandés, par dichotomie (SearchIndexFile). Les modifications suivantes
+sont ajoutées au journal ``tasks.json.search.log`` (une ligne ``[identifiant, mots]``
+par tâche modifiée, ``[identifiant]`` par tâche supprimée).
+"""
+
+import bisect
+import re
+import unicodedata
+
+from source import index_log
+from source.atomic import AtomicFile
+from source.sorted_index import data_signature
+
+SEARCH_SUFFIX = ".search"  # Suffixe du fichier d'index, à côté du fichier des tâches
+MAGIC = b"TMS1"  # Signature du format de la base de l'index
+VERSION = 1  # Version du format
+OR_KEYWORD = "OR"  # Mot-clé séparant les groupes de termes d'une requête
+PREFIX_MARK = "*"  # Suffixe d'un terme recherché comme préfixe
+
+WORD_PATTERN = re.compile(r"\w+")
+
+
+def normalize(word):
+    """Retire les accents d'un mot déjà en minuscules.
+
+    Args:
+        word (str): Le mot.
+
+    Returns:
+        str: Le mot sans accents.
+    """
+    if word.isascii():
+        return word
+    decomposed = unicodedata.normalize("NFKD", word)
+    return "".join(char for char in decomposed if not unicodedata.combining(char))
+
+
+def tokenize(text):
+    """Découpe un texte en mots normalisés, sans casse ni accents.
+
+    Args:
+        text (str or None): Le texte.
+
+    Returns:
+        set[str]: Les mots distincts du texte.
+    """
+    if not text:
+        return set()
+    return {normalize(word) for word in WORD_PATTERN.findall(text.casefold())}
+
+
+def task_tokens(task):
+    """Retourne les mots indexés d'une tâche (titre et description).
+
+    Args:
+        task (Tache): La tâche.
+
+    Returns:
+        set[str]: Les mots distincts.
+    """
+    return tokenize(task.titre) | tokenize(task.description)
+
+
+def parse_query(terms):
+    """Analyse les termes d'une requête.
+
+    Args:
+        terms (list[str]): Les termes, par exemple ``["pain", "OR", "boulang*"]``.
+
+    Returns:
+        list[list[tuple[str, bool]]]: Groupes combinés par OU, chacun formé de couples\
+              (mot, préfixe) combinés par ET.
+    """
+    groups = [[]]
+    for term in terms:
+        if term == OR_KEYWORD:
+            groups.append([])
+            continue
+        prefix = term.endswith(PREFIX_MARK)
+        words = sorted(tokenize(term.rstrip(PREFIX_MARK)))
+        # Seul le dernier mot d'un terme comme « l'école* » est un préfixe.
+        groups[-1].extend((word, prefix and word == words[-1]) for word in words)
+    return [group for group in groups if group]
+
+
+def run_query(lookup, terms):
+    """Retourne les identifiants des tâches correspondant à une requête.
+
+    Args:
+        lookup (callable): Fonction ``lookup(mot, préfixe)`` retournant les\
+              identifiants des tâches contenant un mot.
+        terms (list[str]): Les termes de la requête (voir parse_query).
+
+    Returns:
+        set[int]: Les identifiants trouvés.
+    """
+    found = set()
+    for group in parse_query(terms):
+        # Les ensembles les plus petits d'abord : l'intersection reste petite.
+        matches = sorted((lookup(word, prefix) for word, prefix in group), key=len)
+        group_ids = set(matches[0])
+        for ids in matches[1:]:
+            group_ids &= ids
+        found |= group_ids
+    return found
+
+
+def search_path(filename):
+    """Retourne le chemin de l'index de recherche associé à un fichier de sauvegarde.
+
+    Args:
+        filename (str): Chemin du fichier de sauvegarde.
+
+    Returns:
+        str: Chemin du fichier d'index.
+    """
+    return filename + SEARCH_SUFFIX
+
+
+class SearchIndex:
+    """Index inversé des mots du titre et de la description des tâches.
+
+    Attributes:
+        postings (dict[str, set[int]]): Mot -> identifiants des tâches qui le contiennent.
+    """
+
+    def __init__(self, postings=None):
+        """Initialise l'index.
+
+        Args:
+            postings (dict[str, iterable[int]], optional): Mot -> identifiants.\
+                  Defaults to None (index vide).
+        """
+        self.postings = {word: set(ids) for word, ids in (postings or {}).items()}
+        self._vocabulary = None
+
+    @classmethod
+    def build(cls, tasks):
+        """Construit l'index de toutes les tâches.
+
+        Args:
+            tasks (iterable[Tache]): Les tâches.
+
+        Returns:
+            SearchIndex: L'index construit.
+        """
+        index = cls()
+        for task in tasks:
+            index.insert(task)
+        return index
+
+    def insert(self, task):
+        """Indexe une tâche qui ne figure pas encore dans l'index.
+
+        Args:
+            task (Tache): La tâche.
+        """
+        for word in task_tokens(task):
+            if word not in self.postings:
+                self.postings[word] = set()
+                self._vocabulary = None
+            self.postings[word].add(task.task_id)
+
+    def lookup(self, word, prefix=False):
+        """Retourne les identifiants des tâches contenant un mot.
+
+        Args:
+            word (str): Le mot normalisé.
+            prefix (bool, optional): Accepte aussi les mots commençant par ``word``.\
+                  Defaults to False.
+
+        Returns:
+            set[int]: Les identifiants.
+        """
+        if not prefix:
+            return self.postings.get(word, set())
+        vocabulary = self._sorted_vocabulary()
+        ids = set()
+        start = bisect.bisect_left(vocabulary, word)
+        for candidate in vocabulary[start:]:
+            if not candidate.startswith(word):
+                break
+            ids |= self.postings[candidate]
+        return ids
+
+    def search(self, terms):
+        """Retourne les identifiants des tâches correspondant à une requête.
+
+        Args:
+            terms (list[str]): Les termes de la requête (voir parse_query).
+
+        Returns:
+            set[int]: Les identifiants trouvés.
+        """
+        return run_query(self.lookup, terms)
+
+    def _sorted_vocabulary(self):
+        """Retourne le vocabulaire trié, recalculé seulement après un nouveau mot.
+
+        Returns:
+            list[str]: Les mots triés.
+        """
+        if self._vocabulary is None:
+            self._vocabulary = sorted(self.postings)
+        return self._vocabulary
+
+    def save(self, filename):
+        """Sauvegarde la base de l'index avec la signature actuelle des fichiers de données.
+
+        Le journal de l'index est supprimé : la base contient toutes les tâches.
+
+        Args:
+            filename (str): Chemin du fichier de sauvegarde.
+        """
+        path = search_path(filename)
+        index_log.clear_log(path)
+        header = index_log.pack_header(MAGIC, VERSION, data_signature(filename))
+        vocabulary = self._sorted_vocabulary()
+        entries = []
+        offsets = []
+        position = len(header) + 8 * (1 + len(vocabulary))
+        for word in vocabulary:
+            data = word.encode("utf-8")
+            ids = sorted(self.postings[word])
+            entries.append(index_log.pack_ints([len(data), len(ids)]) + data)
+            entries.append(index_log.pack_ints(ids))
+            offsets.append(position)
+            position += 16 + len(data) + 8 * len(ids)
+        # Index reconstructible : remplacement atomique, sans fsync.
+        with AtomicFile(path, durability="off", encoding=None) as file:
+            file.write(header)
+            file.write(index_log.pack_ints([len(vocabulary)] + offsets))
+            file.writelines(entries)
+
+
+class _Words:
+    """Vocabulaire trié de la base, lu à la demande par la recherche dichotomique."""
+
+    def __init__(self, buffer, offset, count):
+        """Initialise la vue.
+
+        Args:
+            buffer (mmap.mmap): La base de l'index.
+            offset (int): Position de la table des positions des mots.
+            count (int): Nombre de mots.
+        """
+        self.buffer = buffer
+        self.offset = offset
+        self.count = count
+
+    def __len__(self):
+        """Retourne le nombre de mots.
+
+        Returns:
+            int: Le nombre de mots.
+        """
+        return self.count
+
+    def entry(self, rank):
+        """Retourne la position, la longueur et le nombre d'identifiants d'un mot.
+
+        Args:
+            rank (int): Rang du mot dans le vocabulaire.
+
+        Returns:
+            tuple[int, int, int]: Position du mot encodé, sa longueur et le nombre\
+                  d'identifiants qui le suivent.
+        """
+        position = index_log.unpack_ints(self.buffer, self.offset + 8 * rank, 1)[0]
+        length, count = index_log.unpack_ints(self.buffer, position, 2)
+        return position + 16, length, count
+
+    def __getitem__(self, rank):
+        """Retourne un mot du vocabulaire.
+
+        Args:
+            rank (int): Rang du mot.
+
+        Returns:
+            str: Le mot.
+        """
+        position, length, _ = self.entry(rank)
+        return self.buffer[position:position + length].decode("utf-8")
+
+    def ids(self, rank):
+        """Retourne les identifiants des tâches contenant un mot.
+
+        Args:
+            rank (int): Rang du mot.
+
+        Returns:
+            array: Les identifiants.
+        """
+        position, length, count = self.entry(rank)
+        return index_log.unpack_ints(self.buffer, position + length, count)
+
+
+class SearchIndexFile:
+    """Index inversé sauvegardé, interrogé directement dans le fichier sans être chargé.
+
+    Attributes:
+        changed (dict[int, set[str] or None]): Mots des tâches modifiées depuis la base,\
+              None pour une tâche supprimée.
+    """
+
+    def __init__(self, words, changed):
+        """Initialise l'index.
+
+        Args:
+            words (_Words): Le vocabulaire de la base.
+            changed (dict): Tâches modifiées depuis la base (voir Attributes).
+        """
+        self._words = words
+        self.changed = changed
+
+    @classmethod
+    def open(cls, filename):
+        """Ouvre l'index d'un fichier de sauvegarde s'il est à jour.
+
+        Args:
+            filename (str): Chemin du fichier de sauvegarde.
+
+        Returns:
+            SearchIndexFile or None: L'index, ou None s'il est absent, invalide ou\
+                  périmé.
+        """
+        path = search_path(filename)
+        import mmap  # pylint: disable=import-outside-toplevel
+
+        try:
+            with open(path, "rb") as file:
+                # La base est remplacée par renommage : la projection reste valide.
+                buffer = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+        except (FileNotFoundError, ValueError):
+            return None
+        header = index_log.unpack_header(buffer, MAGIC, VERSION)
+        if header is None or len(buffer) < header[1] + 8:
+            return None
+        signature, offset = header
+        count = index_log.unpack_ints(buffer, offset, 1)[0]
+        if len(buffer) < offset + 8 * (1 + count):
+            return None
+        changed = {}
+        log = index_log.read_log(path)
+        if log is not None:
+            entries, signature = log
+            for entry in entries:
+                changed[entry[0]] = set(entry[1]) if len(entry) > 1 else None
+        if signature != data_signature(filename):
+            return None
+        return cls(_Words(buffer, offset + 8, count), changed)
+
+    def lookup(self, word, prefix=False):
+        """Retourne les identifiants des tâches contenant un mot.
+
+        Le mot est cherché par dichotomie dans le vocabulaire de la base ; les tâches
+        du journal y remplacent leurs anciens mots.
+
+        Args:
+            word (str): Le mot normalisé.
+            prefix (bool, optional): Accepte aussi les mots commençant par ``word``.\
+                  Defaults to False.
+
+        Returns:
+            set[int]: Les identifiants.
+        """
+        words = self._words
+        ids = set()
+        rank = bisect.bisect_left(words, word)
+        while rank < len(words):
+            candidate = words[rank]
+            if candidate != word and not (prefix and candidate.startswith(word)):
+                break
+            ids.update(words.ids(rank))
+            rank += 1
+        if not self.changed:
+            return ids
+        ids.difference_update(self.changed)
+        for task_id, task_words in self.changed.items():
+            if task_words and (
+                word in task_words
+                or prefix and any(other.startswith(word) for other in task_words)
+            ):
+                ids.add(task_id)
+        return ids
+
+    def search(self, terms):
+        """Retourne les identifiants des tâches correspondant à une requête.
+
+        Args:
+            terms (list[str]): Les termes de la requête (voir parse_query).
+
+        Returns:
+            set[int]: Les identifiants trouvés.
+        """
+        return run_query(self.lookup, terms)
+
+
+def is_current(filename):
+    """Indique si l'index sauvegardé est à jour, sans lire ses données.
+
+    Args:
+        filename (str): Chemin du fichier de sauvegarde.
+
+    Returns:
+        bool: True si l'index est à jour et peut être complété par append.
+    """
+    signature = index_log.current_signature(search_path(filename), MAGIC, VERSION)
+    return signature is not None and signature == data_signature(filename)
+
+
+def append(filename, changes):
+    """Ajoute des modifications au journal de l'index, après l'écriture des données.
+
+    Args:
+        filename (str): Chemin du fichier de sauvegarde.
+        changes (list[tuple[str, Tache]]): Modifications (opération, tâche).
+
+    Returns:
+        bool: True si le journal a été complété, False s'il faut reconstruire l'index.
+    """
+    entries = [
+        [task.task_id] if operation == "remove" else [task.task_id, sorted(task_tokens(task))]
+        for operation, task in changes
+    ]
+    return index_log.append_log(search_path(filename), entries, data_signature(filename))
+
+
+def rebuild(filename, tasks):
+    """Reconstruit et sauvegarde l'index de toutes les tâches.
+
+    Args:
+        filename (str): Chemin du fichier de sauvegarde.
+        tasks (iterable[Tache]): Les tâches, qui doivent toutes avoir un identifiant.
+    """
+    SearchIndex.build(tasks).save(filename)
+
+
+def remove(filename):
+    """Supprime le fichier d'index de recherche et son journal s'ils existent.
+
+    Args:
+        filename (str): Chemin du fichier de sauvegarde.
+    """
+    index_log.remove(search_path(filename))
@@ -0,0 +1,156 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+Module shards.
+
+Ce module répartit les tâches en projets (listes de tâches nommées) : chaque projet
+est stocké dans son propre fichier, ou fragment, dans un répertoire de stockage
+(``tasks.d`` par défaut), décrit par un petit manifeste :
+
+    tasks.d/manifest.json   {"projects": {"equipe-a": {"file": "equipe-a.json",
+                                                        "storage": "json"}, ...}}
+    tasks.d/equipe-a.json   Les tâches du projet "equipe-a"
+
+Une commande lancée avec ``--project`` n'ouvre que le fragment de son projet. Un projet
+est enregistré dans le manifeste par la première commande qui le modifie, avec le
+backend de stockage choisi à ce moment-là ; ce backend reste celui du projet. Les
+identifiants des tâches sont propres à chaque projet.
+
+``list --all`` lit tous les projets : chaque fragment produit ses tâches déjà triées
+(index trié, ``ORDER BY`` ou tri du seul fragment) et les flux sont fusionnés par
+merge (fusion à k voies), sans trier de nouveau l'ensemble des tâches.
+"""
+
+import heapq
+import json
+import os
+import re
+
+from source.atomic import AtomicFile
+from source.locking import FileLock
+from source.storage import StorageError, storage_class
+
+DEFAULT_STORE = "tasks.d"  # Répertoire de stockage par défaut des projets
+STORE_ENV = "TASK_MANAGER_STORE"  # Variable d'environnement du répertoire de stockage
+MANIFEST_NAME = "manifest.json"  # Nom du manifeste dans le répertoire de stockage
+
+_PROJECT_NAME = re.compile(r"[\w-][\w.-]*")  # Nom de projet, utilisé comme nom de fichier
+
+
+def store_directory(directory=None):
+    """Retourne le répertoire de stockage des projets.
+
+    Args:
+        directory (str, optional): Répertoire choisi par ``--store``. Defaults to None.
+
+    Returns:
+        str: Le répertoire choisi, sinon celui de STORE_ENV, sinon DEFAULT_STORE.
+    """
+    return directory or os.environ.get(STORE_ENV, DEFAULT_STORE)
+
+
+def manifest_path(directory):
+    """Retourne le chemin du manifeste d'un répertoire de stockage.
+
+    Args:
+        directory (str): Le répertoire de stockage.
+
+    Returns:
+        str: Chemin du manifeste.
+    """
+    return os.path.join(directory, MANIFEST_NAME)
+
+
+def load_manifest(directory):
+    """Charge le manifeste d'un répertoire de stockage.
+
+    Args:
+        directory (str): Le répertoire de stockage.
+
+    Returns:
+        dict: Le manifeste, sans projet si le fichier n'existe pas.
+
+    Raises:
+        StorageError: Si le manifeste n'est pas un JSON valide.
+    """
+    path = manifest_path(directory)
+    try:
+        with open(path, "r", encoding="utf-8") as file:
+            return json.load(file)
+    except FileNotFoundError:
+        return {"projects": {}}
+    except json.JSONDecodeError as exc:
+        raise StorageError(f"Manifeste invalide {path} : {exc}") from exc
+
+
+def resolve(directory, project, storage="json", create=True, durability=None):
+    """Retourne le fragment d'un projet, en l'enregistrant dans le manifeste si besoin.
+
+    Args:
+        directory (str): Le répertoire de stockage.
+        project (str): Nom du projet.
+        storage (str, optional): Backend d'un nouveau projet. Defaults to "json".
+        create (bool, optional): Enregistre un projet inconnu dans le manifeste ; sinon\
+              son fragment est seulement nommé, sans rien écrire. Defaults to True.
+        durability (str, optional): Niveau de durabilité de l'écriture du manifeste.\
+              Defaults to DEFAULT_DURABILITY.
+
+    Returns:
+        tuple[str, str]: Chemin du fragment et nom de son backend de stockage.
+
+    Raises:
+        ValueError: Si le nom du projet ne peut pas servir de nom de fichier.
+    """
+    if not _PROJECT_NAME.fullmatch(project):
+        raise ValueError(f"Nom de projet invalide : {project!r}")
+    entry = load_manifest(directory)["projects"].get(project)
+    if entry is None:
+        extension = os.path.splitext(storage_class(storage).default_filename)[1]
+        entry = {"file": project + extension, "storage": storage}
+        if entry["file"] == MANIFEST_NAME:
+            raise ValueError(f"Nom de projet réservé : {project!r}")
+        if create:
+            os.makedirs(directory, exist_ok=True)
+            path = manifest_path(directory)
+            with FileLock(path):
+                # Relu sous le verrou : un autre processus a pu enregistrer le projet.
+                manifest = load_manifest(directory)
+                entry = manifest["projects"].setdefault(project, entry)
+                with AtomicFile(path, durability) as file:
+                    json.dump(manifest, file, ensure_ascii=False, indent=4)
+    return os.path.join(directory, entry["file"]), entry["storage"]
+
+
+def projects(directory):
+    """Retourne les projets enregistrés dans le manifeste, par ordre de nom.
+
+    Args:
+        directory (str): Le répertoire de stockage.
+
+    Returns:
+        list[tuple[str, str, str]]: Nom, chemin du fragment et backend de chaque projet.
+    """
+    entries = load_manifest(directory)["projects"]
+    return [
+        (name, os.path.join(directory, entry["file"]), entry["storage"])
+        for name, entry in sorted(entries.items())
+    ]
+
+
+def merge(streams, key=None):
+    """Fusionne des flux de tâches déjà triés (fusion à k voies).
+
+    Seule la tâche en tête de chaque flux est gardée en mémoire ; à clé égale, les
+    tâches du premier flux viennent en premier.
+
+    Args:
+        streams (list[iterable[Tache]]): Les flux, triés selon key.
+        key (callable, optional): Clé de tri ; None pour les enchaîner sans tri.\
+              Defaults to None.
+
+    Returns:
+        iterator[Tache]: Les tâches de tous les flux, triées selon key.
+    """
+    if key is None:
+        return (task for stream in streams for task in stream)
+    return heapq.merge(*streams, key=key)
@@ -0,0 +1,319 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+Module shell.
+
+Ce module fournit les modes longue durée de l'application :
+
+    - le mode ``shell``, qui lit des commandes sur l'entrée standard ;
+    - le mode ``daemon``, un serveur local sur socket Unix auquel des clients légers
+      (commande ``client``) envoient une commande par connexion.
+
+Dans les deux cas, les tâches sont chargées une seule fois. Chaque commande est
+analysée avec le même analyseur que la ligne de commande puis confiée à la fonction
+``handle_*`` correspondante. Les modifications sont accumulées et écrites sur disque
+à intervalle régulier (``--flush-interval``) ainsi qu'à la fermeture : les
+modifications de toutes les commandes d'un intervalle forment une seule écriture
+(« group commit »), synchronisée sur disque une seule fois.
+"""
+
+import contextlib
+import io
+import os
+import shlex
+import socket
+import socketserver
+import sys
+import time
+
+from source.locking import ConflictError
+from source.textes import ERROR_MESSAGE
+
+EXIT_COMMANDS = ("exit", "quit", "stop")  # Commandes qui terminent la session
+MAX_FLUSH_ATTEMPTS = 5  # Nombre d'écritures tentées en cas de conflit avec un autre processus
+POLL_INTERVAL = 0.5  # Délai d'attente (s) du démon entre deux vérifications
+
+
+class PendingChanges:
+    """Modifications en attente d'écriture sur disque.
+
+    Attributes:
+        changes (list[tuple[str, Tache]]): Modifications (opération, tâche).
+        changed (dict[int, set[str]]): Attributs modifiés, par identifiant de tâche.
+        full (bool): True si toutes les tâches doivent être réécrites.
+    """
+
+    def __init__(self):
+        """Initialise un lot vide."""
+        self.changes = []
+        self.changed = {}
+        self.full = False
+
+    def __bool__(self):
+        """Indique si des modifications sont en attente.
+
+        Returns:
+            bool: True si une écriture est nécessaire.
+        """
+        return self.full or bool(self.changes)
+
+    def record(self, changes):
+        """Enregistre des modifications.
+
+        Après une demande de réécriture complète, les modifications restent
+        enregistrées : elles sont rejouées si les tâches doivent être rechargées
+        après un conflit d'écriture.
+
+        Args:
+            changes (list[tuple[str, Tache]] or None): Modifications, ou None pour\
+                  demander la réécriture de toutes les tâches.
+        """
+        if changes is None:
+            self.full = True
+        else:
+            self.changes.extend(changes)
+            for operation, task in changes:
+                if operation == "edit":
+                    self.changed.setdefault(task.task_id, set()).update(task.changed_fields)
+
+    def clear(self):
+        """Vide le lot après écriture."""
+        self.changes = []
+        self.changed = {}
+        self.full = False
+
+
+class Session:
+    """Session longue durée partageant une collection de tâches chargée une fois.
+
+    Attributes:
+        parser (argparse.ArgumentParser): Analyseur des commandes.
+        options: Options globales de la session (stockage, fichier, etc.).
+        tasks (TaskStore): Les tâches en mémoire.
+        save (callable): Fonction de sauvegarde, de signature\
+              ``save(tasks, filename, storage, changes=None, durability=None)``.
+        flush_interval (float): Délai minimal (s) entre deux écritures.
+        load (callable or None): Fonction sans argument rechargeant les tâches\
+              (TaskStore) après un conflit d'écriture.
+        pending (PendingChanges): Modifications en attente.
+        stopped (bool): True lorsque la session doit se terminer.
+    """
+
+    def __init__(self, parser, options, tasks, save, flush_interval=1.0, load=None):
+        """Initialise la session.
+
+        Args:
+            parser (argparse.ArgumentParser): Analyseur des commandes.
+            options: Options globales de la session.
+            tasks (TaskStore): Les tâches en mémoire.
+            save (callable): Fonction de sauvegarde.
+            flush_interval (float, optional): Délai minimal (s) entre deux écritures ;\
+                  0 pour écrire après chaque commande. Defaults to 1.0.
+            load (callable, optional): Fonction rechargeant les tâches après un conflit\
+                  d'écriture ; sans elle, le conflit est propagé. Defaults to None.
+        """
+        self.parser = parser
+        self.options = options
+        self.tasks = tasks
+        self.save = save
+        self.flush_interval = flush_interval
+        self.load = load
+        self.pending = PendingChanges()
+        self.stopped = False
+        self._last_flush = time.monotonic()
+
+    def execute(self, line):
+        """Exécute une ligne de commande, par exemple ``add --title "Pain"``.
+
+        Args:
+            line (str): La commande, sans le nom du programme.
+        """
+        try:
+            tokens = shlex.split(line)
+        except ValueError as exc:
+            print(f"Commande invalide : {exc}")
+            return
+        if not tokens:
+            return
+        if tokens[0] in EXIT_COMMANDS:
+            self.stopped = True
+            return
+        args = self.prepare(tokens)
+        if args is None:
+            return
+        args.func(args, self.tasks)
+        self.maybe_flush()
+
+    def prepare(self, tokens):
+        """Analyse une commande et lui associe les options et le lot de la session.
+
+        Args:
+            tokens (list[str]): La commande découpée, sans le nom du programme.
+
+        Returns:
+            argparse.Namespace or None: Les arguments de la commande, ou None si elle\
+                  est invalide ou interdite en session (le message d'erreur est affiché).
+        """
+        try:
+            args = self.parser.parse_args(tokens)
+        except SystemExit:
+            return None
+        if not getattr(args, "func", None) or not getattr(args, "in_session", True):
+            print(ERROR_MESSAGE)
+            return None
+        for name in ("storage", "file", "id_width"):
+            setattr(args, name, getattr(self.options, name))
+        args.pending = self.pending
+        return args
+
+    def execute_captured(self, line):
+        """Exécute une commande en capturant tout ce qu'elle affiche.
+
+        Args:
+            line (str): La commande, sans le nom du programme.
+
+        Returns:
+            str: La sortie standard et la sortie d'erreur de la commande.
+        """
+        output = io.StringIO()
+        with contextlib.redirect_stdout(output), contextlib.redirect_stderr(output):
+            self.execute(line)
+        return output.getvalue()
+
+    def flush_due(self):
+        """Indique si des modifications attendent depuis au moins l'intervalle d'écriture.
+
+        Returns:
+            bool: True si flush doit être appelée.
+        """
+        return bool(self.pending) and (
+            time.monotonic() - self._last_flush >= self.flush_interval
+        )
+
+    def maybe_flush(self):
+        """Écrit les modifications en attente si l'intervalle est écoulé."""
+        if time.monotonic() - self._last_flush >= self.flush_interval:
+            self.flush()
+
+    def flush(self):
+        """Écrit les modifications en attente sur disque.
+
+        Si un autre processus a écrit depuis le chargement des tâches, elles sont
+        rechargées et les modifications en attente rejouées par-dessus avant une
+        nouvelle tentative. Les identifiants réattribués et les modifications de
+        tâches supprimées entre-temps sont signalés.
+
+        Raises:
+            ConflictError: Si le conflit persiste ou si la session ne peut pas recharger\
+                  les tâches.
+        """
+        self._last_flush = time.monotonic()
+        if not self.pending:
+            return
+        options = self.options
+        for attempt in range(1, MAX_FLUSH_ATTEMPTS + 1):
+            try:
+                self.save(
+                    self.tasks,
+                    options.file,
+                    options.storage,
+                    changes=None if self.pending.full else self.pending.changes,
+                    durability=getattr(options, "durability", None),
+                )
+                break
+            except ConflictError:
+                if self.load is None or attempt == MAX_FLUSH_ATTEMPTS:
+                    raise
+                self.tasks = self.load()
+                reassigned, skipped = self.tasks.apply(
+                    self.pending.changes, self.pending.changed
+                )
+                for old_id, new_id in reassigned.items():
+                    print(f"Conflit : la tâche {old_id} a reçu l'ID {new_id}.")
+                for task_id in skipped:
+                    print(
+                        f"Conflit : la tâche {task_id} a été supprimée par un autre"
+                        " processus, sa modification est ignorée."
+                    )
+        self.pending.clear()
+
+
+def run_shell(session, stream=None):
+    """Lit et exécute des commandes jusqu'à la fin de l'entrée ou ``exit``.
+
+    Args:
+        session (Session): La session.
+        stream (TextIO, optional): Flux de commandes. Defaults to sys.stdin.
+    """
+    stream = stream or sys.stdin
+    interactive = stream.isatty()
+    try:
+        while not session.stopped:
+            if interactive:
+                print("> ", end="", flush=True)
+            line = stream.readline()
+            if not line:
+                break
+            session.execute(line)
+    finally:
+        session.flush()
+
+
+def serve(session, socket_path):
+    """Sert les commandes reçues sur une socket Unix jusqu'à la commande ``stop``.
+
+    Chaque connexion transporte une commande (une ligne) et reçoit sa sortie. Les
+    connexions sont traitées l'une après l'autre : les tâches ne sont jamais
+    modifiées en parallèle.
+
+    Args:
+        session (Session): La session.
+        socket_path (str): Chemin de la socket Unix.
+    """
+
+    class Handler(socketserver.StreamRequestHandler):
+        """Exécute la commande reçue et renvoie sa sortie."""
+
+        def handle(self):
+            """Traite une connexion."""
+            line = self.rfile.readline().decode("utf-8")
+            self.wfile.write(session.execute_captured(line).encode("utf-8"))
+
+    with contextlib.suppress(FileNotFoundError):
+        os.remove(socket_path)
+    server = socketserver.UnixStreamServer(socket_path, Handler)
+    server.timeout = POLL_INTERVAL
+    try:
+        while not session.stopped:
+            server.handle_request()
+            session.maybe_flush()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+        session.flush()
+        with contextlib.suppress(FileNotFoundError):
+            os.remove(socket_path)
+
+
+def send_command(socket_path, line):
+    """Envoie une commande à un démon et retourne sa sortie.
+
+    Args:
+        socket_path (str): Chemin de la socket Unix du démon.
+        line (str): La commande, sans le nom du programme.
+
+    Returns:
+        str: La sortie de la commande.
+    """
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as client:
+        client.connect(socket_path)
+        client.sendall(line.encode("utf-8") + b"\n")
+        client.shutdown(socket.SHUT_WR)
+        chunks = []
+        while True:
+            chunk = client.recv(65536)
+            if not chunk:
+                break
+            chunks.append(chunk)
+    return b"".join(chunks).decode("utf-8")
@@ -0,0 +1,164 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+Module snapshot_cache.
+
+Ce module conserve à côté d'un fichier JSON (``tasks.json.cache``) un instantané des
+tâches déjà décodées, au format ``marshal`` : une commande qui relit un fichier
+inchangé reconstruit les tâches depuis l'instantané, sans ``json.load`` ni
+``Tache.from_dict``.
+
+L'instantané est associé à une clé : taille, date de modification (en nanosecondes)
+et empreinte BLAKE2 du contenu du fichier. Le fichier est lu une seule fois ; la clé
+est calculée sur les octets lus, et l'instantané n'est utilisé que si sa clé est
+identique. Un fichier modifié sans changer de taille ni de date de modification est
+donc détecté par l'empreinte. Un instantané périmé, illisible ou d'une autre version
+est ignoré puis remplacé.
+
+Les petits fichiers (moins de MIN_SIZE octets), plus rapides à décoder qu'à
+vérifier, ne sont pas mis en cache, de même que les instantanés de plus de
+``TASK_MANAGER_CACHE_SIZE`` octets (MAX_SIZE par défaut, 0 désactive le cache).
+La commande ``cache clear`` supprime l'instantané.
+"""
+
+import marshal
+import os
+import struct
+
+from source import timings
+from source.atomic import AtomicFile
+from source.tache import from_rows
+
+CACHE_SUFFIX = ".cache"  # Suffixe de l'instantané, à côté du fichier JSON
+CACHE_VERSION = 1  # Version du format de l'instantané
+MIN_SIZE = 64 * 1024  # Taille minimale (octets) d'un fichier mis en cache
+MAX_SIZE = 256 * 1024 * 1024  # Taille maximale (octets) d'un instantané, par défaut
+SIZE_ENV = "TASK_MANAGER_CACHE_SIZE"  # Variable d'environnement de la taille maximale
+# Longueur de la clé sérialisée, en tête de l'instantané (la clé est vérifiée avant de
+# lire les tâches)
+KEY_LENGTH = struct.Struct("<I")
+
+
+def cache_path(filename):
+    """Retourne le chemin de l'instantané associé à un fichier de sauvegarde.
+
+    Args:
+        filename (str): Chemin du fichier de sauvegarde.
+
+    Returns:
+        str: Chemin de l'instantané.
+    """
+    return filename + CACHE_SUFFIX
+
+
+def max_size():
+    """Retourne la taille maximale d'un instantané.
+
+    Returns:
+        int: La taille en octets, lue dans SIZE_ENV ou MAX_SIZE ; 0 désactive le cache.
+    """
+    try:
+        return int(os.environ.get(SIZE_ENV, MAX_SIZE))
+    except ValueError:
+        return MAX_SIZE
+
+
+def cache_key(stat, data):
+    """Calcule la clé d'un fichier : taille, date de modification et empreinte.
+
+    Args:
+        stat (os.stat_result): État du fichier, pris pendant sa lecture.
+        data (bytes): Contenu du fichier.
+
+    Returns:
+        tuple or None: La clé, ou None si le fichier n'est pas mis en cache.
+    """
+    if len(data) < MIN_SIZE or max_size() <= 0:
+        return None
+    import hashlib  # pylint: disable=import-outside-toplevel
+
+    digest = hashlib.blake2b(data, digest_size=16).digest()
+    return (CACHE_VERSION, stat.st_size, stat.st_mtime_ns, digest)
+
+
+def load(filename, key):
+    """Reconstruit les tâches depuis l'instantané, s'il correspond à la clé.
+
+    Args:
+        filename (str): Chemin du fichier de sauvegarde.
+        key (tuple or None): Clé du fichier lu (voir cache_key).
+
+    Returns:
+        list[Tache] or None: Les tâches, ou None si l'instantané est absent, périmé ou\
+              illisible.
+    """
+    if key is None:
+        return None
+    try:
+        with open(cache_path(filename), "rb") as file:
+            (length,) = KEY_LENGTH.unpack(file.read(KEY_LENGTH.size))
+            if marshal.loads(file.read(length)) != key:
+                return None
+            # marshal.loads sur le contenu entier : marshal.load lit le fichier par
+            # petits morceaux, bien plus lentement.
+            rows = marshal.loads(file.read())
+    except (OSError, EOFError, ValueError, TypeError, struct.error):
+        return None
+    timings.count("cache_hits")
+    with timings.phase("build"):
+        # Les valeurs ont été validées au décodage du fichier.
+        tasks = from_rows(rows)
+    return tasks
+
+
+def save(filename, key, tasks):
+    """Écrit l'instantané des tâches décodées, s'il ne dépasse pas la taille maximale.
+
+    Args:
+        filename (str): Chemin du fichier de sauvegarde.
+        key (tuple or None): Clé du fichier lu (voir cache_key) ; rien n'est écrit\
+              pour None.
+        tasks (list[Tache]): Les tâches décodées du fichier.
+    """
+    if key is None:
+        return
+    rows = marshal.dumps(
+        [
+            (
+                task.titre,
+                task.description,
+                task.priorite,
+                task.date_limite,
+                task.date_ordinal,
+                task.task_id,
+            )
+            for task in tasks
+        ]
+    )
+    if len(rows) > max_size():
+        clear(filename)
+        return
+    try:
+        # Un instantané perdu est reconstruit : aucune synchronisation sur disque.
+        with AtomicFile(cache_path(filename), "off", encoding=None) as file:
+            header = marshal.dumps(key)
+            file.write(KEY_LENGTH.pack(len(header)) + header)
+            file.write(rows)
+    except OSError:
+        pass  # Répertoire en lecture seule : les tâches sont décodées à chaque fois.
+
+
+def clear(filename):
+    """Supprime l'instantané associé à un fichier de sauvegarde.
+
+    Args:
+        filename (str): Chemin du fichier de sauvegarde.
+
+    Returns:
+        bool: True si un instantané a été supprimé.
+    """
+    try:
+        os.remove(cache_path(filename))
+    except FileNotFoundError:
+        return False
+    return True
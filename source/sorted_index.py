@@ -0,0 +1,365 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+Module sorted_index.
+
+Ce module définit la classe SortedIndex, un ensemble d'index secondaires triés sur la
+priorité et sur la date limite des tâches, sauvegardé à côté du fichier des tâches
+(par exemple ``tasks.json.idx``).
+
+Chaque index est une liste de couples (clé, identifiant) triée ; à clé égale, les
+tâches sont ordonnées par identifiant. Les ajouts, modifications et suppressions ne
+retrient pas l'index : ils sont ajoutés à son journal (voir plus bas).
+
+La date limite est indexée sous forme de date analysée (Tache.date_ordinal) et non
+de chaîne : une tâche sans date passe en premier. La recherche des tâches dont
+l'échéance est comprise entre deux dates (ids_between) se fait aussi par dichotomie.
+
+Sur disque, l'index suit le format de source.index_log : la base contient, pour chaque
+critère, les couples triés sur 2 x 8 octets, cherchés par dichotomie directement dans
+le fichier (SortedIndexFile) ; les modifications suivantes sont ajoutées au journal
+``tasks.json.idx.log`` (une ligne ``[identifiant, priorité, jour]`` par tâche
+modifiée, ``[identifiant]`` par tâche supprimée) et fusionnées à la lecture.
+
+L'index enregistre la taille et la date de modification des fichiers de données
+(fichier des tâches et journal). S'ils ont été modifiés sans passer par l'application,
+l'index est considéré comme périmé et ignoré.
+"""
+
+import bisect
+import heapq
+import os
+
+from source import index_log, journal
+from source.atomic import AtomicFile
+
+INDEX_SUFFIX = ".idx"  # Suffixe du fichier d'index, à côté du fichier des tâches
+NO_DATE = 0  # Clé des tâches sans date limite, placées en premier
+MAGIC = b"TMX1"  # Signature du format de la base de l'index
+VERSION = 1  # Version du format
+
+# Critère de tri indexé -> fonction calculant la clé d'une tâche
+INDEX_KEYS = {
+    "priority": lambda task: task.priorite,
+    "due": lambda task: task.date_ordinal or NO_DATE,
+}
+
+
+def index_path(filename):
+    """Retourne le chemin du fichier d'index associé à un fichier de sauvegarde.
+
+    Args:
+        filename (str): Chemin du fichier de sauvegarde.
+
+    Returns:
+        str: Chemin du fichier d'index.
+    """
+    return filename + INDEX_SUFFIX
+
+
+def data_signature(filename):
+    """Retourne la taille et la date de modification des fichiers de données.
+
+    Args:
+        filename (str): Chemin du fichier de sauvegarde.
+
+    Returns:
+        list[list[int] or None]: ``[taille, mtime_ns]`` du fichier et de son journal,\
+              None pour un fichier absent.
+    """
+    signature = []
+    for path in (filename, journal.journal_path(filename)):
+        try:
+            stat = os.stat(path)
+        except FileNotFoundError:
+            signature.append(None)
+        else:
+            signature.append([stat.st_size, stat.st_mtime_ns])
+    return signature
+
+
+class SortedIndex:
+    """Index secondaires triés, un par critère de INDEX_KEYS.
+
+    Attributes:
+        entries (dict[str, list[list[int]]]): Critère -> couples [clé, identifiant]\
+              triés.
+    """
+
+    def __init__(self, entries=None):
+        """Initialise l'index.
+
+        Args:
+            entries (dict, optional): Couples triés par critère. Defaults to None\
+                  (index vides).
+        """
+        self.entries = {sort: [] for sort in INDEX_KEYS}
+        for sort, pairs in (entries or {}).items():
+            self.entries[sort] = [list(pair) for pair in pairs]
+
+    @classmethod
+    def build(cls, tasks):
+        """Construit l'index de toutes les tâches.
+
+        Args:
+            tasks (iterable[Tache]): Les tâches, qui doivent toutes avoir un identifiant.
+
+        Returns:
+            SortedIndex: L'index construit.
+        """
+        tasks = list(tasks)
+        return cls(
+            {
+                sort: sorted([key(task), task.task_id] for task in tasks)
+                for sort, key in INDEX_KEYS.items()
+            }
+        )
+
+    def __len__(self):
+        """Retourne le nombre de tâches indexées.
+
+        Returns:
+            int: Le nombre de tâches.
+        """
+        return len(self.entries["priority"])
+
+    def ids(self, sort):
+        """Retourne les identifiants des tâches dans l'ordre d'un critère.
+
+        Args:
+            sort (str): Critère de tri ("priority" ou "due").
+
+        Returns:
+            list[int]: Les identifiants triés.
+        """
+        return [task_id for _, task_id in self.entries[sort]]
+
+    def ids_between(self, sort, low=None, high=None):
+        """Retourne les identifiants dont la clé est comprise entre deux bornes.
+
+        Args:
+            sort (str): Critère ("priority" ou "due").
+            low (int, optional): Borne inférieure incluse. Defaults to None.
+            high (int, optional): Borne supérieure incluse. Defaults to None.
+
+        Returns:
+            list[int]: Les identifiants, dans l'ordre du critère.
+        """
+        pairs = self.entries[sort]
+        start = 0 if low is None else bisect.bisect_left(pairs, [low])
+        stop = len(pairs) if high is None else bisect.bisect_left(pairs, [high + 1])
+        return [task_id for _, task_id in pairs[start:stop]]
+
+    def save(self, filename):
+        """Sauvegarde la base de l'index avec la signature actuelle des fichiers de données.
+
+        Le journal de l'index est supprimé : la base contient toutes les tâches.
+
+        Args:
+            filename (str): Chemin du fichier de sauvegarde.
+        """
+        path = index_path(filename)
+        index_log.clear_log(path)
+        # Index reconstructible : remplacement atomique, sans fsync.
+        with AtomicFile(path, durability="off", encoding=None) as file:
+            file.write(index_log.pack_header(MAGIC, VERSION, data_signature(filename)))
+            file.write(index_log.pack_ints([len(self)]))
+            for sort in INDEX_KEYS:
+                pairs = self.entries[sort]
+                file.write(index_log.pack_ints(value for pair in pairs for value in pair))
+
+
+class _Keys:
+    """Clés d'une section de la base, lues à la demande par la recherche dichotomique."""
+
+    def __init__(self, buffer, offset, count):
+        """Initialise la vue.
+
+        Args:
+            buffer (mmap.mmap): La base de l'index.
+            offset (int): Position du premier couple de la section.
+            count (int): Nombre de couples.
+        """
+        self.buffer = buffer
+        self.offset = offset
+        self.count = count
+
+    def __len__(self):
+        """Retourne le nombre de couples.
+
+        Returns:
+            int: Le nombre de couples.
+        """
+        return self.count
+
+    def __getitem__(self, position):
+        """Retourne la clé d'un couple.
+
+        Args:
+            position (int): Rang du couple.
+
+        Returns:
+            int: La clé.
+        """
+        return index_log.unpack_ints(self.buffer, self.offset + 16 * position, 1)[0]
+
+
+class SortedIndexFile:
+    """Index trié sauvegardé, lu directement dans le fichier sans être chargé.
+
+    Attributes:
+        changed (dict[int, tuple[int, ...] or None]): Clés (une par critère de\
+              INDEX_KEYS) des tâches modifiées depuis la base, None pour une tâche\
+              supprimée.
+    """
+
+    def __init__(self, buffer, offset, count, changed):
+        """Initialise l'index.
+
+        Args:
+            buffer (mmap.mmap): La base de l'index.
+            offset (int): Position de la première section.
+            count (int): Nombre de couples de chaque section.
+            changed (dict): Tâches modifiées depuis la base (voir Attributes).
+        """
+        self._buffer = buffer
+        self._offset = offset
+        self._count = count
+        self.changed = changed
+
+    @classmethod
+    def open(cls, filename):
+        """Ouvre l'index d'un fichier de sauvegarde s'il est à jour.
+
+        Args:
+            filename (str): Chemin du fichier de sauvegarde.
+
+        Returns:
+            SortedIndexFile or None: L'index, ou None s'il est absent, invalide ou\
+                  périmé.
+        """
+        path = index_path(filename)
+        import mmap  # pylint: disable=import-outside-toplevel
+
+        try:
+            with open(path, "rb") as file:
+                # La base est remplacée par renommage : la projection reste valide.
+                buffer = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+        except (FileNotFoundError, ValueError):
+            return None
+        header = index_log.unpack_header(buffer, MAGIC, VERSION)
+        if header is None or len(buffer) < header[1] + 8:
+            return None
+        signature, offset = header
+        count = index_log.unpack_ints(buffer, offset, 1)[0]
+        if len(buffer) < offset + 8 + 16 * count * len(INDEX_KEYS):
+            return None
+        changed = {}
+        log = index_log.read_log(path)
+        if log is not None:
+            entries, signature = log
+            for task_id, *keys in entries:
+                changed[task_id] = tuple(keys) or None
+        if signature != data_signature(filename):
+            return None
+        return cls(buffer, offset + 8, count, changed)
+
+    def ids(self, sort):
+        """Retourne les identifiants des tâches dans l'ordre d'un critère.
+
+        Args:
+            sort (str): Critère de tri ("priority" ou "due").
+
+        Returns:
+            list[int]: Les identifiants triés.
+        """
+        return self.ids_between(sort)
+
+    def ids_between(self, sort, low=None, high=None):
+        """Retourne les identifiants dont la clé est comprise entre deux bornes.
+
+        Les bornes sont cherchées par dichotomie dans la base ; les tâches du journal
+        y remplacent leur ancienne position.
+
+        Args:
+            sort (str): Critère ("priority" ou "due").
+            low (int, optional): Borne inférieure incluse. Defaults to None.
+            high (int, optional): Borne supérieure incluse. Defaults to None.
+
+        Returns:
+            list[int]: Les identifiants, dans l'ordre du critère.
+        """
+        rank = list(INDEX_KEYS).index(sort)
+        keys = _Keys(self._buffer, self._offset + 16 * self._count * rank, self._count)
+        start = 0 if low is None else bisect.bisect_left(keys, low)
+        stop = len(keys) if high is None else bisect.bisect_left(keys, high + 1)
+        values = index_log.unpack_ints(
+            self._buffer, keys.offset + 16 * start, 2 * (stop - start)
+        )
+        if not self.changed:
+            return values[1::2].tolist()
+        changed = self.changed
+        base = (
+            (key, task_id)
+            for key, task_id in zip(values[0::2], values[1::2])
+            if task_id not in changed
+        )
+        moved = sorted(
+            (task_keys[rank], task_id)
+            for task_id, task_keys in changed.items()
+            if task_keys is not None
+            and (low is None or task_keys[rank] >= low)
+            and (high is None or task_keys[rank] <= high)
+        )
+        return [task_id for _, task_id in heapq.merge(base, moved)]
+
+
+def is_current(filename):
+    """Indique si l'index sauvegardé est à jour, sans lire ses données.
+
+    Args:
+        filename (str): Chemin du fichier de sauvegarde.
+
+    Returns:
+        bool: True si l'index est à jour et peut être complété par append.
+    """
+    signature = index_log.current_signature(index_path(filename), MAGIC, VERSION)
+    return signature is not None and signature == data_signature(filename)
+
+
+def append(filename, changes):
+    """Ajoute des modifications au journal de l'index, après l'écriture des données.
+
+    Args:
+        filename (str): Chemin du fichier de sauvegarde.
+        changes (list[tuple[str, Tache]]): Modifications (opération, tâche).
+
+    Returns:
+        bool: True si le journal a été complété, False s'il faut reconstruire l'index.
+    """
+    entries = [
+        [task.task_id]
+        if operation == "remove"
+        else [task.task_id] + [key(task) for key in INDEX_KEYS.values()]
+        for operation, task in changes
+    ]
+    return index_log.append_log(index_path(filename), entries, data_signature(filename))
+
+
+def rebuild(filename, tasks):
+    """Reconstruit et sauvegarde l'index de toutes les tâches.
+
+    Args:
+        filename (str): Chemin du fichier de sauvegarde.
+        tasks (iterable[Tache]): Les tâches, qui doivent toutes avoir un identifiant.
+    """
+    SortedIndex.build(tasks).save(filename)
+
+
+def remove(filename):
+    """Supprime le fichier d'index et son journal s'ils existent.
+
+    Args:
+        filename (str): Chemin du fichier de sauvegarde.
+    """
+    index_log.remove(index_path(filename))
@@ -0,0 +1,236 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+Module sqlite_storage.
+
+Ce module fournit un backend de stockage basé sur le module standard sqlite3.
+
+Les colonnes task_id, priorite et date_limite sont indexées : une suppression ou
+une modification ne touche qu'une seule ligne, et le tri de la commande ``list``
+est délégué à un ``ORDER BY`` indexé.
+
+Chaque sauvegarde est une transaction SQLite, atomique par construction, qui écrit
+les tâches et les métadonnées ensemble ; le niveau de durabilité (voir source.atomic)
+est transmis à ``PRAGMA synchronous``. Les lectures ouvrent la base en lecture seule :
+lire une base absente ne la crée pas. Une tâche modifiée ou supprimée par identifiant
+est lue et écrite seule, sans charger les autres (voir ``partial_apply``).
+"""
+
+import os
+import sqlite3
+
+from pathlib import Path
+
+from source.storage import SORT_FIELDS, Storage
+from source.tache import Tache
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS tasks (
+    task_id INTEGER,
+    titre TEXT NOT NULL,
+    description TEXT,
+    priorite INTEGER NOT NULL DEFAULT 1,
+    date_limite TEXT
+);
+CREATE UNIQUE INDEX IF NOT EXISTS idx_tasks_task_id ON tasks (task_id);
+CREATE INDEX IF NOT EXISTS idx_tasks_priorite ON tasks (priorite);
+CREATE INDEX IF NOT EXISTS idx_tasks_date_limite ON tasks (date_limite);
+CREATE TABLE IF NOT EXISTS meta (
+    key TEXT PRIMARY KEY,
+    value
+);
+"""
+
+# Niveau de durabilité -> valeur de PRAGMA synchronous
+SYNCHRONOUS = {"off": "OFF", "normal": "NORMAL", "full": "FULL"}
+
+COLUMNS = ("task_id", "titre", "description", "priorite", "date_limite")
+
+
+def _row(task):
+    """Convertit une tâche en tuple de valeurs dans l'ordre de COLUMNS.
+
+    Args:
+        task (Tache): La tâche à convertir.
+
+    Returns:
+        tuple: Les valeurs des colonnes.
+    """
+    return (task.task_id, task.titre, task.description, task.priorite, task.date_limite)
+
+
+class SqliteStorage(Storage):
+    """Stockage dans une base SQLite indexée."""
+
+    default_filename = "tasks.db"
+    partial_apply = True
+
+    def connect(self, write=False):
+        """Ouvre une connexion à la base.
+
+        Le schéma n'est créé que pour une écriture ; une lecture ouvre la base en
+        lecture seule, sans la créer.
+
+        Args:
+            write (bool, optional): True pour écrire dans la base. Defaults to False.
+
+        Returns:
+            sqlite3.Connection or None: La connexion ouverte, ou None pour une lecture\
+                  d'une base qui n'existe pas.
+        """
+        if write:
+            connection = sqlite3.connect(self.filename)
+            connection.execute(f"PRAGMA synchronous = {SYNCHRONOUS[self.durability]}")
+            connection.executescript(SCHEMA)
+            return connection
+        if not os.path.exists(self.filename):
+            return None
+        return sqlite3.connect(f"{Path(self.filename).absolute().as_uri()}?mode=ro", uri=True)
+
+    def _select(self, query, parameters=()):
+        """Exécute une requête en lecture seule.
+
+        Args:
+            query (str): La requête SQL.
+            parameters (tuple, optional): Les paramètres de la requête. Defaults to ().
+
+        Returns:
+            list[tuple]: Les lignes du résultat, aucune si la base n'existe pas.
+        """
+        connection = self.connect()
+        if connection is None:
+            return []
+        try:
+            return connection.execute(query, parameters).fetchall()
+        finally:
+            connection.close()
+
+    def load(self, sort=None):
+        """Charge les tâches, triées par la base si un critère est fourni.
+
+        L'ordre d'insertion (rowid) départage les égalités, comme le tri stable de Python.
+
+        Args:
+            sort (str, optional): Critère de tri ("title", "priority" ou "due").\
+                  Defaults to None.
+
+        Returns:
+            list[Tache]: Liste d'instances de Tache (aucune si la base n'existe pas).
+        """
+        order = f"{SORT_FIELDS[sort]}, rowid" if sort else "rowid"
+        rows = self._select(f"SELECT {', '.join(COLUMNS)} FROM tasks ORDER BY {order}")
+        return [
+            Tache(titre, desc, prio, due, task_id)
+            for task_id, titre, desc, prio, due in rows
+        ]
+
+    def count(self):
+        """Retourne le nombre de tâches, compté par la base.
+
+        Returns:
+            int: Le nombre de tâches.
+        """
+        rows = self._select("SELECT COUNT(*) FROM tasks")
+        return rows[0][0] if rows else 0
+
+    def get_tasks(self, ids):
+        """Retourne des tâches par identifiant, par l'index de la colonne task_id.
+
+        Args:
+            ids (iterable[int]): Les identifiants.
+
+        Returns:
+            list[Tache]: Les tâches trouvées, dans l'ordre des identifiants.
+        """
+        ids = list(ids)
+        if not ids:
+            return []
+        rows = self._select(
+            f"SELECT {', '.join(COLUMNS)} FROM tasks"
+            f" WHERE task_id IN ({', '.join('?' * len(ids))})",
+            tuple(ids),
+        )
+        found = {row[0]: Tache(row[1], row[2], row[3], row[4], row[0]) for row in rows}
+        return [found[task_id] for task_id in ids if task_id in found]
+
+    def save(self, tasks):
+        """Remplace tout le contenu de la base dans une seule transaction.
+
+        Args:
+            tasks (list[Tache]): Liste des tâches à sauvegarder.
+        """
+        self.write(tasks)
+
+    def load_meta(self):
+        """Charge les métadonnées depuis la table ``meta``.
+
+        Returns:
+            dict: Les métadonnées, vides si la base n'existe pas.
+        """
+        return dict(self._select("SELECT key, value FROM meta"))
+
+    def save_meta(self, meta):
+        """Sauvegarde les métadonnées dans la table ``meta``.
+
+        Args:
+            meta (dict): Les métadonnées à sauvegarder.
+        """
+        self.write(None, [], meta)
+
+    def apply(self, tasks, changes):
+        """Écrit les modifications dans une seule transaction, une ligne par tâche.
+
+        Args:
+            tasks (list[Tache]): Liste des tâches après modification (non utilisée).
+            changes (list[tuple[str, Tache]]): Modifications (opération, tâche).
+        """
+        self.write(tasks, changes)
+
+    def write(self, tasks, changes=None, meta=None):
+        """Écrit les tâches (ou leurs modifications) et les métadonnées ensemble.
+
+        Tout est écrit dans une seule transaction : une interruption ne laisse jamais
+        des tâches écrites avec les métadonnées de la génération précédente.
+
+        Args:
+            tasks (list[Tache]): Liste des tâches après modification.
+            changes (list[tuple[str, Tache]], optional): Modifications (opération,\
+                  tâche) ; None pour réécrire toutes les tâches. Defaults to None.
+            meta (dict, optional): Les métadonnées à sauvegarder. Defaults to None.
+        """
+        connection = self.connect(write=True)
+        try:
+            with connection:
+                if changes is None:
+                    connection.execute("DELETE FROM tasks")
+                    connection.executemany(
+                        "INSERT INTO tasks VALUES (?, ?, ?, ?, ?)", (_row(t) for t in tasks)
+                    )
+                else:
+                    self._apply_rows(connection, changes)
+                if meta is not None:
+                    connection.executemany(
+                        "INSERT OR REPLACE INTO meta VALUES (?, ?)", meta.items()
+                    )
+        finally:
+            connection.close()
+
+    @staticmethod
+    def _apply_rows(connection, changes):
+        """Écrit les modifications, une ligne par tâche, sans valider la transaction.
+
+        Args:
+            connection (sqlite3.Connection): La connexion ouverte.
+            changes (list[tuple[str, Tache]]): Modifications (opération, tâche).
+        """
+        for operation, task in changes:
+            if operation == "add":
+                connection.execute("INSERT INTO tasks VALUES (?, ?, ?, ?, ?)", _row(task))
+            elif operation == "edit":
+                connection.execute(
+                    "UPDATE tasks SET titre = ?, description = ?, priorite = ?,"
+                    " date_limite = ? WHERE task_id = ?",
+                    _row(task)[1:] + (task.task_id,),
+                )
+            elif operation == "remove":
+                connection.execute("DELETE FROM tasks WHERE task_id = ?", (task.task_id,))
@@ -0,0 +1,450 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+Module storage.
+
+Ce module définit l'interface commune des backends de stockage des tâches
+ainsi que les backends basés sur un fichier JSON :
+
+    json (JsonStorage): Réécrit tout le fichier JSON à chaque modification.
+    journal (JournalStorage): Ajoute chaque modification à un journal (voir source.journal).
+    jsonl (JsonlStorage): Une tâche par ligne, lisible en flux (voir source.jsonl_storage).
+    binary (BinaryStorage): Format binaire lu par mmap (voir source.binary_storage).
+    records (RecordStorage): Fiches de taille fixe modifiées sur place\
+          (voir source.record_storage).
+    sqlite (SqliteStorage): Base SQLite indexée (voir source.sqlite_storage).
+
+Les backends sont enregistrés par nom dans STORAGES et importés uniquement lorsqu'ils
+sont utilisés, ce qui permet de choisir le backend par option ou variable d'environnement.
+
+Les fichiers sont réécrits de manière atomique (voir source.atomic) : un fichier de
+sauvegarde illisible n'est donc pas le résultat d'une écriture interrompue, et son
+chargement lève StorageError au lieu de retourner une liste vide.
+"""
+
+import importlib
+import json
+import os
+
+from source import journal, search_index, snapshot_cache, sorted_index, timings
+from source.atomic import DEFAULT_DURABILITY, AtomicFile
+from source.tache import Tache
+
+META_SUFFIX = ".meta"  # Suffixe du fichier de métadonnées des backends JSON
+
+# Nom du backend -> (module, classe). Les modules sont importés à la demande.
+STORAGES = {
+    "json": ("source.storage", "JsonStorage"),
+    "journal": ("source.storage", "JournalStorage"),
+    "jsonl": ("source.jsonl_storage", "JsonlStorage"),
+    "binary": ("source.binary_storage", "BinaryStorage"),
+    "records": ("source.record_storage", "RecordStorage"),
+    "sqlite": ("source.sqlite_storage", "SqliteStorage"),
+}
+
+# Critère de tri de la CLI -> attribut de Tache
+SORT_FIELDS = {"title": "titre", "priority": "priorite", "due": "date_limite"}
+
+# Index sauvegardés à côté des fichiers JSON ; chaque module fournit is_current,
+# append, rebuild et remove (voir source.index_log).
+INDEXES = (sorted_index, search_index)
+
+
+class StorageError(Exception):
+    """Le fichier de sauvegarde existe mais ne peut pas être lu."""
+
+
+class Storage:
+    """Interface commune des backends de stockage.
+
+    Attributes:
+        filename (str): Chemin du fichier de sauvegarde.
+        durability (str): Niveau de durabilité des écritures (voir source.atomic).
+        workers (int or None): Nombre de processus de lecture des backends qui lisent\
+              en parallèle (voir source.parallel_load) ; None pour le choix automatique.
+        partial_apply (bool): True si ``apply`` n'a besoin que des tâches modifiées :\
+              une modification par identifiant charge alors seulement cette tâche.
+    """
+
+    default_filename = "tasks.json"
+    partial_apply = False
+
+    def __init__(self, filename=None, durability=None, workers=None):
+        """Initialise le backend.
+
+        Args:
+            filename (str, optional): Chemin du fichier de sauvegarde.\
+                  Defaults to default_filename.
+            durability (str, optional): Niveau de durabilité des écritures ("off",\
+                  "normal" ou "full"). Defaults to DEFAULT_DURABILITY.
+            workers (int, optional): Nombre de processus de lecture. Defaults to None.
+        """
+        self.filename = filename or self.default_filename
+        self.durability = durability or DEFAULT_DURABILITY
+        self.workers = workers
+
+    def load(self, sort=None):
+        """Charge toutes les tâches.
+
+        Args:
+            sort (str, optional): Critère de tri ("title", "priority" ou "due")\
+                  que le backend peut appliquer directement. Defaults to None.
+
+        Returns:
+            list[Tache]: Liste d'instances de Tache.
+        """
+        raise NotImplementedError
+
+    def iter_tasks(self, sort=None):
+        """Produit les tâches une par une.
+
+        Par défaut, toutes les tâches sont chargées ; les backends capables de lire
+        en flux redéfinissent cette méthode.
+
+        Args:
+            sort (str, optional): Critère de tri que le backend peut appliquer\
+                  directement. Defaults to None.
+
+        Returns:
+            iterator[Tache]: Un itérateur sur les tâches.
+        """
+        return iter(self.load(sort))
+
+    def save(self, tasks):
+        """Sauvegarde l'intégralité des tâches.
+
+        Args:
+            tasks (list[Tache]): Liste des tâches à sauvegarder.
+        """
+        raise NotImplementedError
+
+    def count(self):
+        """Retourne le nombre de tâches.
+
+        Par défaut, les tâches sont parcourues ; les backends qui connaissent leur
+        nombre sans les lire redéfinissent cette méthode.
+
+        Returns:
+            int: Le nombre de tâches.
+        """
+        return sum(1 for _ in self.iter_tasks())
+
+    def get_tasks(self, ids):
+        """Retourne des tâches par identifiant, sans parcourir toutes les tâches.
+
+        Args:
+            ids (iterable[int]): Les identifiants.
+
+        Returns:
+            list[Tache] or None: Les tâches trouvées, dans l'ordre des identifiants, ou\
+                  None si le backend ne permet pas l'accès direct par identifiant.
+        """
+        return None
+
+    def disk_usage(self):
+        """Retourne la taille occupée sur disque par les tâches.
+
+        Returns:
+            int: La taille du fichier de sauvegarde en octets, 0 s'il n'existe pas.
+        """
+        try:
+            return os.path.getsize(self.filename)
+        except FileNotFoundError:
+            return 0
+
+    def load_meta(self):
+        """Charge les métadonnées du stockage (curseur d'identifiants, etc.).
+
+        Returns:
+            dict: Les métadonnées, vides si aucune n'a été sauvegardée.
+        """
+        return {}
+
+    def save_meta(self, meta):
+        """Sauvegarde les métadonnées du stockage.
+
+        Args:
+            meta (dict): Les métadonnées à sauvegarder.
+        """
+
+    def write(self, tasks, changes=None, meta=None):
+        """Écrit les tâches (ou leurs modifications) puis les métadonnées.
+
+        Les backends capables d'écrire les deux dans une seule transaction
+        redéfinissent cette méthode.
+
+        Args:
+            tasks (list[Tache]): Liste des tâches après modification.
+            changes (list[tuple[str, Tache]], optional): Modifications (opération,\
+                  tâche) ; None pour réécrire toutes les tâches. Defaults to None.
+            meta (dict, optional): Les métadonnées à sauvegarder. Defaults to None.
+        """
+        if changes is None:
+            self.save(tasks)
+        else:
+            self.apply(tasks, changes)
+        if meta is not None:
+            self.save_meta(meta)
+
+    def sorted_ids(self, sort, low=None, high=None):
+        """Retourne les identifiants des tâches triés par un index persistant.
+
+        Args:
+            sort (str): Critère de tri ("priority" ou "due").
+            low (int, optional): Clé minimale incluse (priorité ou numéro de jour).\
+                  Defaults to None.
+            high (int, optional): Clé maximale incluse. Defaults to None.
+
+        Returns:
+            list[int] or None: Les identifiants triés, ou None si le backend n'a pas\
+                  d'index à jour pour ce critère.
+        """
+        return None
+
+    def search(self, terms):
+        """Recherche des tâches par mots-clés dans un index inversé persistant.
+
+        Args:
+            terms (list[str]): Les termes de la requête (voir source.search_index).
+
+        Returns:
+            set[int] or None: Les identifiants trouvés, ou None si le backend n'a pas\
+                  d'index de recherche à jour.
+        """
+        return None
+
+    def apply(self, tasks, changes):
+        """Sauvegarde un lot de modifications.
+
+        Par défaut, toutes les tâches sont réécrites une seule fois ; les backends
+        capables d'écritures incrémentales redéfinissent cette méthode.
+
+        Args:
+            tasks (list[Tache]): Liste des tâches après modification.
+            changes (list[tuple[str, Tache]]): Modifications (opération, tâche), où\
+                  l'opération vaut "add", "edit" ou "remove".
+        """
+        self.save(tasks)
+
+
+class JsonStorage(Storage):
+    """Stockage dans un fichier JSON indenté, réécrit à chaque sauvegarde.
+
+    Les index triés sur la priorité et la date limite et l'index de recherche sont
+    sauvegardés dans les fichiers voisins ``<fichier>.idx`` et ``<fichier>.search``
+    (voir source.sorted_index et source.search_index).
+    """
+
+    def load(self, sort=None):
+        """Charge les tâches depuis le fichier JSON.
+
+        Si le fichier n'a pas changé depuis le dernier décodage, les tâches sont
+        reconstruites depuis l'instantané en cache (voir source.snapshot_cache).
+        Si un journal est présent à côté du fichier, il est rejoué par-dessus l'instantané.
+        Si le fichier n'existe pas, une liste vide est retournée.
+
+        Args:
+            sort (str, optional): Ignoré, le tri est fait par l'appelant. Defaults to None.
+
+        Returns:
+            list[Tache]: Liste d'instances de Tache.
+
+        Raises:
+            StorageError: Si le fichier n'est pas un JSON valide.
+        """
+        try:
+            with open(self.filename, "rb") as file, timings.phase("decode"):
+                data = file.read()
+                key = snapshot_cache.cache_key(os.fstat(file.fileno()), data)
+                tasks = snapshot_cache.load(self.filename, key)
+                if tasks is None:
+                    tasks_data = json.loads(data)
+        except FileNotFoundError:
+            tasks, tasks_data, key = None, [], None
+        except (json.JSONDecodeError, UnicodeDecodeError) as exc:
+            raise StorageError(
+                f"Erreur lors du décodage du fichier JSON {self.filename} : {exc}"
+            ) from exc
+        if tasks is None:
+            # Reconstruction des objets Tache à partir des dictionnaires
+            with timings.phase("build"):
+                tasks = [Tache.from_dict(item) for item in tasks_data]
+            snapshot_cache.save(self.filename, key, tasks)
+        return journal.replay(tasks, self.filename)
+
+    def save(self, tasks):
+        """Réécrit l'instantané complet et supprime le journal, désormais intégré.
+
+        L'instantané est remplacé atomiquement : une écriture interrompue laisse
+        l'ancien instantané et son journal intacts.
+
+        Args:
+            tasks (list[Tache]): Liste des tâches à sauvegarder.
+        """
+        self._write_snapshot(tasks)
+        self.save_indexes(tasks)
+
+    def apply(self, tasks, changes):
+        """Réécrit l'instantané et met à jour les index avec les seules modifications.
+
+        Args:
+            tasks (list[Tache]): Liste des tâches après modification.
+            changes (list[tuple[str, Tache]]): Modifications (opération, tâche).
+        """
+        current = self.current_indexes()
+        self._write_snapshot(tasks)
+        self.save_indexes(tasks, current, changes)
+
+    def _write_snapshot(self, tasks):
+        """Remplace atomiquement l'instantané puis supprime le journal.
+
+        Args:
+            tasks (list[Tache]): Liste des tâches à sauvegarder.
+        """
+        tasks_data = [task.to_dict() for task in tasks]
+        with AtomicFile(self.filename, self.durability) as file:
+            json.dump(tasks_data, file, ensure_ascii=False, indent=4)
+            timings.count("bytes_written", file.tell())
+        journal.clear(self.filename)
+
+    def sorted_ids(self, sort, low=None, high=None):
+        """Retourne les identifiants triés lus dans l'index ``<fichier>.idx``.
+
+        Les bornes sont cherchées par dichotomie dans l'index.
+
+        Args:
+            sort (str): Critère de tri ("priority" ou "due").
+            low (int, optional): Clé minimale incluse. Defaults to None.
+            high (int, optional): Clé maximale incluse. Defaults to None.
+
+        Returns:
+            list[int] or None: Les identifiants triés, ou None si l'index est absent,\
+                  périmé ou ne couvre pas ce critère.
+        """
+        if sort not in sorted_index.INDEX_KEYS:
+            return None
+        index = sorted_index.SortedIndexFile.open(self.filename)
+        return None if index is None else index.ids_between(sort, low, high)
+
+    def search(self, terms):
+        """Recherche des tâches dans l'index inversé ``<fichier>.search``.
+
+        Args:
+            terms (list[str]): Les termes de la requête (voir source.search_index).
+
+        Returns:
+            set[int] or None: Les identifiants trouvés, ou None si l'index est absent\
+                  ou périmé.
+        """
+        index = search_index.SearchIndexFile.open(self.filename)
+        return None if index is None else index.search(terms)
+
+    def current_indexes(self):
+        """Indique quels index sont à jour, avant une écriture incrémentale des données.
+
+        Seules les signatures des index sont lues, pas leurs données.
+
+        Returns:
+            list[bool]: Pour chaque entrée de INDEXES, True si l'index est à jour.
+        """
+        with timings.phase("index"):
+            return [index.is_current(self.filename) for index in INDEXES]
+
+    def save_indexes(self, tasks, current=None, changes=None):
+        """Met à jour les index après une écriture des données.
+
+        Les modifications d'un index à jour avant l'écriture sont ajoutées à son
+        journal ; sinon, ou si son journal est devenu trop grand, l'index est
+        reconstruit à partir de toutes les tâches.
+
+        Args:
+            tasks (iterable[Tache]): Tâches après modification.
+            current (list[bool], optional): Index à jour avant l'écriture, selon\
+                  current_indexes. Defaults to None.
+            changes (list[tuple[str, Tache]], optional): Modifications écrites.\
+                  Defaults to None.
+        """
+        if current is None or changes is None:
+            current = [False] * len(INDEXES)
+        with timings.phase("index"):
+            for index, fresh in zip(INDEXES, current):
+                if fresh and index.append(self.filename, changes):
+                    continue
+                if any(task.task_id is None for task in tasks):
+                    # Une tâche sans identifiant ne peut pas être indexée.
+                    index.remove(self.filename)
+                else:
+                    index.rebuild(self.filename, tasks)
+
+    def load_meta(self):
+        """Charge les métadonnées depuis le fichier voisin ``<fichier>.meta``.
+
+        Returns:
+            dict: Les métadonnées, vides si le fichier n'existe pas ou est invalide.
+        """
+        try:
+            with open(self.filename + META_SUFFIX, "r", encoding="utf-8") as file:
+                return json.load(file)
+        except (FileNotFoundError, json.JSONDecodeError):
+            return {}
+
+    def save_meta(self, meta):
+        """Sauvegarde les métadonnées dans le fichier voisin ``<fichier>.meta``.
+
+        Args:
+            meta (dict): Les métadonnées à sauvegarder.
+        """
+        with AtomicFile(self.filename + META_SUFFIX, self.durability) as file:
+            json.dump(meta, file)
+
+
+class JournalStorage(JsonStorage):
+    """Stockage JSON dont les modifications sont ajoutées à un journal."""
+
+    def apply(self, tasks, changes):
+        """Ajoute les modifications au journal sans réécrire l'instantané.
+
+        Args:
+            tasks (list[Tache]): Liste des tâches après modification.
+            changes (list[tuple[str, Tache]]): Modifications (opération, tâche).
+        """
+        current = self.current_indexes()
+        journal.append_entries(self.filename, changes, self.durability)
+        self.save_indexes(tasks, current, changes)
+
+
+def storage_class(name):
+    """Retourne la classe du backend de stockage enregistré sous un nom.
+
+    Args:
+        name (str): Nom du backend (clé de STORAGES).
+
+    Returns:
+        type: La classe du backend.
+
+    Raises:
+        ValueError: Si le backend est inconnu.
+    """
+    try:
+        module_name, class_name = STORAGES[name]
+    except KeyError as exc:
+        raise ValueError(f"Backend de stockage inconnu : {name}") from exc
+    return getattr(importlib.import_module(module_name), class_name)
+
+
+def open_storage(name, filename=None, durability=None, workers=None):
+    """Instancie un backend de stockage.
+
+    Args:
+        name (str): Nom du backend (clé de STORAGES).
+        filename (str, optional): Chemin du fichier de sauvegarde.\
+              Defaults to the backend default filename.
+        durability (str, optional): Niveau de durabilité des écritures.\
+              Defaults to DEFAULT_DURABILITY.
+        workers (int, optional): Nombre de processus de lecture. Defaults to None.
+
+    Returns:
+        Storage: Le backend de stockage.
+    """
+    return storage_class(name)(filename, durability, workers)
+
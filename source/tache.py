@@ -8,15 +8,77 @@ Ce module définit la classe Tache qui représente une tâche avec les attributs
     titre (str): Le titre de la tâche (obligatoire).
     description (str or None): La description de la tâche.
     priorite (int): La priorité de la tâche (doit être au moins 1).
-    date_limite (str or None): La date limite de la tâche (par exemple au format YYYY-MM-DD).
+    date_limite (str or None): La date limite de la tâche, au format YYYY-MM-DD.
     id (int or None): L'identifiant unique de la tâche.
 
 Les méthodes associées permettent la manipulation et la sérialisation des tâches.
+
+La classe utilise ``__slots__`` : les instances n'ont pas de ``__dict__``, ce qui réduit
+fortement leur empreinte mémoire lorsque des millions de tâches sont chargées.
+Elle est écrite sans le module ``dataclasses``, dont l'import ralentit le démarrage
+de la CLI.
+
+La date limite est conservée aussi sous forme de numéro de jour (``date_ordinal``),
+utilisé pour les tris et les recherches par échéance. Les dates saisies (ligne de
+commande, import, ``set_date_limite``) sont validées au format YYYY-MM-DD ; une date
+en texte libre d'un ancien fichier (par exemple ``"vendredi"``) est conservée telle
+quelle au chargement, sans numéro de jour, et peut être corrigée avec ``edit --due``.
+
+Les méthodes ``set_*`` marquent la tâche comme modifiée (``dirty``) lorsque la valeur
+change réellement : la sauvegarde n'écrit que les tâches modifiées, et rien du tout si
+une commande ne change aucune valeur. Les attributs modifiés sont retenus
+(``changed_fields``) pour ne rejouer qu'eux après un conflit d'écriture.
 """
-from dataclasses import dataclass, field
+
+from datetime import date
+
+FIELDS = ("titre", "description", "priorite", "date_limite", "task_id")
+
+
+def parse_date(value):
+    """Valide une date au format YYYY-MM-DD et retourne son numéro de jour.
+
+    Args:
+        value (str or None): La date.
+
+    Returns:
+        int or None: Le numéro du jour (date.toordinal), ou None sans date.
+
+    Raises:
+        ValueError: Si la date n'est pas au format YYYY-MM-DD.
+    """
+    if value is None:
+        return None
+    try:
+        # fromisoformat accepte aussi d'autres formats ISO (20250105, 2025-W01-1)
+        if len(value) != 10 or value[4] != "-" or value[7] != "-":
+            raise ValueError(value)
+        return date.fromisoformat(value).toordinal()
+    except (TypeError, ValueError) as exc:
+        raise ValueError(
+            f"Date limite invalide : {value!r} (format attendu YYYY-MM-DD)"
+        ) from exc
+
+
+def to_ordinal(value):
+    """Retourne le numéro de jour d'une date limite chargée depuis un fichier.
+
+    Contrairement à parse_date, une date en texte libre d'un ancien fichier est
+    acceptée : elle n'a simplement pas de numéro de jour.
+
+    Args:
+        value (str or None): La date.
+
+    Returns:
+        int or None: Le numéro du jour, ou None sans date ou pour une date qui n'est\
+              pas au format YYYY-MM-DD.
+    """
+    try:
+        return parse_date(value)
+    except ValueError:
+        return None
 
 
-@dataclass
 class Tache:
     """Représente une tâche avec ses attributs.
 
@@ -27,20 +89,116 @@ class Tache:
         date_limite (str, optional): La date limite de la tâche (format YYYY-MM-DD).\
               Defaults to None.
         task_id (int, optional): L'identifiant unique de la tâche. Defaults to None.
+        date_ordinal (int or None): Numéro du jour de la date limite (None sans date ou\
+              pour une date en texte libre), en lecture seule.
+        dirty (bool): True si une méthode ``set_*`` a modifié la tâche depuis sa dernière\
+              sauvegarde, en lecture seule.
+        changed_fields (frozenset[str]): Noms des attributs modifiés par les méthodes\
+              ``set_*`` depuis la dernière sauvegarde, en lecture seule.
     """
 
-    titre: str
-    description: str = None
-    priorite: int = field(default=1)
-    date_limite: str = None
-    task_id: int = None
-
-    def __post_init__(self):
-        """Assure la validité des données après l'initialisation.
+    __slots__ = (
+        "titre",
+        "description",
+        "priorite",
+        "_date_limite",
+        "task_id",
+        "_ordinal",
+        "_changed",
+    )
+
+    def __init__(
+        self, titre, description=None, priorite=1, date_limite=None, task_id=None
+    ):
+        """Initialise la tâche.
 
         Vérifie que la priorité n'est pas inférieure à 1 et la corrige si nécessaire.
+        Une date limite qui n'est pas au format YYYY-MM-DD est conservée sans numéro
+        de jour (voir to_ordinal).
+
+        Args:
+            titre (str): Le titre de la tâche.
+            description (str, optional): La description de la tâche. Defaults to None.
+            priorite (int, optional): La priorité de la tâche. Defaults to 1.
+            date_limite (str, optional): La date limite de la tâche. Defaults to None.
+            task_id (int, optional): L'identifiant unique de la tâche. Defaults to None.
+        """
+        self.titre = titre
+        self.description = description
+        self.priorite = max(priorite, 1)
+        self.date_limite = date_limite
+        self.task_id = task_id
+
+    def __eq__(self, other):
+        """Compare deux tâches attribut par attribut.
+
+        Args:
+            other (object): L'objet à comparer.
+
+        Returns:
+            bool: True si les deux tâches ont les mêmes attributs.
         """
-        self.priorite = max(self.priorite, 1)
+        if not isinstance(other, Tache):
+            return NotImplemented
+        return self._values() == other._values()
+
+    __hash__ = None  # Les tâches sont modifiables, donc non hachables
+
+    @property
+    def date_limite(self):
+        """str or None: La date limite, au format YYYY-MM-DD sauf pour un ancien fichier."""
+        return self._date_limite
+
+    @date_limite.setter
+    def date_limite(self, value):
+        self._ordinal = to_ordinal(value)
+        self._date_limite = value
+
+    @property
+    def date_ordinal(self):
+        """int or None: Le numéro du jour de la date limite, ou None sans date."""
+        return self._ordinal
+
+    @property
+    def dirty(self):
+        """bool: True si la tâche a été modifiée depuis sa dernière sauvegarde."""
+        return bool(self.changed_fields)
+
+    @property
+    def changed_fields(self):
+        """frozenset[str]: Les attributs modifiés depuis la dernière sauvegarde."""
+        # Les tâches reconstruites sans __init__ (fichiers binaires, instantanés)
+        # n'ont pas encore l'attribut.
+        return getattr(self, "_changed", frozenset())
+
+    def mark_clean(self):
+        """Marque la tâche comme sauvegardée."""
+        self._changed = frozenset()
+
+    def _mark_changed(self, name):
+        """Retient qu'un attribut a été modifié.
+
+        Args:
+            name (str): Nom de l'attribut (voir FIELDS).
+        """
+        self._changed = self.changed_fields | {name}
+
+    def __repr__(self):
+        """Retourne une représentation de la tâche pour le débogage.
+
+        Returns:
+            str: Par exemple ``Tache(titre='Test', description=None, ...)``.
+        """
+        attributes = ", ".join(f"{name}={getattr(self, name)!r}" for name in FIELDS)
+        return f"{self.__class__.__name__}({attributes})"
+
+    def _values(self):
+        """Retourne les valeurs des attributs dans l'ordre de FIELDS.
+
+        Returns:
+            tuple: Les valeurs des attributs.
+        """
+        return tuple(getattr(self, name) for name in FIELDS)
 
     def get_titre(self):
         """
@@ -58,7 +216,9 @@ class Tache:
         Args:
             nouveau_titre (str): Le nouveau titre.
         """
-        self.titre = nouveau_titre
+        if nouveau_titre != self.titre:
+            self.titre = nouveau_titre
+            self._mark_changed("titre")
 
     def get_description(self):
         """
@@ -76,7 +236,9 @@ class Tache:
         Args:
             nouvelle_description (str): La nouvelle description.
         """
-        self.description = nouvelle_description
+        if nouvelle_description != self.description:
+            self.description = nouvelle_description
+            self._mark_changed("description")
 
     def get_priorite(self):
         """
@@ -95,10 +257,10 @@ class Tache:
         Args:
             nouvelle_priorite (int): La nouvelle priorité.
         """
-        if nouvelle_priorite < 1:
-            self.priorite = 1
-        else:
+        nouvelle_priorite = max(nouvelle_priorite, 1)
+        if nouvelle_priorite != self.priorite:
             self.priorite = nouvelle_priorite
+            self._mark_changed("priorite")
 
     def get_date_limite(self):
         """
@@ -114,9 +276,15 @@ class Tache:
         Met à jour la date limite de la tâche.
 
         Args:
-            nouvelle_date_limite (str): La nouvelle date limite, par exemple au format YYYY-MM-DD.
+            nouvelle_date_limite (str): La nouvelle date limite, au format YYYY-MM-DD.
+
+        Raises:
+            ValueError: Si la date n'est pas au format YYYY-MM-DD.
         """
-        self.date_limite = nouvelle_date_limite
+        if nouvelle_date_limite != self.date_limite:
+            parse_date(nouvelle_date_limite)
+            self.date_limite = nouvelle_date_limite
+            self._mark_changed("date_limite")
 
     def __str__(self):
         """
@@ -166,3 +334,32 @@ class Tache:
             date_limite=tache_dict.get("date_limite"),
             task_id=tache_dict.get("task_id"),
         )
+
+
+def from_rows(rows):
+    """Reconstruit des tâches à partir de valeurs déjà validées, sans appeler __init__.
+
+    Sert aux chargements rapides (instantané en cache, lecture en parallèle), dont les
+    valeurs ont été validées au décodage du fichier.
+
+    Args:
+        rows (iterable[tuple]): Les valeurs de chaque tâche : (titre, description,\
+              priorite, date_limite, date_ordinal, task_id).
+
+    Returns:
+        list[Tache]: Les tâches.
+    """
+    new = Tache.__new__
+    tasks = []
+    append = tasks.append
+    # pylint: disable=protected-access
+    for titre, description, priorite, date_limite, ordinal, task_id in rows:
+        task = new(Tache)
+        task.titre = titre
+        task.description = description
+        task.priorite = priorite
+        task._date_limite = date_limite
+        task._ordinal = ordinal
+        task.task_id = task_id
+        append(task)
+    return tasks
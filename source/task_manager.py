@@ -6,79 +6,370 @@ Module task_manager.
 Ce module fournit une interface en ligne de commande (CLI) pour la gestion d'une liste de tâches.
 
 Fonctionnalités:
-    - Chargement et sauvegarde des tâches depuis/vers un fichier JSON.
+    - Chargement et sauvegarde des tâches via un backend de stockage (``--storage``) :\
+          fichier JSON, journal ou base SQLite (voir source.storage).
     - Ajout d'une nouvelle tâche, avec génération d'un identifiant unique.
     - Suppression d'une tâche existante par son identifiant.
     - Affichage de la liste des tâches, avec possibilité de tri par titre,\
-          priorité ou date d'échéance.
-    - Modification d'une tâche existante (édition).
+          priorité ou date d'échéance, filtre par échéance (``--due-before``,\
+          ``--due-after``, ``--overdue``) et pagination (``--limit``, ``--offset``).
+    - Modification d'une tâche existante (édition) ; seules les tâches ajoutées,\
+          supprimées ou réellement modifiées sont sauvegardées, et une commande qui ne\
+          change rien n'écrit rien (voir Tache.dirty et TaskStore.changes).
+    - Sélection des tâches de ``list``, ``remove`` et ``edit`` par une expression\
+          ``--where`` compilée en prédicat (voir source.where).
+    - Recherche par mots-clés dans le titre et la description (commande ``search``),\
+          avec un index inversé sans casse ni accents.
+    - Import en masse de tâches depuis un fichier CSV ou JSON Lines (commande ``import``).
+    - Modes longue durée : ``shell`` (commandes lues sur l'entrée standard) et ``daemon``\
+          (socket Unix interrogée par ``client``), avec les tâches chargées une seule fois.
+    - API HTTP/JSON locale (commande ``serve``, voir source.http_api) : lectures servies\
+          depuis la mémoire, modifications appliquées par un seul écrivain et écrites\
+          par lots.
+    - Mode journal (``--storage journal``) : les modifications sont ajoutées à un journal\
+          au lieu de réécrire tout le fichier, et la commande ``compact`` les fusionne.
+    - Écritures atomiques et niveau de durabilité configurable (``--durability``,\
+          voir source.atomic).
+    - Accès concurrents de plusieurs processus : verrou de fichier et numéro de\
+          génération, avec nouvelle exécution de la commande en cas de conflit\
+          (voir source.locking).
+    - Format binaire (``--storage binary``) lu par ``mmap``, avec le nombre de tâches\
+          (``list --count``) et l'accès par identifiant sans décodage du fichier\
+          (voir source.binary_storage).
+    - Fiches de taille fixe (``--storage records``) : ``edit`` et ``remove`` réécrivent\
+          quelques octets sur place, et la commande ``vacuum`` récupère l'espace\
+          libéré (voir source.record_storage).
+    - Instantané des tâches décodées conservé à côté du fichier JSON et réutilisé tant\
+          que le fichier n'a pas changé (voir source.snapshot_cache), vidé par\
+          ``cache clear``.
+    - Projets (``--project``) stockés chacun dans leur fichier, avec ``list --all``\
+          qui fusionne les tâches triées de tous les projets (voir source.shards).
+    - Mesure de la durée des phases et compteurs (``--timings``, voir source.timings)\
+          et profilage de la commande sous cProfile (``--profile``).
+    - Lecture en parallèle des très grands fichiers JSON Lines, découpés en plages de\
+          lignes décodées par plusieurs processus (``--workers``, voir\
+          source.parallel_load).
+    - Migration des tâches d'un backend vers un autre (commande ``migrate``), par exemple\
+          pour convertir ``tasks.json`` au format JSON Lines lisible en flux.
 
 Les tâches sont représentées par des instances de la classe Tache,\
       définie dans le module source.tache.
 Les messages affichés à l'utilisateur sont centralisés dans le module source.textes.
+
+Pour accélérer le démarrage, seuls les arguments de la commande demandée sont
+configurés et les modules propres à une commande (import, shell, démon) ne sont
+importés que dans la fonction handle_* correspondante.
 """
 
 import argparse
-import json
-import random
-from source.tache import Tache  # Importation de la classe Tache depuis tache.py
+import heapq
+import itertools
+import os
+import sys
+import time
+from datetime import date
+from source import __version__, timings
+from source.atomic import DEFAULT_DURABILITY, DURABILITY_ENV, DURABILITY_LEVELS
+from source.id_allocator import DEFAULT_ID_WIDTH, IdAllocator
+from source.locking import GENERATION_KEY, ConflictError, FileLock, locked_iter
+from source.sorted_index import INDEX_KEYS, NO_DATE
+from source.storage import STORAGES, StorageError, open_storage, storage_class
+from source.tache import Tache, parse_date  # Importation de la classe Tache depuis tache.py
+from source.task_store import TaskStore
 from source.textes import WELCOME_MESSAGE, ERROR_MESSAGE
 
 DEFAULT_FILENAME = "tasks.json"  # Nom par défaut du fichier de sauvegarde des tâches
+STORAGE_ENV = "TASK_MANAGER_STORAGE"  # Variable d'environnement choisissant le backend
+DEFAULT_SOCKET = "task_manager.sock"  # Socket Unix par défaut du mode démon
+DEFAULT_HTTP_HOST = "127.0.0.1"  # Adresse d'écoute par défaut de "serve" (locale)
+DEFAULT_HTTP_PORT = 8080  # Port d'écoute par défaut de "serve"
+WRITE_BATCH_SIZE = 256  # Nombre de tâches écrites par appel à write
+MAX_ATTEMPTS = 5  # Nombre d'exécutions d'une commande en conflit avec un autre processus
+RETRY_DELAY = 0.05  # Délai (s) de base entre deux tentatives, doublé à chaque conflit
+
+# Critère de tri de la commande "list" -> clé de tri
+SORT_KEYS = {
+    "title": lambda task: task.titre,
+    "priority": lambda task: task.priorite,
+    "due": lambda task: task.date_ordinal or NO_DATE,
+}
 
 
-def load_tasks(filename):
-    """Charge les tâches depuis un fichier JSON et retourne une liste d'objets Tache.
+def load_tasks(filename, storage="json", sort=None, stream=False, workers=None):
+    """Charge les tâches depuis le backend de stockage et retourne une liste d'objets Tache.
 
-    Si le fichier n'existe pas ou en cas d'erreur de décodage, une liste vide est retournée.
+    Avec le backend JSON par défaut, un journal présent à côté du fichier est rejoué
+    par-dessus l'instantané. Si le fichier n'existe pas, une liste vide est retournée.
+    La lecture se fait sous un verrou partagé (voir source.locking), jamais pendant
+    l'écriture d'un autre processus.
 
     Args:
-        filename (str): Chemin du fichier JSON contenant les tâches.
+        filename (str): Chemin du fichier contenant les tâches.
+        storage (str, optional): Nom du backend de stockage. Defaults to "json".
+        sort (str, optional): Critère de tri que le backend peut appliquer\
+              directement. Defaults to None.
+        stream (bool, optional): Retourne un itérateur au lieu d'une liste, lu en\
+              flux par les backends qui le permettent (jsonl). Defaults to False.
+        workers (int, optional): Nombre de processus de lecture d'un grand fichier\
+              JSON Lines (voir source.parallel_load). Defaults to None.
 
     Returns:
-        list[Tache]: Liste d'instances de Tache.
+        list[Tache] or iterator[Tache]: Les instances de Tache (aucune si le fichier\
+              n'existe pas).
+
+    Raises:
+        StorageError: Si le fichier existe mais ne peut pas être décodé.
     """
-    try:
-        with open(filename, "r", encoding="utf-8") as file:
-            tasks_data = json.load(file)
-        # Reconstruction des objets Tache à partir des dictionnaires
-        return [Tache.from_dict(item) for item in tasks_data]
-    except FileNotFoundError:
-        return []
-    except json.JSONDecodeError:
-        print("Erreur lors du décodage du fichier JSON.")
-        return []
+    backend = open_storage(storage, filename, workers=workers)
+    if stream:
+        return timings.counted(
+            locked_iter(backend.filename, lambda: backend.iter_tasks(sort))
+        )
+    with FileLock(backend.filename, shared=True):
+        tasks = backend.load(sort)
+    timings.count("tasks_loaded", len(tasks))
+    return tasks
+
+
+def load_meta(filename, storage="json"):
+    """Charge les métadonnées du stockage (curseur de l'allocateur d'identifiants).
+
+    Args:
+        filename (str): Chemin du fichier contenant les tâches.
+        storage (str, optional): Nom du backend de stockage. Defaults to "json".
+
+    Returns:
+        dict: Les métadonnées, vides si aucune n'a été sauvegardée.
+    """
+    backend = open_storage(storage, filename)
+    with FileLock(backend.filename, shared=True):
+        return backend.load_meta()
+
+
+def load_store(filename, storage="json", sort=None, workers=None):
+    """Charge les tâches et leurs métadonnées dans une collection indexée.
+
+    Les deux lectures se font sous le même verrou partagé, les métadonnées en premier :
+    si une écriture a lieu malgré tout entre les deux lectures (fichier de verrou pas
+    encore créé), la génération chargée est périmée et la sauvegarde sera refusée,
+    jamais l'inverse.
+
+    Args:
+        filename (str): Chemin du fichier contenant les tâches.
+        storage (str, optional): Nom du backend de stockage. Defaults to "json".
+        sort (str, optional): Critère de tri que le backend peut appliquer\
+              directement. Defaults to None.
+        workers (int, optional): Nombre de processus de lecture. Defaults to None.
+
+    Returns:
+        TaskStore: Les tâches et leurs métadonnées.
+    """
+    with FileLock(filename, shared=True):
+        meta = load_meta(filename, storage)
+        tasks = load_tasks(filename, storage, sort=sort, workers=workers)
+        return TaskStore(tasks, meta=meta)
 
 
-def save_tasks(tasks, filename=DEFAULT_FILENAME):
-    """Sauvegarde une liste d'objets Tache dans un fichier JSON.
+def load_store_by_id(filename, storage="json", ids=()):
+    """Charge seulement quelques tâches et les métadonnées dans une collection indexée.
 
-    Chaque objet Tache est converti en dictionnaire avant d'être sauvegardé.
+    Réservé aux backends qui écrivent une modification sans les autres tâches
+    (``partial_apply``), comme SQLite : modifier ou supprimer une tâche par
+    identifiant ne lit alors qu'une ligne.
 
     Args:
-        tasks (list[Tache]): Liste des tâches à sauvegarder.
-        filename (str, optional): Chemin du fichier JSON de sauvegarde.\
+        filename (str): Chemin du fichier contenant les tâches.
+        storage (str, optional): Nom du backend de stockage. Defaults to "json".
+        ids (iterable[int], optional): Les identifiants. Defaults to ().
+
+    Returns:
+        TaskStore or None: Les tâches trouvées et les métadonnées, ou None si le\
+              backend a besoin de toutes les tâches pour écrire une modification.
+    """
+    backend = open_storage(storage, filename)
+    if not backend.partial_apply:
+        return None
+    with FileLock(backend.filename, shared=True):
+        meta = backend.load_meta()
+        return TaskStore(backend.get_tasks(ids), meta=meta)
+
+
+def load_sorted_ids(filename, storage="json", sort="priority", low=None, high=None):
+    """Charge l'ordre des tâches depuis l'index trié persistant du stockage.
+
+    Args:
+        filename (str): Chemin du fichier contenant les tâches.
+        storage (str, optional): Nom du backend de stockage. Defaults to "json".
+        sort (str, optional): Critère de tri ("priority" ou "due").\
+              Defaults to "priority".
+        low (int, optional): Clé minimale incluse. Defaults to None.
+        high (int, optional): Clé maximale incluse. Defaults to None.
+
+    Returns:
+        list[int] or None: Les identifiants triés, ou None sans index à jour.
+    """
+    return open_storage(storage, filename).sorted_ids(sort, low, high)
+
+
+def index_lookup(args):
+    """Retourne la recherche par intervalle dans l'index trié persistant.
+
+    Args:
+        args: Arguments de la ligne de commande (options ``storage`` et ``file``).
+
+    Returns:
+        callable or None: Fonction ``(critère, basse, haute) -> list[int] or None``, ou\
+              None en mode shell ou démon, où les tâches en mémoire peuvent être plus\
+              récentes que l'index sauvegardé.
+    """
+    if getattr(args, "pending", None) is not None:
+        return None
+    return lambda sort, low=None, high=None: load_sorted_ids(
+        args.file, args.storage, sort, low, high
+    )
+
+
+def search_ids(filename, storage="json", terms=()):
+    """Recherche des tâches dans l'index de recherche persistant du stockage.
+
+    Args:
+        filename (str): Chemin du fichier contenant les tâches.
+        storage (str, optional): Nom du backend de stockage. Defaults to "json".
+        terms (list[str], optional): Termes de la requête. Defaults to ().
+
+    Returns:
+        set[int] or None: Les identifiants trouvés, ou None sans index à jour.
+    """
+    return open_storage(storage, filename).search(terms)
+
+
+def count_tasks(filename, storage="json"):
+    """Retourne le nombre de tâches du stockage, sans les charger si le backend le permet.
+
+    Args:
+        filename (str): Chemin du fichier contenant les tâches.
+        storage (str, optional): Nom du backend de stockage. Defaults to "json".
+
+    Returns:
+        int: Le nombre de tâches.
+    """
+    backend = open_storage(storage, filename)
+    with FileLock(backend.filename, shared=True):
+        return backend.count()
+
+
+def load_tasks_by_id(filename, storage="json", ids=()):
+    """Charge des tâches par identifiant, par accès direct si le backend le permet.
+
+    Args:
+        filename (str): Chemin du fichier contenant les tâches.
+        storage (str, optional): Nom du backend de stockage. Defaults to "json".
+        ids (iterable[int], optional): Les identifiants. Defaults to ().
+
+    Returns:
+        list[Tache] or None: Les tâches trouvées, dans l'ordre des identifiants, ou\
+              None si le backend ne permet pas l'accès direct.
+    """
+    backend = open_storage(storage, filename)
+    with FileLock(backend.filename, shared=True):
+        return backend.get_tasks(ids)
+
+
+def save_tasks(
+    tasks, filename=DEFAULT_FILENAME, storage="json", changes=None, durability=None
+):
+    """Sauvegarde une liste d'objets Tache avec le backend de stockage choisi.
+
+    Si des modifications sont fournies, le backend peut n'écrire que celles-ci
+    (journal, lignes SQLite) ; sinon toutes les tâches sont réécrites. Une liste de
+    modifications vide n'écrit rien : ni fichier, ni nouvelle génération.
+    Les métadonnées d'une TaskStore sont sauvegardées avec les tâches.
+
+    L'écriture se fait sous un verrou exclusif et incrémente le numéro de génération
+    des métadonnées. Une TaskStore chargée à une génération antérieure n'est pas
+    sauvegardée : un autre processus a écrit entre-temps. Les fichiers sont remplacés
+    atomiquement et synchronisés selon le niveau de durabilité (voir source.atomic).
+
+    Args:
+        tasks (TaskStore or list[Tache]): Tâches à sauvegarder.
+        filename (str, optional): Chemin du fichier de sauvegarde.\
               Defaults to DEFAULT_FILENAME.
+        storage (str, optional): Nom du backend de stockage. Defaults to "json".
+        changes (list[tuple[str, Tache]], optional): Modifications\
+              (opération, tâche) à sauvegarder. Defaults to None.
+        durability (str, optional): Niveau de durabilité ("off", "normal" ou "full").\
+              Defaults to DEFAULT_DURABILITY.
+
+    Raises:
+        ConflictError: Si le stockage a été modifié depuis le chargement de la TaskStore.
     """
-    tasks_data = [task.to_dict() for task in tasks]
-    with open(filename, "w", encoding="utf-8") as file:
-        json.dump(tasks_data, file, ensure_ascii=False, indent=4)
+    if changes is not None and not changes:
+        return
+    backend = open_storage(storage, filename, durability)
+    with timings.phase("save"), FileLock(backend.filename):
+        stored = backend.load_meta()
+        generation = stored.get(GENERATION_KEY, 0)
+        meta = getattr(tasks, "meta", None)
+        if meta is None:
+            meta = stored
+        elif meta.get(GENERATION_KEY, 0) != generation:
+            raise ConflictError(meta.get(GENERATION_KEY, 0), generation)
+        backend.write(tasks, changes, {**meta, GENERATION_KEY: generation + 1})
+        meta[GENERATION_KEY] = generation + 1
 
 
-def generate_unique_id(tasks):
-    """Génère un identifiant unique à 6 chiffres non utilisé parmi les tâches existantes.
+def generate_unique_id(tasks, width=DEFAULT_ID_WIDTH):
+    """Génère un identifiant unique non utilisé parmi les tâches existantes.
+
+    L'identifiant est attribué de manière déterministe par un IdAllocator ; avec une
+    TaskStore, le curseur de l'allocateur est conservé dans ses métadonnées.
 
     Args:
-        tasks (list[Tache]): Liste des tâches existantes.
+        tasks (TaskStore or list[Tache]): Tâches existantes.
+        width (int, optional): Nombre de chiffres de l'identifiant.\
+              Defaults to DEFAULT_ID_WIDTH.
 
     Returns:
         int: Un identifiant unique.
+
+    Raises:
+        ValueError: Si l'espace des identifiants de cette largeur est épuisé.
     """
+    if isinstance(tasks, TaskStore):
+        return tasks.allocate_ids(1, width)[0]
     existing_ids = {task.task_id for task in tasks if task.task_id is not None}
-    while True:
-        candidate = random.randint(100000, 999999)
-        if candidate not in existing_ids:
-            return candidate
+    return IdAllocator(width).allocate(1, used=existing_ids)[0]
+
+
+def persist(args, tasks, changes=None):
+    """Sauvegarde des modifications avec le backend de stockage choisi.
+
+    Le backend JSON réécrit toutes les tâches ; les backends journal et SQLite
+    n'écrivent que les modifications. En mode shell ou démon, les modifications
+    sont seulement enregistrées dans ``args.pending`` et écrites périodiquement.
+    Sans aucune modification (liste vide), rien n'est écrit ; les modifications
+    sauvegardées ou enregistrées sont ensuite oubliées par la TaskStore.
+
+    Args:
+        args: Arguments de la ligne de commande (options ``storage`` et ``file``).
+        tasks (TaskStore): Tâches après modification.
+        changes (list[tuple[str, Tache]], optional): Modifications\
+              (opération, tâche) ; None pour réécrire toutes les tâches. Defaults to None.
+    """
+    if changes is not None and not changes:
+        return
+    pending = getattr(args, "pending", None)
+    if pending is not None:
+        pending.record(changes)
+    else:
+        save_tasks(
+            tasks,
+            getattr(args, "file", DEFAULT_FILENAME),
+            getattr(args, "storage", "json"),
+            changes=changes,
+            durability=getattr(args, "durability", None),
+        )
+    tasks.mark_clean(changes)
 
 
 def handle_add(args, tasks):
@@ -86,11 +377,11 @@ def handle_add(args, tasks):
 
     Affiche les informations de la tâche à ajouter,\
           crée une instance de Tache avec un identifiant unique,
-    ajoute la tâche à la liste et sauvegarde la liste dans le fichier JSON par défaut.
+    ajoute la tâche à la collection et sauvegarde la modification.
 
     Args:
         args: Arguments de la ligne de commande contenant les détails de la tâche.
-        tasks (list[Tache]): Liste des tâches existantes.
+        tasks (TaskStore): Tâches existantes.
     """
     print("Ajout de la tâche :")
     print(f"  Titre       : {args.title}")
@@ -99,130 +390,742 @@ def handle_add(args, tasks):
     print(f"  Priorité    : {args.priority}")
     if args.due is not None:
         print(f"  Date d'échéance : {args.due}")
-    nouvelle_tache = Tache(args.title, args.desc, args.priority, args.due)
-    nouvelle_tache.task_id = generate_unique_id(tasks)
-    tasks.append(nouvelle_tache)
-    save_tasks(tasks)
+    try:
+        nouvelle_tache = add_task(args, tasks)
+    except ValueError as exc:
+        print(exc)
+        return
     print(
-        f"Tâche ajoutée avec l'ID {nouvelle_tache.task_id} et sauvegardée dans {DEFAULT_FILENAME}."
+        f"Tâche ajoutée avec l'ID {nouvelle_tache.task_id} et sauvegardée dans {args.file}."
     )
 
 
+def add_task(args, tasks):
+    """Crée une tâche avec un identifiant unique, l'ajoute et sauvegarde l'ajout.
+
+    Args:
+        args: Arguments de la commande "add" (titre, description, priorité, échéance).
+        tasks (TaskStore): Tâches existantes.
+
+    Returns:
+        Tache: La tâche ajoutée.
+
+    Raises:
+        ValueError: Si l'espace des identifiants est épuisé.
+    """
+    task = Tache(args.title, args.desc, args.priority, args.due)
+    task.task_id = generate_unique_id(tasks, getattr(args, "id_width", DEFAULT_ID_WIDTH))
+    tasks.add(task)
+    persist(args, tasks, tasks.changes())
+    return task
+
+
+def remove_task(args, tasks, task_id):
+    """Supprime une tâche par identifiant et sauvegarde la suppression.
+
+    Args:
+        args: Arguments de la commande.
+        tasks (TaskStore): Tâches existantes.
+        task_id (int): Identifiant de la tâche à supprimer.
+
+    Returns:
+        Tache or None: La tâche supprimée, ou None si elle n'existe pas.
+    """
+    if task_id not in tasks:
+        return None
+    task = tasks.remove(task_id)
+    persist(args, tasks, tasks.changes())
+    return task
+
+
 def handle_remove(args, tasks):
-    """Supprime une tâche en recherchant par identifiant.
+    """Supprime une tâche en la recherchant par identifiant dans l'index.
+
+    Avec ``--where``, toutes les tâches qui vérifient l'expression sont supprimées
+    et sauvegardées en une seule fois.
 
     Args:
         args: Arguments de la ligne de commande contenant l'identifiant de la tâche à supprimer.
-        tasks (list[Tache]): Liste des tâches existantes.
+        tasks (TaskStore): Tâches existantes.
     """
+    if getattr(args, "where", None) is not None:
+        targets = list(args.where.filter(tasks, index_lookup(args)))
+        for task in targets:
+            tasks.remove(task.task_id)
+        persist(args, tasks, tasks.changes())
+        print(f"{len(targets)} tâche(s) supprimée(s) ({args.where.text}).")
+        return
     task_id = int(args.id)
-    task_to_remove = None
-    for task in tasks:
-        if task.task_id == task_id:
-            task_to_remove = task
-            break
-    if task_to_remove:
-        tasks.remove(task_to_remove)
-        save_tasks(tasks)
+    if remove_task(args, tasks, task_id) is not None:
         print(f"Tâche avec l'ID {task_id} supprimée.")
     else:
         print(f"Aucune tâche trouvée avec l'ID {task_id}.")
 
 
+def select_tasks(tasks, sort=None, limit=None, offset=0):
+    """Sélectionne la page de tâches à afficher.
+
+    Avec un tri et une limite, seules les ``offset + limit`` premières tâches sont
+    conservées dans un tas (``heapq.nsmallest``) au lieu de trier toute la liste.
+    Sans tri, les tâches sont lues jusqu'à la fin de la page seulement.
+
+    Args:
+        tasks (iterable[Tache]): Tâches existantes.
+        sort (str, optional): Critère de tri ("title", "priority" ou "due").\
+              Defaults to None.
+        limit (int, optional): Nombre maximal de tâches. Defaults to None.
+        offset (int, optional): Nombre de tâches à sauter. Defaults to 0.
+
+    Returns:
+        iterable[Tache]: Les tâches de la page, dans l'ordre d'affichage.
+    """
+    stop = None if limit is None else offset + limit
+    if sort:
+        key = SORT_KEYS[sort]
+        if stop is None:
+            tasks = sorted(tasks, key=key)
+        else:
+            # nsmallest est stable : même résultat que sorted(...)[:stop]
+            tasks = heapq.nsmallest(stop, tasks, key=key)
+    return itertools.islice(tasks, offset, stop)
+
+
+def select_indexed_tasks(tasks, ids, limit=None, offset=0):
+    """Sélectionne la page de tâches à afficher dans l'ordre d'un index trié.
+
+    Seules les tâches de la page sont conservées lors du parcours : aucun tri
+    n'est effectué.
+
+    Args:
+        tasks (iterable[Tache]): Tâches existantes, dans un ordre quelconque.
+        ids (list[int]): Identifiants de toutes les tâches, dans l'ordre de l'index.
+        limit (int, optional): Nombre maximal de tâches. Defaults to None.
+        offset (int, optional): Nombre de tâches à sauter. Defaults to 0.
+
+    Returns:
+        list[Tache]: Les tâches de la page, dans l'ordre de l'index.
+    """
+    stop = None if limit is None else offset + limit
+    positions = {task_id: position for position, task_id in enumerate(ids[offset:stop])}
+    page = [None] * len(positions)
+    for task in tasks:
+        position = positions.get(task.task_id)
+        if position is not None:
+            page[position] = task
+    return [task for task in page if task is not None]
+
+
+def output_tasks(args, tasks):
+    """Affiche les tâches sélectionnées, ou seulement leur nombre avec ``--count``.
+
+    Args:
+        args: Arguments de la ligne de commande (option ``count``).
+        tasks (iterable[Tache]): Les tâches sélectionnées.
+    """
+    if getattr(args, "count", False):
+        print(f"{sum(1 for _ in tasks)} tâche(s).")
+    else:
+        write_tasks(tasks)
+
+
+def write_tasks(tasks, out=None):
+    """Écrit des tâches par blocs, avec un appel à ``write`` par bloc.
+
+    Args:
+        tasks (iterable[Tache]): Tâches à écrire.
+        out (TextIO, optional): Flux de sortie. Defaults to sys.stdout.
+    """
+    out = out or sys.stdout
+    separator = "\n" + "-" * 40 + "\n"
+    buffer = []
+    for task in tasks:
+        buffer.append(f"{task}{separator}")
+        if len(buffer) >= WRITE_BATCH_SIZE:
+            out.write("".join(buffer))
+            buffer.clear()
+    out.write("".join(buffer))
+    out.flush()
+
+
+def due_bounds(args):
+    """Calcule l'intervalle d'échéances demandé par les options de "list".
+
+    Args:
+        args: Arguments de la ligne de commande (``due_after``, ``due_before``,\
+              ``overdue``), les dates étant des numéros de jour.
+
+    Returns:
+        tuple[int, int or None] or None: Bornes incluses (numéros de jour), ou None\
+              si aucun filtre d'échéance n'est demandé.
+    """
+    low = getattr(args, "due_after", None)
+    high = getattr(args, "due_before", None)
+    if getattr(args, "overdue", False):
+        yesterday = date.today().toordinal() - 1
+        high = yesterday if high is None else min(high, yesterday)
+    if low is None and high is None:
+        return None
+    # Les tâches sans date limite ne font partie d'aucun intervalle.
+    return max(low or NO_DATE, NO_DATE + 1), high
+
+
 def handle_list(args, tasks):
-    """Affiche la liste des tâches, avec un tri optionnel.
+    """Affiche la liste des tâches, avec un tri, un filtre d'échéance et une pagination.
+
+    La page est sélectionnée par list_page, ou par list_all_projects avec ``--all``.
+    La sortie est écrite par blocs. ``--count`` affiche seulement le nombre de tâches,
+    lu sans les charger lorsque le backend le connaît et qu'aucune option ne filtre
+    les tâches.
 
     Args:
-        args: Arguments de la ligne de commande pouvant inclure l'option de tri.
-        tasks (list[Tache]): Liste des tâches existantes.
+        args: Arguments de la ligne de commande pouvant inclure les options de tri,\
+              de filtre (échéance, ``--where``), de pagination et ``--all``.
+        tasks (TaskStore or iterator[Tache] or None): Tâches existantes, None avec\
+              ``--all``.
     """
     print("Affichage de la liste des tâches")
     if args.sort:
         print(f"Tri par : {args.sort}")
-        if args.sort == "title":
-            tasks.sort(key=lambda x: x.titre)
-        elif args.sort == "priority":
-            tasks.sort(key=lambda x: x.priorite)
-        elif args.sort == "due":
-            tasks.sort(key=lambda x: x.date_limite or "")
-    for task in tasks:
-        print(task)
-        print("-" * 40)
+    if getattr(args, "count", False):
+        count = list_count(args, tasks)
+        if count is not None:
+            print(f"{count} tâche(s).")
+            return
+    if getattr(args, "all", False):
+        output_tasks(args, list_all_projects(args))
+    else:
+        output_tasks(args, list_page(args, tasks))
+
+
+def list_count(args, tasks):
+    """Retourne le nombre de tâches à afficher, sans les parcourir si possible.
+
+    Args:
+        args: Arguments de la ligne de commande de "list".
+        tasks (TaskStore or iterator[Tache] or None): Tâches existantes.
+
+    Returns:
+        int or None: Le nombre de tâches après ``--offset``, ou None si des options\
+              filtrent les tâches (il faut alors les parcourir).
+    """
+    if (
+        getattr(args, "where", None) is not None
+        or due_bounds(args) is not None
+        or getattr(args, "limit", None) is not None
+    ):
+        return None
+    if getattr(args, "all", False):
+        from source import shards  # pylint: disable=import-outside-toplevel
+
+        count = sum(
+            count_tasks(filename, storage)
+            for _, filename, storage in shards.projects(shards.store_directory(args.store))
+        )
+    elif isinstance(tasks, TaskStore):
+        count = len(tasks)
+    else:
+        count = count_tasks(args.file, args.storage)
+    return max(count - getattr(args, "offset", 0), 0)
+
+
+def list_page(args, tasks):
+    """Sélectionne les tâches de la page demandée par "list", dans l'ordre d'affichage.
+
+    Les tris par priorité et par date limite utilisent l'index trié persistant du
+    stockage lorsqu'il est à jour (à clé égale, les tâches sont alors ordonnées par
+    identifiant). Les filtres d'échéance (``--due-after``, ``--due-before``,
+    ``--overdue``) sont résolus par dichotomie dans l'index des dates limites.
+    Sans index, les tâches sont filtrées au fil de la lecture, puis le tri est stable
+    et linéaire lorsque le backend les a déjà triées (par exemple via un ``ORDER BY``
+    SQLite). Avec l'index, les tâches de la page sont lues directement par
+    identifiant si le backend le permet (format binaire).
+
+    Args:
+        args: Arguments de la ligne de commande pouvant inclure les options de tri,\
+              de filtre (échéance, ``--where``) et de pagination.
+        tasks (TaskStore or iterator[Tache]): Tâches existantes.
+
+    Returns:
+        iterable[Tache]: Les tâches de la page.
+    """
+    limit = getattr(args, "limit", None)
+    offset = getattr(args, "offset", 0)
+    bounds = due_bounds(args)
+    plan = getattr(args, "where", None)
+    if plan is not None:
+        # Les conditions d'intervalle de l'expression et des options d'échéance sont
+        # résolues ensemble par le plan ; les tâches retenues sont ensuite triées.
+        if bounds is not None:
+            plan.restrict("due", *bounds)
+        selected = plan.filter(tasks, index_lookup(args))
+        return select_tasks(selected, args.sort, limit, offset)
+    # Une TaskStore (mode shell ou démon) peut contenir des modifications plus
+    # récentes que l'index sauvegardé.
+    use_index = not isinstance(tasks, TaskStore)
+    ids = None
+    if bounds is not None:
+        if use_index:
+            ids = load_sorted_ids(args.file, args.storage, "due", *bounds)
+        if ids is None:
+            low, high = bounds
+            tasks = (
+                task
+                for task in tasks
+                if task.date_ordinal is not None
+                and low <= task.date_ordinal
+                and (high is None or task.date_ordinal <= high)
+            )
+        elif args.sort not in (None, "due"):
+            # Tâches de l'intervalle, à présenter dans un autre ordre.
+            matching = set(ids)
+            ids = None
+            tasks = (task for task in tasks if task.task_id in matching)
+            if args.sort in INDEX_KEYS:
+                order = load_sorted_ids(args.file, args.storage, args.sort)
+                if order is not None:
+                    ids = [task_id for task_id in order if task_id in matching]
+    elif args.sort in INDEX_KEYS and use_index:
+        ids = load_sorted_ids(args.file, args.storage, args.sort)
+    if ids is None:
+        return select_tasks(tasks, args.sort, limit, offset)
+    # Les tâches de la page sont lues directement si le backend le permet.
+    stop = None if limit is None else offset + limit
+    page = load_tasks_by_id(args.file, args.storage, ids[offset:stop])
+    if page is None:
+        page = select_indexed_tasks(tasks, ids, limit, offset)
+    return page
+
+
+def list_all_projects(args):
+    """Sélectionne la page de "list --all" parmi les tâches de tous les projets.
+
+    Chaque projet fournit sa propre page triée (voir list_page), limitée aux
+    ``offset + limit`` premières tâches ; les pages sont ensuite fusionnées par une
+    fusion à k voies (voir source.shards), sans trier de nouveau l'ensemble.
+
+    Args:
+        args: Arguments de la ligne de commande de "list" (options ``store``, tri,\
+              filtres et pagination).
+
+    Returns:
+        iterable[Tache]: Les tâches de la page, dans l'ordre d'affichage.
+    """
+    from source import shards  # pylint: disable=import-outside-toplevel
+
+    limit = getattr(args, "limit", None)
+    offset = getattr(args, "offset", 0)
+    stop = None if limit is None else offset + limit
+    pages = []
+    for _, filename, storage in shards.projects(shards.store_directory(args.store)):
+        shard_args = argparse.Namespace(**vars(args))
+        shard_args.file, shard_args.storage = filename, storage
+        shard_args.limit, shard_args.offset = stop, 0
+        tasks = load_tasks(filename, storage, sort=args.sort, stream=True)
+        pages.append(list_page(shard_args, tasks))
+    key = SORT_KEYS[args.sort] if args.sort else None
+    return itertools.islice(shards.merge(pages, key), offset, stop)
+
+
+def handle_search(args, tasks):
+    """Affiche les tâches dont le titre ou la description contient des mots-clés.
+
+    La recherche utilise l'index inversé persistant du stockage lorsqu'il est à jour ;
+    sinon (index absent ou périmé, mode shell ou démon), un index est construit en
+    mémoire à partir des tâches.
+
+    Args:
+        args: Arguments de la ligne de commande contenant les termes de la requête.
+        tasks (TaskStore or iterator[Tache]): Tâches existantes.
+    """
+    from source.search_index import SearchIndex  # pylint: disable=import-outside-toplevel
+
+    print(f"Recherche : {' '.join(args.terms)}")
+    ids = None
+    if not isinstance(tasks, TaskStore):
+        ids = search_ids(args.file, args.storage, args.terms)
+    if ids is None:
+        tasks = list(tasks)
+        ids = SearchIndex.build(tasks).search(args.terms)
+    found = [task for task in tasks if task.task_id in ids] if ids else []
+    write_tasks(found)
+    print(f"{len(found)} tâche(s) trouvée(s).")
+
+
+def _apply_edits(args, task):
+    """Applique les nouvelles valeurs de la ligne de commande à une tâche.
+
+    Args:
+        args: Arguments de la ligne de commande contenant les nouvelles valeurs.
+        task (Tache): La tâche à modifier.
+    """
+    if args.title is not None:
+        task.set_titre(args.title)
+    if args.desc is not None:
+        task.set_description(args.desc)
+    if args.priority is not None:
+        task.set_priorite(args.priority)
+    if args.due is not None:
+        task.set_date_limite(args.due)
+
+
+def edit_task(args, tasks, task):
+    """Modifie une tâche et sauvegarde la modification si une valeur a changé.
+
+    Args:
+        args: Arguments de la commande "edit" contenant les nouvelles valeurs.
+        tasks (TaskStore): Tâches existantes.
+        task (Tache): La tâche à modifier.
+
+    Returns:
+        bool: True si la tâche a changé.
+    """
+    _apply_edits(args, task)
+    if not task.dirty:
+        return False
+    persist(args, tasks, tasks.changes([task]))
+    return True
 
 
 def handle_edit(args, tasks):
-    """Modifie une tâche existante en recherchant par identifiant.
+    """Modifie une tâche existante en la recherchant par identifiant dans l'index.
+
+    Avec ``--where``, toutes les tâches qui vérifient l'expression sont modifiées
+    et sauvegardées en une seule fois. Seules les tâches dont une valeur a réellement
+    changé sont écrites ; si aucune n'a changé, rien n'est sauvegardé.
 
     Args:
-        args: Arguments de la ligne de commande contenant les modifications à apporter à la tâche.
-        tasks (list[Tache]): Liste des tâches existantes.
+        args: Arguments de la ligne de commande contenant les modifications à apporter\
+              à la tâche.
+        tasks (TaskStore): Tâches existantes.
     """
+    if getattr(args, "where", None) is not None:
+        targets = list(args.where.filter(tasks, index_lookup(args)))
+        for task in targets:
+            _apply_edits(args, task)
+        changes = tasks.changes(targets)
+        persist(args, tasks, changes)
+        print(f"{len(changes)} tâche(s) mise(s) à jour ({args.where.text}).")
+        return
     task_id = int(args.id)
-    task_to_edit = None
-    for task in tasks:
-        if task.task_id == task_id:
-            task_to_edit = task
-            break
+    task_to_edit = tasks.get(task_id)
     if task_to_edit:
-        if args.title is not None:
-            task_to_edit.set_titre(args.title)
-        if args.desc is not None:
-            task_to_edit.set_description(args.desc)
-        if args.priority is not None:
-            task_to_edit.set_priorite(args.priority)
-        if args.due is not None:
-            task_to_edit.set_date_limite(args.due)
-        save_tasks(tasks)
-        print(f"Tâche avec l'ID {task_id} mise à jour.")
+        if edit_task(args, tasks, task_to_edit):
+            print(f"Tâche avec l'ID {task_id} mise à jour.")
+        else:
+            print(f"Aucune modification pour la tâche avec l'ID {task_id}.")
     else:
         print(f"Aucune tâche trouvée avec l'ID {task_id}.")
 
 
-def main():
-    """Point d'entrée principal de l'application CLI.
+def handle_compact(args, tasks):
+    """Fusionne le journal dans l'instantané JSON puis vide le journal.
 
-    Configure l'analyse des arguments de la ligne de commande et délègue l'exécution
-    de la commande à la fonction correspondante.
+    Args:
+        args: Arguments de la ligne de commande.
+        tasks (TaskStore): Tâches, journal déjà rejoué.
     """
-    print(WELCOME_MESSAGE)
+    persist(args, tasks)
+    print(f"Journal fusionné dans {args.file} ({len(tasks)} tâches).")
 
-    parser = argparse.ArgumentParser(
-        description="Une application CLI simple.",
-        formatter_class=argparse.RawTextHelpFormatter,
+
+def handle_vacuum(args, tasks):
+    """Réécrit le fichier de sauvegarde de manière compacte.
+
+    Avec le backend records, les fiches supprimées et le texte remplacé sont
+    récupérés ; avec les backends JSON, le journal est fusionné.
+
+    Args:
+        args: Arguments de la ligne de commande.
+        tasks (TaskStore): Tâches à réécrire.
+    """
+    backend = open_storage(args.storage, args.file, args.durability)
+    before = backend.disk_usage()
+    persist(args, tasks)
+    reclaimed = before - backend.disk_usage()
+    print(f"{args.file} réécrit ({len(tasks)} tâches, {reclaimed} octets récupérés).")
+
+
+def handle_cache(args, tasks):  # pylint: disable=unused-argument
+    """Gère l'instantané des tâches décodées (commande ``cache clear``).
+
+    Args:
+        args: Arguments de la ligne de commande contenant l'action.
+        tasks (None): Non utilisé, les tâches ne sont pas chargées.
+    """
+    from source import snapshot_cache  # pylint: disable=import-outside-toplevel
+
+    if snapshot_cache.clear(args.file):
+        print(f"Cache {snapshot_cache.cache_path(args.file)} supprimé.")
+    else:
+        print(f"Aucun cache pour {args.file}.")
+
+
+def handle_migrate(args, tasks):
+    """Copie toutes les tâches du backend courant vers un autre backend.
+
+    Args:
+        args: Arguments de la ligne de commande contenant le backend de destination.
+        tasks (TaskStore): Tâches du backend courant.
+    """
+    target = open_storage(args.to, args.to_file, args.durability)
+    target.save(tasks)
+    target.save_meta(tasks.meta)
+    print(f"{len(tasks)} tâches migrées vers {target.filename} ({args.to}).")
+
+
+def handle_import(args, tasks):
+    """Importe en masse des tâches depuis un fichier CSV ou JSON Lines.
+
+    Les lignes sont validées en flux, les identifiants attribués en un seul lot
+    et les nouvelles tâches sauvegardées en une seule fois à la fin.
+
+    Args:
+        args: Arguments de la ligne de commande contenant le fichier source et son format.
+        tasks (TaskStore): Tâches existantes.
+    """
+    # pylint: disable-next=import-outside-toplevel
+    from source.importer import detect_format, import_tasks
+
+    fmt = args.format or detect_format(args.source)
+    start = time.perf_counter()
+    try:
+        if args.source == "-":
+            added, rejected = import_tasks(sys.stdin, fmt, tasks, args.id_width)
+        else:
+            with open(args.source, "r", encoding="utf-8", newline="") as file:
+                added, rejected = import_tasks(file, fmt, tasks, args.id_width)
+    except (OSError, ValueError) as exc:
+        print(f"Import impossible : {exc}")
+        return
+    persist(args, tasks, tasks.changes())
+    elapsed = time.perf_counter() - start
+    count = len(added)
+    rows = count + len(rejected)
+    rate = rows / elapsed if elapsed > 0 else float(rows)
+    print(
+        f"{count} tâches importées, {len(rejected)} lignes rejetées "
+        f"en {elapsed:.2f} s ({rate:.0f} lignes/s)."
     )
+    for line_number, reason in rejected:
+        print(f"  Ligne {line_number} rejetée : {reason}")
 
-    subparsers = parser.add_subparsers(
-        dest="command",
-        title="Commandes disponibles",
-        help="Choisissez une commande à exécuter",
+
+def handle_shell(args, tasks):
+    """Lit et exécute des commandes sur l'entrée standard avec les tâches en mémoire.
+
+    Args:
+        args: Arguments de la ligne de commande (intervalle d'écriture).
+        tasks (TaskStore): Tâches chargées une seule fois pour toute la session.
+    """
+    from source.shell import Session, run_shell  # pylint: disable=import-outside-toplevel
+
+    session = Session(
+        build_parser(),
+        args,
+        tasks,
+        save_tasks,
+        args.flush_interval,
+        load=lambda: load_store(args.file, args.storage),
+    )
+    run_shell(session)
+
+
+def handle_daemon(args, tasks):
+    """Sert les commandes des clients légers sur une socket Unix locale.
+
+    Args:
+        args: Arguments de la ligne de commande (socket, intervalle d'écriture).
+        tasks (TaskStore): Tâches chargées une seule fois pour toute la durée du démon.
+    """
+    from source.shell import Session, serve  # pylint: disable=import-outside-toplevel
+
+    session = Session(
+        build_parser(),
+        args,
+        tasks,
+        save_tasks,
+        args.flush_interval,
+        load=lambda: load_store(args.file, args.storage),
     )
+    print(f"Démon à l'écoute sur {args.socket} (commande « stop » pour l'arrêter).")
+    serve(session, args.socket)
+
 
-    # Configuration de la commande "add"
-    parser_add = subparsers.add_parser("add", help="Ajoute une tâche à la liste")
+def handle_serve(args, tasks):
+    """Sert l'API HTTP/JSON des tâches sur l'adresse locale.
+
+    Args:
+        args: Arguments de la ligne de commande (adresse, port, intervalle d'écriture).
+        tasks (TaskStore): Tâches chargées une seule fois pour toute la durée du serveur.
+    """
+    from source.http_api import ApiServer  # pylint: disable=import-outside-toplevel
+    from source.shell import Session  # pylint: disable=import-outside-toplevel
+
+    session = Session(
+        build_parser(),
+        args,
+        tasks,
+        save_tasks,
+        args.flush_interval,
+        load=lambda: load_store(args.file, args.storage),
+    )
+    print(f"API HTTP à l'écoute sur http://{args.host}:{args.port} (Ctrl+C pour l'arrêter).")
+    ApiServer(session).run(args.host, args.port)
+
+
+def handle_client(args, tasks):
+    """Envoie une commande à un démon et affiche sa sortie.
+
+    Args:
+        args: Arguments de la ligne de commande (socket et commande à envoyer).
+        tasks: Non utilisé, le client ne charge pas les tâches.
+    """
+    import shlex  # pylint: disable=import-outside-toplevel
+    from source.shell import send_command  # pylint: disable=import-outside-toplevel
+
+    try:
+        print(send_command(args.socket, shlex.join(args.line)), end="")
+    except OSError as exc:
+        print(f"Impossible de joindre le démon sur {args.socket} : {exc}")
+
+
+def _non_negative(value):
+    """Convertit un argument en entier positif ou nul.
+
+    Args:
+        value (str): Valeur de l'argument.
+
+    Returns:
+        int: La valeur convertie.
+
+    Raises:
+        argparse.ArgumentTypeError: Si la valeur n'est pas un entier positif ou nul.
+    """
+    try:
+        number = int(value)
+    except ValueError as exc:
+        raise argparse.ArgumentTypeError(f"entier attendu : {value!r}") from exc
+    if number < 0:
+        raise argparse.ArgumentTypeError(f"valeur négative : {number}")
+    return number
+
+
+def _due_date(value):
+    """Valide un argument de date limite au format YYYY-MM-DD.
+
+    Args:
+        value (str): Valeur de l'argument.
+
+    Returns:
+        str: La date, inchangée.
+
+    Raises:
+        argparse.ArgumentTypeError: Si la date n'est pas au format YYYY-MM-DD.
+    """
+    try:
+        parse_date(value)
+    except ValueError as exc:
+        raise argparse.ArgumentTypeError(str(exc)) from exc
+    return value
+
+
+def _day_number(value):
+    """Convertit un argument de date au format YYYY-MM-DD en numéro de jour.
+
+    Args:
+        value (str): Valeur de l'argument.
+
+    Returns:
+        int: Le numéro du jour (date.toordinal).
+
+    Raises:
+        argparse.ArgumentTypeError: Si la date n'est pas au format YYYY-MM-DD.
+    """
+    try:
+        return parse_date(value)
+    except ValueError as exc:
+        raise argparse.ArgumentTypeError(str(exc)) from exc
+
+
+def _where_plan(value):
+    """Analyse et compile une expression ``--where``.
+
+    Args:
+        value (str): Valeur de l'argument.
+
+    Returns:
+        Plan: Le plan d'exécution de l'expression (voir source.where).
+
+    Raises:
+        argparse.ArgumentTypeError: Si l'expression est invalide.
+    """
+    from source.where import Plan  # pylint: disable=import-outside-toplevel
+
+    try:
+        return Plan(value)
+    except ValueError as exc:
+        raise argparse.ArgumentTypeError(f"expression invalide : {exc}") from exc
+
+
+def _add_where_argument(parser, help_text):
+    """Ajoute l'option ``--where`` à une sous-commande.
+
+    Args:
+        parser (argparse.ArgumentParser or argparse._ActionsContainer): Analyseur ou\
+              groupe d'arguments.
+        help_text (str): Début de l'aide de l'option.
+    """
+    parser.add_argument(
+        "--where",
+        type=_where_plan,
+        metavar="EXPRESSION",
+        help=(
+            f"{help_text}, par exemple :\n"
+            '  \'priorite>=3 and date_limite<2026-11-01 and titre~"deploy"\'\n'
+            "Champs : titre, description, priorite, date_limite, task_id\n"
+            "Opérateurs : = != < <= > >= ~ (contient), and, or, not, ( )"
+        ),
+    )
+
+
+def _configure_add(parser_add):
+    """Configure les arguments de la commande "add".
+
+    Args:
+        parser_add (argparse.ArgumentParser): Analyseur de la sous-commande.
+    """
     parser_add.add_argument("--title", required=True, help="Titre de la tâche")
     parser_add.add_argument("--desc", help="Description de la tâche")
     parser_add.add_argument(
         "--priority", type=int, default=1, help="Priorité de la tâche (défaut: 1)"
     )
     parser_add.add_argument(
-        "--due", help="Date d'échéance de la tâche (format YYYY-MM-DD)"
+        "--due", type=_due_date, help="Date d'échéance de la tâche (format YYYY-MM-DD)"
     )
     parser_add.set_defaults(func=handle_add)
 
-    # Configuration de la commande "remove"
-    parser_remove = subparsers.add_parser(
-        "remove", help="Supprime une tâche de la liste"
-    )
-    parser_remove.add_argument(
-        "--id", required=True, help="Identifiant de la tâche à supprimer"
-    )
-    parser_remove.set_defaults(func=handle_remove)
 
-    # Configuration de la commande "list"
-    parser_list = subparsers.add_parser("list", help="Affiche la liste des tâches")
+def _configure_remove(parser_remove):
+    """Configure les arguments de la commande "remove".
+
+    Args:
+        parser_remove (argparse.ArgumentParser): Analyseur de la sous-commande.
+    """
+    target = parser_remove.add_mutually_exclusive_group(required=True)
+    target.add_argument("--id", help="Identifiant de la tâche à supprimer")
+    _add_where_argument(target, "Supprime toutes les tâches qui vérifient l'expression")
+    parser_remove.set_defaults(func=handle_remove, by_id=True)
+
+
+def _configure_list(parser_list):
+    """Configure les arguments de la commande "list".
+
+    Args:
+        parser_list (argparse.ArgumentParser): Analyseur de la sous-commande.
+    """
     parser_list.add_argument(
         "--sort",
-        choices=["title", "priority", "due"],
+        choices=list(SORT_KEYS),
         help=(
             "Trier la liste par :\n"
             "  title     Trier par titre\n"
@@ -230,32 +1133,516 @@ def main():
             "  due       Trier par date d'échéance"
         ),
     )
-    parser_list.set_defaults(func=handle_list)
+    parser_list.add_argument(
+        "--limit", type=_non_negative, help="Nombre maximal de tâches à afficher"
+    )
+    parser_list.add_argument(
+        "--offset",
+        type=_non_negative,
+        default=0,
+        help="Nombre de tâches à sauter (défaut: 0)",
+    )
+    parser_list.add_argument(
+        "--due-after",
+        type=_day_number,
+        metavar="DATE",
+        help="Tâches dont l'échéance est au plus tôt le DATE (YYYY-MM-DD)",
+    )
+    parser_list.add_argument(
+        "--due-before",
+        type=_day_number,
+        metavar="DATE",
+        help="Tâches dont l'échéance est au plus tard le DATE (YYYY-MM-DD)",
+    )
+    parser_list.add_argument(
+        "--overdue",
+        action="store_true",
+        help="Tâches dont l'échéance est dépassée (avant aujourd'hui)",
+    )
+    parser_list.add_argument(
+        "--count",
+        action="store_true",
+        help="Affiche seulement le nombre de tâches sélectionnées",
+    )
+    parser_list.add_argument(
+        "--all",
+        action="store_true",
+        help="Affiche les tâches de tous les projets du répertoire de stockage",
+    )
+    _add_where_argument(parser_list, "N'affiche que les tâches qui vérifient l'expression")
+    parser_list.set_defaults(func=handle_list, read_only=True)
 
-    # Configuration de la commande "edit"
-    parser_edit = subparsers.add_parser("edit", help="Modifie une tâche existante")
-    parser_edit.add_argument(
-        "--id", required=True, help="Identifiant de la tâche à modifier"
+
+def _configure_search(parser_search):
+    """Configure les arguments de la commande "search".
+
+    Args:
+        parser_search (argparse.ArgumentParser): Analyseur de la sous-commande.
+    """
+    parser_search.add_argument(
+        "terms",
+        nargs="+",
+        metavar="TERME",
+        help=(
+            "Mots recherchés dans le titre et la description, sans casse ni accents :\n"
+            "  pain lait         les deux mots (ET)\n"
+            "  pain OR lait      l'un des deux mots (OU)\n"
+            "  boulang*          un mot commençant par « boulang »"
+        ),
     )
+    parser_search.set_defaults(func=handle_search, read_only=True)
+
+
+def _configure_edit(parser_edit):
+    """Configure les arguments de la commande "edit".
+
+    Args:
+        parser_edit (argparse.ArgumentParser): Analyseur de la sous-commande.
+    """
+    target = parser_edit.add_mutually_exclusive_group(required=True)
+    target.add_argument("--id", help="Identifiant de la tâche à modifier")
+    _add_where_argument(target, "Modifie toutes les tâches qui vérifient l'expression")
     parser_edit.add_argument("--title", help="Nouveau titre de la tâche")
     parser_edit.add_argument("--desc", help="Nouvelle description de la tâche")
     parser_edit.add_argument(
         "--priority", type=int, help="Nouvelle priorité de la tâche"
     )
     parser_edit.add_argument(
-        "--due", help="Nouvelle date d'échéance de la tâche (format YYYY-MM-DD)"
+        "--due",
+        type=_due_date,
+        help="Nouvelle date d'échéance de la tâche (format YYYY-MM-DD)",
     )
-    parser_edit.set_defaults(func=handle_edit)
+    parser_edit.set_defaults(func=handle_edit, by_id=True)
 
-    args = parser.parse_args()
 
-    # Chargement des tâches depuis le fichier JSON
-    tasks = load_tasks(DEFAULT_FILENAME)
+def _configure_import(parser_import):
+    """Configure les arguments de la commande "import".
 
-    if hasattr(args, "func"):
-        args.func(args, tasks)
-    else:
-        print(ERROR_MESSAGE)
+    Args:
+        parser_import (argparse.ArgumentParser): Analyseur de la sous-commande.
+    """
+    from source.importer import FORMATS  # pylint: disable=import-outside-toplevel
+
+    parser_import.add_argument(
+        "source", help="Fichier à importer (« - » pour l'entrée standard)"
+    )
+    parser_import.add_argument(
+        "--format",
+        choices=FORMATS,
+        help="Format du fichier (défaut: déduit de l'extension, jsonl sinon)",
+    )
+    parser_import.set_defaults(func=handle_import)
+
+
+def _configure_compact(parser_compact):
+    """Configure la commande "compact".
+
+    Args:
+        parser_compact (argparse.ArgumentParser): Analyseur de la sous-commande.
+    """
+    parser_compact.set_defaults(func=handle_compact)
+
+
+def _configure_vacuum(parser_vacuum):
+    """Configure la commande "vacuum".
+
+    Args:
+        parser_vacuum (argparse.ArgumentParser): Analyseur de la sous-commande.
+    """
+    parser_vacuum.set_defaults(func=handle_vacuum, in_session=False)
+
+
+def _configure_cache(parser_cache):
+    """Configure les arguments de la commande "cache".
+
+    Args:
+        parser_cache (argparse.ArgumentParser): Analyseur de la sous-commande.
+    """
+    parser_cache.add_argument(
+        "action", choices=["clear"], help="clear : supprime l'instantané en cache"
+    )
+    parser_cache.set_defaults(func=handle_cache, needs_store=False)
+
+
+def _configure_migrate(parser_migrate):
+    """Configure les arguments de la commande "migrate".
+
+    Args:
+        parser_migrate (argparse.ArgumentParser): Analyseur de la sous-commande.
+    """
+    parser_migrate.add_argument(
+        "--to", required=True, choices=sorted(STORAGES), help="Backend de destination"
+    )
+    parser_migrate.add_argument(
+        "--to-file", help="Fichier de destination (défaut du backend)"
+    )
+    parser_migrate.set_defaults(func=handle_migrate)
+
+
+def _configure_shell(parser_shell):
+    """Configure les arguments de la commande "shell".
+
+    Args:
+        parser_shell (argparse.ArgumentParser): Analyseur de la sous-commande.
+    """
+    parser_shell.add_argument(
+        "--flush-interval",
+        type=float,
+        default=1.0,
+        help="Délai minimal en secondes entre deux écritures (défaut: 1.0)",
+    )
+    parser_shell.set_defaults(func=handle_shell, in_session=False)
+
+
+def _configure_daemon(parser_daemon):
+    """Configure les arguments de la commande "daemon".
+
+    Args:
+        parser_daemon (argparse.ArgumentParser): Analyseur de la sous-commande.
+    """
+    _configure_shell(parser_daemon)
+    parser_daemon.add_argument(
+        "--socket", default=DEFAULT_SOCKET, help=f"Socket Unix (défaut: {DEFAULT_SOCKET})"
+    )
+    parser_daemon.set_defaults(func=handle_daemon)
+
+
+def _configure_serve(parser_serve):
+    """Configure les arguments de la commande "serve".
+
+    Args:
+        parser_serve (argparse.ArgumentParser): Analyseur de la sous-commande.
+    """
+    _configure_shell(parser_serve)
+    parser_serve.add_argument(
+        "--host",
+        default=DEFAULT_HTTP_HOST,
+        help=f"Adresse d'écoute (défaut: {DEFAULT_HTTP_HOST})",
+    )
+    parser_serve.add_argument(
+        "--port",
+        type=_non_negative,
+        default=DEFAULT_HTTP_PORT,
+        help=f"Port d'écoute, 0 pour un port libre (défaut: {DEFAULT_HTTP_PORT})",
+    )
+    parser_serve.set_defaults(func=handle_serve)
+
+
+def _configure_client(parser_client):
+    """Configure les arguments de la commande "client".
+
+    Args:
+        parser_client (argparse.ArgumentParser): Analyseur de la sous-commande.
+    """
+    parser_client.add_argument(
+        "--socket", default=DEFAULT_SOCKET, help=f"Socket Unix (défaut: {DEFAULT_SOCKET})"
+    )
+    parser_client.add_argument(
+        "line", nargs=argparse.REMAINDER, help="Commande à envoyer, ex. : list --sort due"
+    )
+    parser_client.set_defaults(func=handle_client, in_session=False, needs_store=False)
+
+
+# Nom de la commande -> (aide, fonction de configuration de ses arguments)
+COMMANDS = {
+    "add": ("Ajoute une tâche à la liste", _configure_add),
+    "remove": ("Supprime une tâche de la liste", _configure_remove),
+    "list": ("Affiche la liste des tâches", _configure_list),
+    "edit": ("Modifie une tâche existante", _configure_edit),
+    "search": ("Recherche des tâches par mots-clés", _configure_search),
+    "import": ("Importe des tâches depuis un fichier CSV ou JSON Lines", _configure_import),
+    "compact": ("Fusionne le journal dans le fichier de sauvegarde", _configure_compact),
+    "vacuum": ("Récupère l'espace des tâches supprimées ou modifiées", _configure_vacuum),
+    "cache": ("Gère l'instantané des tâches décodées (cache clear)", _configure_cache),
+    "migrate": ("Copie les tâches vers un autre backend de stockage", _configure_migrate),
+    "shell": ("Exécute les commandes lues sur l'entrée standard", _configure_shell),
+    "daemon": ("Sert les commandes des clients sur une socket Unix", _configure_daemon),
+    "client": ("Envoie une commande à un démon en cours d'exécution", _configure_client),
+    "serve": ("Sert une API HTTP/JSON locale des tâches", _configure_serve),
+}
+
+# Options globales suivies d'une valeur, à sauter pour trouver le nom de la commande
+GLOBAL_OPTIONS_WITH_VALUE = (
+    "--storage",
+    "--id-width",
+    "--file",
+    "--project",
+    "--store",
+    "--durability",
+    "--workers",
+    "--profile",
+)
+
+
+def find_command(argv):
+    """Retourne le nom de la commande présente dans les arguments.
+
+    Args:
+        argv (list[str]): Arguments de la ligne de commande, sans le nom du programme.
+
+    Returns:
+        str or None: Le nom de la commande, ou None si aucune commande connue n'est donnée.
+    """
+    tokens = iter(argv)
+    for token in tokens:
+        if token in GLOBAL_OPTIONS_WITH_VALUE:
+            next(tokens, None)
+        elif not token.startswith("-"):
+            return token if token in COMMANDS else None
+    return None
+
+
+def build_parser(command=None):
+    """Construit l'analyseur des arguments de la ligne de commande.
+
+    Toutes les sous-commandes sont déclarées, mais seuls les arguments de la commande
+    demandée sont configurés, ce qui accélère le démarrage.
+
+    Args:
+        command (str, optional): Commande à configurer ; None pour toutes les configurer\
+              (aide complète, modes shell et démon). Defaults to None.
+
+    Returns:
+        argparse.ArgumentParser: L'analyseur, avec une sous-commande par fonction handle_*.
+    """
+    parser = argparse.ArgumentParser(
+        description="Une application CLI simple.",
+        formatter_class=argparse.RawTextHelpFormatter,
+    )
+    parser.add_argument(
+        "--version", action="version", version=f"%(prog)s {__version__}"
+    )
+    parser.add_argument(
+        "--storage",
+        choices=sorted(STORAGES),
+        default=os.environ.get(STORAGE_ENV, "json"),
+        help=(
+            f"Backend de stockage (défaut: ${STORAGE_ENV} ou json) :\n"
+            "  json      Réécrit tout le fichier à chaque modification\n"
+            "  journal   Ajoute chaque modification à un journal\n"
+            "  jsonl     Une tâche par ligne, lue en flux\n"
+            "  binary    Format binaire lu par mmap, texte décodé à la demande\n"
+            "  records   Fiches de taille fixe modifiées sur place\n"
+            "  sqlite    Base SQLite indexée"
+        ),
+    )
+    parser.add_argument(
+        "--id-width",
+        type=int,
+        default=DEFAULT_ID_WIDTH,
+        help=f"Nombre de chiffres des nouveaux identifiants (défaut: {DEFAULT_ID_WIDTH})",
+    )
+    parser.add_argument(
+        "--file",
+        help=(
+            "Fichier de sauvegarde (défaut: tasks.json, tasks.jsonl, tasks.bin, tasks.rec"
+            " ou tasks.db)"
+        ),
+    )
+    parser.add_argument(
+        "--project",
+        metavar="NOM",
+        help="Projet (liste de tâches nommée) stocké dans son propre fichier\n"
+        "du répertoire de stockage",
+    )
+    parser.add_argument(
+        "--store",
+        metavar="RÉPERTOIRE",
+        help="Répertoire de stockage des projets (défaut: $TASK_MANAGER_STORE ou tasks.d)",
+    )
+    parser.add_argument(
+        "--durability",
+        choices=list(DURABILITY_LEVELS),
+        default=os.environ.get(DURABILITY_ENV, DEFAULT_DURABILITY),
+        help=(
+            f"Durabilité des écritures (défaut: ${DURABILITY_ENV} ou "
+            f"{DEFAULT_DURABILITY}) :\n"
+            + "\n".join(
+                f"  {name:<8}  {description}"
+                for name, description in DURABILITY_LEVELS.items()
+            )
+        ),
+    )
+    parser.add_argument(
+        "--workers",
+        type=_non_negative,
+        metavar="N",
+        help="Nombre de processus de lecture d'un grand fichier JSON Lines\n"
+        "(défaut: $TASK_MANAGER_WORKERS ou le nombre de processeurs ; 1 pour lire en série)",
+    )
+    parser.add_argument(
+        "--timings",
+        action="store_true",
+        help="Affiche sur la sortie d'erreur la durée de chaque phase et les compteurs",
+    )
+    parser.add_argument(
+        "--profile",
+        metavar="FICHIER",
+        help="Exécute la commande sous cProfile et écrit les statistiques dans FICHIER\n"
+        "(à lire avec python -m pstats FICHIER)",
+    )
+
+    subparsers = parser.add_subparsers(
+        dest="command",
+        title="Commandes disponibles",
+        help="Choisissez une commande à exécuter",
+    )
+    for name, (help_text, configure) in COMMANDS.items():
+        subparser = subparsers.add_parser(
+            name, help=help_text, formatter_class=argparse.RawTextHelpFormatter
+        )
+        if command is None or name == command:
+            configure(subparser)
+
+    return parser
+
+
+def resolve_project(args):
+    """Remplace le fichier et le backend par ceux du fragment du projet ``--project``.
+
+    Un projet inconnu est enregistré dans le manifeste par une commande qui modifie
+    les tâches ; une commande en lecture seule n'écrit rien.
+
+    Args:
+        args: Arguments analysés de la ligne de commande.
+
+    Raises:
+        SystemExit: Si ``--file`` est aussi donné ou si le nom du projet est invalide.
+    """
+    from source import shards  # pylint: disable=import-outside-toplevel
+
+    if args.file is not None:
+        raise SystemExit("Les options --file et --project sont incompatibles.")
+    try:
+        args.file, args.storage = shards.resolve(
+            shards.store_directory(args.store),
+            args.project,
+            args.storage,
+            create=not getattr(args, "read_only", False),
+            durability=args.durability,
+        )
+    except ValueError as exc:
+        raise SystemExit(str(exc)) from exc
+
+
+def run(args):
+    """Charge les tâches et exécute la commande analysée.
+
+    Si un autre processus a modifié les tâches pendant la commande (ConflictError),
+    les tâches sont rechargées et la commande exécutée de nouveau : seule sa propre
+    modification est appliquée aux données à jour.
+
+    Args:
+        args: Arguments analysés de la ligne de commande.
+
+    Raises:
+        SystemExit: Si la commande est encore en conflit après MAX_ATTEMPTS tentatives.
+    """
+    if args.project is not None:
+        resolve_project(args)
+    if args.file is None:
+        args.file = storage_class(args.storage).default_filename
+    if getattr(args, "all", False):
+        # "list --all" lit lui-même les fragments de tous les projets.
+        args.needs_store = False
+    sort = getattr(args, "sort", None)
+
+    for attempt in range(1, MAX_ATTEMPTS + 1):
+        # Chargement des tâches depuis le backend de stockage ; une commande en lecture
+        # seule lit les tâches en flux, sans construire la collection indexée.
+        with timings.phase("load"):
+            if not getattr(args, "needs_store", True):
+                tasks = None
+            elif getattr(args, "read_only", False):
+                tasks = load_tasks(args.file, args.storage, sort=sort, stream=True)
+            else:
+                tasks = None
+                if getattr(args, "by_id", False) and args.id is not None:
+                    # Une seule tâche visée : elle est chargée seule si le backend le permet.
+                    tasks = load_store_by_id(args.file, args.storage, [int(args.id)])
+                if tasks is None:
+                    tasks = load_store(
+                        args.file,
+                        args.storage,
+                        sort=sort,
+                        workers=getattr(args, "workers", None),
+                    )
+
+        try:
+            with timings.phase("command"):
+                args.func(args, tasks)
+            return
+        except ConflictError as exc:
+            if attempt == MAX_ATTEMPTS:
+                raise SystemExit(f"Échec après {attempt} tentatives : {exc}.") from exc
+            import random  # pylint: disable=import-outside-toplevel
+
+            print(
+                f"Conflit : {exc}, nouvelle tentative ({attempt + 1}/{MAX_ATTEMPTS}).",
+                file=sys.stderr,
+            )
+            timings.count("conflicts")
+            time.sleep(random.uniform(0, RETRY_DELAY * 2**attempt))
+
+
+def run_profiled(args):
+    """Exécute la commande sous cProfile et sauvegarde les statistiques.
+
+    Args:
+        args: Arguments analysés de la ligne de commande (option ``profile``).
+    """
+    import cProfile  # pylint: disable=import-outside-toplevel
+
+    profiler = cProfile.Profile()
+    try:
+        profiler.runcall(run, args)
+    finally:
+        profiler.dump_stats(args.profile)
+        print(f"Profil écrit dans {args.profile}", file=sys.stderr)
+
+
+def main(argv=None):
+    """Point d'entrée principal de l'application CLI.
+
+    Configure l'analyse des arguments de la ligne de commande et délègue l'exécution
+    de la commande à la fonction correspondante. Un fichier de sauvegarde illisible
+    termine le programme avec un message d'erreur, sans rien écrire. Avec
+    ``--timings``, la durée de chaque phase (parse, load, decode, build, command, save,
+    index) et les compteurs sont affichés sur la sortie d'erreur, en texte puis sur une
+    ligne JSON.
+
+    Args:
+        argv (list[str], optional): Arguments à analyser. Defaults to sys.argv[1:].
+    """
+    print(WELCOME_MESSAGE)
+
+    if argv is None:
+        argv = sys.argv[1:]
+    # La mesure démarre avant l'analyse des arguments et s'arrête aussitôt sans --timings.
+    measure = timings.start()
+    args = None
+    try:
+        with timings.phase("parse"):
+            parser = build_parser(find_command(argv))
+            args = parser.parse_args(argv)
+        if not args.timings:
+            timings.stop()
+        if not hasattr(args, "func"):
+            # Aucune commande : rien à faire, le stockage n'est pas chargé.
+            print(ERROR_MESSAGE)
+            return
+        try:
+            if args.profile:
+                run_profiled(args)
+            else:
+                run(args)
+        except StorageError as exc:
+            # Fichier illisible : ne rien écrire par-dessus, et le signaler.
+            raise SystemExit(str(exc)) from exc
+    finally:
+        timings.stop()
+        if args is not None and args.timings:
+            sys.stderr.write(measure.report())
 
 
 if __name__ == "__main__":
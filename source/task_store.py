@@ -0,0 +1,233 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+Module task_store.
+
+Ce module définit la classe TaskStore, une collection de tâches indexée par identifiant.
+
+Les tâches sont conservées dans un dictionnaire task_id -> Tache qui préserve l'ordre
+d'insertion : la recherche, le remplacement et la suppression par identifiant se font
+en temps constant, sans parcourir la liste des tâches.
+
+La collection porte aussi les métadonnées du stockage (par exemple le curseur de
+l'allocateur d'identifiants), sauvegardées avec les tâches.
+
+Elle retient les identifiants des tâches ajoutées et supprimées depuis la dernière
+sauvegarde ; avec les tâches marquées comme modifiées (``Tache.dirty``), ils forment
+la liste des modifications à écrire (``changes``).
+"""
+
+from source.id_allocator import DEFAULT_ID_WIDTH, IdAllocator
+
+
+class TaskStore:
+    """Collection de tâches indexée par identifiant.
+
+    L'itération restitue les tâches dans leur ordre d'insertion.
+
+    Attributes:
+        meta (dict): Métadonnées du stockage.
+        added (dict[int, Tache]): Tâches ajoutées depuis la dernière sauvegarde, par\
+              identifiant, dans leur ordre d'ajout.
+        removed (dict[int, Tache]): Tâches supprimées depuis la dernière sauvegarde, par\
+              identifiant.
+    """
+
+    def __init__(self, tasks=(), meta=None):
+        """Construit la collection à partir de tâches existantes.
+
+        Args:
+            tasks (iterable[Tache], optional): Tâches initiales. Defaults to ().
+            meta (dict, optional): Métadonnées du stockage. Defaults to None.
+        """
+        self._by_id = {task.task_id: task for task in tasks}
+        self.meta = dict(meta or {})
+        self.added = {}
+        self.removed = {}
+
+    def __len__(self):
+        """Retourne le nombre de tâches.
+
+        Returns:
+            int: Le nombre de tâches.
+        """
+        return len(self._by_id)
+
+    def __iter__(self):
+        """Itère sur les tâches dans leur ordre d'insertion.
+
+        Returns:
+            iterator[Tache]: Un itérateur sur les tâches.
+        """
+        return iter(self._by_id.values())
+
+    def __contains__(self, task_id):
+        """Indique si une tâche porte l'identifiant donné.
+
+        Args:
+            task_id (int): Identifiant recherché.
+
+        Returns:
+            bool: True si la tâche existe.
+        """
+        return task_id in self._by_id
+
+    def ids(self):
+        """Retourne une vue des identifiants des tâches.
+
+        Returns:
+            KeysView[int]: Les identifiants, utilisables comme un ensemble.
+        """
+        return self._by_id.keys()
+
+    def get(self, task_id):
+        """Retourne la tâche portant l'identifiant donné.
+
+        Args:
+            task_id (int): Identifiant recherché.
+
+        Returns:
+            Tache or None: La tâche, ou None si elle n'existe pas.
+        """
+        return self._by_id.get(task_id)
+
+    def add(self, task):
+        """Ajoute une nouvelle tâche à la fin de la collection.
+
+        Args:
+            task (Tache): La tâche à ajouter.
+
+        Raises:
+            ValueError: Si une tâche porte déjà le même identifiant.
+        """
+        if task.task_id in self._by_id:
+            raise ValueError(f"Une tâche avec l'ID {task.task_id} existe déjà.")
+        self._by_id[task.task_id] = task
+        self.added[task.task_id] = task
+
+    def replace(self, task):
+        """Remplace la tâche de même identifiant en conservant sa position.
+
+        Args:
+            task (Tache): La nouvelle version de la tâche.
+
+        Raises:
+            KeyError: Si aucune tâche ne porte cet identifiant.
+        """
+        if task.task_id not in self._by_id:
+            raise KeyError(task.task_id)
+        self._by_id[task.task_id] = task
+
+    def remove(self, task_id):
+        """Supprime et retourne la tâche portant l'identifiant donné.
+
+        Args:
+            task_id (int): Identifiant de la tâche à supprimer.
+
+        Returns:
+            Tache: La tâche supprimée.
+
+        Raises:
+            KeyError: Si aucune tâche ne porte cet identifiant.
+        """
+        task = self._by_id.pop(task_id)
+        # Une tâche ajoutée puis supprimée avant la sauvegarde n'est jamais écrite.
+        if self.added.pop(task_id, None) is None:
+            self.removed[task_id] = task
+        return task
+
+    def changes(self, edited=()):
+        """Retourne les modifications à sauvegarder depuis la dernière sauvegarde.
+
+        Args:
+            edited (iterable[Tache], optional): Tâches éventuellement modifiées ; seules\
+                  celles marquées comme modifiées sont retenues. Defaults to ().
+
+        Returns:
+            list[tuple[str, Tache]]: Modifications (opération, tâche) : suppressions,\
+                  ajouts puis modifications ; une liste vide si rien n'a changé.
+        """
+        changes = [("remove", task) for task in self.removed.values()]
+        changes.extend(("add", task) for task in self.added.values())
+        changes.extend(
+            ("edit", task)
+            for task in edited
+            if task.dirty and task.task_id not in self.added
+        )
+        return changes
+
+    def mark_clean(self, changes=None):
+        """Oublie les modifications sauvegardées (ou enregistrées pour l'être).
+
+        Args:
+            changes (list[tuple[str, Tache]], optional): Modifications sauvegardées ;\
+                  None après la réécriture de toutes les tâches. Defaults to None.
+        """
+        self.added.clear()
+        self.removed.clear()
+        tasks = self if changes is None else (task for _, task in changes)
+        for task in tasks:
+            task.mark_clean()
+
+    def apply(self, changes, changed=None):
+        """Applique des modifications enregistrées sur une autre copie des tâches.
+
+        Sert à rejouer les modifications d'une session sur les tâches rechargées après
+        un conflit d'écriture. Une tâche ajoutée dont l'identifiant a été attribué
+        entre-temps par un autre processus reçoit un nouvel identifiant. Une
+        modification d'une tâche supprimée entre-temps est ignorée ; pour une tâche
+        toujours présente, seuls les attributs modifiés par la session sont rejoués et
+        les autres reprennent les valeurs rechargées.
+
+        Args:
+            changes (list[tuple[str, Tache]]): Modifications (opération, tâche), où\
+                  l'opération vaut "add", "edit" ou "remove".
+            changed (dict[int, set[str]], optional): Attributs modifiés par la session,\
+                  par identifiant de tâche ; None rejoue les tâches modifiées en\
+                  entier. Defaults to None.
+
+        Returns:
+            tuple[dict[int, int], list[int]]: Les identifiants réattribués\
+                  (ancien -> nouveau) et ceux des modifications ignorées.
+        """
+        reassigned = {}
+        skipped = []
+        for operation, task in changes:
+            if operation == "remove":
+                self._by_id.pop(task.task_id, None)
+                continue
+            if operation == "add" and task.task_id in self._by_id:
+                old_id = task.task_id
+                task.task_id = self.allocate_ids(1, len(str(old_id)))[0]
+                reassigned[old_id] = task.task_id
+            elif operation == "edit":
+                current = self._by_id.get(task.task_id)
+                if current is None:
+                    skipped.append(task.task_id)
+                    continue
+                fields = None if changed is None else changed.get(task.task_id)
+                if fields is not None and current is not task:
+                    for name in ("titre", "description", "priorite", "date_limite"):
+                        if name not in fields:
+                            setattr(task, name, getattr(current, name))
+            self._by_id[task.task_id] = task
+        return reassigned, skipped
+
+    def allocate_ids(self, count=1, width=DEFAULT_ID_WIDTH):
+        """Attribue des identifiants libres et avance le curseur des métadonnées.
+
+        Args:
+            count (int, optional): Nombre d'identifiants à attribuer. Defaults to 1.
+            width (int, optional): Nombre de chiffres des identifiants.\
+                  Defaults to DEFAULT_ID_WIDTH.
+
+        Returns:
+            list[int]: Les identifiants attribués.
+
+        Raises:
+            ValueError: Si l'espace des identifiants de cette largeur est épuisé.
+        """
+        allocator = IdAllocator(width, self.meta.get("next_id"))
+        ids = allocator.allocate(count, used=self._by_id)
+        self.meta["next_id"] = allocator.next_id
+        return ids
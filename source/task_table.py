@@ -0,0 +1,229 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+Module task_table.
+
+Ce module définit la classe TaskTable, une représentation en colonnes d'un grand
+nombre de tâches.
+
+Les identifiants et les priorités sont stockés dans des ``array('q')`` (8 octets par
+valeur, sans objet Python par valeur) et les titres, descriptions et dates limites dans
+des listes parallèles. L'accès à une ligne retourne une TaskRow : une Tache dont les
+attributs sont lus et écrits directement dans les colonnes, sans copie.
+"""
+
+from array import array
+
+from source.tache import Tache, to_ordinal
+
+NO_ID = -1  # Valeur stockée dans la colonne des identifiants pour un task_id None
+
+
+class TaskRow(Tache):
+    """Vue d'une ligne de TaskTable, qui se comporte comme une Tache.
+
+    Les attributs sont lus dans les colonnes à chaque accès et les modifications (y
+    compris par les méthodes ``set_*``) y sont écrites directement.
+    """
+
+    __slots__ = ("_table", "_index")
+
+    def __init__(self, table, index):  # pylint: disable=super-init-not-called
+        """Crée la vue d'une ligne, sans lire ses valeurs.
+
+        Args:
+            table (TaskTable): La table.
+            index (int): Position de la ligne.
+        """
+        self._table = table
+        self._index = index
+
+    @property
+    def titre(self):
+        """str: Le titre, lu dans la colonne des titres."""
+        return self._table.titres[self._index]
+
+    @titre.setter
+    def titre(self, value):
+        self._table.titres[self._index] = value
+
+    @property
+    def description(self):
+        """str or None: La description, lue dans la colonne des descriptions."""
+        return self._table.descriptions[self._index]
+
+    @description.setter
+    def description(self, value):
+        self._table.descriptions[self._index] = value
+
+    @property
+    def priorite(self):
+        """int: La priorité, lue dans la colonne des priorités."""
+        return self._table.priorites[self._index]
+
+    @priorite.setter
+    def priorite(self, value):
+        self._table.priorites[self._index] = value
+
+    @property
+    def task_id(self):
+        """int or None: L'identifiant, lu dans la colonne des identifiants."""
+        task_id = self._table.task_ids[self._index]
+        return None if task_id == NO_ID else task_id
+
+    @task_id.setter
+    def task_id(self, value):
+        self._table.task_ids[self._index] = NO_ID if value is None else value
+
+    @property
+    def date_limite(self):
+        """str or None: La date limite, lue dans la colonne des dates limites."""
+        return self._table.dates_limites[self._index]
+
+    @date_limite.setter
+    def date_limite(self, value):
+        self._table.dates_limites[self._index] = value
+
+    @property
+    def date_ordinal(self):
+        """int or None: Le numéro du jour de la date limite, calculé à chaque accès."""
+        return to_ordinal(self.date_limite)
+
+
+class TaskTable:
+    """Table de tâches stockées en colonnes parallèles.
+
+    Attributes:
+        task_ids (array): Identifiants des tâches (NO_ID pour None).
+        priorites (array): Priorités des tâches.
+        titres (list[str]): Titres des tâches.
+        descriptions (list[str or None]): Descriptions des tâches.
+        dates_limites (list[str or None]): Dates limites des tâches.
+    """
+
+    def __init__(self, tasks=()):
+        """Construit la table à partir de tâches existantes.
+
+        Args:
+            tasks (iterable[Tache], optional): Tâches initiales. Defaults to ().
+        """
+        self.task_ids = array("q")
+        self.priorites = array("q")
+        self.titres = []
+        self.descriptions = []
+        self.dates_limites = []
+        for task in tasks:
+            self.append(task)
+
+    @classmethod
+    def from_dicts(cls, items):
+        """Construit la table directement à partir de dictionnaires (par exemple du JSON).
+
+        Aucune instance de Tache n'est créée.
+
+        Args:
+            items (iterable[dict]): Dictionnaires au format de Tache.to_dict.
+
+        Returns:
+            TaskTable: La table construite.
+        """
+        table = cls()
+        for item in items:
+            task_id = item.get("task_id")
+            table.task_ids.append(NO_ID if task_id is None else task_id)
+            table.priorites.append(max(item.get("priorite", 1), 1))
+            table.titres.append(item["titre"])
+            table.descriptions.append(item.get("description"))
+            table.dates_limites.append(item.get("date_limite"))
+        return table
+
+    def __len__(self):
+        """Retourne le nombre de tâches.
+
+        Returns:
+            int: Le nombre de tâches.
+        """
+        return len(self.task_ids)
+
+    def __getitem__(self, index):
+        """Retourne la vue de la tâche située à une position donnée.
+
+        Aucune valeur n'est copiée : une modification de la vue modifie la table.
+
+        Args:
+            index (int): Position de la tâche.
+
+        Returns:
+            TaskRow: La vue de la tâche.
+
+        Raises:
+            IndexError: Si la position est hors de la table.
+        """
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError(index)
+        return TaskRow(self, index)
+
+    def __setitem__(self, index, task):
+        """Remplace la tâche située à une position donnée.
+
+        Args:
+            index (int): Position de la tâche.
+            task (Tache): La nouvelle version de la tâche.
+        """
+        self.task_ids[index] = NO_ID if task.task_id is None else task.task_id
+        self.priorites[index] = task.priorite
+        self.titres[index] = task.titre
+        self.descriptions[index] = task.description
+        self.dates_limites[index] = task.date_limite
+
+    def __iter__(self):
+        """Produit les vues des tâches une par une.
+
+        Yields:
+            TaskRow: Les tâches, dans l'ordre de la table.
+        """
+        for index in range(len(self)):
+            yield TaskRow(self, index)
+
+    def append(self, task):
+        """Ajoute une tâche à la fin de la table.
+
+        Args:
+            task (Tache): La tâche à ajouter.
+        """
+        self.task_ids.append(NO_ID if task.task_id is None else task.task_id)
+        self.priorites.append(task.priorite)
+        self.titres.append(task.titre)
+        self.descriptions.append(task.description)
+        self.dates_limites.append(task.date_limite)
+
+    def index_of(self, task_id):
+        """Retourne la position de la tâche portant un identifiant.
+
+        Args:
+            task_id (int): Identifiant recherché.
+
+        Returns:
+            int: La position de la tâche.
+
+        Raises:
+            ValueError: Si aucune tâche ne porte cet identifiant.
+        """
+        return self.task_ids.index(task_id)
+
+    def to_dicts(self):
+        """Produit les dictionnaires des tâches, sans créer d'instances de Tache.
+
+        Yields:
+            dict: Un dictionnaire au format de Tache.to_dict par tâche.
+        """
+        for index, task_id in enumerate(self.task_ids):
+            yield {
+                "task_id": None if task_id == NO_ID else task_id,
+                "titre": self.titres[index],
+                "description": self.descriptions[index],
+                "priorite": self.priorites[index],
+                "date_limite": self.dates_limites[index],
+            }
@@ -0,0 +1,235 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+Module timings.
+
+Ce module mesure la durée des phases d'une commande (analyse des arguments,
+décodage du fichier, construction des objets Tache, commande, sauvegarde) et tient
+des compteurs (tâches chargées, octets écrits), affichés par l'option globale
+``--timings``.
+
+L'instrumentation passe par les fonctions du module, utilisables partout sans
+modifier les fonctions handle_* :
+
+    with timings.phase("decode"):
+        data = json.load(file)
+    timings.count("bytes_written", size)
+
+Tant qu'aucune mesure n'est démarrée (start), ces fonctions ne font rien. Les phases
+peuvent s'imbriquer : la durée d'une phase exclut celle des phases qu'elle contient,
+si bien que la somme des phases est égale à la durée totale mesurée.
+"""
+
+import json
+import time
+
+_active = None  # Mesure en cours (Timings), ou None si l'instrumentation est désactivée
+
+
+class _Phase:
+    """Gestionnaire de contexte mesurant une phase d'une mesure Timings."""
+
+    __slots__ = ("timings", "name")
+
+    def __init__(self, timings, name):
+        """Initialise la phase.
+
+        Args:
+            timings (Timings): La mesure à laquelle ajouter la durée.
+            name (str): Nom de la phase.
+        """
+        self.timings = timings
+        self.name = name
+
+    def __enter__(self):
+        """Démarre la phase."""
+        self.timings.enter(self.name)
+        return self
+
+    def __exit__(self, *exc_info):
+        """Termine la phase, y compris en cas d'exception."""
+        self.timings.exit()
+
+
+class _NoPhase:
+    """Gestionnaire de contexte vide, utilisé quand l'instrumentation est désactivée."""
+
+    __slots__ = ()
+
+    def __enter__(self):
+        """Ne fait rien."""
+        return self
+
+    def __exit__(self, *exc_info):
+        """Ne fait rien."""
+
+
+NO_PHASE = _NoPhase()
+
+
+class Timings:
+    """Durées des phases et compteurs d'une commande.
+
+    Attributes:
+        phases (dict[str, float]): Nom de la phase -> durée cumulée en secondes, hors\
+              phases imbriquées. Les phases sont conservées dans l'ordre de leur début.
+        counters (dict[str, int]): Nom du compteur -> valeur.
+        total (float): Durée totale des phases de premier niveau, en secondes.
+    """
+
+    def __init__(self):
+        """Initialise une mesure vide."""
+        self.phases = {}
+        self.counters = {}
+        self.total = 0.0
+        # Pile des phases en cours : [nom, début, durée des phases imbriquées]
+        self._stack = []
+
+    def enter(self, name):
+        """Démarre une phase.
+
+        Args:
+            name (str): Nom de la phase.
+        """
+        self.phases.setdefault(name, 0.0)
+        self._stack.append([name, time.perf_counter(), 0.0])
+
+    def exit(self):
+        """Termine la phase en cours et ajoute sa durée propre."""
+        name, start, nested = self._stack.pop()
+        elapsed = time.perf_counter() - start
+        self.phases[name] += elapsed - nested
+        if self._stack:
+            self._stack[-1][2] += elapsed
+        else:
+            self.total += elapsed
+
+    def phase(self, name):
+        """Retourne un gestionnaire de contexte mesurant une phase.
+
+        Args:
+            name (str): Nom de la phase.
+
+        Returns:
+            _Phase: Le gestionnaire de contexte.
+        """
+        return _Phase(self, name)
+
+    def count(self, name, amount=1):
+        """Incrémente un compteur.
+
+        Args:
+            name (str): Nom du compteur.
+            amount (int, optional): Valeur ajoutée. Defaults to 1.
+        """
+        self.counters[name] = self.counters.get(name, 0) + amount
+
+    def to_dict(self):
+        """Retourne la mesure sous forme de dictionnaire sérialisable en JSON.
+
+        Returns:
+            dict: Clés "phases_ms", "total_ms" et "counters".
+        """
+        return {
+            "phases_ms": {
+                name: round(seconds * 1000, 3) for name, seconds in self.phases.items()
+            },
+            "total_ms": round(self.total * 1000, 3),
+            "counters": dict(self.counters),
+        }
+
+    def report(self):
+        """Retourne la mesure en texte lisible, suivie d'une ligne JSON.
+
+        Returns:
+            str: Le rapport, terminé par un saut de ligne.
+        """
+        width = max(map(len, [*self.phases, *self.counters, "total"]))
+        lines = ["Durées des phases (ms) :"]
+        for name, seconds in self.phases.items():
+            lines.append(f"  {name:<{width}}  {seconds * 1000:10.3f}")
+        lines.append(f"  {'total':<{width}}  {self.total * 1000:10.3f}")
+        if self.counters:
+            lines.append("Compteurs :")
+            for name, value in self.counters.items():
+                lines.append(f"  {name:<{width}}  {value:10d}")
+        lines.append(json.dumps({"timings": self.to_dict()}, ensure_ascii=False))
+        return "\n".join(lines) + "\n"
+
+
+def start():
+    """Démarre une nouvelle mesure, qui reçoit désormais les phases et compteurs.
+
+    Returns:
+        Timings: La mesure démarrée.
+    """
+    global _active  # pylint: disable=global-statement
+    _active = Timings()
+    return _active
+
+
+def stop():
+    """Arrête la mesure en cours.
+
+    Returns:
+        Timings or None: La mesure arrêtée, ou None si aucune n'était en cours.
+    """
+    global _active  # pylint: disable=global-statement
+    timings, _active = _active, None
+    return timings
+
+
+def phase(name):
+    """Retourne un gestionnaire de contexte mesurant une phase de la mesure en cours.
+
+    Args:
+        name (str): Nom de la phase.
+
+    Returns:
+        Le gestionnaire de contexte, sans effet si aucune mesure n'est en cours.
+    """
+    if _active is None:
+        return NO_PHASE
+    return _active.phase(name)
+
+
+def count(name, amount=1):
+    """Incrémente un compteur de la mesure en cours, s'il y en a une.
+
+    Args:
+        name (str): Nom du compteur.
+        amount (int, optional): Valeur ajoutée. Defaults to 1.
+    """
+    if _active is not None:
+        _active.count(name, amount)
+
+
+def counted(tasks, name="tasks_loaded"):
+    """Compte les tâches produites par un itérateur, si une mesure est en cours.
+
+    Args:
+        tasks (iterable[Tache]): Les tâches.
+        name (str, optional): Nom du compteur. Defaults to "tasks_loaded".
+
+    Returns:
+        iterable[Tache]: Les mêmes tâches, comptées au fil de leur lecture.
+    """
+    if _active is None:
+        return tasks
+    return _counted(_active, tasks, name)
+
+
+def _counted(timings, tasks, name):
+    """Produit les tâches en incrémentant un compteur.
+
+    Args:
+        timings (Timings): La mesure.
+        tasks (iterable[Tache]): Les tâches.
+        name (str): Nom du compteur.
+
+    Yields:
+        Tache: Les tâches.
+    """
+    for task in tasks:
+        timings.count(name)
+        yield task
@@ -0,0 +1,378 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+Module where.
+
+Ce module analyse les expressions de filtre de l'option ``--where`` et les compile en
+un prédicat Python, par exemple :
+
+    priorite>=3 and date_limite<2026-11-01 and titre~"deploy"
+
+Grammaire :
+
+    expression  := terme ("or" terme)*
+    terme       := facteur ("and" facteur)*
+    facteur     := "not" facteur | "(" expression ")" | condition
+    condition   := champ opérateur valeur
+
+Les champs sont ceux de Tache (titre, description, priorite, date_limite, task_id).
+Les opérateurs sont ``=`` (ou ``==``), ``!=``, ``<``, ``<=``, ``>``, ``>=`` et ``~``
+(« contient », sans casse). Une valeur contenant des espaces se met entre guillemets.
+Une condition sur un champ absent (par exemple une tâche sans date limite) est fausse.
+
+L'expression est analysée une seule fois puis compilée en fermetures imbriquées :
+aucune analyse n'a lieu pendant le parcours des tâches. Le planificateur (Plan) extrait
+en outre les conditions d'intervalle sur la priorité et la date limite combinées par
+``and`` au premier niveau ; lorsqu'un index trié persistant est disponible (voir
+source.sorted_index), elles sont résolues par dichotomie et seules les conditions
+restantes sont testées sur les tâches candidates. Sans index, l'expression entière est
+testée en un seul parcours des tâches.
+"""
+
+import functools
+import operator
+import re
+
+from source.sorted_index import NO_DATE
+from source.tache import parse_date
+
+# Champ -> (attribut lu sur la tâche, conversion de la valeur de l'expression)
+FIELDS = {
+    "titre": ("titre", str),
+    "description": ("description", str),
+    "priorite": ("priorite", int),
+    "date_limite": ("date_ordinal", parse_date),
+    "task_id": ("task_id", int),
+}
+
+OPERATORS = {
+    "=": operator.eq,
+    "==": operator.eq,
+    "!=": operator.ne,
+    "<": operator.lt,
+    "<=": operator.le,
+    ">": operator.gt,
+    ">=": operator.ge,
+}
+CONTAINS = "~"
+
+# Champ -> critère de l'index trié utilisable pour ses conditions d'intervalle
+RANGE_FIELDS = {"priorite": "priority", "date_limite": "due"}
+
+TOKEN_PATTERN = re.compile(
+    r"""\s*(?:
+        (?P<paren>[()])
+      | (?P<op>==|!=|<=|>=|=|<|>|~)
+      | "(?P<dq>(?:[^"\\]|\\.)*)"
+      | '(?P<sq>(?:[^'\\]|\\.)*)'
+      | (?P<word>[^\s()=!<>~"']+)
+    )""",
+    re.VERBOSE,
+)
+KEYWORDS = ("and", "or", "not")
+
+
+def tokenize(text):
+    """Découpe une expression en lexèmes.
+
+    Args:
+        text (str): L'expression.
+
+    Returns:
+        list[tuple[str, str]]: Couples (genre, texte), le genre valant "paren", "op",\
+              "str" (valeur entre guillemets), "word" ou un mot-clé.
+
+    Raises:
+        ValueError: Si un caractère inattendu est rencontré.
+    """
+    tokens = []
+    position = 0
+    text = text.rstrip()
+    while position < len(text):
+        match = TOKEN_PATTERN.match(text, position)
+        if match is None:
+            raise ValueError(
+                f"caractère inattendu en position {position} : {text[position:]!r}"
+            )
+        position = match.end()
+        kind = match.lastgroup
+        value = match.group(kind)
+        if kind in ("dq", "sq"):
+            tokens.append(("str", re.sub(r"\\(.)", r"\1", value)))
+        elif kind == "word" and value.lower() in KEYWORDS:
+            tokens.append((value.lower(), value))
+        else:
+            tokens.append((kind, value))
+    return tokens
+
+
+class _Parser:
+    """Analyseur descendant récursif produisant un arbre de tuples.
+
+    Les nœuds sont ``("and", [nœuds])``, ``("or", [nœuds])``, ``("not", nœud)`` et
+    ``("cmp", champ, opérateur, valeur)``.
+    """
+
+    def __init__(self, tokens):
+        """Initialise l'analyseur.
+
+        Args:
+            tokens (list[tuple[str, str]]): Les lexèmes de l'expression.
+        """
+        self.tokens = tokens
+        self.position = 0
+
+    def peek(self):
+        """Retourne le genre du lexème courant.
+
+        Returns:
+            str or None: Le genre, ou None à la fin de l'expression.
+        """
+        if self.position < len(self.tokens):
+            return self.tokens[self.position][0]
+        return None
+
+    def take(self, *kinds):
+        """Consomme le lexème courant s'il est de l'un des genres attendus.
+
+        Args:
+            *kinds (str): Genres acceptés.
+
+        Returns:
+            str: Le texte du lexème.
+
+        Raises:
+            ValueError: Si le lexème courant n'est pas du genre attendu.
+        """
+        kind = self.peek()
+        if kind not in kinds:
+            if kind is None:
+                found = "fin de l'expression"
+            else:
+                found = repr(self.tokens[self.position][1])
+            raise ValueError(f"{' ou '.join(kinds)} attendu, {found} trouvé")
+        self.position += 1
+        return self.tokens[self.position - 1][1]
+
+    def expression(self):
+        """Analyse une disjonction."""
+        nodes = [self.term()]
+        while self.peek() == "or":
+            self.take("or")
+            nodes.append(self.term())
+        return nodes[0] if len(nodes) == 1 else ("or", nodes)
+
+    def term(self):
+        """Analyse une conjonction."""
+        nodes = [self.factor()]
+        while self.peek() == "and":
+            self.take("and")
+            nodes.append(self.factor())
+        return nodes[0] if len(nodes) == 1 else ("and", nodes)
+
+    def factor(self):
+        """Analyse une négation, une expression entre parenthèses ou une condition."""
+        if self.peek() == "not":
+            self.take("not")
+            return ("not", self.factor())
+        if self.peek() == "paren":
+            if self.take("paren") != "(":
+                raise ValueError("« ) » inattendue")
+            node = self.expression()
+            if self.take("paren") != ")":
+                raise ValueError("« ) » attendue")
+            return node
+        return self.condition()
+
+    def condition(self):
+        """Analyse une condition ``champ opérateur valeur``."""
+        field = self.take("word")
+        if field not in FIELDS:
+            raise ValueError(
+                f"champ inconnu : {field!r} (champs : {', '.join(FIELDS)})"
+            )
+        op = self.take("op")
+        raw = self.take("word", "str")
+        if op == CONTAINS:
+            if FIELDS[field][1] is not str:
+                raise ValueError(
+                    f"l'opérateur ~ ne s'applique qu'au texte, pas à {field}"
+                )
+            return ("cmp", field, op, raw.casefold())
+        try:
+            value = FIELDS[field][1](raw)
+        except ValueError as exc:
+            raise ValueError(f"valeur invalide pour {field} : {raw!r}") from exc
+        return ("cmp", field, op, value)
+
+
+def parse(text):
+    """Analyse une expression ``--where``.
+
+    Args:
+        text (str): L'expression.
+
+    Returns:
+        tuple: La racine de l'arbre de l'expression.
+
+    Raises:
+        ValueError: Si l'expression est invalide.
+    """
+    parser = _Parser(tokenize(text))
+    if parser.peek() is None:
+        raise ValueError("expression vide")
+    node = parser.expression()
+    if parser.peek() is not None:
+        raise ValueError(f"lexème inattendu : {parser.tokens[parser.position][1]!r}")
+    return node
+
+
+def compile_node(node):
+    """Compile un nœud de l'arbre en prédicat.
+
+    Args:
+        node (tuple): Le nœud (voir _Parser).
+
+    Returns:
+        callable: Fonction ``prédicat(tâche) -> bool``.
+    """
+    kind = node[0]
+    if kind == "cmp":
+        _, field, op, value = node
+        get = operator.attrgetter(FIELDS[field][0])
+        if op == CONTAINS:
+            return lambda task: (get(task) or "").casefold().find(value) >= 0
+        compare = OPERATORS[op]
+        return lambda task: (actual := get(task)) is not None and compare(actual, value)
+    if kind == "not":
+        inner = compile_node(node[1])
+        return lambda task: not inner(task)
+    predicates = [compile_node(child) for child in node[1]]
+    if kind == "and":
+        return functools.reduce(
+            lambda left, right: lambda task: left(task) and right(task), predicates
+        )
+    return functools.reduce(
+        lambda left, right: lambda task: left(task) or right(task), predicates
+    )
+
+
+def _bounds(op, value):
+    """Convertit une condition d'intervalle entière en bornes incluses.
+
+    Args:
+        op (str): Opérateur de comparaison.
+        value (int): Valeur comparée.
+
+    Returns:
+        tuple[int or None, int or None]: Bornes (basse, haute) incluses.
+    """
+    return {
+        "=": (value, value),
+        "==": (value, value),
+        "<": (None, value - 1),
+        "<=": (None, value),
+        ">": (value + 1, None),
+        ">=": (value, None),
+    }[op]
+
+
+class Plan:
+    """Plan d'exécution d'une expression ``--where``.
+
+    Attributes:
+        text (str): L'expression d'origine.
+        predicate (callable): Prédicat compilé de l'expression complète.
+        ranges (dict[str, list]): Critère d'index trié ("priority" ou "due") ->\
+              bornes [basse, haute] incluses, extraites des conditions d'intervalle.
+        residual (callable): Prédicat des conditions non résolues par les index.
+    """
+
+    def __init__(self, text):
+        """Analyse et compile l'expression.
+
+        Args:
+            text (str): L'expression.
+
+        Raises:
+            ValueError: Si l'expression est invalide.
+        """
+        self.text = text
+        node = parse(text)
+        self.predicate = compile_node(node)
+        conditions = node[1] if node[0] == "and" else [node]
+        self.ranges = {}
+        rest = []
+        for condition in conditions:
+            if (
+                condition[0] == "cmp"
+                and condition[1] in RANGE_FIELDS
+                and condition[2] in OPERATORS
+                and condition[2] != "!="
+            ):
+                self.restrict(
+                    RANGE_FIELDS[condition[1]], *_bounds(condition[2], condition[3])
+                )
+            else:
+                rest.append(condition)
+        if not rest:
+            self.residual = lambda task: True
+        else:
+            self.residual = compile_node(rest[0] if len(rest) == 1 else ("and", rest))
+
+    def restrict(self, sort, low=None, high=None):
+        """Ajoute une condition d'intervalle résolue par un index trié.
+
+        Args:
+            sort (str): Critère de l'index trié ("priority" ou "due").
+            low (int, optional): Borne basse incluse. Defaults to None.
+            high (int, optional): Borne haute incluse. Defaults to None.
+        """
+        # Les tâches sans date limite (NO_DATE dans l'index) ne vérifient aucune condition.
+        default_low = NO_DATE + 1 if sort == "due" else None
+        bounds = self.ranges.setdefault(sort, [default_low, None])
+        if low is not None:
+            bounds[0] = low if bounds[0] is None else max(bounds[0], low)
+        if high is not None:
+            bounds[1] = high if bounds[1] is None else min(bounds[1], high)
+
+    def candidates(self, ids_between):
+        """Retourne les identifiants des tâches qui vérifient les conditions d'intervalle.
+
+        Args:
+            ids_between (callable): Fonction ``(critère, basse, haute) -> list[int]``\
+                  d'un index trié, ou qui retourne None sans index.
+
+        Returns:
+            set[int] or None: Les identifiants candidats, ou None si le plan n'a pas\
+                  de condition d'intervalle ou si l'index est indisponible.
+        """
+        found = None
+        for sort, (low, high) in self.ranges.items():
+            ids = ids_between(sort, low, high)
+            if ids is None:
+                return None
+            found = set(ids) if found is None else found.intersection(ids)
+        return found
+
+    def filter(self, tasks, ids_between=None):
+        """Sélectionne les tâches qui vérifient l'expression, en un seul parcours.
+
+        Les conditions d'intervalle sont résolues par l'index fourni ; à défaut,
+        l'expression entière est testée sur chaque tâche, sans construire d'index.
+
+        Args:
+            tasks (iterable[Tache]): Les tâches.
+            ids_between (callable, optional): Recherche par intervalle dans un index\
+                  persistant (voir candidates). Defaults to None.
+
+        Returns:
+            iterator[Tache]: Les tâches sélectionnées, dans leur ordre d'origine.
+        """
+        ids = None
+        if self.ranges and ids_between is not None:
+            ids = self.candidates(ids_between)
+        if ids is None:
+            return filter(self.predicate, tasks)
+        residual = self.residual
+        return (task for task in tasks if task.task_id in ids and residual(task))
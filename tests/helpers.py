@@ -0,0 +1,99 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+Module d'outils communs aux tests.
+
+Ce module regroupe l'exécution de la CLI avec capture de sa sortie standard, la
+lecture des titres affichés et les jeux de tâches partagés par plusieurs modules de
+tests. Chaque jeu est retourné sous forme de nouvelles instances : un test peut les
+modifier sans effet sur les autres.
+"""
+
+import io
+
+from unittest.mock import patch
+
+from source import task_manager
+from source.tache import Tache
+
+
+def run_cli(argv):
+    """Exécute la CLI et retourne sa sortie standard.
+
+    Args:
+        argv (list[str]): Arguments de la CLI.
+
+    Returns:
+        str: La sortie standard.
+    """
+    with patch("sys.stdout", new_callable=io.StringIO) as fake_out:
+        task_manager.main(argv)
+    return fake_out.getvalue()
+
+
+def listed_titles(output):
+    """Retourne les titres des tâches affichées, dans l'ordre.
+
+    Args:
+        output (str): Sortie d'une commande "list" ou "search".
+
+    Returns:
+        list[str]: Les titres.
+    """
+    return [
+        line.split("Titre: ")[1] for line in output.splitlines() if "Titre: " in line
+    ]
+
+
+def storage_tasks():
+    """Retourne trois tâches dans un ordre non trié, avec de grands identifiants.
+
+    Returns:
+        list[Tache]: Les tâches de test.
+    """
+    return [
+        Tache("Zebra", "Desc", 3, "2025-03-03", task_id=111111),
+        Tache("Apple", None, 1, None, task_id=222222),
+        Tache("Mango", "Desc", 2, "2025-01-01", task_id=333333),
+    ]
+
+
+def indexed_tasks():
+    """Retourne quatre tâches dans un ordre non trié, dont une sans date limite.
+
+    Returns:
+        list[Tache]: Les tâches de test.
+    """
+    return [
+        Tache("Zebra", None, 3, "2025-03-03", task_id=4),
+        Tache("Apple", None, 1, None, task_id=3),
+        Tache("Mango", None, 2, "2025-01-01", task_id=2),
+        Tache("Kiwi", None, 1, "2024-12-31", task_id=1),
+    ]
+
+
+def search_tasks():
+    """Retourne trois tâches aux titres et descriptions accentués.
+
+    Returns:
+        list[Tache]: Les tâches de test.
+    """
+    return [
+        Tache("Acheter du pain", "Passer à la boulangerie", task_id=1),
+        Tache("Réviser l'été", "Préparer les congés", task_id=2),
+        Tache("Acheter du lait", None, task_id=3),
+    ]
+
+
+def where_tasks():
+    """Retourne quatre tâches pour les expressions --where.
+
+    Returns:
+        list[Tache]: Les tâches de test.
+    """
+    return [
+        Tache("Deploy API", "Mise en production", 3, "2026-10-01", task_id=1),
+        Tache("Deploy front", None, 1, "2026-12-01", task_id=2),
+        Tache("Écrire le rapport", "deploy notes", 4, None, task_id=3),
+        Tache("Relire", None, 5, "2026-09-15", task_id=4),
+    ]
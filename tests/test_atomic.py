@@ -0,0 +1,139 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+Module de tests pour les écritures atomiques (atomic).
+
+Ce module vérifie que le fichier de sauvegarde est remplacé atomiquement, qu'une
+écriture interrompue (exception, disque plein) laisse l'ancien fichier intact, le
+retrait d'une dernière ligne tronquée avant un ajout, le nombre de synchronisations
+de chaque niveau de durabilité et le regroupement des modifications d'une session en
+une seule écriture.
+
+Chaque méthode de test est documentée avec une docstring au format Google.
+"""
+
+import errno
+import os
+import tempfile
+import unittest
+
+from unittest.mock import patch
+
+from source import task_manager
+from source.atomic import AtomicFile, drop_torn_tail
+from source.shell import Session
+from source.storage import open_storage
+from source.tache import Tache
+
+
+class TestAtomic(unittest.TestCase):
+    """Tests unitaires pour les écritures atomiques et la durabilité."""
+
+    def setUp(self):
+        """Crée un fichier de tâches dans un répertoire temporaire."""
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.filename = os.path.join(self.tmpdir.name, "tasks.json")
+        open_storage("json", self.filename).save([Tache("Ancienne", task_id=1)])
+
+    def tearDown(self):
+        """Supprime le répertoire temporaire."""
+        self.tmpdir.cleanup()
+
+    def titles(self, storage="json"):
+        """Retourne les titres des tâches sauvegardées.
+
+        Args:
+            storage (str, optional): Nom du backend. Defaults to "json".
+
+        Returns:
+            list[str]: Les titres.
+        """
+        return [task.titre for task in open_storage(storage, self.filename).load()]
+
+    def leftovers(self):
+        """Retourne les fichiers temporaires restés dans le répertoire.
+
+        Returns:
+            list[str]: Les noms des fichiers temporaires.
+        """
+        return [name for name in os.listdir(self.tmpdir.name) if name.endswith(".tmp")]
+
+    def test_replace(self):
+        """Test du remplacement du fichier, avec ses permissions conservées."""
+        os.chmod(self.filename, 0o600)
+        with AtomicFile(self.filename) as file:
+            file.write("[]")
+        with open(self.filename, "r", encoding="utf-8") as file:
+            self.assertEqual(file.read(), "[]")
+        self.assertEqual(os.stat(self.filename).st_mode & 0o777, 0o600)
+        self.assertEqual(self.leftovers(), [])
+
+    def test_interrupted_write_keeps_old_file(self):
+        """Test qu'une écriture interrompue laisse l'ancien fichier intact."""
+        storage = open_storage("json", self.filename)
+        with patch("json.dump", side_effect=KeyboardInterrupt):
+            with self.assertRaises(KeyboardInterrupt):
+                storage.save([Tache("Nouvelle", task_id=2)])
+        self.assertEqual(self.titles(), ["Ancienne"])
+        self.assertEqual(self.leftovers(), [])
+
+    def test_disk_full_keeps_old_file(self):
+        """Test qu'un disque plein pendant la synchronisation laisse l'ancien fichier intact."""
+        for storage in ("json", "jsonl"):
+            with self.subTest(storage=storage):
+                backend = open_storage(storage, self.filename)
+                backend.save([Tache("Ancienne", task_id=1)])
+                with patch("os.fsync", side_effect=OSError(errno.ENOSPC, "plein")):
+                    with self.assertRaises(OSError):
+                        backend.save([Tache("Nouvelle", task_id=2)])
+                self.assertEqual(self.titles(storage), ["Ancienne"])
+                self.assertEqual(self.leftovers(), [])
+
+    def test_drop_torn_tail(self):
+        """Test que seule une dernière ligne sans saut de ligne est retirée."""
+        path = os.path.join(self.tmpdir.name, "lignes")
+        long_line = "x" * 10000
+        cases = [
+            ("a\nb\n", "a\nb\n"),
+            ("a\nb", "a\n"),
+            ("a\n" + long_line, "a\n"),
+            (long_line, ""),
+        ]
+        for content, expected in cases:
+            with self.subTest(content=content[:10]):
+                with open(path, "w", encoding="utf-8") as file:
+                    file.write(content)
+                drop_torn_tail(path)
+                with open(path, "r", encoding="utf-8") as file:
+                    self.assertEqual(file.read(), expected)
+        drop_torn_tail(os.path.join(self.tmpdir.name, "absent"))
+
+    def test_durability_levels(self):
+        """Test du nombre de fsync de chaque niveau de durabilité."""
+        expected = {"off": 0, "normal": 2, "full": 4}  # données et métadonnées
+        for durability, count in expected.items():
+            with self.subTest(durability=durability):
+                store = task_manager.load_store(self.filename)
+                with patch("os.fsync") as mock_fsync:
+                    task_manager.save_tasks(store, self.filename, durability=durability)
+                self.assertEqual(mock_fsync.call_count, count)
+
+    def test_session_group_commit(self):
+        """Test que les commandes d'une session sont écrites et synchronisées une fois."""
+        options = task_manager.build_parser().parse_args(
+            ["--storage", "journal", "--file", self.filename, "shell"]
+        )
+        session = Session(
+            task_manager.build_parser(),
+            options,
+            task_manager.load_store(self.filename),
+            task_manager.save_tasks,
+            flush_interval=3600,
+        )
+        with patch("builtins.print"):
+            for number in range(3):
+                session.execute(f"add --title 'Tâche {number}'")
+        with patch("os.fsync") as mock_fsync:
+            session.flush()
+        self.assertEqual(mock_fsync.call_count, 2)  # journal et métadonnées
+        self.assertEqual(len(self.titles("journal")), 4)
@@ -0,0 +1,99 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+Module de tests pour le banc d'essai (benchmarks.bench) et le test de charge
+(benchmarks.load_test).
+
+Ce module vérifie, sur de très petits volumes, que le générateur de tâches est
+déterministe, que chaque opération est mesurée, que le mode de comparaison
+signale les régressions au-delà du seuil et que le test de charge mesure les
+requêtes envoyées à un serveur "serve".
+
+Chaque méthode de test est documentée avec une docstring au format Google.
+"""
+
+import io
+import json
+import os
+import tempfile
+import unittest
+
+from unittest.mock import patch
+
+from benchmarks import bench, load_test, parallel_bench
+
+
+class TestBenchmarks(unittest.TestCase):
+    """Tests unitaires pour le banc d'essai."""
+
+    def test_generate_tasks_is_deterministic(self):
+        """Test que deux générations avec la même graine sont identiques."""
+        first = bench.generate_tasks(50)
+        self.assertEqual(first, bench.generate_tasks(50))
+        self.assertEqual(len({task.task_id for task in first}), 50)
+
+    def test_run_benchmarks(self):
+        """Test que chaque opération est mesurée pour chaque taille."""
+        with patch("sys.stderr", new_callable=io.StringIO):
+            results = bench.run_benchmarks(sizes=[20, 40], repeat=1)
+        self.assertEqual(set(results["results"]), set(bench.OPERATIONS))
+        for by_size in results["results"].values():
+            self.assertEqual(set(by_size), {"20", "40"})
+            for result in by_size.values():
+                self.assertGreaterEqual(result["seconds"], 0)
+                self.assertGreaterEqual(result["peak_bytes"], 0)
+
+    def test_compare(self):
+        """Test que seules les hausses au-delà du seuil sont signalées."""
+        baseline = {"results": {"load": {"1000": {"seconds": 1.0, "peak_bytes": 100}}}}
+        current = {"results": {"load": {"1000": {"seconds": 1.2, "peak_bytes": 200}}}}
+        self.assertEqual(
+            bench.compare(baseline, current, threshold=0.25),
+            [("load", "1000", "peak_bytes", 100, 200)],
+        )
+
+    def test_compare_command_exit_code(self):
+        """Test que la commande "compare" retourne 1 en cas de régression."""
+        baseline = {"results": {"list": {"10": {"seconds": 1.0, "peak_bytes": 1}}}}
+        current = {"results": {"list": {"10": {"seconds": 3.0, "peak_bytes": 1}}}}
+        with tempfile.TemporaryDirectory() as tmpdir:
+            paths = []
+            for name, data in (("baseline", baseline), ("current", current)):
+                paths.append(os.path.join(tmpdir, f"{name}.json"))
+                with open(paths[-1], "w", encoding="utf-8") as file:
+                    json.dump(data, file)
+            with patch("sys.stdout", new_callable=io.StringIO) as fake_out:
+                code = bench.main(["compare", paths[0], "--current", paths[1]])
+        self.assertEqual(code, 1)
+        self.assertIn("RÉGRESSION list", fake_out.getvalue())
+
+    def test_percentile(self):
+        """Test des centiles par la méthode du rang le plus proche."""
+        values = [float(value) for value in range(1, 101)]
+        self.assertEqual(load_test.percentile(values, 50), 50.0)
+        self.assertEqual(load_test.percentile(values, 99), 99.0)
+        self.assertEqual(load_test.percentile([], 99), 0.0)
+
+    def test_load_test(self):
+        """Test que le test de charge envoie toutes les requêtes sans erreur."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            output = os.path.join(tmpdir, "charge.json")
+            argv = ["--tasks", "50", "--requests", "200", "--concurrency", "4"]
+            argv += ["--writes", "0.5", "--output", output]
+            with patch("sys.stdout", new_callable=io.StringIO) as fake_out:
+                code = load_test.main(argv)
+            with open(output, encoding="utf-8") as file:
+                result = json.load(file)
+        self.assertEqual(code, 0, fake_out.getvalue())
+        self.assertEqual((result["requests"], result["errors"]), (200, 0))
+        self.assertGreater(result["requests_per_second"], 0)
+        self.assertLessEqual(result["p50_ms"], result["p99_ms"])
+        self.assertIn("req/s", fake_out.getvalue())
+
+    def test_parallel_bench(self):
+        """Test que le banc d'essai parallèle mesure chaque nombre de processus."""
+        with patch("sys.stdout", new_callable=io.StringIO) as fake_out:
+            code = parallel_bench.main(["--tasks", "200", "--workers", "2", "--repeat", "1"])
+        self.assertEqual(code, 0)
+        self.assertIn("2 processus", fake_out.getvalue())
+        self.assertIn("accélération 1.00x", fake_out.getvalue())
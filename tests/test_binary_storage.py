@@ -0,0 +1,162 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+Module de tests pour le backend binaire (binary_storage).
+
+Ce module vérifie l'aller-retour des tâches par le format binaire, le décodage du
+texte à la demande, le nombre de tâches lu dans l'en-tête, l'accès direct par
+identifiant, la détection d'un fichier invalide, la recopie des fiches inchangées
+et les commandes "migrate" et "list" avec ce backend.
+
+Chaque méthode de test est documentée avec une docstring au format Google.
+"""
+
+import os
+import tempfile
+import unittest
+
+from unittest.mock import patch
+
+from source import task_manager
+from source.binary_storage import HEADER, BinaryFile, BinaryStorage, LazyTache
+from source.storage import StorageError, open_storage
+from source.tache import Tache
+from tests.helpers import run_cli
+
+
+class TestBinaryStorage(unittest.TestCase):
+    """Tests unitaires pour le backend binaire."""
+
+    def setUp(self):
+        """Crée un répertoire temporaire et un fichier binaire de trois tâches."""
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.filename = self.path("tasks.bin")
+        self.tasks = [
+            Tache("Été", "Déjà", 2, "2025-01-01", 1),
+            Tache("B", task_id=3),
+            Tache("C", "Texte", 7, task_id=2),
+        ]
+        BinaryStorage(self.filename).save(self.tasks)
+
+    def tearDown(self):
+        """Supprime le répertoire temporaire."""
+        self.tmpdir.cleanup()
+
+    def path(self, name):
+        """Retourne le chemin d'un fichier du répertoire temporaire.
+
+        Args:
+            name (str): Nom du fichier.
+
+        Returns:
+            str: Le chemin.
+        """
+        return os.path.join(self.tmpdir.name, name)
+
+    def test_round_trip(self):
+        """Test que les tâches relues sont égales aux tâches sauvegardées."""
+        loaded = BinaryStorage(self.filename).load()
+        self.assertEqual(
+            [t.to_dict() for t in loaded], [t.to_dict() for t in self.tasks]
+        )
+
+    def test_text_decoded_on_demand(self):
+        """Test que le titre n'est décodé qu'au premier accès, puis conservé."""
+        task = next(iter(BinaryFile(self.filename)))
+        self.assertIsInstance(task, LazyTache)
+        with self.assertRaises(AttributeError):
+            Tache.__dict__["titre"].__get__(task)
+        self.assertEqual(task.titre, "Été")
+        self.assertEqual(Tache.__dict__["titre"].__get__(task), "Été")
+        task.titre = "Modifié"
+        self.assertEqual(task.get_titre(), "Modifié")
+
+    def test_count_from_header(self):
+        """Test que le nombre de tâches est lu sans charger les tâches."""
+        storage = BinaryStorage(self.filename)
+        with patch.object(BinaryFile, "task") as mock_task:
+            self.assertEqual(storage.count(), 3)
+        mock_task.assert_not_called()
+        self.assertEqual(BinaryStorage(self.path("absent.bin")).count(), 0)
+
+    def test_get_tasks_by_id(self):
+        """Test de l'accès direct par identifiant, dans l'ordre demandé."""
+        tasks = BinaryStorage(self.filename).get_tasks([3, 99, 1])
+        self.assertEqual([t.get_titre() for t in tasks], ["B", "Été"])
+
+    def test_invalid_file(self):
+        """Test qu'un fichier d'un autre format ou tronqué lève StorageError."""
+        with open(self.filename, "rb") as file:
+            content = file.read()
+        for data in (b"{}" + content[2:], content[: HEADER.size - 1], content[:-1]):
+            with self.subTest(data=data[:8]):
+                with open(self.filename, "wb") as file:
+                    file.write(data)
+                with self.assertRaises(StorageError):
+                    BinaryStorage(self.filename).load()
+
+    def test_apply_copies_unchanged_records(self):
+        """Test que les fiches inchangées sont recopiées sans être décodées."""
+        storage = BinaryStorage(self.filename)
+        tasks = storage.load()
+        tasks[1].priorite = 5
+        raw = LazyTache.raw
+        with patch.object(LazyTache, "raw", autospec=True, side_effect=raw) as mock_raw:
+            storage.apply(tasks, [("edit", tasks[1])])
+        self.assertEqual(mock_raw.call_count, 2)
+        loaded = storage.load()
+        self.assertEqual([t.priorite for t in loaded], [2, 5, 7])
+        self.assertEqual([t.get_titre() for t in loaded], ["Été", "B", "C"])
+        self.assertEqual(storage.search(["texte"]), {2})
+
+    def test_free_form_due_date_kept(self):
+        """Test qu'une date limite en texte libre est conservée, y compris recopiée."""
+        storage = BinaryStorage(self.filename)
+        tasks = self.tasks + [Tache("Ancienne", None, 1, "vendredi", 4)]
+        storage.save(tasks)
+        loaded = storage.load()
+        self.assertEqual(loaded[3].date_limite, "vendredi")
+        self.assertIsNone(loaded[3].date_ordinal)
+        loaded[1].priorite = 5
+        storage.apply(loaded, [("edit", loaded[1])])
+        self.assertEqual(
+            [t.date_limite for t in storage.load()], ["2025-01-01", None, None, "vendredi"]
+        )
+
+    def test_migrate_json_binary_json(self):
+        """Test de la conversion JSON -> binaire -> JSON avec "migrate"."""
+        json_file = self.path("tasks.json")
+        open_storage("json", json_file).save(self.tasks)
+        converted = self.path("converted.bin")
+        back_file = self.path("back.json")
+        run_cli(
+            ["--file", json_file, "migrate", "--to", "binary", "--to-file", converted]
+        )
+        run_cli(
+            ["--storage", "binary", "--file", converted, "migrate", "--to", "json"]
+            + ["--to-file", back_file]
+        )
+        self.assertEqual(
+            [t.to_dict() for t in open_storage("json", back_file).load()],
+            [t.to_dict() for t in self.tasks],
+        )
+
+    def test_list_count(self):
+        """Test de "list --count", lu dans l'en-tête sans charger les tâches."""
+        argv = ["--storage", "binary", "--file", self.filename, "list", "--count"]
+        with patch.object(task_manager, "load_store") as mock_load:
+            self.assertTrue(run_cli(argv).endswith("\n3 tâche(s).\n"))
+        mock_load.assert_not_called()
+        output = run_cli(argv + ["--where", "priorite >= 2"])
+        self.assertTrue(output.endswith("\n2 tâche(s).\n"))
+
+    def test_list_sorted_page(self):
+        """Test de "list --sort priority --limit" avec l'accès direct par identifiant."""
+        argv = ["--storage", "binary", "--file", self.filename, "list"]
+        output = run_cli(argv + ["--sort", "priority", "--limit", "2"])
+        titles = [line for line in output.splitlines() if line.startswith("Titre: ")]
+        self.assertEqual(titles, ["Titre: B", "Titre: Été"])
+
+
+if __name__ == "__main__":
+    unittest.main()
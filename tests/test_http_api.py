@@ -0,0 +1,192 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+Module de tests pour l'API HTTP/JSON locale (http_api).
+
+Ce module vérifie les requêtes de lecture, d'ajout, de modification et de suppression,
+la validation des paramètres et des champs par l'analyseur de la ligne de commande,
+l'écriture par lots des modifications et l'écriture finale à l'arrêt du serveur.
+
+Chaque méthode de test est documentée avec une docstring au format Google.
+"""
+
+import http.client
+import json
+import os
+import tempfile
+import threading
+import unittest
+
+from unittest.mock import patch
+
+from source import task_manager
+from source.http_api import ApiServer
+from source.shell import Session
+from source.tache import Tache
+from source.task_store import TaskStore
+
+
+class TestHttpApi(unittest.TestCase):
+    """Tests unitaires pour l'API HTTP/JSON locale."""
+
+    def setUp(self):
+        """Crée un fichier de deux tâches et démarre le serveur sur un port libre."""
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.filename = os.path.join(self.tmpdir.name, "tasks.json")
+        task_manager.save_tasks(
+            TaskStore([Tache("Pain", priorite=3, task_id=1), Tache("Lait", task_id=2)]),
+            self.filename,
+        )
+        self.saves = []
+        self.start_server(flush_interval=3600)
+
+    def tearDown(self):
+        """Arrête le serveur et supprime le répertoire temporaire."""
+        self.stop_server()
+        self.tmpdir.cleanup()
+
+    def start_server(self, flush_interval):
+        """Démarre le serveur dans un thread.
+
+        Args:
+            flush_interval (float): Intervalle d'écriture de la session.
+        """
+
+        def save(*args, **kwargs):
+            self.saves.append(kwargs.get("changes"))
+            task_manager.save_tasks(*args, **kwargs)
+
+        parser = task_manager.build_parser()
+        options = parser.parse_args(["--file", self.filename, "serve"])
+        session = Session(
+            parser, options, task_manager.load_store(self.filename), save, flush_interval
+        )
+        self.server = ApiServer(session)
+        self.thread = threading.Thread(target=self.server.run, args=("127.0.0.1", 0))
+        self.thread.start()
+        self.server.ready.wait(5)
+        self.connection = http.client.HTTPConnection("127.0.0.1", self.server.port)
+
+    def stop_server(self):
+        """Arrête le serveur et attend la fin de son thread."""
+        if self.thread.is_alive():
+            self.connection.close()
+            self.server.stop()
+            self.thread.join(5)
+
+    def request(self, method, path, body=None):
+        """Envoie une requête sur la connexion gardée ouverte.
+
+        Args:
+            method (str): La méthode.
+            path (str): Le chemin.
+            body (dict, optional): Le corps JSON. Defaults to None.
+
+        Returns:
+            tuple[int, object]: Le code HTTP et le document JSON (None sans corps).
+        """
+        self.connection.request(method, path, None if body is None else json.dumps(body))
+        response = self.connection.getresponse()
+        data = response.read()
+        return response.status, json.loads(data) if data else None
+
+    def stored_titles(self):
+        """Retourne les titres des tâches sauvegardées dans le fichier.
+
+        Returns:
+            list[str]: Les titres.
+        """
+        return [task.titre for task in task_manager.load_tasks(self.filename)]
+
+    def test_read_and_list(self):
+        """Test de la lecture d'une tâche et de la liste triée, paginée et comptée."""
+        self.assertEqual(
+            self.request("GET", "/tasks/1"),
+            (200, Tache("Pain", priorite=3, task_id=1).to_dict()),
+        )
+        status, payload = self.request("GET", "/tasks?sort=priority&limit=1")
+        self.assertEqual(status, 200)
+        self.assertEqual([task["titre"] for task in payload["tasks"]], ["Lait"])
+        self.assertEqual(self.request("GET", "/tasks?count"), (200, {"count": 2}))
+        status, payload = self.request("GET", "/tasks?where=priorite>=2")
+        self.assertEqual([task["task_id"] for task in payload["tasks"]], [1])
+
+    def test_add_edit_remove(self):
+        """Test de l'ajout, de la modification et de la suppression d'une tâche."""
+        status, task = self.request(
+            "POST", "/tasks", {"titre": "Été", "priorite": 2, "date_limite": "2026-07-01"}
+        )
+        self.assertEqual(status, 201)
+        self.assertEqual((task["titre"], task["priorite"]), ("Été", 2))
+        path = f"/tasks/{task['task_id']}"
+        status, task = self.request("PATCH", path, {"description": "Vacances"})
+        self.assertEqual((status, task["description"]), (200, "Vacances"))
+        self.assertEqual(self.request("DELETE", "/tasks/1"), (204, None))
+        self.assertEqual(self.request("DELETE", "/tasks/1")[0], 404)
+        self.assertEqual(self.request("GET", "/tasks?count"), (200, {"count": 2}))
+
+    def test_leading_dash_values(self):
+        """Test qu'une valeur commençant par un tiret n'est pas prise pour une option."""
+        status, task = self.request("POST", "/tasks", {"titre": "-urgent"})
+        self.assertEqual((status, task["titre"]), (201, "-urgent"))
+        path = f"/tasks/{task['task_id']}"
+        status, task = self.request("PATCH", path, {"description": "--desc"})
+        self.assertEqual((status, task["description"]), (200, "--desc"))
+
+    def test_invalid_requests(self):
+        """Test des erreurs : validation par l'analyseur, champs, ressource et méthode."""
+        for method, path, body, status in (
+            ("POST", "/tasks", {"titre": "X", "date_limite": "demain"}, 400),
+            ("POST", "/tasks", {"priorite": 2}, 400),
+            ("POST", "/tasks", {"titre": "X", "inconnu": 1}, 400),
+            ("PATCH", "/tasks/1", {"priorite": "haute"}, 400),
+            ("PATCH", "/tasks/99", {"priorite": 2}, 404),
+            ("GET", "/tasks?limit=-1", None, 400),
+            ("GET", "/tasks?all=1", None, 400),
+            ("GET", "/tasks/abc", None, 404),
+            ("GET", "/autre", None, 404),
+            ("PUT", "/tasks", None, 405),
+        ):
+            with self.subTest(method=method, path=path, body=body):
+                code, payload = self.request(method, path, body)
+                self.assertEqual(code, status)
+                self.assertIn("erreur", payload)
+        _, payload = self.request("POST", "/tasks", {"titre": "X", "date_limite": "demain"})
+        self.assertIn("Date limite invalide", payload["erreur"])
+
+    def test_writes_batched_and_flushed_on_stop(self):
+        """Test que les modifications d'un intervalle forment une écriture, à l'arrêt."""
+        self.request("POST", "/tasks", {"titre": "Beurre"})
+        self.request("PATCH", "/tasks/2", {"titre": "Lait entier"})
+        self.request("PATCH", "/tasks/1", {"titre": "Pain"})
+        self.assertEqual(self.saves, [])
+        self.assertEqual(self.stored_titles(), ["Pain", "Lait"])
+        self.stop_server()
+        self.assertEqual(len(self.saves), 1)
+        self.assertEqual(
+            [operation for operation, _ in self.saves[0]], ["add", "edit"]
+        )
+        self.assertEqual(self.stored_titles(), ["Pain", "Lait entier", "Beurre"])
+
+    def test_periodic_flush(self):
+        """Test que le lot est écrit pendant que le serveur tourne."""
+        self.stop_server()
+        self.start_server(flush_interval=0)
+        self.request("DELETE", "/tasks/2")
+        self.request("GET", "/tasks/1")
+        for _ in range(50):
+            if self.saves:
+                break
+            threading.Event().wait(0.1)
+        self.assertEqual(self.stored_titles(), ["Pain"])
+
+    def test_serve_command(self):
+        """Test que la commande "serve" démarre l'API avec les tâches chargées."""
+        with patch.object(ApiServer, "run") as mock_run:
+            with patch("builtins.print"):
+                task_manager.main(["--file", self.filename, "serve", "--port", "0"])
+        mock_run.assert_called_once_with("127.0.0.1", 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
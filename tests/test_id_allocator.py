@@ -0,0 +1,94 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+Module de tests pour l'allocateur d'identifiants (id_allocator).
+
+Ce module vérifie l'attribution déterministe des identifiants, le saut des
+identifiants déjà utilisés, l'attribution par lot, l'épuisement de l'espace des
+identifiants et la persistance du curseur dans les métadonnées du stockage.
+
+Chaque méthode de test est documentée avec une docstring au format Google.
+"""
+
+import os
+import sys
+import tempfile
+import unittest
+
+from unittest.mock import patch
+
+from source import task_manager
+from source.id_allocator import IdAllocator
+from source.storage import open_storage
+from source.tache import Tache
+from source.task_store import TaskStore
+
+
+class TestIdAllocator(unittest.TestCase):
+    """Tests unitaires pour la classe IdAllocator."""
+
+    def test_sequential_allocation(self):
+        """Test que les identifiants sont attribués dans l'ordre croissant."""
+        allocator = IdAllocator()
+        self.assertEqual(allocator.allocate(), [100000])
+        self.assertEqual(allocator.allocate(3), [100001, 100002, 100003])
+        self.assertEqual(allocator.next_id, 100004)
+
+    def test_skips_used_ids(self):
+        """Test que les identifiants déjà utilisés sont sautés."""
+        allocator = IdAllocator(next_id=100000)
+        ids = allocator.allocate(2, used={100000, 100002})
+        self.assertEqual(ids, [100001, 100003])
+
+    def test_exhaustion_raises(self):
+        """Test qu'un espace d'identifiants épuisé lève une ValueError.
+
+        Vérifie aussi qu'aucune boucle infinie ne se produit lorsque tous les
+        identifiants sont utilisés.
+        """
+        allocator = IdAllocator(width=1)
+        self.assertEqual(allocator.allocate(8, used={5}), [1, 2, 3, 4, 6, 7, 8, 9])
+        with self.assertRaises(ValueError):
+            allocator.allocate()
+        with self.assertRaises(ValueError):
+            IdAllocator(width=1).allocate(used=set(range(1, 10)))
+
+    def test_wider_ids(self):
+        """Test de la largeur configurable des identifiants."""
+        allocator = IdAllocator(width=9, next_id=123)
+        self.assertEqual(allocator.allocate(), [100000000])
+
+    def test_cursor_persisted_in_meta(self):
+        """Test que le curseur survit à une sauvegarde et un rechargement.
+
+        Vérifie, pour les backends JSON et SQLite, qu'un identifiant supprimé
+        n'est pas réattribué.
+        """
+        with tempfile.TemporaryDirectory() as tmpdir:
+            for name in ("json", "sqlite"):
+                with self.subTest(backend=name):
+                    filename = os.path.join(tmpdir, f"tasks.{name}")
+                    store = TaskStore()
+                    task = Tache("A", task_id=store.allocate_ids()[0])
+                    store.add(task)
+                    store.remove(task.task_id)
+                    task_manager.save_tasks(store, filename, name)
+
+                    reloaded = TaskStore(
+                        task_manager.load_tasks(filename, name),
+                        meta=task_manager.load_meta(filename, name),
+                    )
+                    self.assertEqual(reloaded.allocate_ids(), [100001])
+
+    def test_add_command_allocates_consecutive_ids(self):
+        """Test que deux ajouts successifs reçoivent des identifiants consécutifs."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            filename = os.path.join(tmpdir, "tasks.json")
+            for title in ("A", "B"):
+                test_argv = ["task_manager.py", "--file", filename, "add", "--title", title]
+                with patch.object(sys, "argv", test_argv):
+                    with patch("builtins.print"):
+                        task_manager.main()
+            storage = open_storage("json", filename)
+            self.assertEqual([t.task_id for t in storage.load()], [100000, 100001])
+            self.assertEqual(storage.load_meta(), {"next_id": 100002, "generation": 2})
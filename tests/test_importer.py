@@ -0,0 +1,138 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+Module de tests pour l'import en masse de tâches (importer).
+
+Ce module vérifie la lecture et la validation des fichiers CSV et JSON Lines,
+l'attribution des identifiants en lot et la sauvegarde unique de la commande
+"import".
+
+Chaque méthode de test est documentée avec une docstring au format Google.
+"""
+
+import csv
+import io
+import os
+import sys
+import tempfile
+import unittest
+
+from unittest.mock import patch
+
+from source import task_manager
+from source.importer import detect_format, import_tasks
+from source.storage import open_storage
+from source.task_store import TaskStore
+
+CSV_DATA = """titre,description,priorite,date_limite
+Acheter du pain,,2,2025-04-10
+,Sans titre,1,
+Réviser,Chapitre 3,abc,
+Appeler Léa,,,
+"""
+
+JSONL_DATA = """{"titre": "A", "priorite": 3}
+pas du json
+{"description": "sans titre"}
+
+{"titre": "B", "date_limite": "2025-05-01", "task_id": 42}
+"""
+
+
+class TestImporter(unittest.TestCase):
+    """Tests unitaires pour l'import en masse."""
+
+    def test_detect_format(self):
+        """Test de la détection du format par l'extension."""
+        self.assertEqual(detect_format("export.CSV"), "csv")
+        self.assertEqual(detect_format("export.jsonl"), "jsonl")
+        self.assertEqual(detect_format("-"), "jsonl")
+
+    def test_import_csv(self):
+        """Test de l'import CSV avec lignes rejetées.
+
+        Vérifie que les lignes valides reçoivent des identifiants consécutifs et que
+        les lignes invalides sont signalées avec leur numéro.
+        """
+        store = TaskStore()
+        added, rejected = import_tasks(io.StringIO(CSV_DATA), "csv", store)
+        self.assertEqual(len(added), 2)
+        self.assertEqual([line for line, _ in rejected], [3, 4])
+        tasks = list(store)
+        self.assertEqual([t.task_id for t in tasks], [100000, 100001])
+        self.assertEqual(tasks[0].get_priorite(), 2)
+        self.assertIsNone(tasks[0].get_description())
+        self.assertEqual(tasks[1].get_titre(), "Appeler Léa")
+        self.assertEqual(tasks[1].get_priorite(), 1)
+
+    def test_import_csv_unreadable_line(self):
+        """Test qu'une ligne CSV illisible (champ trop long) est rejetée sans arrêter l'import."""
+        data = "titre\nA\n" + "x" * (csv.field_size_limit() + 1) + "\nB\n"
+        store = TaskStore()
+        added, rejected = import_tasks(io.StringIO(data), "csv", store)
+        self.assertEqual([task.get_titre() for task in added], ["A", "B"])
+        self.assertEqual([line for line, _ in rejected], [3])
+        self.assertIn("CSV invalide", rejected[0][1])
+
+    def test_import_jsonl(self):
+        """Test de l'import JSON Lines ; un task_id fourni est ignoré."""
+        store = TaskStore()
+        added, rejected = import_tasks(io.StringIO(JSONL_DATA), "jsonl", store)
+        self.assertEqual(len(added), 2)
+        self.assertEqual([line for line, _ in rejected], [2, 3])
+        self.assertNotIn(42, store)
+
+    def test_import_jsonl_rejects_wrong_types(self):
+        """Test que les titres, descriptions et priorités mal typés sont rejetés."""
+        data = "\n".join([
+            '{"titre": 123, "priorite": 2.9}',
+            '{"titre": "A", "priorite": 2.9}',
+            '{"titre": "B", "priorite": true}',
+            '{"titre": "C", "description": ["x"]}',
+            '{"titre": "D", "priorite": "4"}',
+        ])
+        store = TaskStore()
+        added, rejected = import_tasks(io.StringIO(data), "jsonl", store)
+        self.assertEqual([task.get_titre() for task in added], ["D"])
+        self.assertEqual(added[0].get_priorite(), 4)
+        self.assertEqual(
+            rejected,
+            [
+                (1, "titre invalide : 123"),
+                (2, "priorité invalide : 2.9"),
+                (3, "priorité invalide : True"),
+                (4, "description invalide : ['x']"),
+            ],
+        )
+
+    def test_import_command_saves_once(self):
+        """Test que la commande "import" lit l'entrée standard et sauvegarde une fois."""
+        test_argv = ["task_manager.py", "import", "-", "--format", "csv"]
+        with patch.object(sys, "argv", test_argv):
+            with patch("sys.stdin", io.StringIO(CSV_DATA)):
+                with patch("source.task_manager.load_tasks", return_value=[]):
+                    with patch("source.task_manager.load_meta", return_value={}):
+                        with patch("source.task_manager.save_tasks") as mock_save:
+                            with patch(
+                                "sys.stdout", new_callable=io.StringIO
+                            ) as fake_out:
+                                task_manager.main()
+        mock_save.assert_called_once()
+        self.assertEqual(len(mock_save.call_args[0][0]), 2)
+        output = fake_out.getvalue()
+        self.assertIn("2 tâches importées, 2 lignes rejetées", output)
+        self.assertIn("lignes/s", output)
+
+    def test_import_command_from_file(self):
+        """Test de l'import d'un fichier JSON Lines dans un stockage JSON."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            source = os.path.join(tmpdir, "export.jsonl")
+            filename = os.path.join(tmpdir, "tasks.json")
+            with open(source, "w", encoding="utf-8") as file:
+                file.write(JSONL_DATA)
+            test_argv = ["task_manager.py", "--file", filename, "import", source]
+            with patch.object(sys, "argv", test_argv):
+                with patch("builtins.print"):
+                    task_manager.main()
+            tasks = open_storage("json", filename).load()
+        self.assertEqual([t.get_titre() for t in tasks], ["A", "B"])
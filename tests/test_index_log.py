@@ -0,0 +1,79 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+Module de tests pour le format commun des index sauvegardés (index_log).
+
+Ce module vérifie l'en-tête des bases d'index, l'ajout et la relecture du journal
+d'un index, la lecture de la dernière signature sans lire le journal entier, la
+limite de taille du journal et le traitement d'une écriture interrompue.
+
+Chaque méthode de test est documentée avec une docstring au format Google.
+"""
+
+import os
+import tempfile
+import unittest
+
+from unittest.mock import patch
+
+from source import index_log
+
+SIGNATURE = [[120, 1700000000000000000], None]
+
+
+class TestIndexLog(unittest.TestCase):
+    """Tests unitaires pour le format commun des index."""
+
+    def setUp(self):
+        """Crée une base d'index vide dans un répertoire temporaire."""
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.tmpdir.name, "tasks.json.idx")
+        with open(self.path, "wb") as file:
+            file.write(index_log.pack_header(b"TEST", 1, SIGNATURE))
+
+    def tearDown(self):
+        """Supprime le répertoire temporaire."""
+        self.tmpdir.cleanup()
+
+    def test_header(self):
+        """Test de l'en-tête : signature des données, format et version vérifiés."""
+        header = index_log.pack_header(b"TEST", 1, SIGNATURE) + b"donnees"
+        self.assertEqual(index_log.unpack_header(header, b"TEST", 1), (SIGNATURE, len(header) - 7))
+        self.assertIsNone(index_log.unpack_header(header, b"AUTR", 1))
+        self.assertIsNone(index_log.unpack_header(header, b"TEST", 2))
+        self.assertIsNone(index_log.unpack_header(header[:5], b"TEST", 1))
+        self.assertEqual(index_log.current_signature(self.path, b"TEST", 1), SIGNATURE)
+
+    def test_append_and_read(self):
+        """Test du journal : lignes relues dans l'ordre et dernière signature."""
+        self.assertIsNone(index_log.read_log(self.path))
+        self.assertTrue(index_log.append_log(self.path, [[1, 2], [3]], [[1, 1], None]))
+        self.assertTrue(index_log.append_log(self.path, [[4, ["été"]]], [[2, 2], None]))
+        self.assertEqual(
+            index_log.read_log(self.path), ([[1, 2], [3], [4, ["été"]]], [[2, 2], None])
+        )
+        self.assertEqual(index_log.current_signature(self.path, b"TEST", 1), [[2, 2], None])
+        index_log.clear_log(self.path)
+        self.assertEqual(index_log.current_signature(self.path, b"TEST", 1), SIGNATURE)
+
+    def test_interrupted_write(self):
+        """Test qu'une dernière ligne tronquée rend l'index périmé."""
+        index_log.append_log(self.path, [[1, 2]], [[1, 1], None])
+        with open(index_log.log_path(self.path), "ab") as file:
+            file.write(b'[2,3]\n{"signa')
+        self.assertIsNone(index_log.read_log(self.path)[1])
+        self.assertIsNone(index_log.current_signature(self.path, b"TEST", 1))
+
+    def test_size_limit(self):
+        """Test que rien n'est ajouté au-delà de la taille maximale du journal."""
+        with patch.object(index_log, "COMPACT_MIN_BYTES", 100):
+            self.assertTrue(index_log.append_log(self.path, [[1, 2]], SIGNATURE))
+            self.assertFalse(index_log.append_log(self.path, [[n] for n in range(50)], SIGNATURE))
+        self.assertEqual(index_log.read_log(self.path), ([[1, 2]], SIGNATURE))
+        index_log.remove(self.path)
+        self.assertFalse(os.path.exists(self.path))
+        self.assertFalse(index_log.append_log(self.path, [[1, 2]], SIGNATURE))
+
+
+if __name__ == "__main__":
+    unittest.main()
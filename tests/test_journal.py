@@ -0,0 +1,152 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+Module de tests pour le journal des modifications (journal).
+
+Ce module vérifie l'ajout d'enregistrements au journal, leur relecture par-dessus
+l'instantané JSON, la fusion du journal par la commande "compact" et la
+journalisation des seules tâches réellement modifiées.
+
+Chaque méthode de test est documentée avec une docstring au format Google.
+"""
+
+import json
+import os
+import sys
+import tempfile
+import unittest
+
+from unittest.mock import patch
+
+from source import journal, task_manager
+from source.tache import Tache
+from tests.helpers import run_cli
+
+
+class TestJournal(unittest.TestCase):
+    """Tests unitaires pour le stockage en mode journal."""
+
+    def setUp(self):
+        """Crée un répertoire temporaire contenant le fichier de sauvegarde."""
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.filename = os.path.join(self.tmpdir.name, "tasks.json")
+
+    def tearDown(self):
+        """Supprime le répertoire temporaire."""
+        self.tmpdir.cleanup()
+
+    def test_replay_on_top_of_snapshot(self):
+        """Test de la relecture du journal par-dessus l'instantané.
+
+        Vérifie que les ajouts, modifications et suppressions journalisés sont
+        appliqués dans l'ordre lors du chargement.
+        """
+        task_manager.save_tasks(
+            [Tache("A", task_id=1), Tache("B", task_id=2)], self.filename
+        )
+        journal.append_entry(self.filename, "add", Tache("C", task_id=3))
+        journal.append_entry(self.filename, "edit", Tache("B modifiée", task_id=2))
+        journal.append_entry(self.filename, "remove", Tache("A", task_id=1))
+
+        tasks = task_manager.load_tasks(self.filename)
+        self.assertEqual([t.task_id for t in tasks], [2, 3])
+        self.assertEqual(tasks[0].get_titre(), "B modifiée")
+
+    def test_save_with_change_only_appends(self):
+        """Test qu'une sauvegarde avec modification n'écrit que dans le journal.
+
+        Vérifie que l'instantané n'est pas réécrit et que le journal contient une
+        seule ligne.
+        """
+        task_manager.save_tasks([Tache("A", task_id=1)], self.filename)
+        before = os.path.getmtime(self.filename), os.path.getsize(self.filename)
+        task = Tache("B", task_id=2)
+        task_manager.save_tasks([], self.filename, "journal", changes=[("add", task)])
+
+        self.assertEqual(
+            (os.path.getmtime(self.filename), os.path.getsize(self.filename)), before
+        )
+        with open(journal.journal_path(self.filename), encoding="utf-8") as file:
+            lines = file.readlines()
+        self.assertEqual(len(lines), 1)
+        self.assertEqual(json.loads(lines[0])["task"]["titre"], "B")
+
+    def test_truncated_last_line_is_ignored(self):
+        """Test qu'une dernière ligne tronquée du journal est ignorée."""
+        journal.append_entry(self.filename, "add", Tache("A", task_id=1))
+        with open(journal.journal_path(self.filename), "a", encoding="utf-8") as f:
+            f.write('{"op": "add", "task": {"titre"')
+
+        tasks = task_manager.load_tasks(self.filename)
+        self.assertEqual([t.task_id for t in tasks], [1])
+
+    def test_append_after_truncated_line(self):
+        """Test qu'un ajout après une ligne tronquée reste lisible au rechargement."""
+        journal.append_entry(self.filename, "add", Tache("A", task_id=1))
+        with open(journal.journal_path(self.filename), "a", encoding="utf-8") as f:
+            f.write('{"op": "add", "task": {"task_id": 9')
+        journal.append_entry(self.filename, "add", Tache("B", task_id=2))
+        journal.append_entry(self.filename, "add", Tache("C", task_id=3))
+
+        tasks = task_manager.load_tasks(self.filename)
+        self.assertEqual([t.task_id for t in tasks], [1, 2, 3])
+
+    def test_compact_command(self):
+        """Test de la commande "compact".
+
+        Vérifie que le journal est fusionné dans l'instantané puis supprimé.
+        """
+        task_manager.save_tasks([Tache("A", task_id=1)], self.filename)
+        journal.append_entry(self.filename, "add", Tache("B", task_id=2))
+
+        test_argv = ["task_manager.py", "--file", self.filename, "compact"]
+        with patch.object(sys, "argv", test_argv):
+            with patch("builtins.print"):
+                task_manager.main()
+
+        self.assertFalse(os.path.exists(journal.journal_path(self.filename)))
+        with open(self.filename, encoding="utf-8") as file:
+            data = json.load(file)
+        self.assertEqual([item["task_id"] for item in data], [1, 2])
+
+    def test_add_in_journal_mode(self):
+        """Test de la commande "add" en mode journal.
+
+        Vérifie que le backend journal est transmis à save_tasks avec la
+        modification à journaliser.
+        """
+        test_argv = ["task_manager.py", "--storage", "journal", "add", "--title", "T"]
+        with patch.object(sys, "argv", test_argv):
+            with patch("source.task_manager.load_tasks", return_value=[]):
+                with patch("source.task_manager.save_tasks") as mock_save:
+                    with patch("builtins.print"):
+                        task_manager.main()
+                    self.assertEqual(mock_save.call_args[0][2], "journal")
+                    [(operation, task)] = mock_save.call_args[1]["changes"]
+                    self.assertEqual(operation, "add")
+                    self.assertEqual(task.get_titre(), "T")
+
+    def test_edit_journals_changed_tasks_only(self):
+        """Test que "edit" ne journalise que les tâches dont une valeur change.
+
+        Vérifie qu'une modification sans effet n'écrit ni le journal, ni une nouvelle
+        génération.
+        """
+        task_manager.save_tasks(
+            [Tache("A", priorite=p, task_id=p) for p in (1, 2, 3)], self.filename
+        )
+        base = ["--storage", "journal", "--file", self.filename, "edit"]
+        output = run_cli(base + ["--where", "priorite>=2", "--priority", "3"])
+        self.assertIn("1 tâche(s) mise(s) à jour", output)
+        path = journal.journal_path(self.filename)
+        with open(path, encoding="utf-8") as file:
+            [line] = file.readlines()
+        self.assertEqual(json.loads(line)["task"]["task_id"], 2)
+        before = os.path.getsize(path), task_manager.load_meta(self.filename)
+        output = run_cli(base + ["--where", "priorite>=2", "--priority", "3"])
+        output += run_cli(base + ["--id", "1", "--title", "A"])
+        self.assertIn("0 tâche(s) mise(s) à jour", output)
+        self.assertIn("Aucune modification pour la tâche avec l'ID 1.", output)
+        self.assertEqual(
+            (os.path.getsize(path), task_manager.load_meta(self.filename)), before
+        )
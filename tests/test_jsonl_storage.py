@@ -0,0 +1,125 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+Module de tests pour le backend JSON Lines (jsonl_storage).
+
+Ce module vérifie la lecture en flux des tâches, l'ajout d'une ligne lors d'un
+ajout de tâche, la conversion depuis le fichier JSON et l'affichage en flux de
+la commande "list".
+
+Chaque méthode de test est documentée avec une docstring au format Google.
+"""
+
+import io
+import os
+import sys
+import tempfile
+import types
+import unittest
+
+from unittest.mock import patch
+
+from source import task_manager
+from source.jsonl_storage import JsonlStorage, iter_tasks
+from source.storage import StorageError, open_storage
+from source.tache import Tache
+
+
+class TestJsonlStorage(unittest.TestCase):
+    """Tests unitaires pour le backend JSON Lines."""
+
+    def setUp(self):
+        """Crée un répertoire temporaire et un fichier JSON Lines de deux tâches."""
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.filename = os.path.join(self.tmpdir.name, "tasks.jsonl")
+        JsonlStorage(self.filename).save(
+            [Tache("Été", "Déjà", 2, "2025-01-01", 1), Tache("B", task_id=2)]
+        )
+
+    def tearDown(self):
+        """Supprime le répertoire temporaire."""
+        self.tmpdir.cleanup()
+
+    def test_one_task_per_line(self):
+        """Test que chaque tâche occupe une ligne, sans échappement des accents."""
+        with open(self.filename, encoding="utf-8") as file:
+            lines = file.readlines()
+        self.assertEqual(len(lines), 2)
+        self.assertIn('"titre": "Été"', lines[0])
+
+    def test_iter_tasks_is_a_generator(self):
+        """Test que iter_tasks produit les tâches une par une."""
+        tasks = iter_tasks(self.filename)
+        self.assertIsInstance(tasks, types.GeneratorType)
+        self.assertEqual(next(tasks).get_titre(), "Été")
+        self.assertEqual([t.task_id for t in tasks], [2])
+
+    def test_missing_file_and_invalid_line(self):
+        """Test d'un fichier absent, d'une dernière ligne tronquée puis d'une ligne invalide."""
+        self.assertEqual(list(iter_tasks(self.path("absent.jsonl"))), [])
+        with open(self.filename, "a", encoding="utf-8") as file:
+            file.write('{"titre": "tronq')
+        self.assertEqual(len(list(iter_tasks(self.filename))), 2)
+        with open(self.filename, "a", encoding="utf-8") as file:
+            file.write("\n")
+        with self.assertRaisesRegex(StorageError, "ligne 3"):
+            list(iter_tasks(self.filename))
+
+    def test_add_after_truncated_line(self):
+        """Test qu'un ajout après une ligne tronquée n'est pas perdu."""
+        with open(self.filename, "a", encoding="utf-8") as file:
+            file.write('{"titre": "tronq')
+        storage = JsonlStorage(self.filename)
+        storage.apply([], [("add", Tache("C", task_id=3))])
+        self.assertEqual([t.task_id for t in storage.load()], [1, 2, 3])
+
+    def test_add_appends_one_line(self):
+        """Test qu'un ajout n'écrit qu'une ligne en fin de fichier."""
+        storage = JsonlStorage(self.filename)
+        size = os.path.getsize(self.filename)
+        storage.apply([], [("add", Tache("C", task_id=3))])
+        self.assertGreater(os.path.getsize(self.filename), size)
+        self.assertEqual([t.task_id for t in storage.load()], [1, 2, 3])
+
+    def test_convert_from_and_to_json(self):
+        """Test de la conversion JSON -> JSON Lines -> JSON avec "migrate"."""
+        expected = [t.to_dict() for t in JsonlStorage(self.filename).load()]
+        json_file = self.path("tasks.json")
+        converted = self.path("converted.jsonl")
+        back_file = self.path("back.json")
+        open_storage("json", json_file).save(JsonlStorage(self.filename).load())
+        commands = [
+            ["--file", json_file, "migrate", "--to", "jsonl", "--to-file", converted],
+            ["--storage", "jsonl", "--file", converted, "migrate", "--to", "json"],
+        ]
+        commands[1] += ["--to-file", back_file]
+        for argv in commands:
+            with patch.object(sys, "argv", ["task_manager.py"] + argv):
+                with patch("builtins.print"):
+                    task_manager.main()
+        self.assertEqual(
+            [t.to_dict() for t in open_storage("json", back_file).load()], expected
+        )
+
+    def test_list_streams_tasks(self):
+        """Test que la commande "list" sans tri lit les tâches en flux."""
+        test_argv = ["task_manager.py", "--storage", "jsonl", "--file", self.filename]
+        with patch.object(sys, "argv", test_argv + ["list"]):
+            with patch(
+                "source.jsonl_storage.JsonlStorage.load", side_effect=AssertionError
+            ):
+                with patch("sys.stdout", new_callable=io.StringIO) as fake_out:
+                    task_manager.main()
+        self.assertIn("Titre: Été", fake_out.getvalue())
+        self.assertIn("Titre: B", fake_out.getvalue())
+
+    def path(self, name):
+        """Retourne un chemin dans le répertoire temporaire.
+
+        Args:
+            name (str): Nom du fichier.
+
+        Returns:
+            str: Le chemin complet.
+        """
+        return os.path.join(self.tmpdir.name, name)
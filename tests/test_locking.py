@@ -0,0 +1,182 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+Module de tests pour les accès concurrents (locking).
+
+Ce module vérifie le verrou pris pendant les écritures, la détection des conflits par
+le numéro de génération, la nouvelle exécution d'une commande en conflit, le rejeu
+des modifications d'une session et, avec plusieurs processus écrivant en parallèle,
+qu'aucune modification n'est perdue.
+
+Chaque méthode de test est documentée avec une docstring au format Google.
+"""
+
+import io
+import os
+import subprocess
+import sys
+import tempfile
+import unittest
+
+from unittest.mock import patch
+
+from source import locking, task_manager
+from source.shell import Session
+from source.storage import open_storage
+from source.tache import Tache
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+WRITERS = 6  # Nombre de processus écrivant en parallèle
+ADDS_PER_WRITER = 4  # Nombre de commandes "add" lancées par chaque processus
+
+# Processus écrivain : modifie la tâche qui lui est attribuée puis ajoute des tâches.
+WRITER_CODE = """
+import sys
+from unittest.mock import patch
+from source import task_manager
+storage, filename, writer, adds = sys.argv[1], sys.argv[2], int(sys.argv[3]), int(sys.argv[4])
+base = ["--storage", storage, "--file", filename]
+with patch("builtins.print"):
+    task_manager.main(base + ["edit", "--id", str(writer + 1), "--title", f"Modifiée {writer}"])
+    for number in range(adds):
+        task_manager.main(base + ["add", "--title", f"Tâche {writer}-{number}"])
+"""
+
+
+class TestLocking(unittest.TestCase):
+    """Tests unitaires pour les accès concurrents aux fichiers de sauvegarde."""
+
+    def setUp(self):
+        """Crée un fichier de tâches dans un répertoire temporaire."""
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.filename = os.path.join(self.tmpdir.name, "tasks.json")
+        task_manager.save_tasks(
+            [Tache(f"Tâche {n}", None, task_id=n + 1) for n in range(WRITERS)],
+            self.filename,
+        )
+
+    def tearDown(self):
+        """Supprime le répertoire temporaire."""
+        self.tmpdir.cleanup()
+
+    @unittest.skipIf(locking.fcntl is None, "fcntl indisponible")
+    def test_save_holds_exclusive_lock(self):
+        """Test qu'aucun lecteur ne peut prendre le verrou pendant une écriture."""
+        backend = open_storage("json", self.filename)
+        blocked = []
+
+        def try_shared_lock(backend, tasks):  # pylint: disable=unused-argument
+            with open(locking.lock_path(self.filename), "rb") as file:
+                try:
+                    locking.fcntl.flock(
+                        file.fileno(), locking.fcntl.LOCK_SH | locking.fcntl.LOCK_NB
+                    )
+                except BlockingIOError:
+                    blocked.append(True)
+
+        with patch.object(type(backend), "save", try_shared_lock):
+            task_manager.save_tasks([], self.filename)
+        self.assertEqual(blocked, [True])
+
+    def test_generation_conflict(self):
+        """Test qu'une collection chargée avant une autre écriture n'est pas sauvegardée."""
+        first = task_manager.load_store(self.filename)
+        second = task_manager.load_store(self.filename)
+        self.assertEqual(first.meta[locking.GENERATION_KEY], 1)
+        task_manager.save_tasks(first, self.filename)
+        with self.assertRaises(locking.ConflictError):
+            task_manager.save_tasks(second, self.filename)
+        self.assertEqual(task_manager.load_meta(self.filename)[locking.GENERATION_KEY], 2)
+
+    def test_command_retried_on_conflict(self):
+        """Test qu'une commande en conflit est exécutée de nouveau sur les tâches à jour."""
+        save_tasks = task_manager.save_tasks
+        intrusions = []
+
+        def save_after_intrusion(tasks, *args, **kwargs):
+            if not intrusions:
+                # Un autre processus modifie une autre tâche juste avant l'écriture.
+                other = task_manager.load_store(self.filename)
+                other.replace(Tache("Modifiée ailleurs", None, task_id=2))
+                save_tasks(other, self.filename, changes=[("edit", other.get(2))])
+                intrusions.append(True)
+            save_tasks(tasks, *args, **kwargs)
+
+        argv = ["--file", self.filename, "edit", "--id", "1", "--priority", "9"]
+        with patch.object(task_manager, "save_tasks", side_effect=save_after_intrusion):
+            with patch("sys.stdout", new_callable=io.StringIO):
+                with patch("sys.stderr", new_callable=io.StringIO) as fake_err:
+                    with patch("time.sleep"):
+                        task_manager.main(argv)
+        self.assertIn("Conflit", fake_err.getvalue())
+        tasks = {task.task_id: task for task in open_storage("json", self.filename).load()}
+        self.assertEqual(tasks[1].priorite, 9)
+        self.assertEqual(tasks[2].titre, "Modifiée ailleurs")
+
+    def test_session_replays_changes(self):
+        """Test qu'une session rejoue ses modifications sur les tâches rechargées."""
+        options = task_manager.build_parser().parse_args(
+            ["--file", self.filename, "shell"]
+        )
+        session = Session(
+            task_manager.build_parser(),
+            options,
+            task_manager.load_store(self.filename),
+            task_manager.save_tasks,
+            flush_interval=3600,
+            load=lambda: task_manager.load_store(self.filename),
+        )
+        other = task_manager.load_store(self.filename)
+        other.remove(1)
+        task_manager.save_tasks(
+            other, self.filename, changes=[("remove", Tache("", task_id=1))]
+        )
+        with patch("builtins.print"):
+            session.execute('edit --id 2 --title "Depuis la session"')
+        session.flush()
+        tasks = open_storage("json", self.filename).load()
+        titles = {task.task_id: task.titre for task in tasks}
+        self.assertNotIn(1, titles)
+        self.assertEqual(titles[2], "Depuis la session")
+
+    def test_parallel_writers(self):
+        """Test de plusieurs processus écrivant en parallèle : aucune modification perdue."""
+        for storage in ("json", "journal", "jsonl", "binary", "records", "sqlite"):
+            with self.subTest(storage=storage):
+                filename = os.path.join(self.tmpdir.name, f"stress-{storage}")
+                open_storage(storage, filename).save(
+                    [Tache(f"Tâche {n}", None, task_id=n + 1) for n in range(WRITERS)]
+                )
+                writers = [
+                    subprocess.Popen(  # pylint: disable=consider-using-with
+                        [
+                            sys.executable,
+                            "-c",
+                            WRITER_CODE,
+                            storage,
+                            filename,
+                            str(writer),
+                            str(ADDS_PER_WRITER),
+                        ],
+                        cwd=ROOT,
+                        stderr=subprocess.DEVNULL,
+                    )
+                    for writer in range(WRITERS)
+                ]
+                for writer in writers:
+                    self.assertEqual(writer.wait(timeout=120), 0)
+                tasks = open_storage(storage, filename).load()
+                titles = sorted(task.titre for task in tasks)
+                self.assertEqual(
+                    titles,
+                    sorted(
+                        [f"Modifiée {w}" for w in range(WRITERS)]
+                        + [
+                            f"Tâche {w}-{n}"
+                            for w in range(WRITERS)
+                            for n in range(ADDS_PER_WRITER)
+                        ]
+                    ),
+                )
+                self.assertEqual(len({task.task_id for task in tasks}), len(tasks))
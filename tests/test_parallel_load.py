@@ -0,0 +1,111 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+Module de tests pour le chargement parallèle des fichiers JSON Lines (parallel_load).
+
+Ce module vérifie le découpage du fichier en plages alignées sur les lignes, l'égalité
+du chargement parallèle avec la lecture en série, les erreurs des lignes invalides,
+le choix du nombre de processus et la lecture en série des petits fichiers.
+
+Chaque méthode de test est documentée avec une docstring au format Google.
+"""
+
+import os
+import tempfile
+import unittest
+
+from unittest.mock import patch
+
+from source import parallel_load, task_manager
+from source.jsonl_storage import JsonlStorage, iter_tasks
+from source.storage import StorageError
+from source.tache import Tache
+
+
+class TestParallelLoad(unittest.TestCase):
+    """Tests unitaires pour le chargement parallèle."""
+
+    def setUp(self):
+        """Crée un fichier JSON Lines de cinquante tâches."""
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.filename = os.path.join(self.tmpdir.name, "tasks.jsonl")
+        self.tasks = [
+            Tache(f"Tâche {i}", "Déjà" if i % 2 else None, i % 5 + 1,
+                  "2025-01-01" if i % 3 else None, i)
+            for i in range(1, 51)
+        ]
+        JsonlStorage(self.filename).save(self.tasks)
+
+    def tearDown(self):
+        """Supprime le répertoire temporaire."""
+        self.tmpdir.cleanup()
+
+    def test_chunk_ranges(self):
+        """Test que les plages couvrent le fichier et commencent chacune sur une ligne."""
+        with open(self.filename, "rb") as file:
+            data = file.read()
+        for count in (1, 3, 8, 200):
+            with self.subTest(count=count):
+                ranges = parallel_load.chunk_ranges(self.filename, count)
+                self.assertLessEqual(len(ranges), count)
+                self.assertEqual(ranges[0][0], 0)
+                self.assertEqual(ranges[-1][1], len(data))
+                for (_, end), (start, _) in zip(ranges, ranges[1:]):
+                    self.assertEqual(end, start)
+                    self.assertEqual(data[start - 1:start], b"\n")
+
+    def test_parallel_equals_serial(self):
+        """Test que le chargement par deux processus donne les tâches dans l'ordre."""
+        loaded = parallel_load.load(self.filename, 2)
+        self.assertEqual(loaded, self.tasks)
+        self.assertEqual(loaded, list(iter_tasks(self.filename)))
+        self.assertEqual(loaded[0].description, "Déjà")
+
+    def test_invalid_lines_numbered_in_file(self):
+        """Test qu'une ligne invalide est signalée avec son numéro dans le fichier."""
+        with open(self.filename, "a", encoding="utf-8") as file:
+            file.write("\n" + '{"titre": "tronq\n' + '{"titre": "Fin"}\n')
+        with self.assertRaises(StorageError) as context:
+            parallel_load.load(self.filename, 2)
+        self.assertEqual(
+            str(context.exception),
+            f"Erreur lors du décodage de la ligne 52 de {self.filename}.",
+        )
+
+    def test_truncated_last_line_ignored(self):
+        """Test qu'une dernière ligne tronquée (ajout interrompu) est ignorée."""
+        with open(self.filename, "a", encoding="utf-8") as file:
+            file.write('{"titre": "tronq')
+        self.assertEqual(parallel_load.load(self.filename, 2), self.tasks)
+
+    def test_worker_count(self):
+        """Test du nombre de processus : option, variable d'environnement, processeurs."""
+        with patch.dict(os.environ, {parallel_load.WORKERS_ENV: "3"}):
+            self.assertEqual(parallel_load.worker_count(2), 2)
+            self.assertEqual(parallel_load.worker_count(0), 3)
+        with patch.dict(os.environ, {parallel_load.WORKERS_ENV: "abc"}):
+            with patch("os.cpu_count", return_value=6):
+                self.assertEqual(parallel_load.worker_count(), 6)
+
+    def test_storage_threshold_and_workers_option(self):
+        """Test de la lecture en série sous le seuil et de l'option --workers."""
+        with patch.object(parallel_load, "load", return_value=self.tasks) as mock_load:
+            self.assertEqual(JsonlStorage(self.filename, workers=4).load(), self.tasks)
+            mock_load.assert_not_called()
+            with patch.object(parallel_load, "MIN_SIZE", 0):
+                JsonlStorage(self.filename, workers=1).load()
+                mock_load.assert_not_called()
+                argv = ["--storage", "jsonl", "--file", self.filename, "--workers", "2"]
+                with patch("builtins.print"):
+                    task_manager.main(argv + ["edit", "--id", "1", "--priority", "5"])
+                mock_load.assert_called_once_with(self.filename, 2)
+
+    def test_fallback_when_processes_unavailable(self):
+        """Test de la lecture en série si les processus ne peuvent pas être créés."""
+        with patch.object(parallel_load, "MIN_SIZE", 0):
+            with patch.object(parallel_load, "load", side_effect=PermissionError):
+                self.assertEqual(JsonlStorage(self.filename, workers=2).load(), self.tasks)
+
+
+if __name__ == "__main__":
+    unittest.main()
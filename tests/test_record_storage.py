@@ -0,0 +1,202 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+Module de tests pour le backend en fiches de taille fixe (record_storage).
+
+Ce module vérifie l'aller-retour des tâches, la modification sur place d'une fiche,
+l'ajout du seul texte modifié au tas, la suppression par drapeau et la réutilisation
+des fiches libres, un lot de modifications successives sur la même tâche, la commande
+"vacuum" et la détection d'un fichier invalide.
+
+Chaque méthode de test est documentée avec une docstring au format Google.
+"""
+
+import os
+import tempfile
+import unittest
+
+from source.record_storage import HEADER, SLOT, RecordStorage, RecordTache, heap_path
+from source.storage import StorageError
+from source.tache import Tache, parse_date
+from tests.helpers import run_cli
+
+
+class TestRecordStorage(unittest.TestCase):
+    """Tests unitaires pour le backend en fiches de taille fixe."""
+
+    def setUp(self):
+        """Crée un répertoire temporaire et un fichier de trois fiches."""
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.filename = os.path.join(self.tmpdir.name, "tasks.rec")
+        self.storage = RecordStorage(self.filename)
+        self.tasks = [
+            Tache("Été", "Déjà", 2, "2025-01-01", 1),
+            Tache("B", task_id=2),
+            Tache("C", "Texte", 7, task_id=3),
+        ]
+        self.storage.save(self.tasks)
+
+    def tearDown(self):
+        """Supprime le répertoire temporaire."""
+        self.tmpdir.cleanup()
+
+    def sizes(self, number=0):
+        """Retourne la taille du fichier des fiches et celle du tas.
+
+        Args:
+            number (int, optional): Numéro du tas. Defaults to 0.
+
+        Returns:
+            tuple[int, int]: Les deux tailles en octets.
+        """
+        return (
+            os.path.getsize(self.filename),
+            os.path.getsize(heap_path(self.filename, number)),
+        )
+
+    def run_cli(self, argv):
+        """Exécute la CLI avec le backend records et retourne sa sortie standard.
+
+        Args:
+            argv (list[str]): Arguments de la commande.
+
+        Returns:
+            str: La sortie standard.
+        """
+        return run_cli(["--storage", "records", "--file", self.filename] + argv)
+
+    def test_round_trip(self):
+        """Test que les tâches relues sont égales aux tâches sauvegardées."""
+        loaded = self.storage.load()
+        self.assertEqual(loaded, self.tasks)
+        self.assertEqual([task.slot for task in loaded], [0, 1, 2])
+        self.assertEqual(self.storage.count(), 3)
+        self.assertEqual(self.sizes(), (HEADER.size + 3 * SLOT.size, 18))
+
+    def test_edit_in_place(self):
+        """Test qu'une modification de priorité ne réécrit que la fiche."""
+        tasks = self.storage.load()
+        tasks[1].priorite = 9
+        sizes = self.sizes()
+        self.storage.apply(tasks, [("edit", tasks[1])])
+        self.assertEqual(self.sizes(), sizes)
+        self.assertEqual(self.storage.load(), tasks)
+
+    def test_edited_text_appended_to_heap(self):
+        """Test qu'un texte modifié est ajouté au tas, sans avoir la fiche chargée."""
+        sizes = self.sizes()
+        edited = Tache("Été", "Nouvelle description", 2, "2025-01-01", 1)
+        self.storage.apply([], [("edit", edited)])
+        self.assertEqual(self.sizes(), (sizes[0], sizes[1] + len("Nouvelle description")))
+        self.assertEqual(self.storage.load()[0], edited)
+
+    def test_free_form_due_date_kept(self):
+        """Test qu'une date limite en texte libre est conservée, sur place ou non."""
+        legacy = Tache("Ancienne", "Note", 1, "vendredi", 4)
+        self.storage.apply([], [("add", legacy)])
+        self.assertEqual(self.storage.load()[3], legacy)
+        tasks = self.storage.load()
+        tasks[3].priorite = 5
+        sizes = self.sizes()
+        self.storage.apply(tasks, [("edit", tasks[3])])
+        self.assertEqual(self.sizes(), sizes)
+        edited = Tache("Ancienne", None, 5, "samedi", 4)
+        self.storage.apply([], [("edit", edited)])
+        self.assertEqual(self.storage.load()[3], edited)
+        self.storage.save(self.storage.load())
+        self.assertEqual([t.date_limite for t in self.storage.load()][2:], [None, "samedi"])
+        self.storage.apply([], [("edit", Tache("Ancienne", "Note", 5, "2025-02-01", 4))])
+        self.assertEqual(self.storage.load()[3].date_ordinal, parse_date("2025-02-01"))
+
+    def test_remove_and_reuse_free_slot(self):
+        """Test qu'une fiche supprimée est réutilisée par l'ajout suivant."""
+        tasks = self.storage.load()
+        self.storage.apply([], [("remove", tasks[0])])
+        self.assertEqual(self.storage.count(), 2)
+        self.assertEqual([task.task_id for task in self.storage.load()], [2, 3])
+        size = self.sizes()[0]
+        self.storage.apply([], [("add", Tache("D", task_id=4))])
+        loaded = self.storage.load()
+        self.assertEqual(self.sizes()[0], size)
+        self.assertEqual(
+            [(task.task_id, task.slot) for task in loaded], [(4, 0), (2, 1), (3, 2)]
+        )
+
+    def test_header_not_written_after_slot_reuse(self):
+        """Test qu'un en-tête non réécrit après la réutilisation d'une fiche est réparé.
+
+        Simule une interruption entre l'écriture des fiches et celle de l'en-tête : la
+        fiche libre de l'en-tête est de nouveau occupée, et l'ajout suivant ne doit pas
+        l'écraser.
+        """
+        self.storage.apply([], [("remove", Tache("", task_id=1))])
+        with open(self.filename, "rb") as file:
+            header = file.read(HEADER.size)
+        self.storage.apply([], [("add", Tache("D", task_id=4))])
+        with open(self.filename, "r+b") as file:
+            file.write(header)
+        self.storage.apply([], [("add", Tache("E", task_id=5))])
+        loaded = self.storage.load()
+        self.assertEqual(
+            [(task.task_id, task.slot) for task in loaded], [(4, 0), (2, 1), (3, 2), (5, 3)]
+        )
+        self.assertEqual(self.storage.count(), 4)
+        self.storage.apply([], [("remove", Tache("", task_id=2))])
+        self.storage.apply([], [("add", Tache("F", task_id=6))])
+        self.assertEqual([task.task_id for task in self.storage.load()], [4, 6, 3, 5])
+
+    def test_changes_in_one_batch(self):
+        """Test d'un lot qui ajoute, modifie puis supprime des tâches."""
+        added = Tache("D", "Ajoutée", task_id=4)
+        edited = Tache("D", "Modifiée", 3, task_id=4)
+        self.storage.apply(
+            [],
+            [
+                ("remove", Tache("", task_id=2)),
+                ("add", added),
+                ("edit", edited),
+                ("remove", Tache("", task_id=1)),
+                ("add", Tache("E", task_id=5)),
+            ],
+        )
+        loaded = self.storage.load()
+        self.assertEqual([task.task_id for task in loaded], [5, 4, 3])
+        self.assertEqual(loaded[1], edited)
+        self.assertIsInstance(loaded[1], RecordTache)
+
+    def test_vacuum(self):
+        """Test que "vacuum" réécrit un nouveau tas sans l'espace libéré."""
+        self.run_cli(["remove", "--id", "2"])
+        self.run_cli(["edit", "--id", "3", "--title", "Renommée"])
+        output = self.run_cli(["vacuum"])
+        self.assertIn("2 tâches", output)
+        self.assertFalse(os.path.exists(heap_path(self.filename, 0)))
+        self.assertEqual(self.sizes(1), (HEADER.size + 2 * SLOT.size, 25))
+        titles = [task.titre for task in self.storage.load()]
+        self.assertEqual(titles, ["Été", "Renommée"])
+
+    def test_list_and_search_without_index(self):
+        """Test que "list --sort" et "search" fonctionnent sans index voisin."""
+        output = self.run_cli(["list", "--sort", "priority"])
+        titles = [line for line in output.splitlines() if line.startswith("Titre: ")]
+        self.assertEqual(titles, ["Titre: B", "Titre: Été", "Titre: C"])
+        self.assertIn("Titre: C", self.run_cli(["search", "texte"]))
+        self.assertFalse(os.path.exists(self.filename + ".idx"))
+
+    def test_invalid_file(self):
+        """Test qu'un fichier d'un autre format, tronqué ou sans tas lève StorageError."""
+        os.remove(heap_path(self.filename, 0))
+        with self.assertRaises(StorageError):
+            self.storage.load()
+        with open(self.filename, "rb") as file:
+            content = file.read()
+        for data in (b"{}" + content[2:], content[:-1]):
+            with self.subTest(data=data[:8]):
+                with open(self.filename, "wb") as file:
+                    file.write(data)
+                with self.assertRaises(StorageError):
+                    self.storage.load()
+
+
+if __name__ == "__main__":
+    unittest.main()
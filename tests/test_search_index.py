@@ -0,0 +1,98 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+Module de tests pour l'index de recherche (search_index) et la commande "search".
+
+Ce module vérifie la normalisation des mots sans casse ni accents, l'analyse des
+requêtes (ET, OU, préfixe), la mise à jour incrémentale de l'index, sa sauvegarde
+à côté du fichier des tâches et son utilisation par la commande "search".
+
+Chaque méthode de test est documentée avec une docstring au format Google.
+"""
+
+import os
+import tempfile
+import unittest
+
+from unittest.mock import patch
+
+from source.search_index import SearchIndex, parse_query, search_path, tokenize
+from source.storage import open_storage
+from source.tache import Tache
+from tests.helpers import run_cli, search_tasks
+
+
+class TestSearchIndex(unittest.TestCase):
+    """Tests unitaires pour la classe SearchIndex et la commande "search"."""
+
+    def setUp(self):
+        """Crée un répertoire temporaire pour les fichiers de sauvegarde."""
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.filename = os.path.join(self.tmpdir.name, "tasks.json")
+
+    def tearDown(self):
+        """Supprime le répertoire temporaire."""
+        self.tmpdir.cleanup()
+
+    def test_tokenize(self):
+        """Test du découpage en mots sans casse ni accents."""
+        self.assertEqual(tokenize("Réviser l'ÉTÉ !"), {"reviser", "l", "ete"})
+        self.assertEqual(tokenize(None), set())
+
+    def test_parse_query(self):
+        """Test de l'analyse des groupes ET / OU et des préfixes."""
+        self.assertEqual(
+            parse_query(["Pain", "lait", "OR", "boulang*"]),
+            [[("pain", False), ("lait", False)], [("boulang", True)]],
+        )
+
+    def test_search(self):
+        """Test des recherches ET, OU et par préfixe."""
+        index = SearchIndex.build(search_tasks())
+        self.assertEqual(index.search(["acheter"]), {1, 3})
+        self.assertEqual(index.search(["acheter", "pain"]), {1})
+        self.assertEqual(index.search(["pain", "OR", "ETE"]), {1, 2})
+        self.assertEqual(index.search(["boul*"]), {1})
+        self.assertEqual(index.search(["pr*", "conges"]), {2})
+        self.assertEqual(index.search(["inconnu"]), set())
+
+    def test_storage_keeps_index_up_to_date(self):
+        """Test que le backend journal complète le journal de l'index sans réécrire sa base."""
+        storage = open_storage("journal", self.filename)
+        tasks = search_tasks()
+        storage.save(tasks)
+        self.assertTrue(os.path.exists(search_path(self.filename)))
+        base = os.stat(search_path(self.filename))
+        added = Tache("Pain de mie", None, task_id=4)
+        edited = Tache("Acheter du beurre", None, task_id=1)
+        with patch.object(SearchIndex, "build", side_effect=AssertionError):
+            storage.apply(tasks + [added], [("add", added)])
+            self.assertEqual(storage.search(["pain"]), {1, 4})
+            storage.apply(
+                [edited, tasks[1], added], [("edit", edited), ("remove", tasks[2])]
+            )
+        self.assertEqual(os.stat(search_path(self.filename)).st_ino, base.st_ino)
+        self.assertEqual(storage.search(["pain"]), {4})
+        self.assertEqual(storage.search(["ache*"]), {1})
+        self.assertEqual(storage.search(["b*"]), {1})
+        self.assertEqual(storage.search(["ete", "OR", "mie"]), {2, 4})
+
+    def test_search_command_uses_index(self):
+        """Test que la commande "search" interroge l'index sauvegardé."""
+        open_storage("jsonl", self.filename).save(search_tasks())
+        argv = ["--storage", "jsonl", "--file", self.filename, "search", "ache*"]
+        with patch.object(SearchIndex, "build", side_effect=AssertionError):
+            output = run_cli(argv)
+        self.assertIn("Titre: Acheter du pain", output)
+        self.assertIn("Titre: Acheter du lait", output)
+        self.assertIn("2 tâche(s) trouvée(s).", output)
+
+    def test_search_command_without_index(self):
+        """Test que la commande "search" fonctionne sans index sauvegardé."""
+        open_storage("json", self.filename).save(search_tasks())
+        os.remove(search_path(self.filename))
+        argv = ["--file", self.filename, "search", "ete", "OR", "lait"]
+        output = run_cli(argv)
+        self.assertIn("Titre: Réviser l'été", output)
+        self.assertIn("Titre: Acheter du lait", output)
+        self.assertNotIn("Titre: Acheter du pain", output)
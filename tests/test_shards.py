@@ -0,0 +1,126 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+Module de tests pour les projets répartis en fragments (shards).
+
+Ce module vérifie l'enregistrement des projets dans le manifeste, la validation de
+leur nom, la fusion à k voies de flux triés, l'ouverture du seul fragment du projet
+demandé et la commande "list --all" sur des projets de backends différents.
+
+Chaque méthode de test est documentée avec une docstring au format Google.
+"""
+
+import os
+import tempfile
+import unittest
+
+from unittest.mock import patch
+
+from source import shards, task_manager
+from source.tache import Tache
+from tests.helpers import run_cli
+
+
+class TestShards(unittest.TestCase):
+    """Tests unitaires pour les projets répartis en fragments."""
+
+    def setUp(self):
+        """Crée un répertoire de stockage temporaire."""
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.store = os.path.join(self.tmpdir.name, "tasks.d")
+
+    def tearDown(self):
+        """Supprime le répertoire temporaire."""
+        self.tmpdir.cleanup()
+
+    def run_cli(self, argv):
+        """Exécute la CLI avec le répertoire de stockage temporaire.
+
+        Args:
+            argv (list[str]): Arguments de la CLI.
+
+        Returns:
+            str: La sortie standard.
+        """
+        return run_cli(["--store", self.store] + argv)
+
+    def add_tasks(self):
+        """Ajoute des tâches à deux projets, l'un en JSON, l'autre en SQLite."""
+        for project, storage, title, priority in (
+            ("alpha", "json", "A1", 3),
+            ("alpha", "json", "A2", 1),
+            ("beta", "sqlite", "B1", 2),
+            ("beta", "sqlite", "B2", 5),
+        ):
+            self.run_cli(
+                ["--project", project, "--storage", storage, "add", "--title", title]
+                + ["--priority", str(priority)]
+            )
+
+    def test_resolve_registers_project(self):
+        """Test qu'un projet garde le fichier et le backend de sa création."""
+        path = shards.manifest_path(self.store)
+        self.assertEqual(
+            shards.resolve(self.store, "alpha", "sqlite", create=False),
+            (os.path.join(self.store, "alpha.db"), "sqlite"),
+        )
+        self.assertFalse(os.path.exists(path))
+        shards.resolve(self.store, "alpha", "jsonl")
+        self.assertEqual(
+            shards.resolve(self.store, "alpha", "json"),
+            (os.path.join(self.store, "alpha.jsonl"), "jsonl"),
+        )
+        self.assertEqual(
+            shards.projects(self.store),
+            [("alpha", os.path.join(self.store, "alpha.jsonl"), "jsonl")],
+        )
+
+    def test_invalid_project_name(self):
+        """Test qu'un nom de projet qui sortirait du répertoire est refusé."""
+        for name in ("../x", "a/b", "", ".cache", "manifest"):
+            with self.subTest(name=name):
+                with self.assertRaises(ValueError):
+                    shards.resolve(self.store, name)
+
+    def test_merge(self):
+        """Test de la fusion de flux triés, stable à clé égale."""
+        first = [Tache("a", priorite=1), Tache("c", priorite=3)]
+        second = [Tache("b", priorite=1), Tache("d", priorite=2)]
+        merged = shards.merge([iter(first), iter(second)], lambda task: task.priorite)
+        self.assertEqual([task.titre for task in merged], ["a", "b", "d", "c"])
+        chained = shards.merge([first, second])
+        self.assertEqual([task.titre for task in chained], ["a", "c", "b", "d"])
+
+    def test_command_opens_only_its_shard(self):
+        """Test qu'une commande ne charge que le fragment de son projet."""
+        self.add_tasks()
+        load_tasks = task_manager.load_tasks
+        with patch.object(
+            task_manager, "load_tasks", side_effect=load_tasks
+        ) as mock_load:
+            output = self.run_cli(["--project", "beta", "list", "--sort", "title"])
+        self.assertEqual(
+            {call.args[0] for call in mock_load.call_args_list},
+            {os.path.join(self.store, "beta.db")},
+        )
+        self.assertIn("B2", output)
+        self.assertNotIn("A1", output)
+
+    def test_list_all_merges_projects(self):
+        """Test de "list --all" triée et paginée sur des projets de backends différents."""
+        self.add_tasks()
+        output = self.run_cli(["list", "--all", "--sort", "priority"])
+        titles = [line[7:] for line in output.splitlines() if line.startswith("Titre: ")]
+        self.assertEqual(titles, ["A2", "B1", "A1", "B2"])
+        output = self.run_cli(
+            ["list", "--all", "--sort", "priority", "--limit", "2", "--offset", "1"]
+        )
+        titles = [line[7:] for line in output.splitlines() if line.startswith("Titre: ")]
+        self.assertEqual(titles, ["B1", "A1"])
+        self.assertTrue(self.run_cli(["list", "--all", "--count"]).endswith("4 tâche(s).\n"))
+        output = self.run_cli(["list", "--all", "--count", "--where", "priorite>=2"])
+        self.assertTrue(output.endswith("3 tâche(s).\n"))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,208 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+Module de tests pour les modes longue durée (shell, daemon, client).
+
+Ce module vérifie que les tâches sont chargées une seule fois, que les commandes
+sont confiées aux fonctions handle_* et que les modifications accumulées sont
+écrites à la fermeture de la session.
+
+Chaque méthode de test est documentée avec une docstring au format Google.
+"""
+
+import io
+import os
+import socket
+import sys
+import tempfile
+import threading
+import time
+import unittest
+
+from unittest.mock import patch
+
+from source import task_manager
+from source.shell import PendingChanges, Session, send_command
+from source.storage import open_storage
+from source.tache import Tache
+from tests.helpers import run_cli
+
+COMMANDS = """add --title "Acheter du pain" --priority 2
+add --title Courrier
+edit --id 100001 --priority 5
+remove --id 100000
+commande-inconnue
+list --sort priority
+"""
+
+
+class TestPendingChanges(unittest.TestCase):
+    """Tests unitaires pour la classe PendingChanges."""
+
+    def test_record(self):
+        """Test de l'accumulation des modifications et de la réécriture complète."""
+        pending = PendingChanges()
+        self.assertFalse(pending)
+        task = Tache("A", task_id=1)
+        pending.record([("add", task)])
+        pending.record([("edit", task)])
+        self.assertEqual(len(pending.changes), 2)
+        pending.record(None)
+        pending.record([("remove", task)])
+        self.assertTrue(pending.full)
+        self.assertEqual(len(pending.changes), 3)
+        pending.clear()
+        self.assertFalse(pending)
+
+
+class TestShell(unittest.TestCase):
+    """Tests unitaires pour les modes shell et démon."""
+
+    def setUp(self):
+        """Crée un répertoire temporaire pour le fichier de sauvegarde."""
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.filename = os.path.join(self.tmpdir.name, "tasks.db")
+
+    def tearDown(self):
+        """Supprime le répertoire temporaire."""
+        self.tmpdir.cleanup()
+
+    def test_shell_loads_once_and_flushes_on_exit(self):
+        """Test du mode shell.
+
+        Vérifie que les tâches sont chargées une seule fois, que les modifications
+        ne sont écrites qu'une fois à la fin et qu'une commande inconnue n'arrête
+        pas la session.
+        """
+        argv = ["--storage", "sqlite", "--file", self.filename, "shell"]
+        argv += ["--flush-interval", "3600"]
+        with patch("sys.stdin", io.StringIO(COMMANDS)):
+            with patch(
+                "source.task_manager.load_tasks", wraps=task_manager.load_tasks
+            ) as mock_load:
+                with patch(
+                    "source.task_manager.save_tasks", wraps=task_manager.save_tasks
+                ) as mock_save:
+                    with patch("sys.stdout", new_callable=io.StringIO) as fake_out:
+                        with patch("sys.stderr", new_callable=io.StringIO):
+                            task_manager.main(argv)
+        mock_load.assert_called_once()
+        mock_save.assert_called_once()
+        self.assertIn("Priorité: 5", fake_out.getvalue())
+        tasks = open_storage("sqlite", self.filename).load()
+        self.assertEqual([(t.task_id, t.priorite) for t in tasks], [(100001, 5)])
+
+    def test_shell_refuses_nested_session(self):
+        """Test qu'une session ne peut pas lancer une autre session."""
+        argv = ["--file", os.path.join(self.tmpdir.name, "tasks.json"), "shell"]
+        with patch("sys.stdin", io.StringIO("shell\nexit\nadd --title Ignorée\n")):
+            output = run_cli(argv)
+        self.assertIn(task_manager.ERROR_MESSAGE, output)
+        self.assertFalse(os.path.exists(os.path.join(self.tmpdir.name, "tasks.json")))
+
+    @unittest.skipUnless(hasattr(socket, "AF_UNIX"), "sockets Unix indisponibles")
+    def test_daemon_and_client(self):
+        """Test du mode démon interrogé par des clients légers.
+
+        Vérifie que les commandes envoyées par plusieurs connexions partagent les
+        mêmes tâches en mémoire et que la commande « stop » écrit les modifications.
+        """
+        socket_path = os.path.join(self.tmpdir.name, "tm.sock")
+        argv = ["--storage", "sqlite", "--file", self.filename, "daemon"]
+        argv += ["--socket", socket_path, "--flush-interval", "3600"]
+        with patch("sys.stdout", new_callable=io.StringIO):
+            thread = threading.Thread(
+                target=task_manager.main, args=(argv,), daemon=True
+            )
+            thread.start()
+            for _ in range(100):
+                if os.path.exists(socket_path):
+                    break
+                time.sleep(0.05)
+            try:
+                added = send_command(socket_path, "add --title 'Via le démon'")
+                listed = send_command(socket_path, "list")
+            finally:
+                send_command(socket_path, "stop")
+                thread.join(timeout=10)
+        self.assertFalse(thread.is_alive())
+        self.assertIn("Tâche ajoutée avec l'ID 100000", added)
+        self.assertIn("Titre: Via le démon", listed)
+        tasks = open_storage("sqlite", self.filename).load()
+        self.assertEqual([t.get_titre() for t in tasks], ["Via le démon"])
+
+    def test_conflict_after_full_rewrite_keeps_changes(self):
+        """Test qu'un conflit après une réécriture complète rejoue toutes les modifications."""
+        filename = os.path.join(self.tmpdir.name, "tasks.json")
+        task_manager.save_tasks([Tache("Initiale", task_id=1)], filename)
+        parser = task_manager.build_parser()
+        session = Session(
+            parser,
+            parser.parse_args(["--file", filename, "shell"]),
+            task_manager.load_store(filename),
+            task_manager.save_tasks,
+            flush_interval=3600,
+            load=lambda: task_manager.load_store(filename),
+        )
+        with patch("builtins.print"):
+            session.execute("add --title A")
+            session.execute("compact")
+            session.execute("add --title B")
+        other = task_manager.load_store(filename)
+        added = Tache("Autre processus", task_id=other.allocate_ids(1)[0])
+        other.add(added)
+        task_manager.save_tasks(other, filename, changes=[("add", added)])
+        session.flush()
+        titles = sorted(task.titre for task in open_storage("json", filename).load())
+        self.assertEqual(titles, ["A", "Autre processus", "B", "Initiale"])
+
+    def test_conflict_reports_replayed_changes(self):
+        """Test qu'un conflit ne ressuscite pas une tâche supprimée ni n'écrase ses valeurs.
+
+        Vérifie aussi que l'identifiant réattribué à un ajout est affiché.
+        """
+        filename = os.path.join(self.tmpdir.name, "tasks.json")
+        task_manager.save_tasks(
+            [Tache("Gardée", task_id=1), Tache("Supprimée", task_id=2)], filename
+        )
+        parser = task_manager.build_parser()
+        session = Session(
+            parser,
+            parser.parse_args(["--file", filename, "shell"]),
+            task_manager.load_store(filename),
+            task_manager.save_tasks,
+            flush_interval=3600,
+            load=lambda: task_manager.load_store(filename),
+        )
+        with patch("builtins.print"):
+            session.execute("edit --id 1 --priority 5")
+            session.execute("edit --id 2 --title Modifiée")
+            session.execute("add --title Nouvelle")
+        other = task_manager.load_store(filename)
+        other.get(1).set_titre("Renommée")
+        other.remove(2)
+        added = Tache("Autre processus", task_id=other.allocate_ids(1)[0])
+        other.add(added)
+        task_manager.save_tasks(other, filename)
+        with patch("sys.stdout", new_callable=io.StringIO) as fake_out:
+            session.flush()
+        tasks = {task.titre: task for task in open_storage("json", filename).load()}
+        self.assertEqual(sorted(tasks), ["Autre processus", "Nouvelle", "Renommée"])
+        self.assertEqual(tasks["Renommée"].priorite, 5)
+        output = fake_out.getvalue()
+        self.assertIn(
+            f"la tâche {added.task_id} a reçu l'ID {tasks['Nouvelle'].task_id}", output
+        )
+        self.assertIn("la tâche 2 a été supprimée par un autre processus", output)
+
+    def test_client_without_daemon(self):
+        """Test du client lorsqu'aucun démon n'écoute : un message est affiché."""
+        argv = ["client", "--socket", os.path.join(self.tmpdir.name, "absent.sock")]
+        with patch.object(task_manager, "load_tasks") as mock_load:
+            output = run_cli(argv + ["list"])
+        mock_load.assert_not_called()
+        self.assertIn("Impossible de joindre le démon", output)
+
+
+if __name__ == "__main__":
+    unittest.main(argv=sys.argv[:1])
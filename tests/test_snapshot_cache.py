@@ -0,0 +1,124 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+Module de tests pour l'instantané des tâches décodées (snapshot_cache).
+
+Ce module vérifie que l'instantané est utilisé tant que le fichier JSON est
+inchangé, qu'un instantané périmé n'est jamais utilisé (même si la taille et la date
+de modification du fichier sont identiques), qu'un instantané illisible est
+remplacé, la taille maximale, le journal rejoué par-dessus l'instantané et la
+commande "cache clear".
+
+Chaque méthode de test est documentée avec une docstring au format Google.
+"""
+
+import json
+import os
+import tempfile
+import unittest
+
+from unittest.mock import patch
+
+from source import journal, snapshot_cache, timings
+from source.storage import JsonStorage
+from source.tache import Tache
+from tests.helpers import run_cli
+
+
+@patch.object(snapshot_cache, "MIN_SIZE", 0)
+class TestSnapshotCache(unittest.TestCase):
+    """Tests unitaires pour l'instantané des tâches décodées."""
+
+    def setUp(self):
+        """Crée un fichier JSON de deux tâches dans un répertoire temporaire."""
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.filename = os.path.join(self.tmpdir.name, "tasks.json")
+        self.storage = JsonStorage(self.filename)
+        self.tasks = [Tache("Été", "Déjà", 2, "2025-01-01", 1), Tache("B", task_id=2)]
+        self.storage.save(self.tasks)
+        self.cache = snapshot_cache.cache_path(self.filename)
+
+    def tearDown(self):
+        """Supprime le répertoire temporaire."""
+        self.tmpdir.cleanup()
+
+    def test_unchanged_file_served_from_cache(self):
+        """Test que le fichier inchangé n'est pas décodé une seconde fois."""
+        self.assertEqual(self.storage.load(), self.tasks)
+        self.assertTrue(os.path.exists(self.cache))
+        with patch("json.loads", side_effect=AssertionError("fichier décodé")):
+            loaded = self.storage.load()
+        self.assertEqual(loaded, self.tasks)
+        self.assertEqual(loaded[0].date_ordinal, self.tasks[0].date_ordinal)
+
+    def test_stale_cache_never_served(self):
+        """Test qu'un fichier modifié à taille et date identiques est relu.
+
+        Chaque modification garde la taille du fichier et rétablit sa date de
+        modification : seule l'empreinte du contenu change.
+        """
+        self.storage.load()
+        stat = os.stat(self.filename)
+        with open(self.filename, encoding="utf-8") as file:
+            content = file.read()
+        for old, new in (('"B"', '"C"'), ('"priorite": 2', '"priorite": 9')):
+            with self.subTest(new=new):
+                content = content.replace(old, new)
+                with open(self.filename, "w", encoding="utf-8") as file:
+                    file.write(content)
+                os.utime(self.filename, ns=(stat.st_atime_ns, stat.st_mtime_ns))
+                self.assertEqual(os.path.getsize(self.filename), stat.st_size)
+                loaded = self.storage.load()
+                self.assertEqual([t.to_dict() for t in loaded], json.loads(content))
+
+    def test_invalid_cache_replaced(self):
+        """Test qu'un instantané illisible est ignoré puis remplacé."""
+        for data in (b"", b"\x05\x00\x00\x00abc", b"\xff" * 64):
+            with self.subTest(data=data):
+                with open(self.cache, "wb") as file:
+                    file.write(data)
+                self.assertEqual(self.storage.load(), self.tasks)
+                with patch("json.loads", side_effect=AssertionError("fichier décodé")):
+                    self.assertEqual(self.storage.load(), self.tasks)
+
+    def test_size_cap(self):
+        """Test qu'un instantané trop grand n'est pas écrit ; une taille nulle désactive."""
+        self.storage.load()
+        with patch.dict(os.environ, {snapshot_cache.SIZE_ENV: "10"}):
+            self.storage.save(self.tasks + [Tache("C", task_id=3)])
+            self.assertEqual(len(self.storage.load()), 3)
+            self.assertFalse(os.path.exists(self.cache))
+        with patch.dict(os.environ, {snapshot_cache.SIZE_ENV: "0"}):
+            self.storage.load()
+            self.assertFalse(os.path.exists(self.cache))
+
+    def test_small_files_not_cached(self):
+        """Test que les fichiers plus petits que MIN_SIZE ne sont pas mis en cache."""
+        with patch.object(snapshot_cache, "MIN_SIZE", 1024 * 1024):
+            self.storage.load()
+        self.assertFalse(os.path.exists(self.cache))
+
+    def test_journal_replayed_over_cache(self):
+        """Test que le journal est rejoué par-dessus l'instantané en cache."""
+        self.storage.load()
+        journal.append_entry(self.filename, "edit", Tache("B modifiée", task_id=2))
+        measure = timings.start()
+        try:
+            loaded = self.storage.load()
+        finally:
+            timings.stop()
+        self.assertEqual(measure.counters, {"cache_hits": 1})
+        self.assertEqual([t.titre for t in loaded], ["Été", "B modifiée"])
+
+    def test_cache_clear_command(self):
+        """Test de la commande "cache clear"."""
+        self.storage.load()
+        argv = ["--file", self.filename, "cache", "clear"]
+        output = run_cli(argv) + run_cli(argv)
+        self.assertFalse(os.path.exists(self.cache))
+        self.assertIn("supprimé", output)
+        self.assertIn("Aucun cache", output)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,148 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+Module de tests pour les index triés persistants (sorted_index).
+
+Ce module vérifie la construction et la mise à jour incrémentale des index sur la
+priorité et la date limite, leur sauvegarde à côté du fichier des tâches, leur
+invalidation après une modification externe et leur utilisation par la commande
+"list".
+
+Chaque méthode de test est documentée avec une docstring au format Google.
+"""
+
+import os
+import tempfile
+import unittest
+
+from unittest.mock import patch
+
+from source import index_log
+from source.sorted_index import NO_DATE, SortedIndex, index_path
+from source.storage import open_storage
+from source.tache import Tache, parse_date
+from tests.helpers import indexed_tasks, listed_titles, run_cli
+
+
+class TestSortedIndex(unittest.TestCase):
+    """Tests unitaires pour la classe SortedIndex."""
+
+    def setUp(self):
+        """Crée un répertoire temporaire pour les fichiers de sauvegarde."""
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.filename = os.path.join(self.tmpdir.name, "tasks.json")
+
+    def tearDown(self):
+        """Supprime le répertoire temporaire."""
+        self.tmpdir.cleanup()
+
+    def test_build_and_ranges(self):
+        """Test de l'ordre des index et des recherches par intervalle."""
+        index = SortedIndex.build(indexed_tasks())
+        self.assertEqual(index.ids("priority"), [1, 3, 2, 4])
+        self.assertEqual(index.ids("due"), [3, 1, 2, 4])
+        self.assertEqual(index.ids_between("priority", 2, 3), [2, 4])
+        self.assertEqual(
+            index.ids_between("due", parse_date("2025-01-01")), [2, 4]
+        )
+        self.assertEqual(index.ids_between("due", NO_DATE + 1), [1, 2, 4])
+
+    def test_storage_keeps_index_up_to_date(self):
+        """Test que le backend journal complète le journal de l'index sans réécrire sa base."""
+        storage = open_storage("journal", self.filename)
+        tasks = indexed_tasks()
+        storage.save(tasks)
+        base = os.stat(index_path(self.filename))
+        added = Tache("Pear", None, 2, "2024-06-01", task_id=5)
+        edited = Tache("Kiwi", None, 4, None, task_id=1)
+        with patch.object(SortedIndex, "build", side_effect=AssertionError):
+            storage.apply(tasks + [added], [("add", added)])
+            storage.apply(tasks[:2] + [added, edited], [("edit", edited), ("remove", tasks[2])])
+        self.assertEqual(os.stat(index_path(self.filename)).st_ino, base.st_ino)
+        self.assertTrue(os.path.exists(index_log.log_path(index_path(self.filename))))
+        self.assertEqual(storage.sorted_ids("priority"), [3, 5, 4, 1])
+        self.assertEqual(storage.sorted_ids("due", NO_DATE + 1), [5, 4])
+        self.assertEqual(storage.sorted_ids("priority", 2, 3), [5, 4])
+
+    def test_json_edit_updates_index_without_rebuild(self):
+        """Test que "edit" sur le backend JSON complète l'index sans le reconstruire."""
+        open_storage("json", self.filename).save(indexed_tasks())
+        base = os.stat(index_path(self.filename))
+        argv = ["--file", self.filename, "edit", "--id", "3", "--priority", "5"]
+        with patch.object(SortedIndex, "build", side_effect=AssertionError):
+            run_cli(argv)
+        self.assertEqual(os.stat(index_path(self.filename)).st_ino, base.st_ino)
+        self.assertEqual(open_storage("json", self.filename).sorted_ids("priority"), [1, 2, 4, 3])
+
+    def test_index_log_compacted(self):
+        """Test que l'index est reconstruit lorsque son journal devient trop grand."""
+        storage = open_storage("journal", self.filename)
+        tasks = indexed_tasks()
+        storage.save(tasks)
+        log = index_log.log_path(index_path(self.filename))
+        with patch.object(index_log, "COMPACT_MIN_BYTES", 0):
+            added = Tache("Pear", None, 2, "2024-06-01", task_id=5)
+            storage.apply(tasks + [added], [("add", added)])
+        self.assertFalse(os.path.exists(log))
+        self.assertEqual(storage.sorted_ids("priority"), [1, 3, 2, 5, 4])
+
+    def test_interrupted_index_write(self):
+        """Test qu'un journal d'index tronqué est ignoré puis réparé à l'écriture suivante."""
+        storage = open_storage("journal", self.filename)
+        tasks = indexed_tasks()
+        storage.save(tasks)
+        with open(index_log.log_path(index_path(self.filename)), "a", encoding="utf-8") as file:
+            file.write("[5,2")
+        self.assertIsNone(storage.sorted_ids("priority"))
+        added = Tache("Pear", None, 2, "2024-06-01", task_id=5)
+        storage.apply(tasks + [added], [("add", added)])
+        self.assertEqual(storage.sorted_ids("priority"), [1, 3, 2, 5, 4])
+
+    def test_external_change_invalidates_index(self):
+        """Test qu'un fichier modifié hors de l'application rend l'index périmé."""
+        storage = open_storage("json", self.filename)
+        storage.save(indexed_tasks())
+        with open(self.filename, "a", encoding="utf-8") as file:
+            file.write("\n")
+        self.assertIsNone(storage.sorted_ids("due"))
+
+    def test_list_uses_index(self):
+        """Test que "list --sort due" suit l'index sans trier les tâches."""
+        open_storage("jsonl", self.filename).save(indexed_tasks())
+        argv = ["--storage", "jsonl", "--file", self.filename, "list", "--sort", "due"]
+        with patch("source.task_manager.select_tasks", side_effect=AssertionError):
+            output = run_cli(argv + ["--limit", "2"])
+        self.assertEqual(listed_titles(output), ["Apple", "Kiwi"])
+
+    def test_list_due_range_uses_index(self):
+        """Test que les filtres d'échéance sont résolus par l'index des dates."""
+        open_storage("jsonl", self.filename).save(indexed_tasks())
+        argv = ["--storage", "jsonl", "--file", self.filename, "list"]
+        cases = [
+            (["--due-after", "2025-01-01"], ["Mango", "Zebra"]),
+            (["--due-before", "2025-01-01"], ["Kiwi", "Mango"]),
+            (["--overdue", "--sort", "priority"], ["Kiwi", "Mango", "Zebra"]),
+        ]
+        for options, expected in cases:
+            with self.subTest(options=options):
+                with patch(
+                    "source.task_manager.select_tasks", side_effect=AssertionError
+                ):
+                    output = run_cli(argv + options)
+                self.assertEqual(listed_titles(output), expected)
+
+    def test_list_without_index_sorts(self):
+        """Test que "list" trie les tâches lorsque l'index est absent."""
+        open_storage("json", self.filename).save(indexed_tasks())
+        os.remove(index_path(self.filename))
+        argv = ["--file", self.filename, "list", "--sort", "priority"]
+        priorites = [
+            int(line.split("Priorité: ")[1])
+            for line in run_cli(argv).splitlines()
+            if "Priorité: " in line
+        ]
+        self.assertEqual(priorites, [1, 1, 2, 3])
+
+
+if __name__ == "__main__":
+    unittest.main()
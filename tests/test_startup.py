@@ -0,0 +1,120 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+Module de tests pour le démarrage de la CLI.
+
+Ce module vérifie que la commande "list" n'importe pas les modules propres aux
+autres commandes, que le temps d'import mesuré par ``python -X importtime`` reste
+sous un budget fixé, et que ``--version`` ou l'absence de commande ne chargent
+pas le stockage.
+
+Chaque méthode de test est documentée avec une docstring au format Google.
+"""
+
+import io
+import os
+import subprocess
+import sys
+import tempfile
+import unittest
+
+from unittest.mock import patch
+
+from source import __version__, task_manager
+from tests.helpers import run_cli
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Budget (en microsecondes) du temps d'import cumulé de source.task_manager
+IMPORT_BUDGET_US = 150_000
+
+# Modules réservés à d'autres commandes que "list"
+LAZY_MODULES = {
+    "asyncio",
+    "cProfile",
+    "concurrent.futures",
+    "csv",
+    "dataclasses",
+    "hashlib",
+    "mmap",
+    "shlex",
+    "socket",
+    "socketserver",
+    "sqlite3",
+    "source.binary_storage",
+    "source.http_api",
+    "source.importer",
+    "source.record_storage",
+    "source.shards",
+    "source.shell",
+}
+
+
+def import_times(argv):
+    """Exécute la CLI sous ``python -X importtime`` et relève les temps d'import.
+
+    Args:
+        argv (list[str]): Arguments de la CLI.
+
+    Returns:
+        dict[str, int]: Temps d'import cumulé (µs) par module importé.
+    """
+    code = f"from source import task_manager; task_manager.main({argv!r})"
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", code],
+        cwd=ROOT,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    times = {}
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _, cumulative, name = line[len("import time:"):].split("|")
+        times[name.strip()] = int(cumulative)
+    return times
+
+
+class TestStartup(unittest.TestCase):
+    """Tests du coût de démarrage de la CLI."""
+
+    def test_list_import_budget(self):
+        """Test du budget d'import de la commande "list".
+
+        Vérifie que les modules des autres commandes ne sont pas importés et que
+        l'import de source.task_manager reste sous IMPORT_BUDGET_US.
+        """
+        with tempfile.TemporaryDirectory() as tmpdir:
+            times = import_times(["--file", os.path.join(tmpdir, "t.json"), "list"])
+        self.assertEqual(LAZY_MODULES & times.keys(), set())
+        self.assertLess(times["source.task_manager"], IMPORT_BUDGET_US)
+
+    def test_version_skips_store(self):
+        """Test que --version affiche la version sans charger le stockage."""
+        with patch.object(task_manager, "load_tasks") as mock_load:
+            with patch("sys.stdout", new_callable=io.StringIO) as fake_out:
+                with self.assertRaises(SystemExit):
+                    task_manager.main(["--version"])
+        mock_load.assert_not_called()
+        self.assertIn(__version__, fake_out.getvalue())
+
+    def test_no_command_skips_store(self):
+        """Test que l'absence de commande n'entraîne pas le chargement du stockage."""
+        with patch.object(task_manager, "load_tasks") as mock_load:
+            output = run_cli([])
+        mock_load.assert_not_called()
+        self.assertIn(task_manager.ERROR_MESSAGE, output)
+
+    def test_find_command(self):
+        """Test de la recherche du nom de la commande parmi les options globales."""
+        self.assertEqual(task_manager.find_command(["--file", "list", "add"]), "add")
+        self.assertEqual(task_manager.find_command(["--storage=sqlite", "list"]), "list")
+        self.assertIsNone(task_manager.find_command(["--version"]))
+        self.assertIsNone(task_manager.find_command(["inconnue"]))
+
+    def test_unknown_command_still_reports_error(self):
+        """Test qu'une commande inconnue est refusée par argparse."""
+        with patch("sys.stderr", new_callable=io.StringIO):
+            with self.assertRaises(SystemExit):
+                task_manager.main(["inconnue"])
@@ -0,0 +1,190 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+Module de tests pour les backends de stockage (storage, sqlite_storage).
+
+Ce module vérifie que chaque backend restitue les tâches sauvegardées, que le
+backend SQLite applique les tris et les modifications unitaires, sans créer la base
+à la lecture ni charger toutes les tâches pour une modification, et que la commande
+"migrate" copie les tâches d'un backend vers un autre.
+
+Chaque méthode de test est documentée avec une docstring au format Google.
+"""
+
+import os
+import sqlite3
+import sys
+import tempfile
+import unittest
+
+from unittest.mock import patch
+
+from source import task_manager
+from source.storage import open_storage
+from source.tache import Tache
+from tests.helpers import storage_tasks
+
+
+class TestStorage(unittest.TestCase):
+    """Tests unitaires pour les backends de stockage."""
+
+    def setUp(self):
+        """Crée un répertoire temporaire pour les fichiers de sauvegarde."""
+        self.tmpdir = tempfile.TemporaryDirectory()
+
+    def tearDown(self):
+        """Supprime le répertoire temporaire."""
+        self.tmpdir.cleanup()
+
+    def path(self, name):
+        """Retourne un chemin dans le répertoire temporaire.
+
+        Args:
+            name (str): Nom du fichier.
+
+        Returns:
+            str: Le chemin complet.
+        """
+        return os.path.join(self.tmpdir.name, name)
+
+    def test_round_trip_all_backends(self):
+        """Test que chaque backend restitue les tâches sauvegardées dans l'ordre."""
+        expected = [task.to_dict() for task in storage_tasks()]
+        for name in ("json", "journal", "sqlite"):
+            with self.subTest(backend=name):
+                storage = open_storage(name, self.path(f"tasks.{name}"))
+                storage.save(storage_tasks())
+                self.assertEqual([t.to_dict() for t in storage.load()], expected)
+
+    def test_sqlite_sorted_load(self):
+        """Test du tri délégué à SQLite.
+
+        Vérifie que l'ordre obtenu correspond au tri stable de handle_list.
+        """
+        storage = open_storage("sqlite", self.path("tasks.db"))
+        storage.save(storage_tasks())
+        keys = {
+            "title": lambda t: t.titre,
+            "priority": lambda t: t.priorite,
+            "due": lambda t: t.date_limite or "",
+        }
+        for sort, key in keys.items():
+            with self.subTest(sort=sort):
+                expected = [t.task_id for t in sorted(storage_tasks(), key=key)]
+                self.assertEqual([t.task_id for t in storage.load(sort)], expected)
+
+    def test_sqlite_apply_touches_one_row(self):
+        """Test des modifications unitaires du backend SQLite."""
+        storage = open_storage("sqlite", self.path("tasks.db"))
+        storage.save(storage_tasks())
+        edited = Tache("Zebra 2", "Desc", 5, "2025-03-03", task_id=111111)
+        storage.apply([], [("edit", edited)])
+        storage.apply(
+            [],
+            [("remove", Tache("Apple", task_id=222222)), ("add", Tache("Kiwi", task_id=444444))],
+        )
+
+        tasks = storage.load()
+        self.assertEqual([t.task_id for t in tasks], [111111, 333333, 444444])
+        self.assertEqual(tasks[0].get_titre(), "Zebra 2")
+        self.assertEqual(tasks[0].get_priorite(), 5)
+
+    def test_sqlite_read_does_not_create_database(self):
+        """Test qu'une lecture d'une base absente ne crée pas le fichier."""
+        storage = open_storage("sqlite", self.path("tasks.db"))
+        self.assertEqual(storage.load(), [])
+        self.assertEqual(storage.count(), 0)
+        self.assertEqual(storage.load_meta(), {})
+        self.assertEqual(storage.get_tasks([1]), [])
+        self.assertFalse(os.path.exists(storage.filename))
+
+    def test_sqlite_tasks_and_meta_in_one_transaction(self):
+        """Test que les tâches ne sont pas écrites si l'écriture des métadonnées échoue."""
+        storage = open_storage("sqlite", self.path("tasks.db"))
+        storage.write(storage_tasks(), meta={"generation": 1})
+        added = Tache("Kiwi", task_id=444444)
+        with self.assertRaises(sqlite3.Error):
+            storage.write([], [("add", added)], {"generation": object()})
+        self.assertEqual(storage.count(), 3)
+        self.assertEqual(storage.load_meta(), {"generation": 1})
+
+    def test_sqlite_edit_by_id_loads_one_task(self):
+        """Test que "edit --id" et "remove --id" ne chargent pas toutes les tâches."""
+        db_file = self.path("tasks.db")
+        task_manager.save_tasks(storage_tasks(), db_file, "sqlite")
+        argv = ["--storage", "sqlite", "--file", db_file]
+        with patch.object(task_manager, "load_tasks", side_effect=AssertionError):
+            with patch("builtins.print") as mock_print:
+                task_manager.main(argv + ["edit", "--id", "333333", "--priority", "5"])
+                task_manager.main(argv + ["remove", "--id", "222222"])
+                task_manager.main(argv + ["remove", "--id", "42"])
+        printed = [call.args[0] for call in mock_print.call_args_list]
+        self.assertIn("Tâche avec l'ID 333333 mise à jour.", printed)
+        self.assertIn("Tâche avec l'ID 222222 supprimée.", printed)
+        self.assertIn("Aucune tâche trouvée avec l'ID 42.", printed)
+        storage = open_storage("sqlite", db_file)
+        self.assertEqual([t.task_id for t in storage.load()], [111111, 333333])
+        self.assertEqual(storage.get_tasks([333333])[0].get_priorite(), 5)
+        self.assertEqual(storage.load_meta()["generation"], 3)
+
+    def test_sqlite_indexes(self):
+        """Test que les index sur task_id, priorite et date_limite existent."""
+        storage = open_storage("sqlite", self.path("tasks.db"))
+        storage.save([])
+        connection = sqlite3.connect(storage.filename)
+        try:
+            names = {
+                row[0]
+                for row in connection.execute(
+                    "SELECT name FROM sqlite_master WHERE type = 'index'"
+                )
+            }
+        finally:
+            connection.close()
+        self.assertTrue(
+            {"idx_tasks_task_id", "idx_tasks_priorite", "idx_tasks_date_limite"}
+            <= names
+        )
+
+    def test_unknown_backend(self):
+        """Test qu'un backend inconnu lève une ValueError."""
+        with self.assertRaises(ValueError):
+            open_storage("inconnu")
+
+    def test_migrate_command(self):
+        """Test de la commande "migrate" du JSON vers SQLite."""
+        json_file = self.path("tasks.json")
+        db_file = self.path("tasks.db")
+        open_storage("json", json_file).save(storage_tasks())
+        test_argv = [
+            "task_manager.py",
+            "--file",
+            json_file,
+            "migrate",
+            "--to",
+            "sqlite",
+            "--to-file",
+            db_file,
+        ]
+        with patch.object(sys, "argv", test_argv):
+            with patch("builtins.print"):
+                task_manager.main()
+        self.assertEqual(
+            [t.to_dict() for t in open_storage("sqlite", db_file).load()],
+            [t.to_dict() for t in storage_tasks()],
+        )
+
+    def test_storage_from_environment(self):
+        """Test du choix du backend via la variable d'environnement.
+
+        Vérifie qu'une tâche ajoutée sans option --storage est écrite dans la base
+        SQLite lorsque TASK_MANAGER_STORAGE vaut "sqlite".
+        """
+        db_file = self.path("tasks.db")
+        test_argv = ["task_manager.py", "--file", db_file, "add", "--title", "T"]
+        with patch.dict(os.environ, {task_manager.STORAGE_ENV: "sqlite"}):
+            with patch.object(sys, "argv", test_argv):
+                with patch("builtins.print"):
+                    task_manager.main()
+        tasks = open_storage("sqlite", db_file).load()
+        self.assertEqual([t.get_titre() for t in tasks], ["T"])
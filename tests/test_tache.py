@@ -10,7 +10,8 @@ Chaque méthode de test est documentée avec une docstring au format Google.
 """
 
 import unittest
-from source.tache import Tache
+from datetime import date
+from source.tache import Tache, parse_date
 from source.task_manager import generate_unique_id
 
 
@@ -126,6 +127,61 @@ class TestTache(unittest.TestCase):
             "La représentation en chaîne ne contient pas le titre",
         )
 
+    def test_slots(self):
+        """Test que les instances de Tache n'ont pas de __dict__.
+
+        Vérifie qu'un attribut inconnu ne peut pas être ajouté à une tâche.
+        """
+        tache1 = Tache("Faire les courses")
+        self.assertFalse(hasattr(tache1, "__dict__"))
+        with self.assertRaises(AttributeError):
+            tache1.attribut_inconnu = 1
+
+    def test_dirty_tracking(self):
+        """Test que seuls les setters qui changent une valeur marquent la tâche.
+
+        Vérifie qu'une tâche neuve n'est pas marquée, qu'une valeur identique (ou une
+        priorité corrigée à la même valeur) ne la marque pas, les attributs modifiés
+        retenus et mark_clean.
+        """
+        tache1 = Tache("Faire les courses", "Pain", 1, "2025-03-05")
+        self.assertFalse(tache1.dirty)
+        tache1.set_titre("Faire les courses")
+        tache1.set_description("Pain")
+        tache1.set_priorite(0)
+        tache1.set_date_limite("2025-03-05")
+        self.assertFalse(tache1.dirty)
+        tache1.set_priorite(2)
+        tache1.set_titre("Courses")
+        self.assertTrue(tache1.dirty)
+        self.assertEqual(tache1.changed_fields, {"priorite", "titre"})
+        tache1.mark_clean()
+        self.assertFalse(tache1.dirty)
+        tache1.set_date_limite(None)
+        self.assertTrue(tache1.dirty)
+
+    def test_date_limite_validation(self):
+        """Test de la validation de la date limite.
+
+        Vérifie que la date est convertie en numéro de jour, qu'une nouvelle date qui
+        n'est pas au format YYYY-MM-DD est refusée et qu'une date en texte libre d'un
+        ancien fichier est conservée sans numéro de jour.
+        """
+        tache1 = Tache("Faire les courses", date_limite="2025-03-05")
+        self.assertEqual(tache1.date_ordinal, date(2025, 3, 5).toordinal())
+        tache1.set_date_limite(None)
+        self.assertIsNone(tache1.date_ordinal)
+        for invalide in ("demain", "2025-02-30", "20250305", "2025-W10-3"):
+            with self.subTest(date_limite=invalide):
+                with self.assertRaises(ValueError):
+                    parse_date(invalide)
+                with self.assertRaises(ValueError):
+                    tache1.set_date_limite(invalide)
+                ancienne = Tache.from_dict({"titre": "Ancienne", "date_limite": invalide})
+                self.assertEqual(ancienne.date_limite, invalide)
+                self.assertIsNone(ancienne.date_ordinal)
+        self.assertIsNone(tache1.get_date_limite())
+
     def test_generate_unique_id(self):
         """Test de la génération d'un ID unique pour une tâche.
 
@@ -18,6 +18,7 @@ import tempfile
 
 from unittest.mock import patch
 from source.tache import Tache
+from source.storage import StorageError
 
 from source import task_manager
 
@@ -53,7 +54,7 @@ class TestTaskManagerArgs(unittest.TestCase):
                     mock_save.assert_called_once()
                     tasks_list = mock_save.call_args[0][0]
                     self.assertEqual(len(tasks_list), 1)
-                    task = tasks_list[0]
+                    task = next(iter(tasks_list))
                     self.assertEqual(task.get_titre(), "Test Title")
                     self.assertEqual(task.get_description(), "Test description")
                     self.assertEqual(task.get_priorite(), 2)
@@ -169,21 +170,27 @@ class TestTaskManagerArgs(unittest.TestCase):
     def test_load_tasks_invalid_json(self):
         """Test du chargement de tâches depuis un fichier contenant un JSON invalide.
 
-        Vérifie que la fonction load_tasks retourne une liste vide et affiche un
-        message d'erreur en cas d'échec du décodage JSON.
+        Vérifie que la fonction load_tasks lève StorageError au lieu de retourner une
+        liste vide, que la CLI se termine avec un message d'erreur et que le fichier
+        n'est pas écrasé.
         """
         with tempfile.NamedTemporaryFile("w", delete=False, encoding="utf-8") as tmp:
             tmp.write("ce n'est pas du JSON valide")
             tmp_filename = tmp.name
         try:
-            with patch("builtins.print") as mock_print:
-                tasks = task_manager.load_tasks(tmp_filename)
-                self.assertEqual(tasks, [])
-                mock_print.assert_called_with(
-                    "Erreur lors du décodage du fichier JSON."
-                )
+            with self.assertRaises(StorageError):
+                task_manager.load_tasks(tmp_filename)
+            argv = ["--file", tmp_filename, "add", "--title", "Nouvelle"]
+            with patch("builtins.print"):
+                with self.assertRaises(SystemExit) as context:
+                    task_manager.main(argv)
+            self.assertIn("Erreur lors du décodage", str(context.exception.code))
+            with open(tmp_filename, "r", encoding="utf-8") as file:
+                self.assertEqual(file.read(), "ce n'est pas du JSON valide")
         finally:
             os.remove(tmp_filename)
+            if os.path.exists(tmp_filename + ".lock"):
+                os.remove(tmp_filename + ".lock")
 
     def test_remove_nonexistent_id(self):
         """Test de la suppression d'une tâche avec un ID inexistant.
@@ -239,8 +246,8 @@ class TestTaskManagerArgs(unittest.TestCase):
     def test_edit_without_changes(self):
         """Test de l'édition d'une tâche sans fournir de nouvelles valeurs.
 
-        Vérifie que, même sans modification, la tâche est sauvegardée et qu'un message
-        de mise à jour est affiché, tout en conservant ses valeurs initiales.
+        Vérifie que, sans modification, la tâche conserve ses valeurs initiales et
+        qu'aucune sauvegarde n'est effectuée.
         """
         task_to_edit = Tache(
             "Titre initial", "Description initiale", 1, "2025-06-01", task_id=777777
@@ -252,7 +259,9 @@ class TestTaskManagerArgs(unittest.TestCase):
                     with patch("sys.stdout", new_callable=io.StringIO) as fake_out:
                         task_manager.main()
                         output = fake_out.getvalue()
-                        self.assertIn("Tâche avec l'ID 777777 mise à jour.", output)
+                        self.assertIn(
+                            "Aucune modification pour la tâche avec l'ID 777777.", output
+                        )
                         # Vérification que la tâche reste inchangée
                         self.assertEqual(task_to_edit.get_titre(), "Titre initial")
                         self.assertEqual(
@@ -260,7 +269,25 @@ class TestTaskManagerArgs(unittest.TestCase):
                         )
                         self.assertEqual(task_to_edit.get_priorite(), 1)
                         self.assertEqual(task_to_edit.get_date_limite(), "2025-06-01")
-                        mock_save.assert_called_once()
+                        mock_save.assert_not_called()
+
+    def test_full_save_then_incremental_save(self):
+        """Test qu'une réécriture complète oublie les modifications qu'elle a sauvegardées.
+
+        Vérifie que la sauvegarde incrémentale suivante n'écrit que la tâche modifiée
+        depuis la réécriture.
+        """
+        first, second = Tache("A", task_id=1), Tache("B", task_id=2)
+        store = task_manager.TaskStore([first, second])
+        args = task_manager.build_parser().parse_args(["compact"])
+        first.set_titre("A2")
+        with patch("source.task_manager.save_tasks") as mock_save:
+            task_manager.persist(args, store)
+            self.assertIsNone(mock_save.call_args.kwargs["changes"])
+            self.assertFalse(first.dirty)
+            second.set_titre("B2")
+            task_manager.persist(args, store, store.changes(store))
+        self.assertEqual(mock_save.call_args.kwargs["changes"], [("edit", second)])
 
     def test_list_sort_by_title(self):
         """Test de l'affichage de la liste des tâches avec tri par titre."""
@@ -339,6 +366,126 @@ class TestTaskManagerArgs(unittest.TestCase):
                         self.assertEqual(dates, ["None", "2025-01-01", "2025-03-03"])
                         mock_save.assert_not_called()
 
+    def test_list_limit_offset(self):
+        """Test de la pagination de la liste avec --limit et --offset.
+
+        Vérifie qu'avec un tri, seule la page demandée est affichée, dans l'ordre du
+        tri complet, et que les égalités gardent l'ordre d'origine.
+        """
+        tasks = [
+            Tache(f"Task {i}", None, priorite, None, task_id=i)
+            for i, priorite in enumerate([3, 1, 2, 1, 5, 2], start=1)
+        ]
+        test_argv = ["task_manager.py", "list", "--sort", "priority"]
+        with patch.object(sys, "argv", test_argv + ["--limit", "3", "--offset", "1"]):
+            with patch("source.task_manager.load_tasks", return_value=tasks):
+                with patch("sys.stdout", new_callable=io.StringIO) as fake_out:
+                    task_manager.main()
+        titres = [
+            line.split("Titre: ")[1]
+            for line in fake_out.getvalue().splitlines()
+            if "Titre: " in line
+        ]
+        self.assertEqual(titres, ["Task 4", "Task 3", "Task 6"])
+
+    def test_list_due_filters_without_index(self):
+        """Test des filtres d'échéance lorsque le stockage n'a pas d'index.
+
+        Vérifie que les tâches sans date limite sont exclues et que les bornes
+        sont incluses.
+        """
+        tasks = [
+            Tache("Task A", None, 1, "2000-01-01", task_id=1),
+            Tache("Task B", None, 1, None, task_id=2),
+            Tache("Task C", None, 1, "2025-01-31", task_id=3),
+            Tache("Task D", None, 1, "2999-12-31", task_id=4),
+        ]
+        cases = [
+            (["--due-after", "2025-01-31", "--sort", "title"], ["Task C", "Task D"]),
+            (["--due-before", "2025-01-31"], ["Task A", "Task C"]),
+            (["--overdue", "--due-after", "2020-01-01"], ["Task C"]),
+        ]
+        for options, expected in cases:
+            with self.subTest(options=options):
+                with patch("source.task_manager.load_tasks", return_value=tasks):
+                    with patch("source.task_manager.load_sorted_ids", return_value=None):
+                        with patch("sys.stdout", new_callable=io.StringIO) as fake_out:
+                            task_manager.main(["list"] + options)
+                titres = [
+                    line.split("Titre: ")[1]
+                    for line in fake_out.getvalue().splitlines()
+                    if "Titre: " in line
+                ]
+                self.assertEqual(titres, expected)
+
+    def test_invalid_due_date_rejected(self):
+        """Test qu'une date d'échéance invalide est refusée par argparse."""
+        for argv in (
+            ["add", "--title", "T", "--due", "demain"],
+            ["list", "--due-before", "2025-13-01"],
+        ):
+            with self.subTest(argv=argv):
+                with patch("source.task_manager.save_tasks") as mock_save:
+                    with patch("sys.stderr", new_callable=io.StringIO):
+                        with self.assertRaises(SystemExit):
+                            task_manager.main(argv)
+                mock_save.assert_not_called()
+
+    def test_load_legacy_free_form_due_date(self):
+        """Test du chargement d'un ancien fichier dont une date limite est en texte libre.
+
+        Vérifie que la date est conservée et affichée, que la tâche est triée comme une
+        tâche sans date limite (en premier) et qu'elle peut être corrigée avec
+        ``edit --due``.
+        """
+        with tempfile.TemporaryDirectory() as tmpdir:
+            filename = os.path.join(tmpdir, "tasks.json")
+            with open(filename, "w", encoding="utf-8") as file:
+                file.write(
+                    '[{"task_id": 1, "titre": "Ancienne", "date_limite": "vendredi"},'
+                    ' {"task_id": 2, "titre": "Datée", "date_limite": "2025-01-01"}]'
+                )
+            with patch("sys.stdout", new_callable=io.StringIO) as fake_out:
+                task_manager.main(["--file", filename, "list", "--sort", "due"])
+            output = fake_out.getvalue()
+            self.assertIn("Date limite: vendredi", output)
+            self.assertLess(output.index("Ancienne"), output.index("Datée"))
+            with patch("builtins.print"):
+                task_manager.main(["--file", filename, "edit", "--id", "1", "--due", "2025-02-01"])
+            tasks = {task.task_id: task for task in task_manager.load_tasks(filename)}
+            self.assertEqual(tasks[1].get_date_limite(), "2025-02-01")
+
+    def test_select_tasks_without_sort(self):
+        """Test que la pagination sans tri ne lit que le début du flux."""
+        consumed = []
+
+        def stream():
+            for i in range(1, 100):
+                consumed.append(i)
+                yield Tache(f"Task {i}", task_id=i)
+
+        page = list(task_manager.select_tasks(stream(), limit=2, offset=3))
+        self.assertEqual([task.task_id for task in page], [4, 5])
+        self.assertEqual(consumed, [1, 2, 3, 4, 5])
+
+    def test_list_rejects_negative_limit(self):
+        """Test qu'une limite négative est refusée par argparse."""
+        test_argv = ["task_manager.py", "list", "--limit", "-1"]
+        with patch.object(sys, "argv", test_argv):
+            with patch("sys.stderr", new_callable=io.StringIO):
+                with self.assertRaises(SystemExit):
+                    task_manager.main()
+
+    def test_write_tasks_batches_output(self):
+        """Test que write_tasks écrit les tâches par blocs."""
+        tasks = [Tache(f"Task {i}", task_id=i) for i in range(5)]
+        out = io.StringIO()
+        with patch.object(task_manager, "WRITE_BATCH_SIZE", 2):
+            with patch.object(out, "write", wraps=out.write) as mock_write:
+                task_manager.write_tasks(tasks, out)
+        self.assertEqual(mock_write.call_count, 3)
+        self.assertEqual(out.getvalue().count("-" * 40), 5)
+
     def test_save_tasks(self):
         """Test de la sauvegarde des tâches dans un fichier JSON.
 
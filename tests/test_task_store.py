@@ -0,0 +1,106 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+Module de tests pour la collection indexée TaskStore.
+
+Ce module vérifie la recherche, l'ajout, le remplacement et la suppression de
+tâches par identifiant, la conservation de l'ordre d'insertion, la liste des
+modifications à sauvegarder et leur rejeu après un conflit d'écriture.
+
+Chaque méthode de test est documentée avec une docstring au format Google.
+"""
+
+import unittest
+
+from source.tache import Tache
+from source.task_manager import generate_unique_id
+from source.task_store import TaskStore
+
+
+class TestTaskStore(unittest.TestCase):
+    """Tests unitaires pour la classe TaskStore."""
+
+    def setUp(self):
+        """Crée une collection de trois tâches."""
+        self.store = TaskStore(
+            [Tache("A", task_id=1), Tache("B", task_id=2), Tache("C", task_id=3)]
+        )
+
+    def test_get_and_contains(self):
+        """Test de la recherche par identifiant."""
+        self.assertEqual(self.store.get(2).get_titre(), "B")
+        self.assertIsNone(self.store.get(42))
+        self.assertIn(3, self.store)
+        self.assertNotIn(42, self.store)
+        self.assertEqual(len(self.store), 3)
+
+    def test_add(self):
+        """Test de l'ajout d'une tâche et du refus d'un identifiant en double."""
+        self.store.add(Tache("D", task_id=4))
+        self.assertEqual([t.task_id for t in self.store], [1, 2, 3, 4])
+        with self.assertRaises(ValueError):
+            self.store.add(Tache("Doublon", task_id=4))
+
+    def test_replace_keeps_position(self):
+        """Test que le remplacement conserve la position de la tâche."""
+        self.store.replace(Tache("B2", task_id=2))
+        self.assertEqual([t.get_titre() for t in self.store], ["A", "B2", "C"])
+        with self.assertRaises(KeyError):
+            self.store.replace(Tache("X", task_id=42))
+
+    def test_remove(self):
+        """Test de la suppression par identifiant."""
+        removed = self.store.remove(2)
+        self.assertEqual(removed.get_titre(), "B")
+        self.assertEqual([t.task_id for t in self.store], [1, 3])
+        with self.assertRaises(KeyError):
+            self.store.remove(2)
+
+    def test_changes(self):
+        """Test que seules les tâches ajoutées, supprimées ou modifiées sont retenues."""
+        self.assertEqual(self.store.changes(self.store), [])
+        first, second, third = self.store
+        self.store.remove(1)
+        added = Tache("D", task_id=4)
+        self.store.add(added)
+        self.store.add(Tache("E", task_id=5))
+        self.store.remove(5)
+        added.set_titre("D2")
+        second.set_titre("B")
+        third.set_titre("C2")
+        self.assertEqual(
+            self.store.changes(self.store),
+            [("remove", first), ("add", added), ("edit", third)],
+        )
+        self.store.mark_clean(self.store.changes(self.store))
+        self.assertEqual(self.store.changes(self.store), [])
+        self.assertFalse(added.dirty or third.dirty)
+
+    def test_apply(self):
+        """Test du rejeu des modifications d'une session sur des tâches rechargées.
+
+        Vérifie qu'un ajout en conflit reçoit un nouvel identifiant, qu'une
+        modification d'une tâche supprimée entre-temps est ignorée et que seuls les
+        attributs modifiés par la session remplacent les valeurs rechargées.
+        """
+        reloaded = TaskStore(
+            [Tache("A", priorite=4, task_id=1), Tache("C", task_id=3), Tache("X", task_id=4)]
+        )
+        edited = Tache("A", task_id=1)
+        edited.set_titre("A2")
+        gone = Tache("B", task_id=2)
+        gone.set_titre("B2")
+        added = Tache("D", task_id=4)
+        changes = [("edit", edited), ("edit", gone), ("add", added)]
+        reassigned, skipped = reloaded.apply(changes, {1: {"titre"}, 2: {"titre"}})
+        self.assertEqual(reassigned, {4: added.task_id})
+        self.assertNotEqual(added.task_id, 4)
+        self.assertEqual(skipped, [2])
+        self.assertNotIn("B2", [task.get_titre() for task in reloaded])
+        self.assertEqual(reloaded.get(1), Tache("A2", priorite=4, task_id=1))
+        self.assertEqual(reloaded.get(4).get_titre(), "X")
+
+    def test_generate_unique_id_uses_index(self):
+        """Test que generate_unique_id accepte une TaskStore."""
+        new_id = generate_unique_id(self.store)
+        self.assertNotIn(new_id, self.store)
@@ -0,0 +1,70 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+Module de tests pour la table en colonnes TaskTable.
+
+Ce module vérifie la construction de la table, l'accès aux tâches par des vues
+sans copie, leur modification et la conversion en dictionnaires.
+
+Chaque méthode de test est documentée avec une docstring au format Google.
+"""
+
+import unittest
+
+from array import array
+
+from source.tache import Tache
+from source.task_table import TaskTable
+
+
+class TestTaskTable(unittest.TestCase):
+    """Tests unitaires pour la classe TaskTable."""
+
+    def setUp(self):
+        """Crée les tâches de test."""
+        self.tasks = [
+            Tache("A", "Desc", 3, "2025-01-01", task_id=111111),
+            Tache("B", task_id=None),
+        ]
+
+    def test_columns(self):
+        """Test que les identifiants et priorités sont stockés dans des array('q')."""
+        table = TaskTable(self.tasks)
+        self.assertIsInstance(table.task_ids, array)
+        self.assertEqual(table.priorites.typecode, "q")
+        self.assertEqual(list(table.priorites), [3, 1])
+        self.assertEqual(table.titres, ["A", "B"])
+
+    def test_round_trip(self):
+        """Test que les tâches reconstruites sont identiques aux originales."""
+        table = TaskTable(self.tasks)
+        self.assertEqual(len(table), 2)
+        self.assertEqual(list(table), self.tasks)
+        self.assertIsNone(table[1].task_id)
+
+    def test_from_dicts(self):
+        """Test de la construction depuis des dictionnaires et de to_dicts."""
+        dicts = [task.to_dict() for task in self.tasks]
+        table = TaskTable.from_dicts(dicts)
+        self.assertEqual(list(table.to_dicts()), dicts)
+
+    def test_setitem_and_index_of(self):
+        """Test de la modification d'une tâche retrouvée par identifiant.
+
+        Vérifie que la vue retournée écrit directement dans les colonnes, sans copie,
+        et que le remplacement d'une ligne entière reste possible.
+        """
+        table = TaskTable(self.tasks)
+        index = table.index_of(111111)
+        task = table[index]
+        task.set_priorite(5)
+        task.set_date_limite(None)
+        self.assertEqual(table.priorites[index], 5)
+        self.assertIsNone(table.dates_limites[index])
+        self.assertEqual(task, Tache("A", "Desc", 5, None, task_id=111111))
+        table[index] = Tache("Kiwi", None, 2, None, task_id=111111)
+        self.assertEqual(task.get_titre(), "Kiwi")
+        with self.assertRaises(IndexError):
+            _ = table[len(table)]
+        with self.assertRaises(ValueError):
+            table.index_of(42)
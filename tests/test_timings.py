@@ -0,0 +1,99 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+Module de tests pour la mesure des phases (timings) et les options --timings et --profile.
+
+Ce module vérifie le calcul des durées propres des phases imbriquées, l'absence d'effet
+des fonctions d'instrumentation sans mesure en cours, le rapport de ``--timings`` sur
+la sortie d'erreur et le fichier de statistiques écrit par ``--profile``.
+
+Chaque méthode de test est documentée avec une docstring au format Google.
+"""
+
+import io
+import json
+import os
+import pstats
+import tempfile
+import unittest
+
+from unittest.mock import patch
+
+from source import task_manager, timings
+from source.storage import open_storage
+from source.tache import Tache
+
+
+class TestTimings(unittest.TestCase):
+    """Tests unitaires pour le module timings."""
+
+    def setUp(self):
+        """Crée un fichier de tâches dans un répertoire temporaire."""
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.filename = os.path.join(self.tmpdir.name, "tasks.json")
+        open_storage("json", self.filename).save(
+            [Tache("Tâche 1", None, 2, task_id=1), Tache("Tâche 2", None, 1, task_id=2)]
+        )
+
+    def tearDown(self):
+        """Supprime le répertoire temporaire et arrête toute mesure en cours."""
+        timings.stop()
+        self.tmpdir.cleanup()
+
+    def test_nested_phases(self):
+        """Test que la durée d'une phase exclut celle des phases imbriquées."""
+        measure = timings.Timings()
+        with patch("time.perf_counter", side_effect=[0.0, 1.0, 3.0, 4.0]):
+            with measure.phase("command"):
+                with measure.phase("save"):
+                    pass
+        self.assertEqual(measure.phases, {"command": 2.0, "save": 2.0})
+        self.assertEqual(measure.total, 4.0)
+
+    def test_disabled(self):
+        """Test que l'instrumentation est sans effet sans mesure en cours."""
+        tasks = [1, 2]
+        self.assertIs(timings.counted(tasks), tasks)
+        timings.count("bytes_written", 10)
+        with timings.phase("load"):
+            pass
+        measure = timings.start()
+        self.assertEqual(list(timings.counted(tasks)), tasks)
+        self.assertIs(timings.stop(), measure)
+        self.assertEqual(measure.counters, {"tasks_loaded": 2})
+
+    def test_timings_option(self):
+        """Test du rapport de --timings : texte puis ligne JSON sur la sortie d'erreur."""
+        argv = ["--timings", "--storage", "journal", "--file", self.filename]
+        with patch("sys.stdout", new_callable=io.StringIO):
+            with patch("sys.stderr", new_callable=io.StringIO) as fake_err:
+                task_manager.main(argv + ["edit", "--id", "1", "--priority", "5"])
+        lines = fake_err.getvalue().splitlines()
+        self.assertEqual(lines[0], "Durées des phases (ms) :")
+        report = json.loads(lines[-1])["timings"]
+        for name in ("parse", "load", "decode", "build", "command", "save", "index"):
+            self.assertIn(name, report["phases_ms"])
+        self.assertAlmostEqual(
+            sum(report["phases_ms"].values()), report["total_ms"], delta=0.01
+        )
+        self.assertEqual(report["counters"]["tasks_loaded"], 2)
+        self.assertGreater(report["counters"]["bytes_written"], 0)
+
+    def test_without_timings_option(self):
+        """Test que rien n'est mesuré ni affiché sans --timings."""
+        with patch("sys.stdout", new_callable=io.StringIO):
+            with patch("sys.stderr", new_callable=io.StringIO) as fake_err:
+                task_manager.main(["--file", self.filename, "list"])
+        self.assertEqual(fake_err.getvalue(), "")
+        self.assertIsNone(timings.stop())
+
+    def test_profile_option(self):
+        """Test que --profile écrit des statistiques lisibles par pstats."""
+        profile = os.path.join(self.tmpdir.name, "out.prof")
+        with patch("sys.stdout", new_callable=io.StringIO):
+            with patch("sys.stderr", new_callable=io.StringIO):
+                task_manager.main(["--profile", profile, "--file", self.filename, "list"])
+        stats = pstats.Stats(profile)
+        self.assertTrue(
+            any(name == "handle_list" for _, _, name in stats.stats)
+        )
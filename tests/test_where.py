@@ -0,0 +1,157 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+Module de tests pour les expressions --where (where).
+
+Ce module vérifie l'analyse et la compilation des expressions, l'extraction des
+conditions d'intervalle par le planificateur et les opérations en masse des
+commandes "list", "remove" et "edit" avec --where.
+
+Chaque méthode de test est documentée avec une docstring au format Google.
+"""
+
+import io
+import os
+import tempfile
+import unittest
+
+from unittest.mock import patch
+
+from source import task_manager
+from source.sorted_index import SortedIndex
+from source.storage import open_storage
+from source.tache import parse_date
+from source.where import Plan, parse
+from tests.helpers import listed_titles, run_cli, where_tasks
+
+
+def matching_ids(expression, tasks=None):
+    """Retourne les identifiants des tâches qui vérifient une expression.
+
+    Args:
+        expression (str): L'expression --where.
+        tasks (list[Tache], optional): Les tâches. Defaults to where_tasks().
+
+    Returns:
+        list[int]: Les identifiants, dans l'ordre des tâches.
+    """
+    plan = Plan(expression)
+    return [task.task_id for task in plan.filter(tasks or where_tasks())]
+
+
+class TestWhere(unittest.TestCase):
+    """Tests unitaires pour les expressions --where."""
+
+    def setUp(self):
+        """Crée un répertoire temporaire pour les fichiers de sauvegarde."""
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.filename = os.path.join(self.tmpdir.name, "tasks.json")
+
+    def tearDown(self):
+        """Supprime le répertoire temporaire."""
+        self.tmpdir.cleanup()
+
+    def test_parse(self):
+        """Test de l'arbre produit pour une expression avec priorités des opérateurs."""
+        self.assertEqual(
+            parse('priorite>=3 and not titre~"a b" or task_id=2'),
+            (
+                "or",
+                [
+                    (
+                        "and",
+                        [
+                            ("cmp", "priorite", ">=", 3),
+                            ("not", ("cmp", "titre", "~", "a b")),
+                        ],
+                    ),
+                    ("cmp", "task_id", "=", 2),
+                ],
+            ),
+        )
+
+    def test_invalid_expressions(self):
+        """Test des messages d'erreur des expressions invalides."""
+        for expression in (
+            "",
+            "priorite>>3",
+            "inconnu=1",
+            "priorite=haute",
+            "date_limite<demain",
+            "priorite~3",
+            "(priorite=1",
+            "priorite=1 titre=a",
+        ):
+            with self.subTest(expression=expression):
+                with self.assertRaises(ValueError):
+                    Plan(expression)
+
+    def test_predicates(self):
+        """Test des prédicats compilés, y compris sur un champ absent."""
+        self.assertEqual(
+            matching_ids('priorite>=3 and date_limite<2026-11-01 and titre~"deploy"'),
+            [1],
+        )
+        self.assertEqual(matching_ids("titre~deploy or description~DEPLOY"), [1, 2, 3])
+        self.assertEqual(matching_ids("date_limite!=2026-10-01"), [2, 4])
+        self.assertEqual(matching_ids("not (priorite<4) and task_id!=4"), [3])
+        self.assertEqual(matching_ids("titre='Écrire le rapport'"), [3])
+
+    def test_plan_extracts_ranges(self):
+        """Test que les conditions d'intervalle de premier niveau sont extraites."""
+        plan = Plan("priorite>1 and priorite<=4 and date_limite>=2026-10-01 and titre~e")
+        self.assertEqual(plan.ranges["priority"], [2, 4])
+        self.assertEqual(plan.ranges["due"], [parse_date("2026-10-01"), None])
+        self.assertEqual(Plan("priorite>1 or titre~a").ranges, {})
+
+    def test_filter_only_tests_candidates(self):
+        """Test que seules les tâches candidates de l'index sont testées."""
+        tasks = where_tasks()
+        index = SortedIndex.build(tasks)
+        plan = Plan("priorite>=4 and titre~r")
+        tested = []
+        residual = plan.residual
+        plan.residual = lambda task: tested.append(task.task_id) or residual(task)
+        self.assertEqual([t.task_id for t in plan.filter(tasks, index.ids_between)], [3, 4])
+        self.assertEqual(sorted(tested), [3, 4])
+
+    def test_filter_without_index(self):
+        """Test qu'en l'absence d'index les tâches sont filtrées sans construire d'index."""
+        plan = Plan("priorite>=3 and date_limite<2026-11-01")
+        with patch.object(SortedIndex, "build", side_effect=AssertionError):
+            selected = plan.filter(iter(where_tasks()))
+            self.assertEqual([t.task_id for t in selected], [1, 4])
+            selected = plan.filter(where_tasks(), lambda sort, low, high: None)
+            self.assertEqual([t.task_id for t in selected], [1, 4])
+
+    def test_list_where(self):
+        """Test de la commande "list --where" avec l'index sauvegardé."""
+        open_storage("json", self.filename).save(where_tasks())
+        argv = ["--file", self.filename, "list", "--where", "priorite>=3", "--sort", "due"]
+        with patch.object(SortedIndex, "build", side_effect=AssertionError):
+            output = run_cli(argv)
+        self.assertEqual(listed_titles(output), ["Écrire le rapport", "Relire", "Deploy API"])
+
+    def test_remove_and_edit_where(self):
+        """Test des suppressions et modifications en masse, sauvegardées une fois."""
+        open_storage("journal", self.filename).save(where_tasks())
+        base = ["--storage", "journal", "--file", self.filename]
+        with patch("builtins.print"):
+            with patch.object(
+                task_manager, "save_tasks", wraps=task_manager.save_tasks
+            ) as mock_save:
+                task_manager.main(base + ["edit", "--where", "titre~deploy", "--priority", "9"])
+                task_manager.main(base + ["remove", "--where", "priorite<5"])
+        self.assertEqual(mock_save.call_count, 2)
+        tasks = open_storage("journal", self.filename).load()
+        self.assertEqual(
+            sorted((t.task_id, t.priorite) for t in tasks), [(1, 9), (2, 9), (4, 5)]
+        )
+
+    def test_remove_requires_target(self):
+        """Test que "remove" exige --id ou --where, mais pas les deux."""
+        for argv in (["remove"], ["remove", "--id", "1", "--where", "priorite=1"]):
+            with self.subTest(argv=argv):
+                with patch("sys.stderr", new_callable=io.StringIO):
+                    with self.assertRaises(SystemExit):
+                        task_manager.main(argv)